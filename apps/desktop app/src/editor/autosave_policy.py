@@ -0,0 +1,163 @@
+"""Adaptive autosave scheduling.
+
+A plain debounce never fires for someone who types without pausing and
+fires constantly for a slow typist. :class:`AutosavePolicy` decides how
+long to wait after each edit:
+
+* the *debounce* interval is waited after the last edit, but
+* a save is due at the latest *max wait* after the first unsaved edit, and
+* the debounce grows with the measured cost of a save (exponentially
+  weighted average) so expensive documents are not saved after every
+  short pause.
+
+Saves are also forced on window focus-out and tab switches (see
+:attr:`AutosaveConfig.save_on_focus_out` / ``save_on_tab_switch``).
+
+Settings are per project space and read from
+``<space>/.crowdly/autosave.json``; missing keys fall back to defaults.
+The policy only deals with numbers and an injectable clock, so it can be
+driven by a fake clock in tests. This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable
+
+CONFIG_DIRNAME = ".crowdly"
+CONFIG_FILENAME = "autosave.json"
+
+
+@dataclass(frozen=True)
+class AutosaveConfig:
+    """Autosave settings for one project space.
+
+    Parameters
+    ----------
+    debounce_ms:
+        Quiet period after the last edit before saving.
+    max_wait_ms:
+        Upper bound between the first unsaved edit and the save, however
+        continuously the user keeps typing.
+    max_debounce_ms:
+        Ceiling for the debounce after backoff.
+    cost_factor:
+        The debounce is at least ``cost_factor`` times the average save
+        cost, so saving never takes more than ``1 / cost_factor`` of the
+        editing time.
+    save_on_focus_out:
+        Save immediately when the window loses focus.
+    save_on_tab_switch:
+        Save the tab being left immediately on a tab switch.
+    """
+
+    debounce_ms: int = 2000
+    max_wait_ms: int = 30000
+    max_debounce_ms: int = 10000
+    cost_factor: float = 20.0
+    save_on_focus_out: bool = True
+    save_on_tab_switch: bool = True
+
+
+def config_path_for_space(root: Path) -> Path:
+    return Path(root) / CONFIG_DIRNAME / CONFIG_FILENAME
+
+
+def load_config(root: Path | None) -> AutosaveConfig:
+    """Return the autosave settings for space *root* (defaults if unset)."""
+
+    if root is None:
+        return AutosaveConfig()
+    try:
+        raw = json.loads(config_path_for_space(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return AutosaveConfig()
+    if not isinstance(raw, dict):
+        return AutosaveConfig()
+
+    defaults = AutosaveConfig()
+    values = {}
+    for f in fields(AutosaveConfig):
+        default = getattr(defaults, f.name)
+        value = raw.get(f.name, default)
+        # bool is an int subclass; keep flags and numbers apart.
+        if isinstance(default, bool):
+            values[f.name] = value if isinstance(value, bool) else default
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            values[f.name] = type(default)(value)
+        else:
+            values[f.name] = default
+    return AutosaveConfig(**values)
+
+
+def save_config(root: Path, config: AutosaveConfig) -> None:
+    """Persist *config* for space *root*."""
+
+    from . import storage
+
+    path = config_path_for_space(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    storage.write_text(path, json.dumps(asdict(config), indent=2) + "\n")
+
+
+class AutosavePolicy:
+    """Compute autosave delays from edit timing and measured save cost.
+
+    Parameters
+    ----------
+    config:
+        Settings to apply; see :class:`AutosaveConfig`.
+    clock:
+        Monotonic clock in seconds. Defaults to :func:`time.monotonic`.
+    """
+
+    # Weight of the newest sample in the save cost average.
+    _COST_ALPHA = 0.3
+
+    def __init__(self, config: AutosaveConfig | None = None, clock: Callable[[], float] | None = None) -> None:
+        self.config = config or AutosaveConfig()
+        self.clock = clock or time.monotonic
+        self._first_edit_at: float | None = None
+        self._avg_cost_s: float | None = None
+
+    @property
+    def average_cost_ms(self) -> float | None:
+        return None if self._avg_cost_s is None else self._avg_cost_s * 1000.0
+
+    def debounce_ms(self) -> int:
+        """Return the current debounce including cost backoff."""
+
+        config = self.config
+        debounce = float(config.debounce_ms)
+        if self._avg_cost_s is not None:
+            debounce = max(debounce, self._avg_cost_s * 1000.0 * config.cost_factor)
+        return int(min(debounce, max(config.max_debounce_ms, config.debounce_ms)))
+
+    def note_edit(self) -> int:
+        """Record an edit and return the delay in ms until the save is due."""
+
+        now = self.clock()
+        if self._first_edit_at is None:
+            self._first_edit_at = now
+        remaining_ms = (self._first_edit_at + self.config.max_wait_ms / 1000.0 - now) * 1000.0
+        return max(0, int(min(self.debounce_ms(), remaining_ms)))
+
+    def has_pending_edits(self) -> bool:
+        return self._first_edit_at is not None
+
+    def record_cost(self, duration_s: float) -> None:
+        """Record that a save took *duration_s* seconds."""
+
+        duration_s = max(0.0, float(duration_s))
+        if self._avg_cost_s is None:
+            self._avg_cost_s = duration_s
+        else:
+            self._avg_cost_s += self._COST_ALPHA * (duration_s - self._avg_cost_s)
+
+    def reset(self) -> None:
+        """Forget pending edits after a save (or when nothing can be saved)."""
+
+        self._first_edit_at = None
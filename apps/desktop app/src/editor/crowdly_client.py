@@ -25,8 +25,11 @@ from typing import Any
 from urllib.parse import urlparse, urlencode
 import json
 import re
-import urllib.request
-import urllib.error
+
+from .crowdly_session import SessionManager, shared_sessions
+from .http_cache import CachedResponse, HttpCache, shared_cache
+from .http_transport import HttpResponse, HttpTransport, TransportError, shared_transport
+from .update_channel import KIND_SCREENPLAY, KIND_STORY, UpdateEvent
 
 
 @dataclass(frozen=True)
@@ -115,7 +118,16 @@ def api_base_url_from_story_url(url: str, *, backend_port: int = 4000) -> str:
 
 
 class CrowdlyClient:
-    """Minimal Crowdly client based on urllib (no external deps).
+    """Minimal Crowdly client (no external deps).
+
+    Requests go through a pooled keep-alive :class:`editor.http_transport.HttpTransport`
+    (the process-wide one unless *transport* is given), so consecutive calls
+    reuse the same connection. JSON GETs are revalidated against an
+    :class:`editor.http_cache.HttpCache` with ``If-None-Match`` /
+    ``If-Modified-Since``; a 304 reply is answered from the cached body.
+    Logins are shared through an :class:`editor.crowdly_session.SessionManager`
+    (the process-wide one unless *sessions* is given); a request rejected
+    with 401 under a reused session is retried once after a fresh login.
 
     ``base_url`` is expected to point at the Crowdly **backend** origin, e.g.::
 
@@ -133,16 +145,32 @@ class CrowdlyClient:
         *,
         timeout_seconds: float = 10.0,
         credentials: tuple[str, str] | None = None,
+        transport: HttpTransport | None = None,
+        cache: HttpCache | None = None,
+        sessions: SessionManager | None = None,
     ) -> None:
         self.base_url = (base_url or "").rstrip("/")
         self.timeout_seconds = timeout_seconds
+        self._transport = transport or shared_transport()
+        self._cache = cache or shared_cache()
+        self._sessions = sessions or shared_sessions()
         self._credentials = credentials
         self._user_id: str | None = None
+        # Whether _user_id came from the session cache rather than a login
+        # made by this client.
+        self._session_reused = False
+
+    @property
+    def transport(self) -> HttpTransport:
+        """The connection pool used by this client, for ad-hoc backend calls."""
+
+        return self._transport
 
     def login(self) -> str:
         """Log in to Crowdly backend and return the user_id.
 
         Crowdly backend expects POST /auth/login with JSON {email, password}.
+        A live session for the same backend and credentials is reused.
         """
 
         if self._credentials is None:
@@ -151,15 +179,28 @@ class CrowdlyClient:
         if self._user_id:
             return self._user_id
 
-        email, password = self._credentials
+        self._user_id, self._session_reused = self._sessions.login(
+            self.base_url, self._credentials, self._authenticate
+        )
+        return self._user_id
+
+    def _authenticate(self) -> str:
+        email, password = self._credentials or ("", "")
         payload = {"email": email, "password": password}
         data = self._http_post_json(f"{self.base_url}/auth/login", payload)
 
         if not isinstance(data, dict) or not isinstance(data.get("id"), str):
             raise CrowdlyClientError("Unexpected login response.", kind="invalid_response")
+        return data["id"]
 
-        self._user_id = data["id"]
-        return self._user_id
+    def _renew_session(self) -> str | None:
+        """Replace a reused session the backend rejected; ``None`` if not reused."""
+
+        if self._credentials is None or not self._session_reused:
+            return None
+        self._sessions.invalidate(self.base_url, self._credentials)
+        self._user_id = None
+        return self.login()
 
     @staticmethod
     def parse_story_id(value: str) -> str:
@@ -202,6 +243,16 @@ class CrowdlyClient:
     def get_story_title_row(self, story_id: str) -> dict[str, Any]:
         """Fetch the raw story_title row (best-effort auth)."""
 
+        return self.check_story_title_row(story_id)[0]
+
+    def check_story_title_row(self, story_id: str) -> tuple[dict[str, Any], bool]:
+        """Fetch the story_title row and whether it is unchanged.
+
+        Returns ``(row, not_modified)``; ``not_modified`` is True when the
+        server answered 304 to a revalidation of the cached row, i.e. the
+        story title has not changed since it was last fetched.
+        """
+
         if not self.base_url:
             raise CrowdlyClientError("Crowdly base URL is not configured.", kind="config")
 
@@ -209,14 +260,20 @@ class CrowdlyClient:
         if self._credentials is not None:
             user_id = self.login()
 
-        title_url = f"{self.base_url}/story-titles/{story_id}"
-        if user_id:
-            title_url = title_url + "?" + urlencode({"userId": user_id})
+        def title_url(user_id: str | None) -> str:
+            url = f"{self.base_url}/story-titles/{story_id}"
+            return url + "?" + urlencode({"userId": user_id}) if user_id else url
 
-        row = self._http_get_json(title_url)
+        try:
+            row, not_modified = self._http_get_json_revalidated(title_url(user_id))
+        except CrowdlyClientError as exc:
+            renewed = self._renew_session() if exc.status_code == 401 and user_id else None
+            if renewed is None:
+                raise
+            row, not_modified = self._http_get_json_revalidated(title_url(renewed))
         if not isinstance(row, dict):
             raise CrowdlyClientError("Unexpected story title response.", kind="invalid_response")
-        return row
+        return row, not_modified
 
     def get_screenplay_title_row(self, screenplay_id: str) -> dict[str, Any]:
         """Fetch the raw screenplay_title row.
@@ -234,8 +291,12 @@ class CrowdlyClient:
             raise CrowdlyClientError("Unexpected screenplay title response.", kind="invalid_response")
         return row
 
-    def fetch_story(self, story_url: str) -> CrowdlyStory:
-        """Fetch a story from Crowdly backend and assemble a Markdown document."""
+    def fetch_story(self, story_url: str, *, title_row: dict[str, Any] | None = None) -> CrowdlyStory:
+        """Fetch a story from Crowdly backend and assemble a Markdown document.
+
+        Pass *title_row* when the story_title row was already fetched (e.g.
+        to compare ``updated_at``) so it is not requested again.
+        """
 
         if not self.base_url:
             raise CrowdlyClientError("Crowdly base URL is not configured.", kind="config")
@@ -247,7 +308,8 @@ class CrowdlyClient:
             user_id = self.login()
 
         # Story title (visibility/access enforced here).
-        title_row = self.get_story_title_row(story_id)
+        if title_row is None:
+            title_row = self.get_story_title_row(story_id)
 
         story_title = title_row.get("title")
         if not isinstance(story_title, str) or not story_title.strip():
@@ -480,12 +542,17 @@ class CrowdlyClient:
         chapters: list[dict[str, Any]],
         metadata: dict[str, Any] | None,
         creative_space_id: str | None = None,
+        delta: dict[str, Any] | None = None,
     ) -> Any:
         """Sync story metadata + full content to the backend (desktop endpoint).
 
         ``creative_space_id`` is optional and, when provided, is treated by the
         backend as the primary Space that owns this story. This is kept
         best-effort so existing stories without Spaces continue to work.
+
+        When ``delta`` is given (see :func:`editor.story_delta.compute_delta`)
+        it is sent instead of ``chapters``; the backend rejects it with 409
+        when the story changed since the delta's base.
         """
 
         user_id = self.login()  # raises on auth error
@@ -493,12 +560,15 @@ class CrowdlyClient:
             "userId": user_id,
             "title": title,
             "metadata": metadata or {},
-            "chapters": chapters,
             # Explicitly mark this as a "story" payload so the backend (and
             # any future CRDT or routing logic) can distinguish it from
             # screenplay syncs using the same revision machinery.
             "bodyType": "story",
         }
+        if delta is not None:
+            payload["delta"] = delta
+        else:
+            payload["chapters"] = chapters
         if creative_space_id:
             # The backend accepts either creativeSpaceId or spaceId; we send
             # both for clarity and forwards compatibility.
@@ -514,6 +584,7 @@ class CrowdlyClient:
         scenes: list[dict[str, Any]],
         metadata: dict[str, Any] | None = None,
         remote_updated_at: str | None = None,
+        patch: dict[str, Any] | None = None,
     ) -> Any:
         """Sync screenplay structure to the backend (desktop endpoint).
 
@@ -521,6 +592,9 @@ class CrowdlyClient:
         tables. The payload is a snapshot of scenes and their paragraphs,
         which the backend maps to `screenplay_scene` and `screenplay_block`
         rows.
+
+        When ``patch`` is given (see :func:`editor.screenplay_sync.compute_patch`)
+        it is sent instead of ``scenes``.
         """
 
         if not self.base_url:
@@ -535,8 +609,11 @@ class CrowdlyClient:
             "userId": user_id,
             "title": title,
             "metadata": metadata or {},
-            "scenes": scenes,
         }
+        if patch is not None:
+            payload["patch"] = patch
+        else:
+            payload["scenes"] = scenes
         if remote_updated_at:
             payload["remoteUpdatedAt"] = remote_updated_at
         return self._http_post_json(
@@ -544,78 +621,127 @@ class CrowdlyClient:
             payload,
         )
 
-    def _http_post_json(self, url: str, payload: dict[str, Any]) -> Any:
-        raw = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=raw,
-            headers={
-                "User-Agent": "crowdly-editor/0.1",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+    def fetch_changes(
+        self,
+        *,
+        stories: dict[str, str | None] | None = None,
+        screenplays: dict[str, str | None] | None = None,
+    ) -> list[UpdateEvent]:
+        """Return the items whose revision differs from the one given.
+
+        ``stories`` and ``screenplays`` map remote ids to the ``updated_at``
+        last seen (``None`` when unknown). One request covers all of them;
+        items that did not change are not returned, and neither are items
+        the logged-in user (anonymous without credentials) may not read.
+        """
+
+        if not self.base_url:
+            raise CrowdlyClientError("Crowdly base URL is not configured.", kind="config")
 
+        payload: dict[str, Any] = {"stories": stories or {}, "screenplays": screenplays or {}}
+        if self._credentials is not None:
+            payload["userId"] = self.login()
+        data = self._http_post_json(f"{self.base_url}/updates/changes", payload)
+        changes = data.get("changes") if isinstance(data, dict) else None
+        events: list[UpdateEvent] = []
+        for raw in changes if isinstance(changes, list) else []:
+            if not isinstance(raw, dict):
+                continue
+            kind, item_id, updated_at = raw.get("kind"), raw.get("id"), raw.get("updatedAt")
+            if kind in (KIND_STORY, KIND_SCREENPLAY) and isinstance(item_id, str) and isinstance(updated_at, str):
+                events.append(UpdateEvent(kind=kind, item_id=item_id, updated_at=updated_at))
+        return events
+
+    def _request(self, method: str, url: str, payload: dict[str, Any] | None = None) -> HttpResponse:
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_seconds) as resp:
-                content_type = (resp.headers.get_content_type() or "").lower()
-                charset = resp.headers.get_content_charset() or "utf-8"
-                body = resp.read().decode(charset, errors="replace")
-
-                if "json" not in content_type:
-                    raise CrowdlyClientError(
-                        f"Expected JSON but got '{content_type}'.",
-                        kind="invalid_response",
-                    )
+            return self._transport.request(
+                method,
+                url,
+                json_body=payload,
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as exc:
+            raise CrowdlyClientError(str(exc), kind="network")
 
-                return json.loads(body)
-        except urllib.error.HTTPError as exc:
-            if exc.code in (401, 403):
-                raise CrowdlyClientError("Login failed.", kind="auth_failed", status_code=exc.code)
+    def _http_post_json(self, url: str, payload: dict[str, Any]) -> Any:
+        resp = self._request("POST", url, payload)
+        if resp.status == 401 and self._user_id and payload.get("userId") == self._user_id:
+            renewed = self._renew_session()
+            if renewed is not None:
+                resp = self._request("POST", url, {**payload, "userId": renewed})
+
+        if not resp.ok:
+            if resp.status in (401, 403):
+                raise CrowdlyClientError("Login failed.", kind="auth_failed", status_code=resp.status)
             raise CrowdlyClientError(
-                "HTTP error (HTTP {code}).".format(code=exc.code),
+                "HTTP error (HTTP {code}).".format(code=resp.status),
                 kind="http_error",
-                status_code=exc.code,
+                status_code=resp.status,
+            )
+
+        if "json" not in resp.content_type:
+            raise CrowdlyClientError(
+                f"Expected JSON but got '{resp.content_type}'.",
+                kind="invalid_response",
             )
-        except urllib.error.URLError as exc:
-            raise CrowdlyClientError(f"Network error: {exc}", kind="network")
+
+        return resp.json()
+
+    def _cache_user(self) -> str:
+        return self._user_id or "anonymous"
 
     def _http_get_json(self, url: str) -> Any:
-        headers = {
-            "User-Agent": "crowdly-editor/0.1",
-            "Accept": "application/json",
-        }
+        return self._http_get_json_revalidated(url)[0]
 
-        req = urllib.request.Request(
-            url,
-            headers=headers,
-            method="GET",
-        )
+    def _http_get_json_revalidated(self, url: str) -> tuple[Any, bool]:
+        """GET *url* as JSON, revalidating a cached copy when there is one.
 
+        Returns ``(data, not_modified)``.
+        """
+
+        user = self._cache_user()
+        cached = self._cache.lookup(url, user)
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_seconds) as resp:
-                content_type = (resp.headers.get_content_type() or "").lower()
-                charset = resp.headers.get_content_charset() or "utf-8"
-                raw_text = resp.read().decode(charset, errors="replace")
-
-                # Be strict: if the endpoint returns HTML, it's not usable.
-                if "json" not in content_type:
-                    raise CrowdlyClientError(
-                        f"Expected JSON from Crowdly backend but got '{content_type}'.",
-                        kind="invalid_response",
-                    )
+            resp = self._transport.request(
+                "GET",
+                url,
+                headers=cached.validator_headers() if cached is not None else None,
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as exc:
+            raise CrowdlyClientError(str(exc), kind="network")
+
+        if resp.status == 304 and cached is not None:
+            try:
+                return json.loads(cached.body), True
+            except ValueError:
+                # Corrupt entry: drop it and fetch the full body once more.
+                self._cache.discard(url, user)
+                return self._http_get_json_revalidated(url)
+
+        data = self._decode_get_json(resp)
+        self._cache.store(
+            CachedResponse(
+                url=url,
+                user=user,
+                body=resp.text(),
+                content_type=resp.content_type,
+                etag=resp.headers.get("etag"),
+                last_modified=resp.headers.get("last-modified"),
+            )
+        )
+        return data, False
+
+    def _decode_get_json(self, resp: HttpResponse) -> Any:
 
-                return json.loads(raw_text)
-        except urllib.error.HTTPError as exc:
-            if exc.code == 404:
+        if not resp.ok:
+            if resp.status == 404:
                 raise CrowdlyClientError("Story not found (404).", kind="http_404", status_code=404)
 
-            if exc.code == 403:
+            if resp.status == 403:
                 # Backend returns 403 for private stories without userId, and for access denied.
                 try:
-                    body = exc.read().decode("utf-8", errors="replace")
-                    data = json.loads(body)
+                    data = resp.json()
                     msg = data.get("error") if isinstance(data, dict) else None
                 except Exception:
                     msg = None
@@ -630,9 +756,16 @@ class CrowdlyClient:
                 )
 
             raise CrowdlyClientError(
-                "HTTP error (HTTP {code}).".format(code=exc.code),
+                "HTTP error (HTTP {code}).".format(code=resp.status),
                 kind="http_error",
-                status_code=exc.code,
+                status_code=resp.status,
             )
-        except urllib.error.URLError as exc:
-            raise CrowdlyClientError(f"Network error: {exc}", kind="network")
+
+        # Be strict: if the endpoint returns HTML, it's not usable.
+        if "json" not in resp.content_type:
+            raise CrowdlyClientError(
+                f"Expected JSON from Crowdly backend but got '{resp.content_type}'.",
+                kind="invalid_response",
+            )
+
+        return resp.json()
@@ -0,0 +1,237 @@
+"""Process-wide cache of authenticated Crowdly backend sessions.
+
+``POST /auth/login`` verifies the credentials and returns the user id the
+desktop endpoints expect as ``userId``. Every background sync and pull used
+to build a new :class:`editor.crowdly_client.CrowdlyClient` and log in again;
+:class:`SessionManager` keeps the result per ``(api base, email)`` instead,
+shared by all clients and threads:
+
+* concurrent logins for the same key are serialised, so a burst of
+  background jobs performs one login;
+* sessions expire after ``ttl`` seconds and are then renewed on next use;
+* :meth:`SessionManager.invalidate` drops a session the backend rejected
+  (the client retries once with a fresh login).
+
+Sessions are bound to the password they were created with: the key also
+holds a salted PBKDF2 fingerprint of it, so a changed or mistyped password
+never reuses an old session. With a *path*, sessions are persisted between
+runs in a JSON file readable only by the user (``0600``); neither the
+password nor anything it can be recovered from cheaply is stored. This
+module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from .settings import CONFIG_DIR_NAME
+
+SESSIONS_FILE_NAME = "sessions.json"
+
+# Sessions are renewed after this many seconds.
+DEFAULT_TTL = 12 * 60 * 60
+
+_PBKDF2_ITERATIONS = 100_000
+
+_Key = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class Session:
+    """A logged-in user on one backend."""
+
+    api_base: str
+    email: str
+    user_id: str
+    expires_at: float
+
+
+def default_sessions_path() -> Path:
+    return Path.home().joinpath(".config", CONFIG_DIR_NAME, SESSIONS_FILE_NAME)
+
+
+class SessionManager:
+    """Thread-safe session store keyed by backend and user.
+
+    Parameters
+    ----------
+    path:
+        JSON file to persist sessions in; ``None`` keeps them in memory.
+    ttl:
+        Lifetime of a session in seconds.
+    clock:
+        Wall clock in seconds (persisted expiries must survive restarts).
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self.clock = clock or time.time
+        self._lock = threading.Lock()
+        self._key_locks: Dict[_Key, threading.Lock] = {}
+        self._fingerprints: Dict[Tuple[str, str], str] = {}
+        self._sessions: Dict[_Key, Session] = {}
+        self._salt = ""
+        self._loaded = False
+
+    # Keys -------------------------------------------------------------------
+
+    def _fingerprint(self, password: str) -> str:
+        memo = (self._salt, password)
+        digest = self._fingerprints.get(memo)
+        if digest is None:
+            digest = hashlib.pbkdf2_hmac(
+                "sha256", password.encode("utf-8"), bytes.fromhex(self._salt), _PBKDF2_ITERATIONS
+            ).hex()
+            self._fingerprints[memo] = digest
+        return digest
+
+    def _key(self, api_base: str, credentials: Tuple[str, str]) -> _Key:
+        email, password = credentials
+        return (api_base.rstrip("/"), email.strip().lower(), self._fingerprint(password))
+
+    # Lookup / login -----------------------------------------------------------
+
+    def get(self, api_base: str, credentials: Tuple[str, str]) -> Session | None:
+        """Return the live session for *credentials* on *api_base*, if any."""
+
+        with self._lock:
+            self._ensure_loaded()
+            key = self._key(api_base, credentials)
+            session = self._sessions.get(key)
+            if session is not None and session.expires_at <= self.clock():
+                del self._sessions[key]
+                session = None
+            return session
+
+    def login(self, api_base: str, credentials: Tuple[str, str], authenticate: Callable[[], str]) -> Tuple[str, bool]:
+        """Return ``(user_id, cached)``, calling *authenticate* when needed.
+
+        *authenticate* performs the actual login and returns the user id;
+        its exceptions propagate and nothing is cached.
+        """
+
+        with self._lock:
+            self._ensure_loaded()
+            key = self._key(api_base, credentials)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have logged in while we waited.
+            session = self.get(api_base, credentials)
+            if session is not None:
+                return session.user_id, True
+            user_id = authenticate()
+            session = Session(
+                api_base=key[0],
+                email=key[1],
+                user_id=user_id,
+                expires_at=self.clock() + self.ttl,
+            )
+            with self._lock:
+                self._sessions[key] = session
+                self._save()
+            return user_id, False
+
+    def invalidate(self, api_base: str, credentials: Tuple[str, str]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self._sessions.pop(self._key(api_base, credentials), None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Forget all sessions (e.g. on logout)."""
+
+        with self._lock:
+            self._ensure_loaded()
+            self._sessions.clear()
+            self._save()
+
+    # Persistence (called with ``_lock`` held) ---------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        raw = None
+        if self.path is not None:
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = None
+        salt = raw.get("salt") if isinstance(raw, dict) else None
+        if not isinstance(salt, str) or len(salt) != 32:
+            self._salt = secrets.token_hex(16)
+            return
+        self._salt = salt
+        now = self.clock()
+        for entry in raw.get("sessions") or []:
+            if not isinstance(entry, dict):
+                continue
+            api_base, email, fingerprint = entry.get("api_base"), entry.get("email"), entry.get("fingerprint")
+            user_id, expires_at = entry.get("user_id"), entry.get("expires_at")
+            if not all(isinstance(v, str) and v for v in (api_base, email, fingerprint, user_id)):
+                continue
+            if not isinstance(expires_at, (int, float)) or expires_at <= now:
+                continue
+            self._sessions[(api_base, email, fingerprint)] = Session(api_base, email, user_id, float(expires_at))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        now = self.clock()
+        data = {
+            "salt": self._salt,
+            "sessions": [
+                {
+                    "api_base": s.api_base,
+                    "email": s.email,
+                    "fingerprint": key[2],
+                    "user_id": s.user_id,
+                    "expires_at": s.expires_at,
+                }
+                for key, s in self._sessions.items()
+                if s.expires_at > now
+            ],
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except OSError:
+            # Persistence is best-effort; sessions stay valid in memory.
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+_shared: SessionManager | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_sessions() -> SessionManager:
+    """Return the process-wide session manager (persisted under ``~/.config``)."""
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SessionManager(default_sessions_path())
+        return _shared
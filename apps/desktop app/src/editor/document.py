@@ -2,19 +2,81 @@
 
 This module is GUI-agnostic and encapsulates the basic behaviour for
 loading and saving text documents on disk.
+
+The text lives in a persistent :class:`editor.rope.Rope`. Editor deltas
+are applied in O(log n) without copying the document, every change bumps
+``version``, and :meth:`Document.snapshot` hands out an immutable
+:class:`TextSnapshot` in O(1) for background save/sync/render work. The
+plain string is only built when ``content`` is read, and cached until the
+next change.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 from . import storage
 from . import file_metadata
+from .rope import Rope
+
+
+class TextSnapshot:
+    """Immutable view of a document's text at one version.
+
+    Creating a snapshot is O(1); the string is built on first use via
+    ``str(snapshot)`` (typically on a worker thread) and then cached.
+    """
+
+    __slots__ = ("version", "_rope", "_text")
+
+    def __init__(self, rope: Rope, version: int, text: str | None = None) -> None:
+        self.version = version
+        self._rope = rope
+        self._text = text
+
+    def __len__(self) -> int:
+        return len(self._rope)
+
+    def __str__(self) -> str:
+        text = self._text
+        if text is None:
+            text = str(self._rope)
+            self._text = text
+        return text
+
+
+def write_document(path: Path, text: str | TextSnapshot, storage_format: str | None = None) -> bool:
+    """Write *text* to *path* and refresh its metadata.
+
+    Byte-identical content is not rewritten, and then the metadata is left
+    alone too so ``change_date`` only moves on real edits. Metadata is only
+    touched when *storage_format* is given. Returns ``True`` after a write.
+    Safe to call from a worker thread.
+    """
+
+    written = storage.write_text(path, str(text))
+
+    # Best-effort: if this file is associated with a Crowdly story, update
+    # the change_date metadata automatically and mirror the storage_format
+    # into the body_format xattr so other components can reason about it.
+    # Both attributes go out in one batch after the content write, so the
+    # atomic replace never has to copy half-updated metadata.
+    if written and storage_format is not None:
+        try:
+            with file_metadata.batch(path) as meta:
+                if meta.record.is_crowdly:
+                    meta.set(file_metadata.FIELD_CHANGE_DATE, file_metadata.now_human())
+                    meta.set(file_metadata.FIELD_CHANGE_MS, str(file_metadata.now_ms()))
+                # Persist the body_format hint even for non-Crowdly documents;
+                # this is harmless on platforms without xattr support.
+                meta.set(file_metadata.FIELD_BODY_FORMAT, storage_format.strip() or "markdown")
+        except Exception:
+            # Never fail a save due to metadata issues.
+            pass
+    return written
 
 
-@dataclass
 class Document:
     """Represents a single text/Markdown document on disk.
 
@@ -29,16 +91,91 @@ class Document:
     between these formats and what the user sees in the MD/WYSIWYG panes.
     """
 
-    path: Path | None = None
-    content: str = ""
-    is_dirty: bool = False
-    last_saved_at: datetime | None = None
-    # High-level type hint used by the UI and sync layers. "generic" means the
-    # document is not yet classified as a story or screenplay.
-    kind: str = "generic"  # "generic" | "story" | "screenplay"
-    # Low-level storage format for ``content``. This mirrors the
-    # ``file_metadata.body_format`` xattr where available.
-    storage_format: str = "markdown"  # "markdown" | "story_v1" | "screenplay_v1"
+    def __init__(
+        self,
+        path: Path | None = None,
+        content: str = "",
+        is_dirty: bool = False,
+        last_saved_at: datetime | None = None,
+        # High-level type hint used by the UI and sync layers. "generic" means
+        # the document is not yet classified as a story or screenplay.
+        kind: str = "generic",  # "generic" | "story" | "screenplay"
+        # Low-level storage format for ``content``. This mirrors the
+        # ``file_metadata.body_format`` xattr where available.
+        storage_format: str = "markdown",  # "markdown" | "story_v1" | "screenplay_v1"
+    ) -> None:
+        self.path = path
+        self.is_dirty = is_dirty
+        self.last_saved_at = last_saved_at
+        self.kind = kind
+        self.storage_format = storage_format
+
+        self._rope = Rope(content)
+        self._text: str | None = content
+        self._version = 0
+        # Editor version the text corresponds to, and the document version at
+        # which that was established. Deltas are only applied while both still
+        # hold; any other change to ``content`` forces a full resync.
+        self._editor_version: int | None = None
+        self._synced_at: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Document(path={self.path!r}, length={len(self._rope)}, is_dirty={self.is_dirty!r}, "
+            f"kind={self.kind!r}, storage_format={self.storage_format!r}, version={self._version})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        return (
+            self.path == other.path
+            and self.is_dirty == other.is_dirty
+            and self.last_saved_at == other.last_saved_at
+            and self.kind == other.kind
+            and self.storage_format == other.storage_format
+            and self.content == other.content
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # Text -----------------------------------------------------------------
+
+    @property
+    def content(self) -> str:
+        text = self._text
+        if text is None:
+            text = str(self._rope)
+            self._text = text
+        return text
+
+    @content.setter
+    def content(self, value: str) -> None:
+        value = value or ""
+        if self._text is not None and value is self._text:
+            return
+        self._rope = Rope(value)
+        self._text = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped by every change to the text."""
+
+        return self._version
+
+    def changed_since(self, version: int) -> bool:
+        """Return True if the text changed after *version* (O(1))."""
+
+        return self._version != version
+
+    def snapshot(self) -> TextSnapshot:
+        """Return an immutable view of the current text in O(1)."""
+
+        return TextSnapshot(self._rope, self._version, self._text)
+
+    def __len__(self) -> int:
+        return len(self._rope)
 
     @classmethod
     def load(cls, path: Path) -> "Document":
@@ -60,32 +197,72 @@ class Document:
             self.content = new_content
             self.is_dirty = True
 
-    def save(self, path: Path | None = None) -> None:
+    def apply_delta(self, position: int, removed: int, inserted: str, base_version: int, version: int) -> bool:
+        """Apply an editor delta made on top of *base_version*.
+
+        *position* and *removed* count UTF-16 code units, the unit Qt
+        reports edits in; they are mapped onto character indexes here so
+        text with emoji and other non-BMP characters stays aligned.
+
+        Returns ``False`` (leaving the content untouched) when the content
+        is not known to match the editor at *base_version*; the caller then
+        falls back to :meth:`sync_text`.
+        """
+
+        if self._editor_version != base_version or self._synced_at != self._version:
+            return False
+        start = self._rope.index_from_utf16(position)
+        end = self._rope.index_from_utf16(position + removed)
+        if start is None or end is None or end < start:
+            return False
+        if removed or inserted:
+            self._rope = self._rope.replace(start, end - start, inserted)
+            self._text = None
+            self._version += 1
+            self.is_dirty = True
+        self._editor_version = version
+        self._synced_at = self._version
+        return True
+
+    def synced_with(self, version: int) -> bool:
+        """Return True if ``content`` is the editor text at *version*."""
+
+        return self._editor_version == version and self._synced_at == self._version
+
+    def sync_text(self, text: str, version: int) -> None:
+        """Set the full editor text for *version* (fallback for deltas)."""
+
+        self.set_content(text)
+        self._editor_version = version
+        self._synced_at = self._version
+
+    # Persistence ----------------------------------------------------------
+
+    def save(self, path: Path | None = None) -> bool:
         """Persist the document to disk.
 
         If ``path`` is provided, it becomes the new document path. Otherwise
-        the existing ``self.path`` is used.
+        the existing ``self.path`` is used. Returns ``False`` when the file
+        already held identical content and nothing was written.
         """
 
         target = path or self.path
         if target is None:
             raise ValueError("Cannot save a document without a file path")
 
-        storage.write_text(target, self.content)
+        written = write_document(target, self.content, self.storage_format or "markdown")
 
-        # Best-effort: if this file is associated with a Crowdly story, update
-        # the change_date metadata automatically and mirror the storage_format
-        # into the body_format xattr so other components can reason about it.
-        try:
-            file_metadata.touch_change_date(target)
-            # Persist the body_format hint even for non-Crowdly documents; this
-            # is harmless on platforms without xattr support.
-            fmt = (self.storage_format or "").strip() or "markdown"
-            file_metadata.set_attr(target, file_metadata.FIELD_BODY_FORMAT, fmt)
-        except Exception:
-            # Never fail a save due to metadata issues.
-            pass
+        self.mark_saved(target, written)
+        return written
+
+    def mark_saved(self, path: Path, written: bool = True) -> None:
+        """Record that the current content was handed off for saving to *path*.
+
+        Used directly by the asynchronous save pipeline, which snapshots
+        ``content`` on the GUI thread and writes it in the background.
+        """
 
-        self.path = target
+        self.path = path
         self.is_dirty = False
-        self.last_saved_at = datetime.now()
+        if written:
+            self.last_saved_at = datetime.now()
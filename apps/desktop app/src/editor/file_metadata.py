@@ -5,20 +5,32 @@ metadata association survives renames.
 
 All values are stored as UTF-8 strings.
 
+Reads go through a small cache of :class:`MetadataRecord` objects keyed
+by path and validated against the file's (inode, mtime, ctime) stamp: one
+``stat`` answers repeated lookups, and a miss reads every
+``user.crowdly.*`` attribute in a single ``listxattr`` pass. Writes are
+collected in a :class:`MetadataBatch` and flushed together after the
+content write; values that are already current are not rewritten.
+
 Notes
 -----
 - Xattrs typically survive renames/moves on the same filesystem.
 - Copies may drop xattrs unless the tool preserves them (e.g. `cp -a`, `rsync -A`).
+- Changing an xattr updates the file's ctime, so external edits (e.g.
+  ``setfattr``) invalidate cached records.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime
 from pathlib import Path
 import errno
 import os
-from typing import Iterable
+import threading
+import time
+from typing import Dict, Iterable, Mapping, Tuple
 
 
 XATTR_PREFIX = "user.crowdly."
@@ -48,6 +60,12 @@ FIELD_BODY_TYPE = "body_type"  # "story" | "screenplay" (optional hint)
 FIELD_BODY_FORMAT = "body_format"
 # ISO timestamp of last known title.updated_at from the backend.
 FIELD_REMOTE_UPDATED_AT = "remote_updated_at"
+# Machine-readable counterparts of change_date / last_sync_date (epoch
+# milliseconds; the public fields only resolve minutes) and the hash of the
+# sync payload the backend last accepted.
+FIELD_CHANGE_MS = "change_ms"
+FIELD_LAST_SYNC_MS = "last_sync_ms"
+FIELD_SYNCED_HASH = "synced_hash"
 
 PUBLIC_FIELDS: tuple[str, ...] = (
     FIELD_AUTHOR_ID,
@@ -66,6 +84,9 @@ INTERNAL_FIELDS: tuple[str, ...] = (
     FIELD_SOURCE_URL,
     FIELD_BODY_FORMAT,
     FIELD_REMOTE_UPDATED_AT,
+    FIELD_CHANGE_MS,
+    FIELD_LAST_SYNC_MS,
+    FIELD_SYNCED_HASH,
 )
 
 ALL_FIELDS: tuple[str, ...] = PUBLIC_FIELDS + INTERNAL_FIELDS
@@ -86,6 +107,211 @@ class StoryMetadata:
     source_url: str | None = None
     body_format: str | None = None
     remote_updated_at: str | None = None
+    change_ms: str | None = None
+    last_sync_ms: str | None = None
+    synced_hash: str | None = None
+
+
+# (st_ino, st_mtime_ns, st_ctime_ns) of the file a record was read from.
+Stamp = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class MetadataRecord:
+    """All ``user.crowdly.*`` attributes of a file, without the prefix.
+
+    Treat ``attrs`` as read-only; records are shared through the cache.
+    """
+
+    attrs: Mapping[str, str] = dataclass_field(default_factory=dict)
+    stamp: Stamp | None = None
+
+    def get(self, field: str) -> str | None:
+        return self.attrs.get(field)
+
+    @property
+    def is_crowdly(self) -> bool:
+        """True for documents linked to a Crowdly story or screenplay."""
+
+        return bool(self.attrs.get(FIELD_STORY_ID) or self.attrs.get("screenplay_id"))
+
+    @property
+    def story(self) -> StoryMetadata:
+        return StoryMetadata(**{field: self.attrs.get(field) for field in ALL_FIELDS})
+
+
+_CACHE_LIMIT = 512
+_cache: "OrderedDict[str, MetadataRecord]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _stamp(path: Path) -> Stamp | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_ctime_ns
+
+
+def _store(path: Path, record: MetadataRecord) -> None:
+    key = os.path.abspath(path)
+    with _cache_lock:
+        _cache[key] = record
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_LIMIT:
+            _cache.popitem(last=False)
+
+
+def forget(path: Path) -> None:
+    """Drop the cached record for *path*."""
+
+    with _cache_lock:
+        _cache.pop(os.path.abspath(path), None)
+
+
+def _decode(raw: bytes) -> str | None:
+    try:
+        return raw.decode("utf-8", errors="replace")
+    except Exception:
+        return None
+
+
+def _read_attrs(path: Path) -> Dict[str, str]:
+    """Read every ``user.crowdly.*`` attribute of *path* from disk."""
+
+    if not hasattr(os, "listxattr"):
+        return {}
+    try:
+        names = os.listxattr(path)
+    except OSError:
+        return {}
+    attrs: Dict[str, str] = {}
+    for name in names:
+        if not name.startswith(XATTR_PREFIX):
+            continue
+        try:
+            value = _decode(os.getxattr(path, name))
+        except OSError:
+            # Removed between listxattr and getxattr.
+            continue
+        if value is not None:
+            attrs[name[len(XATTR_PREFIX) :]] = value
+    return attrs
+
+
+def read_record(path: Path) -> MetadataRecord:
+    """Return the metadata record of *path*, from cache when still valid."""
+
+    # Stat before reading: if the file changes while we read, the stored
+    # stamp is already outdated and the next lookup reads again.
+    stamp = _stamp(path)
+    if stamp is None:
+        return MetadataRecord()
+    key = os.path.abspath(path)
+    with _cache_lock:
+        record = _cache.get(key)
+        if record is not None and record.stamp == stamp:
+            _cache.move_to_end(key)
+            return record
+    record = MetadataRecord(_read_attrs(path), stamp)
+    _store(path, record)
+    return record
+
+
+def remember_copied(path: Path, raw_attrs: Mapping[str, bytes]) -> None:
+    """Seed the cache for *path* with xattrs just written onto it.
+
+    Used by :func:`editor.storage.write_text_atomic`, which copies the old
+    file's attributes onto the replacement, so the next lookup on the new
+    inode does not have to list them again.
+    """
+
+    stamp = _stamp(path)
+    if stamp is None:
+        return
+    attrs: Dict[str, str] = {}
+    for name, raw in raw_attrs.items():
+        if name.startswith(XATTR_PREFIX):
+            value = _decode(raw)
+            if value is not None:
+                attrs[name[len(XATTR_PREFIX) :]] = value
+    _store(path, MetadataRecord(attrs, stamp))
+
+
+class MetadataBatch:
+    """Collect metadata writes for one file and apply them together.
+
+    Use as a context manager; the batch is flushed on a clean exit::
+
+        with file_metadata.batch(path) as meta:
+            if meta.record.is_crowdly:
+                meta.set(FIELD_CHANGE_DATE, now_human())
+            meta.set(FIELD_BODY_FORMAT, "markdown")
+
+    Values that already match the cached record are skipped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._ops: Dict[str, str | None] = {}
+        self._record: MetadataRecord | None = None
+
+    @property
+    def record(self) -> MetadataRecord:
+        if self._record is None:
+            self._record = read_record(self.path)
+        return self._record
+
+    def set(self, field: str, value: str) -> None:
+        self._ops[field] = value or ""
+
+    def remove(self, field: str) -> None:
+        self._ops[field] = None
+
+    def flush(self) -> bool:
+        """Apply staged writes; returns False if any of them failed."""
+
+        ops, self._ops = self._ops, {}
+        if not ops:
+            return True
+        record = read_record(self.path)
+        attrs = dict(record.attrs)
+        ok = True
+        changed = False
+        for field, value in ops.items():
+            if value is None:
+                if field not in attrs:
+                    continue
+                if _remove_raw(self.path, field):
+                    del attrs[field]
+                    changed = True
+                else:
+                    ok = False
+            else:
+                if attrs.get(field) == value:
+                    continue
+                if _set_raw(self.path, field, value):
+                    attrs[field] = value
+                    changed = True
+                else:
+                    ok = False
+        if changed:
+            stamp = _stamp(self.path)
+            if stamp is not None:
+                _store(self.path, MetadataRecord(attrs, stamp))
+        self._record = None
+        return ok
+
+    def __enter__(self) -> "MetadataBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
+def batch(path: Path) -> MetadataBatch:
+    return MetadataBatch(path)
 
 
 def now_human() -> str:
@@ -105,6 +331,35 @@ def parse_human(value: str | None) -> datetime | None:
         return None
 
 
+def now_ms() -> int:
+    """Current time in epoch milliseconds (for the ``*_ms`` fields)."""
+
+    return time.time_ns() // 1_000_000
+
+
+def _parse_ms(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def has_unsynced_changes(metadata: StoryMetadata) -> bool:
+    """True when the file changed after the snapshot last synced.
+
+    Uses the millisecond fields when both are present and falls back to the
+    minute-resolution public dates for files written by older versions.
+    """
+
+    changed_ms = _parse_ms(metadata.change_ms)
+    synced_ms = _parse_ms(metadata.last_sync_ms)
+    if changed_ms is not None and synced_ms is not None:
+        return changed_ms > synced_ms
+    changed_at = parse_human(metadata.change_date)
+    synced_at = parse_human(metadata.last_sync_date)
+    return changed_at is not None and synced_at is not None and changed_at > synced_at
+
+
 def has_story_metadata(path: Path) -> bool:
     """Return True if *path* appears to be associated with a Crowdly story."""
 
@@ -115,13 +370,11 @@ def is_crowdly_document(path: Path) -> bool:
     """Return True if *path* looks like a Crowdly-linked document.
 
     This includes both regular stories (story_id) and screenplays (screenplay_id).
+    Screenplays created from the Crowdly template store their association via
+    a dedicated ``screenplay_id`` xattr.
     """
 
-    if has_story_metadata(path):
-        return True
-    # Screenplays created from the Crowdly template store their association via
-    # a dedicated ``screenplay_id`` xattr.
-    return bool(get_attr(path, "screenplay_id"))
+    return read_record(path).is_crowdly
 
 
 def xattr_key(field: str) -> str:
@@ -131,21 +384,7 @@ def xattr_key(field: str) -> str:
 def get_attr(path: Path, field: str) -> str | None:
     """Get xattr value for *field* on *path*, returning None if missing/unsupported."""
 
-    key = xattr_key(field)
-    try:
-        raw = os.getxattr(path, key)
-    except OSError as exc:
-        if exc.errno in (errno.ENODATA, errno.EOPNOTSUPP, errno.ENOTSUP) or (
-            _ERRNO_ENOATTR is not None and exc.errno == _ERRNO_ENOATTR
-        ):
-            return None
-        # Missing file etc.
-        return None
-
-    try:
-        return raw.decode("utf-8", errors="replace")
-    except Exception:
-        return None
+    return read_record(path).get(field)
 
 
 def set_attr(path: Path, field: str, value: str) -> bool:
@@ -154,6 +393,18 @@ def set_attr(path: Path, field: str, value: str) -> bool:
     Returns True on success, False on unsupported/permission errors.
     """
 
+    meta = batch(path)
+    meta.set(field, value)
+    return meta.flush()
+
+
+def remove_attr(path: Path, field: str) -> bool:
+    meta = batch(path)
+    meta.remove(field)
+    return meta.flush()
+
+
+def _set_raw(path: Path, field: str, value: str) -> bool:
     key = xattr_key(field)
     try:
         os.setxattr(path, key, (value or "").encode("utf-8"))
@@ -164,7 +415,7 @@ def set_attr(path: Path, field: str, value: str) -> bool:
         return False
 
 
-def remove_attr(path: Path, field: str) -> bool:
+def _remove_raw(path: Path, field: str) -> bool:
     key = xattr_key(field)
     try:
         os.removexattr(path, key)
@@ -178,24 +429,9 @@ def remove_attr(path: Path, field: str) -> bool:
 
 
 def read_story_metadata(path: Path) -> StoryMetadata:
-    """Read all known metadata fields from xattrs."""
-
-    data = {field: get_attr(path, field) for field in ALL_FIELDS}
-    return StoryMetadata(
-        author_id=data.get(FIELD_AUTHOR_ID),
-        initiator_id=data.get(FIELD_INITIATOR_ID),
-        story_id=data.get(FIELD_STORY_ID),
-        story_title=data.get(FIELD_STORY_TITLE),
-        genre=data.get(FIELD_GENRE),
-        tags=data.get(FIELD_TAGS),
-        description=data.get(FIELD_DESCRIPTION),
-        creation_date=data.get(FIELD_CREATION_DATE),
-        change_date=data.get(FIELD_CHANGE_DATE),
-        last_sync_date=data.get(FIELD_LAST_SYNC_DATE),
-        source_url=data.get(FIELD_SOURCE_URL),
-        body_format=data.get(FIELD_BODY_FORMAT),
-        remote_updated_at=data.get(FIELD_REMOTE_UPDATED_AT),
-    )
+    """Read all known metadata fields from xattrs (one cached pass)."""
+
+    return read_record(path).story
 
 
 def _iter_items(metadata: StoryMetadata) -> Iterable[tuple[str, str | None]]:
@@ -212,6 +448,9 @@ def _iter_items(metadata: StoryMetadata) -> Iterable[tuple[str, str | None]]:
     yield FIELD_SOURCE_URL, metadata.source_url
     yield FIELD_BODY_FORMAT, metadata.body_format
     yield FIELD_REMOTE_UPDATED_AT, metadata.remote_updated_at
+    yield FIELD_CHANGE_MS, metadata.change_ms
+    yield FIELD_LAST_SYNC_MS, metadata.last_sync_ms
+    yield FIELD_SYNCED_HASH, metadata.synced_hash
 
 
 def write_story_metadata(path: Path, metadata: StoryMetadata, *, remove_missing: bool = False) -> None:
@@ -221,12 +460,13 @@ def write_story_metadata(path: Path, metadata: StoryMetadata, *, remove_missing:
     Otherwise None values are ignored.
     """
 
-    for field, value in _iter_items(metadata):
-        if value is None:
-            if remove_missing:
-                remove_attr(path, field)
-            continue
-        set_attr(path, field, value)
+    with batch(path) as meta:
+        for field, value in _iter_items(metadata):
+            if value is None:
+                if remove_missing:
+                    meta.remove(field)
+                continue
+            meta.set(field, value)
 
 
 def touch_change_date(path: Path, *, when: str | None = None) -> None:
@@ -237,7 +477,9 @@ def touch_change_date(path: Path, *, when: str | None = None) -> None:
 
     if not is_crowdly_document(path):
         return
-    set_attr(path, FIELD_CHANGE_DATE, when or now_human())
+    with batch(path) as meta:
+        meta.set(FIELD_CHANGE_DATE, when or now_human())
+        meta.set(FIELD_CHANGE_MS, str(now_ms()))
 
 
 def touch_last_sync_date(path: Path, *, when: str | None = None) -> None:
@@ -245,7 +487,24 @@ def touch_last_sync_date(path: Path, *, when: str | None = None) -> None:
 
     if not is_crowdly_document(path):
         return
-    set_attr(path, FIELD_LAST_SYNC_DATE, when or now_human())
+    with batch(path) as meta:
+        meta.set(FIELD_LAST_SYNC_DATE, when or now_human())
+        meta.set(FIELD_LAST_SYNC_MS, str(now_ms()))
+
+
+def mark_synced(path: Path, payload_hash: str, *, snapshot_ms: int) -> None:
+    """Record that the backend accepted the payload taken at *snapshot_ms*.
+
+    *snapshot_ms* is when the uploaded text was read, not when the upload
+    finished, so edits made while it ran still count as unsynced.
+    """
+
+    if not is_crowdly_document(path):
+        return
+    with batch(path) as meta:
+        meta.set(FIELD_LAST_SYNC_DATE, now_human())
+        meta.set(FIELD_LAST_SYNC_MS, str(snapshot_ms))
+        meta.set(FIELD_SYNCED_HASH, payload_hash)
 
 
 def set_genre(path: Path, genre: str) -> None:
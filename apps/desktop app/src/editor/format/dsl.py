@@ -0,0 +1,136 @@
+"""Block-level parsing shared by the `.story` and `.screenplay` DSLs.
+
+Both formats use the same one-line ``[tag attrs]body[/tag]`` shape. This
+module turns DSL text into a flat list of :class:`DslBlock` items that
+mirror what the respective ``dsl_to_html`` functions emit, so renderers
+other than HTML (e.g. a direct ``QTextDocument`` builder in the GUI layer)
+can walk the structure without generating and re-parsing markup.
+
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .styles import AttrKey, freeze_attrs
+
+TAG_RAW = "raw"
+TAG_IMAGE = "image"
+
+
+@dataclass(frozen=True)
+class DslBlock:
+    """One rendered block of a DSL document.
+
+    ``tag`` is the DSL tag name, ``"image"`` or ``"raw"`` for untagged
+    text. ``attrs`` is the interned attribute key (see
+    :func:`styles.freeze_attrs`); ``src`` is only set for images.
+    """
+
+    tag: str
+    text: str
+    attrs: AttrKey = ()
+    src: str | None = None
+
+    @property
+    def attrs_dict(self) -> Dict[str, str]:
+        return dict(self.attrs)
+
+
+def parse_blocks(
+    text: str,
+    tags: Iterable[str],
+    parse_header: Callable[[str], Tuple[str, dict[str, str]]],
+    images: bool = False,
+) -> List[DslBlock]:
+    """Parse DSL *text* into blocks using the same rules as ``dsl_to_html``.
+
+    Parameters
+    ----------
+    text:
+        DSL source.
+    tags:
+        Tag names recognised in the one-line ``[tag attrs]body[/tag]`` form.
+    parse_header:
+        Callable splitting a ``[tag attrs]`` header into ``(tag, attrs)``.
+    images:
+        When true, ``[image attrs](path)[/image]`` lines become image blocks.
+
+    Untagged lines are accumulated into a single ``raw`` block until the
+    next tagged line, exactly like the HTML renderer does.
+    """
+
+    tag_names = tuple(tags)
+    blocks: List[DslBlock] = []
+    raw_buf: list[str] = []
+    # Headers repeat heavily ("[action]", "[paragraph left]"), so parse and
+    # intern each distinct one only once per call.
+    header_keys: Dict[str, AttrKey] = {}
+
+    def attrs_for(header: str) -> AttrKey:
+        key = header_keys.get(header)
+        if key is None:
+            _tag, attrs = parse_header(header + "]")
+            key = header_keys[header] = freeze_attrs(attrs)
+        return key
+
+    def flush_raw() -> None:
+        if raw_buf:
+            body = "\n".join(raw_buf).strip("\n")
+            if body:
+                blocks.append(DslBlock(tag=TAG_RAW, text=body))
+            raw_buf.clear()
+
+    for line in (text or "").splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if images and stripped.startswith("[image") and stripped.endswith("[/image]") and "](" in stripped:
+            flush_raw()
+            try:
+                header, rest = stripped.split("]", 1)
+                if not rest.startswith("("):
+                    raise ValueError
+                path_part, _closing = rest.split(")[/image]", 1)
+                blocks.append(DslBlock(tag=TAG_IMAGE, text="", attrs=attrs_for(header), src=path_part[1:]))
+            except Exception:
+                blocks.append(DslBlock(tag=TAG_RAW, text=stripped))
+            continue
+
+        for tag_name in tag_names:
+            close_suffix = f"[/{tag_name}]"
+            if stripped.startswith(f"[{tag_name}") and stripped.endswith(close_suffix):
+                flush_raw()
+                header, body = stripped.split("]", 1)
+                blocks.append(DslBlock(tag=tag_name, text=body[: -len(close_suffix)], attrs=attrs_for(header)))
+                break
+        else:
+            raw_buf.append(line)
+
+    flush_raw()
+    return blocks
+
+
+def blocks_to_markdown(blocks: Iterable[DslBlock], headings: Dict[str, int]) -> str:
+    """Render *blocks* as Markdown text.
+
+    *headings* maps tag names to heading levels (e.g. ``{"story_title": 1}``);
+    other tags become plain paragraphs. Inline styles and alignment have no
+    Markdown equivalent and are dropped, as when the preview exports its
+    content via ``QTextDocument.toMarkdown``.
+    """
+
+    parts: List[str] = []
+    for block in blocks:
+        if block.tag == TAG_IMAGE:
+            parts.append(f"![]({block.src or ''})")
+            continue
+        text = block.text.strip("\n")
+        if not text:
+            continue
+        level = headings.get(block.tag)
+        parts.append(f"{'#' * level} {text}" if level else text)
+    return "\n\n".join(parts) + "\n" if parts else ""
@@ -17,6 +17,7 @@ from html import escape
 from typing import List, Tuple
 
 from .. import story_sync
+from . import dsl, styles
 
 
 class ScreenplayBlockType(Enum):
@@ -147,95 +148,47 @@ def _parse_tag_and_attrs(header: str) -> Tuple[str, dict[str, str]]:
 
 
 def _normalise_css_color(value: str) -> str:
-    """Normalise *value* into a CSS color string.
+    """Normalise *value* into a CSS color string (see :mod:`.styles`)."""
 
-    Accepts:
-    - Named CSS colors (returned unchanged).
-    - 3/6-digit hex without "#" (e.g. "333", "3F5B2A", "151467"); these
-      are converted to "#333", "#3F5B2A", "#151467".
-    - Values already starting with "#" are returned unchanged.
+    return styles.normalise_css_color(value)
+
+
+def _style_from_attrs(attrs: dict[str, str]) -> str:
+    """Map tag attributes to an inline CSS style string.
+
+    Delegates to :func:`styles.style_from_attrs`, which interns the result
+    per distinct attribute combination.
     """
 
-    if not value:
-        return value
-    v = value.strip()
-    if v.startswith("#"):
-        return v
-    hex_candidate = v
-    if len(hex_candidate) in (3, 6) and all(c in "0123456789abcdefABCDEF" for c in hex_candidate):
-        return "#" + hex_candidate
-    return value
+    return styles.style_from_attrs(attrs)
 
 
-def _style_from_attrs(attrs: dict[str, str]) -> str:
-    """Map tag attributes to inline CSS style string.
-
-    Supported attributes (all optional):
-    - align / left|center|right|justify
-    - width, height
-    - bold, italic, underlined, stroke-through/strikethrough
-    - font_color=<css-color> or color=<css-color>
-    - font_size=<number>[unit]
-    - text_wrap=<css-color>
-    - word_wrap=<css-color>
+def dsl_to_blocks(text: str) -> List[dsl.DslBlock]:
+    """Parse `.screenplay` DSL text into render-ready blocks.
+
+    The result mirrors :func:`dsl_to_html` block for block, including the
+    default centring of screenplay titles without an explicit alignment.
     """
 
-    styles: list[str] = []
-
-    # Alignment
-    align = attrs.get("align")
-    if align in {"left", "center", "right", "justify"}:
-        styles.append(f"text-align:{align}")
-
-    # Block dimensions
-    width = attrs.get("width")
-    if width:
-        styles.append(f"width:{width}")
-
-    height = attrs.get("height")
-    if height:
-        styles.append(f"height:{height}")
-
-    # Font weight / style
-    if "bold" in attrs:
-        styles.append("font-weight:bold")
-
-    if "italic" in attrs:
-        styles.append("font-style:italic")
-
-    # Text decoration
-    decorations: list[str] = []
-    if "underlined" in attrs:
-        decorations.append("underline")
-    if "stroke-through" in attrs or "strikethrough" in attrs:
-        decorations.append("line-through")
-    if decorations:
-        styles.append(f"text-decoration:{' '.join(decorations)}")
-
-    # Colors and font size
-    font_color = attrs.get("font_color") or attrs.get("color")
-    if font_color:
-        css_color = _normalise_css_color(font_color)
-        styles.append(f"color:{css_color}")
-
-    font_size = attrs.get("font_size")
-    if font_size:
-        if font_size.isdigit():
-            styles.append(f"font-size:{font_size}px")
-        else:
-            styles.append(f"font-size:{font_size}")
-
-    # Text/word wrap highlighting – both currently map to background-color.
-    text_wrap = attrs.get("text_wrap")
-    word_wrap = attrs.get("word_wrap")
-    bg_color = text_wrap or word_wrap
-    if bg_color:
-        css_bg = _normalise_css_color(bg_color)
-        styles.append(f"background-color:{css_bg}")
-
-    if not styles:
-        return ""
-    return " style=\"" + "; ".join(styles) + "\""
+    blocks = dsl.parse_blocks(
+        text,
+        ("screenplay_title", "scene_slugline", "action"),
+        _parse_tag_and_attrs,
+    )
+    result: List[dsl.DslBlock] = []
+    for block in blocks:
+        if block.tag == "screenplay_title" and "align" not in block.attrs_dict:
+            attrs = dict(block.attrs)
+            attrs["align"] = "center"
+            block = dsl.DslBlock(tag=block.tag, text=block.text, attrs=styles.freeze_attrs(attrs))
+        result.append(block)
+    return result
+
+
+def dsl_to_markdown(text: str) -> str:
+    """Render `.screenplay` DSL text as Markdown (titles as ``#``/``##`` headings)."""
+
+    return dsl.blocks_to_markdown(dsl_to_blocks(text), {"screenplay_title": 1, "scene_slugline": 2})
 
 
 def dsl_to_html(text: str) -> str:
@@ -0,0 +1,213 @@
+"""Interned inline styles for `.story` / `.screenplay` DSL attributes.
+
+Real documents only use a handful of distinct attribute combinations
+(alignment, bold, a colour or two), yet every block carries its own
+attribute dict. This module maps a frozen, order-independent attribute
+key to a precomputed CSS ``style="..."`` fragment and, for callers that
+build a :class:`QTextDocument` directly, to reusable
+``QTextBlockFormat`` / ``QTextCharFormat`` instances.
+
+The CSS side is GUI-agnostic. Qt formats are created lazily on first use
+so that exporters and tests can import this module without PySide6.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Tuple
+
+AttrKey = Tuple[Tuple[str, str], ...]
+
+_ALIGNMENTS = ("left", "center", "right", "justify")
+
+# Qt formats keyed by attribute key. They are only populated when the GUI
+# layer asks for them; see :func:`block_format_for_attrs`.
+_BLOCK_FORMATS: Dict[AttrKey, Any] = {}
+_CHAR_FORMATS: Dict[AttrKey, Any] = {}
+
+
+def freeze_attrs(attrs: Mapping[str, str] | None) -> AttrKey:
+    """Return a hashable, order-independent key for *attrs*."""
+
+    if not attrs:
+        return ()
+    return tuple(sorted(attrs.items()))
+
+
+def normalise_css_color(value: str) -> str:
+    """Normalise *value* into a CSS color string.
+
+    Accepts:
+    - Named CSS colors (returned unchanged).
+    - 3/6-digit hex without "#" (e.g. "333", "3F5B2A", "151467"); these
+      are converted to "#333", "#3F5B2A", "#151467".
+    - Values already starting with "#" are returned unchanged.
+    """
+
+    if not value:
+        return value
+    v = value.strip()
+    if v.startswith("#"):
+        return v
+    hex_candidate = v
+    if len(hex_candidate) in (3, 6) and all(c in "0123456789abcdefABCDEF" for c in hex_candidate):
+        return "#" + hex_candidate
+    return value
+
+
+@lru_cache(maxsize=512)
+def _style_for_key(key: AttrKey) -> str:
+    attrs = dict(key)
+    styles: list[str] = []
+
+    # Alignment
+    align = attrs.get("align")
+    if align in _ALIGNMENTS:
+        styles.append(f"text-align:{align}")
+
+    # Block dimensions
+    width = attrs.get("width")
+    if width:
+        styles.append(f"width:{width}")
+
+    height = attrs.get("height")
+    if height:
+        styles.append(f"height:{height}")
+
+    # Font weight / style
+    if "bold" in attrs:
+        styles.append("font-weight:bold")
+
+    if "italic" in attrs:
+        styles.append("font-style:italic")
+
+    # Text decoration
+    decorations: list[str] = []
+    if "underlined" in attrs:
+        decorations.append("underline")
+    if "stroke-through" in attrs or "strikethrough" in attrs:
+        decorations.append("line-through")
+    if decorations:
+        styles.append(f"text-decoration:{' '.join(decorations)}")
+
+    # Colors and font size
+    font_color = attrs.get("font_color") or attrs.get("color")
+    if font_color:
+        styles.append(f"color:{normalise_css_color(font_color)}")
+
+    font_size = attrs.get("font_size")
+    if font_size:
+        if font_size.isdigit():
+            styles.append(f"font-size:{font_size}px")
+        else:
+            styles.append(f"font-size:{font_size}")
+
+    # Text/word wrap highlighting – both currently map to background-color.
+    bg_color = attrs.get("text_wrap") or attrs.get("word_wrap")
+    if bg_color:
+        styles.append(f"background-color:{normalise_css_color(bg_color)}")
+
+    if not styles:
+        return ""
+    return " style=\"" + "; ".join(styles) + "\""
+
+
+def style_from_attrs(attrs: Mapping[str, str] | None) -> str:
+    """Map tag attributes to an inline CSS ``style="..."`` fragment.
+
+    Supported attributes (all optional):
+    - align / left|center|right|justify
+    - width, height
+    - bold, italic, underlined, stroke-through/strikethrough
+    - font_color=<css-color> or color=<css-color>
+    - font_size=<number>[unit]
+    - text_wrap=<css-color>
+    - word_wrap=<css-color>
+
+    The result is memoised per distinct attribute combination, so repeated
+    blocks share a single string instance.
+    """
+
+    return _style_for_key(freeze_attrs(attrs))
+
+
+def block_format_for_attrs(attrs: Mapping[str, str] | None) -> Any:
+    """Return a shared ``QTextBlockFormat`` for *attrs*.
+
+    Only alignment is block-level; sizing attributes are ignored because
+    Qt's rich-text engine does not apply them to paragraphs either. The
+    returned object is cached and must not be mutated; copy it first when
+    a caller needs to adjust it.
+    """
+
+    key = freeze_attrs(attrs)
+    fmt = _BLOCK_FORMATS.get(key)
+    if fmt is not None:
+        return fmt
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QTextBlockFormat
+
+    fmt = QTextBlockFormat()
+    align = dict(key).get("align")
+    if align == "left":
+        fmt.setAlignment(Qt.AlignLeft)
+    elif align == "center":
+        fmt.setAlignment(Qt.AlignHCenter)
+    elif align == "right":
+        fmt.setAlignment(Qt.AlignRight)
+    elif align == "justify":
+        fmt.setAlignment(Qt.AlignJustify)
+
+    _BLOCK_FORMATS[key] = fmt
+    return fmt
+
+
+def char_format_for_attrs(attrs: Mapping[str, str] | None) -> Any:
+    """Return a shared ``QTextCharFormat`` for *attrs*.
+
+    Font sizes are deliberately not applied: the preview strips them from
+    HTML as well so that zooming keeps working. The returned object is
+    cached and must not be mutated.
+    """
+
+    key = freeze_attrs(attrs)
+    fmt = _CHAR_FORMATS.get(key)
+    if fmt is not None:
+        return fmt
+
+    from PySide6.QtGui import QColor, QFont, QTextCharFormat
+
+    attrs_dict = dict(key)
+    fmt = QTextCharFormat()
+    if "bold" in attrs_dict:
+        fmt.setFontWeight(QFont.Bold)
+    if "italic" in attrs_dict:
+        fmt.setFontItalic(True)
+    if "underlined" in attrs_dict:
+        fmt.setFontUnderline(True)
+    if "stroke-through" in attrs_dict or "strikethrough" in attrs_dict:
+        fmt.setFontStrikeOut(True)
+
+    font_color = attrs_dict.get("font_color") or attrs_dict.get("color")
+    if font_color:
+        color = QColor(normalise_css_color(font_color))
+        if color.isValid():
+            fmt.setForeground(color)
+
+    bg_color = attrs_dict.get("text_wrap") or attrs_dict.get("word_wrap")
+    if bg_color:
+        color = QColor(normalise_css_color(bg_color))
+        if color.isValid():
+            fmt.setBackground(color)
+
+    _CHAR_FORMATS[key] = fmt
+    return fmt
+
+
+def clear_caches() -> None:
+    """Drop all interned styles and formats (mainly for tests)."""
+
+    _style_for_key.cache_clear()
+    _BLOCK_FORMATS.clear()
+    _CHAR_FORMATS.clear()
@@ -59,7 +59,9 @@ def detect_kind_and_format(path: Path) -> tuple[str, str]:
         # `.screenplay` files we treat the extension as the source of truth
         # for the storage format so that older metadata values like
         # "markdown" do not downgrade the classification.
-        md = file_metadata.read_story_metadata(path)
+        # One cached record answers every lookup below.
+        record = file_metadata.read_record(path)
+        md = record.story
         body_fmt = (md.body_format or "").strip().lower()
         if body_fmt == FORMAT_STORY_V1:
             storage_format = FORMAT_STORY_V1
@@ -69,9 +71,9 @@ def detect_kind_and_format(path: Path) -> tuple[str, str]:
             storage_format = FORMAT_MARKDOWN
 
         # Determine kind based on Crowdly story/screenplay linkage.
-        if md.story_id or file_metadata.get_attr(path, "story_id"):
+        if md.story_id:
             kind = KIND_STORY
-        elif file_metadata.get_attr(path, "screenplay_id"):
+        elif record.get("screenplay_id"):
             kind = KIND_SCREENPLAY
     except Exception:
         # Never let metadata issues break loading; fall back to safe defaults.
@@ -0,0 +1,170 @@
+"""On-disk cache of backend GET responses for conditional revalidation.
+
+Each successful JSON GET is stored with its ``ETag`` / ``Last-Modified``
+validators under ``~/.cache/crowdly_editor/http/``, keyed by the URL and
+the user the request was made for (so private responses are never shared
+between accounts). The next request for the same key sends
+``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified`` reply is
+answered from the cached body without transferring it again.
+
+Entries are never served without asking the server first, so the cache
+cannot return outdated data; it only saves bandwidth and parsing. This
+module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+CACHE_DIR_NAME = "crowdly_editor"
+
+# Oldest entries beyond this count are removed, checked once every
+# _PRUNE_INTERVAL stores (and on the first store of the process).
+_MAX_ENTRIES = 500
+_PRUNE_INTERVAL = 50
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with the validators needed to revalidate it."""
+
+    url: str
+    user: str
+    body: str
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validator_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def default_cache_dir() -> Path:
+    return Path.home().joinpath(".cache", CACHE_DIR_NAME, "http")
+
+
+class HttpCache:
+    """File-per-entry response cache; safe to share between threads."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self._lock = threading.Lock()
+        self._stores_until_prune = 0
+
+    def _entry_path(self, url: str, user: str) -> Path:
+        digest = hashlib.sha256(f"{user}\n{url}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def lookup(self, url: str, user: str) -> CachedResponse | None:
+        try:
+            raw = json.loads(self._entry_path(url, user).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(raw, dict) or raw.get("url") != url or raw.get("user") != user:
+            return None
+        body = raw.get("body")
+        if not isinstance(body, str):
+            return None
+        return CachedResponse(
+            url=url,
+            user=user,
+            body=body,
+            content_type=str(raw.get("content_type") or ""),
+            etag=raw.get("etag") if isinstance(raw.get("etag"), str) else None,
+            last_modified=raw.get("last_modified") if isinstance(raw.get("last_modified"), str) else None,
+        )
+
+    def store(self, entry: CachedResponse) -> None:
+        """Persist *entry*; entries without validators are not worth keeping."""
+
+        if not entry.etag and not entry.last_modified:
+            self.discard(entry.url, entry.user)
+            return
+
+        payload = {
+            "url": entry.url,
+            "user": entry.user,
+            "body": entry.body,
+            "content_type": entry.content_type,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            if not self._write_private(self._entry_path(entry.url, entry.user), json.dumps(payload)):
+                return
+            self._stores_until_prune -= 1
+            if self._stores_until_prune > 0:
+                return
+            self._stores_until_prune = _PRUNE_INTERVAL
+        # Listing the directory is O(entries); other stores need not wait.
+        self._prune()
+
+    def _write_private(self, path: Path, text: str) -> bool:
+        """Replace *path* with *text*, readable by the owner only.
+
+        Cached bodies may belong to private stories. Entries are disposable,
+        so this skips the fsyncs and bookkeeping of document saves.
+        """
+
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        return True
+
+    def discard(self, url: str, user: str) -> None:
+        try:
+            self._entry_path(url, user).unlink()
+        except OSError:
+            pass
+
+    def _prune(self) -> None:
+        try:
+            entries = [(p.stat().st_mtime, p) for p in self.directory.glob("*.json")]
+        except OSError:
+            return
+        if len(entries) <= _MAX_ENTRIES:
+            return
+        entries.sort()
+        for _mtime, path in entries[: len(entries) - _MAX_ENTRIES]:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+
+
+_shared: HttpCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> HttpCache:
+    """Return the process-wide response cache."""
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HttpCache()
+        return _shared
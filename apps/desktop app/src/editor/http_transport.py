@@ -0,0 +1,461 @@
+"""Pooled keep-alive HTTP transport for the Crowdly backend.
+
+``urllib.request.urlopen`` opens a new TCP (and TLS) connection for every
+call. :class:`HttpTransport` keeps a small pool of idle
+``http.client`` connections per (scheme, host, port) and reuses them, so a
+sync that makes dozens of calls pays for one handshake.
+
+* Connections are checked out by one thread at a time; the pool itself is
+  guarded by a lock, so a transport can be shared between worker threads.
+* Responses are requested with ``Accept-Encoding: gzip`` and decoded
+  transparently; request bodies above a threshold are sent gzip-encoded
+  (the backend's JSON body parser inflates them).
+* Idempotent requests (GET, HEAD, PUT, DELETE, OPTIONS) are retried on
+  network errors and 429/502/503/504 with jittered exponential backoff.
+  Any request is retried once on a fresh connection when a pooled
+  keep-alive connection turns out to have been closed by the server.
+* Idle connections are dropped after a few seconds, below Node's default
+  keep-alive timeout of 5 s, so reuse rarely hits a closed socket.
+* ``http_proxy`` / ``https_proxy`` / ``no_proxy`` are honoured like urllib does.
+* :meth:`HttpTransport.open_stream` opens a dedicated, unpooled connection
+  for long-lived responses (Server-Sent Events) that are read line by line.
+
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Tuple
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "crowdly-editor/0.1"
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Errors that mean a reused keep-alive connection was already closed.
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+
+
+class TransportError(OSError):
+    """The request could not be completed (DNS, connect, timeout, reset, ...)."""
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fully read HTTP response with a decoded (un-gzipped) body."""
+
+    status: int
+    headers: Mapping[str, str] = field(default_factory=dict)  # lower-case names
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def content_type(self) -> str:
+        return (self.headers.get("content-type") or "").split(";", 1)[0].strip().lower()
+
+    @property
+    def charset(self) -> str:
+        for part in (self.headers.get("content-type") or "").split(";")[1:]:
+            name, _, value = part.partition("=")
+            if name.strip().lower() == "charset" and value.strip():
+                return value.strip().strip('"')
+        return "utf-8"
+
+    def text(self) -> str:
+        return self.body.decode(self.charset, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+
+class HttpStream:
+    """An unread streaming response on its own connection.
+
+    :meth:`close` may be called from another thread to interrupt a blocked
+    :meth:`readline`.
+    """
+
+    def __init__(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse, sock: socket.socket) -> None:
+        self._conn = conn
+        self._resp = resp
+        # Kept separately: the connection forgets its socket when the
+        # response is delimited by closing it (HTTP/1.0, Connection: close).
+        self._sock = sock
+        self.status = resp.status
+        self.headers = {name.lower(): value for name, value in resp.getheaders()}
+
+    @property
+    def content_type(self) -> str:
+        return (self.headers.get("content-type") or "").split(";", 1)[0].strip().lower()
+
+    def readline(self) -> bytes:
+        """Return the next line (empty at end of stream).
+
+        Raises :class:`TransportError` on timeouts and network errors.
+        """
+
+        try:
+            return self._resp.readline()
+        except (OSError, http.client.HTTPException, ValueError, AttributeError) as exc:
+            # ValueError/AttributeError: the stream was closed under us.
+            raise TransportError(f"Stream interrupted: {exc}") from exc
+
+    def close(self) -> None:
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._conn.close()
+        self._resp.close()
+
+
+_Key = Tuple[str, str, int, str | None]
+
+
+@dataclass
+class _Idle:
+    conn: http.client.HTTPConnection
+    since: float
+
+
+class HttpTransport:
+    """Thread-safe keep-alive connection pool.
+
+    Parameters
+    ----------
+    timeout:
+        Default socket timeout in seconds for connect and each read.
+    max_idle_per_host:
+        Idle connections kept per host; more may be open concurrently.
+    idle_timeout:
+        Seconds after which an idle connection is closed instead of reused.
+    retries:
+        Extra attempts for idempotent requests.
+    backoff_base, backoff_max:
+        The sleep before retry *n* is uniform in
+        ``[0, min(backoff_max, backoff_base * 2 ** n)]``.
+    gzip_min_bytes:
+        Request bodies at least this large are gzip-encoded; ``0`` disables
+        request compression.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 10.0,
+        max_idle_per_host: int = 4,
+        idle_timeout: float = 4.0,
+        retries: int = 2,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        gzip_min_bytes: int = 4096,
+    ) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.gzip_min_bytes = gzip_min_bytes
+        self._idle: Dict[_Key, List[_Idle]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    # Pool -----------------------------------------------------------------
+
+    def _context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> str | None:
+        try:
+            proxy = urllib.request.getproxies().get(scheme)
+            if proxy and not urllib.request.proxy_bypass(host):
+                return proxy
+        except Exception:
+            pass
+        return None
+
+    def _checkout(self, key: _Key) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` for *key*."""
+
+        now = time.monotonic()
+        stale: List[http.client.HTTPConnection] = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                entry = idle.pop()
+                if now - entry.since <= self.idle_timeout:
+                    conn = entry.conn
+                    break
+                stale.append(entry.conn)
+        for old in stale:
+            old.close()
+        if conn is not None:
+            return conn, True
+        return self._connect(key), False
+
+    def _connect(self, key: _Key) -> http.client.HTTPConnection:
+        scheme, host, port, proxy = key
+        if proxy:
+            proxy_parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+            proxy_host = proxy_parts.hostname or ""
+            proxy_port = proxy_parts.port or 80
+            if scheme == "https":
+                conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                    proxy_host, proxy_port, timeout=self.timeout, context=self._context()
+                )
+                conn.set_tunnel(host, port)
+                return conn
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._context())
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _checkin(self, key: _Key, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(_Idle(conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for entry in idle:
+                entry.conn.close()
+
+    # Requests -------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        json_body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        redirects: int = 5,
+    ) -> HttpResponse:
+        """Perform a request and return the fully read response.
+
+        HTTP error statuses are returned, not raised; :class:`TransportError`
+        is raised when no response could be obtained.
+        """
+
+        method = method.upper()
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise TransportError(f"Unsupported URL: {url}")
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, host)
+        key: _Key = (scheme, host, port, proxy)
+
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        if proxy and scheme == "http":
+            # Plain HTTP through a proxy uses the absolute URL as target.
+            target = f"http://{parts.netloc}{target}"
+
+        send_headers: Dict[str, str] = {
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            send_headers["Content-Type"] = "application/json"
+        if headers:
+            send_headers.update(headers)
+        if body is not None and self.gzip_min_bytes and len(body) >= self.gzip_min_bytes:
+            body = gzip.compress(body, compresslevel=5)
+            send_headers["Content-Encoding"] = "gzip"
+
+        attempts = 1
+        if method in IDEMPOTENT_METHODS:
+            attempts += max(0, self.retries if retries is None else retries)
+        attempt = 0
+        while True:
+            try:
+                response = self._send(key, method, target, body, send_headers, timeout)
+            except TransportError:
+                attempt += 1
+                if attempt >= attempts:
+                    raise
+                self._sleep_before_retry(attempt, None)
+                continue
+            attempt += 1
+            if response.status in RETRY_STATUSES and attempt < attempts:
+                self._sleep_before_retry(attempt, response.headers.get("retry-after"))
+                continue
+            location = response.headers.get("location")
+            if response.status in REDIRECT_STATUSES and location and method in ("GET", "HEAD") and redirects > 0:
+                # urlopen followed redirects; keep doing so for safe methods.
+                return self.request(
+                    method,
+                    urljoin(url, location),
+                    headers=headers,
+                    timeout=timeout,
+                    retries=retries,
+                    redirects=redirects - 1,
+                )
+            return response
+
+    def _sleep_before_retry(self, attempt: int, retry_after: str | None) -> None:
+        delay = random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, min(self.backoff_max, float(retry_after)))
+            except ValueError:
+                pass
+        time.sleep(delay)
+
+    def _send(
+        self,
+        key: _Key,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: Mapping[str, str],
+        timeout: float | None,
+    ) -> HttpResponse:
+        conn, reused = self._checkout(key)
+        while True:
+            sent = False
+            try:
+                conn.timeout = self.timeout if timeout is None else timeout
+                if conn.sock is None:
+                    conn.connect()
+                    # Small request/response pairs on a kept-alive socket
+                    # otherwise stall on Nagle + delayed ACK.
+                    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                else:
+                    conn.sock.settimeout(conn.timeout)
+                conn.request(method, target, body=body, headers=dict(headers))
+                sent = True
+                resp = conn.getresponse()
+                raw = resp.read()
+            except _STALE_ERRORS as exc:
+                conn.close()
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    # The server closed the idle connection. A failure while
+                    # sending means the request was not processed; once it
+                    # was sent, the server may have handled it before
+                    # dropping the connection, so only idempotent requests
+                    # are sent once more.
+                    conn, reused = self._connect(key), False
+                    continue
+                raise TransportError(f"Network error: {exc}") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if isinstance(exc, socket.timeout):
+                    raise TransportError(f"Request timed out: {exc}") from exc
+                raise TransportError(f"Network error: {exc}") from exc
+            break
+
+        response_headers = {name.lower(): value for name, value in resp.getheaders()}
+        if response_headers.get("content-encoding", "").lower() == "gzip" and raw:
+            try:
+                raw = gzip.decompress(raw)
+            except (OSError, EOFError) as exc:
+                conn.close()
+                raise TransportError(f"Invalid gzip response: {exc}") from exc
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return HttpResponse(status=resp.status, headers=response_headers, body=raw)
+
+    def open_stream(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HttpStream:
+        """GET *url* on a dedicated connection and return the unread body.
+
+        *timeout* bounds the connect and each read; servers that stream
+        should send heartbeats more often than that. No retries: streaming
+        callers implement their own reconnect policy.
+        """
+
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise TransportError(f"Unsupported URL: {url}")
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, host)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        if proxy and scheme == "http":
+            target = f"http://{parts.netloc}{target}"
+
+        send_headers: Dict[str, str] = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+        if headers:
+            send_headers.update(headers)
+
+        conn = self._connect((scheme, host, port, proxy))
+        conn.timeout = self.timeout if timeout is None else timeout
+        try:
+            conn.connect()
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock = conn.sock
+            conn.request("GET", target, headers=send_headers)
+            resp = conn.getresponse()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise TransportError(f"Network error: {exc}") from exc
+        return HttpStream(conn, resp, sock)
+
+    # Convenience ----------------------------------------------------------
+
+    def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post_json(self, url: str, payload: Any, **kwargs: Any) -> HttpResponse:
+        return self.request("POST", url, json_body=payload, **kwargs)
+
+
+_shared: HttpTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_transport() -> HttpTransport:
+    """Return the process-wide transport used by the Crowdly clients."""
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HttpTransport()
+        return _shared
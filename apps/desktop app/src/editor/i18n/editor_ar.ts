@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>بدون اسم</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>التنقل</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>البحث في المساحة</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>الاستبدال في المساحة…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>الاستبدال في المساحة</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>التراجع عن الاستبدال في المساحة</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>بحث:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>استبدال بـ:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>لم يتم اختيار مساحة مشروع.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>استبدال {count} تكرار في {files} ملف؟</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>تم استبدال {count} تكرار في {files} ملف.</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>لا يوجد استبدال على مستوى المساحة للتراجع عنه.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>تغيّر {count} ملف بعد الاستبدال وتُرك دون تعديل.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>تمت استعادة {files} ملف.</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>جارٍ الحفظ…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>تم الحفظ</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>فشل الحفظ</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>فشلت المزامنة مع الويب؛ ستتم إعادة المحاولة تلقائيًا.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} قيد الانتظار)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>قد لا يكون قد تم الاستبدال في {count} ملف(ات) ولا يمكن التراجع عنها تلقائيًا. يرجى التحقق منها.</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>إظهار تمييز الفروقات</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>البحث في جميع مستندات هذه المساحة…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>جارٍ فهرسة المساحة…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} نتيجة</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>لم يتم اختيار مساحة مشروع.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>تعذر حفظ المستند الرئيسي. هل تريد الإغلاق وفقدان آخر التغييرات؟</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>فشل الحفظ</translation>
+    </message>
+</context>
 </TS>
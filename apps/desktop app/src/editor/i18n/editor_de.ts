@@ -23,8 +23,114 @@
         <source>Description deleted.</source>
         <translation>Beschreibung gelöscht.</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Navigator</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Im Space suchen</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Im Space ersetzen…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Im Space ersetzen</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Ersetzen im Space rückgängig machen</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>Suchen:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Ersetzen durch:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Kein Projekt-Space ausgewählt.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>{count} Vorkommen in {files} Datei(en) ersetzen?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{count} Vorkommen in {files} Datei(en) ersetzt.</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>Es gibt kein Ersetzen im Space, das rückgängig gemacht werden kann.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} Datei(en) wurden nach dem Ersetzen geändert und nicht angetastet.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files} Datei(en) wiederhergestellt.</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Wird gespeichert…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Gespeichert</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Speichern fehlgeschlagen</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Web-Synchronisierung fehlgeschlagen; wird automatisch erneut versucht.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} ausstehend)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} Datei(en) wurden möglicherweise nicht ersetzt und können nicht automatisch rückgängig gemacht werden. Bitte prüfen.</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Alle Dokumente in diesem Space durchsuchen…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Space wird indiziert…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} Treffer</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Kein Projekt-Space ausgewählt.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>Das Master-Dokument konnte nicht gespeichert werden. Trotzdem schließen und die letzten Änderungen verlieren?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Speichern fehlgeschlagen</translation>
+    </message>
+</context>
 </TS>
@@ -471,6 +471,78 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>No name</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Navigator</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Find in Space</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Replace in Space…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Replace in Space</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Undo Replace in Space</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>Find:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Replace with:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>No project space selected.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>Replace {count} occurrence(s) in {files} file(s)?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>Replaced {count} occurrence(s) in {files} file(s).</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>There is no Space-wide replace to undo.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} file(s) changed after the replace and were left untouched.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>Restored {files} file(s).</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Saving…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Saved</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Web sync failed; will retry automatically.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} pending)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</translation>
+    </message>
 </context>
 <context>
     <name>IncludeContainerWidget</name>
@@ -581,6 +653,14 @@ Details: {error}</translation>
         <source>Read only include container</source>
         <translation>Read only include container</translation>
     </message>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>The master document could not be saved. Close anyway and lose the latest changes?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Save failed</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -633,4 +713,23 @@ Details: {error}</translation>
         <translation>Show diff highlights</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Search all documents in this Space…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Indexing Space…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} result(s)</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>No project space selected.</translation>
+    </message>
+</context>
 </TS>
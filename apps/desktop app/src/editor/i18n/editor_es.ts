@@ -23,8 +23,114 @@
         <source>Description deleted.</source>
         <translation>Descripción eliminada.</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Navegador</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Buscar en el espacio</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Reemplazar en el espacio…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Reemplazar en el espacio</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Deshacer reemplazo en el espacio</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>Buscar:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Reemplazar con:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>No se ha seleccionado ningún espacio de proyecto.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>¿Reemplazar {count} coincidencia(s) en {files} archivo(s)?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>Se reemplazaron {count} coincidencia(s) en {files} archivo(s).</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>No hay ningún reemplazo en el espacio para deshacer.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} archivo(s) cambiaron después del reemplazo y no se modificaron.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>Se restauraron {files} archivo(s).</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Guardando…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Guardado</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Error al guardar</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Error al sincronizar con la web; se reintentará automáticamente.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} pendientes)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>Es posible que {count} archivo(s) no se hayan reemplazado y no se pueden deshacer automáticamente. Revísalos.</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Buscar en todos los documentos de este espacio…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Indexando el espacio…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} resultado(s)</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>No se ha seleccionado ningún espacio de proyecto.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>No se pudo guardar el documento maestro. ¿Cerrar de todos modos y perder los últimos cambios?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Error al guardar</translation>
+    </message>
+</context>
 </TS>
@@ -23,8 +23,114 @@
         <source>Description deleted.</source>
         <translation>Description supprimée.</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Navigateur</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Rechercher dans l'espace</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Remplacer dans l'espace…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Remplacer dans l'espace</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Annuler le remplacement dans l'espace</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>Rechercher :</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Remplacer par :</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Aucun espace de projet sélectionné.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>Remplacer {count} occurrence(s) dans {files} fichier(s) ?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{count} occurrence(s) remplacée(s) dans {files} fichier(s).</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>Aucun remplacement dans l'espace à annuler.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} fichier(s) modifié(s) après le remplacement ont été laissés intacts.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files} fichier(s) restauré(s).</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Enregistrement…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Enregistré</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Échec de l'enregistrement</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Échec de la synchronisation web ; nouvelle tentative automatique.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} en attente)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} fichier(s) n'ont peut-être pas été remplacés et ne peuvent pas être annulés automatiquement. Veuillez les vérifier.</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Rechercher dans tous les documents de cet espace…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Indexation de l'espace…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} résultat(s)</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Aucun espace de projet sélectionné.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>Le document maître n'a pas pu être enregistré. Fermer quand même et perdre les dernières modifications ?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Échec de l'enregistrement</translation>
+    </message>
+</context>
 </TS>
@@ -23,8 +23,114 @@
         <source>Description deleted.</source>
         <translation>विवरण हटाया गया।</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>नेविगेटर</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>स्पेस में खोजें</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>स्पेस में बदलें…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>स्पेस में बदलें</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>स्पेस में बदलाव पूर्ववत करें</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>खोजें:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>इससे बदलें:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>कोई प्रोजेक्ट स्पेस चयनित नहीं है।</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>{files} फ़ाइलों में {count} घटनाएँ बदलें?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{files} फ़ाइलों में {count} घटनाएँ बदली गईं।</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>पूर्ववत करने के लिए कोई स्पेस-व्यापी बदलाव नहीं है।</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} फ़ाइलें बदलाव के बाद संशोधित हुईं और अछूती छोड़ी गईं।</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files} फ़ाइलें पुनर्स्थापित की गईं।</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>सहेजा जा रहा है…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>सहेजा गया</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>सहेजना विफल</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>वेब सिंक विफल रहा; स्वचालित रूप से पुनः प्रयास किया जाएगा।</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} लंबित)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} फ़ाइल(ें) शायद नहीं बदली गईं और अपने आप पूर्ववत नहीं की जा सकतीं। कृपया उन्हें जाँचें।</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>इस स्पेस के सभी दस्तावेज़ों में खोजें…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>स्पेस को अनुक्रमित किया जा रहा है…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} परिणाम</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>कोई प्रोजेक्ट स्पेस चयनित नहीं है।</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>मास्टर दस्तावेज़ सहेजा नहीं जा सका। फिर भी बंद करें और नवीनतम बदलाव खो दें?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>सहेजना विफल</translation>
+    </message>
+</context>
 </TS>
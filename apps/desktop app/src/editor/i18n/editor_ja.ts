@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>名前なし</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>ナビゲーター</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>スペース内を検索</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>スペース内で置換…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>スペース内で置換</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>スペース内の置換を元に戻す</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>検索:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>置換後:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>プロジェクトスペースが選択されていません。</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>{files} 個のファイルで {count} 件を置換しますか？</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{files} 個のファイルで {count} 件を置換しました。</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>元に戻せるスペース全体の置換はありません。</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} 個のファイルは置換後に変更されたため、そのままにしました。</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files} 個のファイルを復元しました。</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>保存中…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>保存済み</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>保存に失敗しました</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Web 同期に失敗しました。自動的に再試行します。</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>（保留中: {count}）</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} 個のファイルは置換されていない可能性があり、自動で元に戻せません。確認してください。</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>差分ハイライトを表示</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>このスペースのすべての文書を検索…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>スペースをインデックス中…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} 件の結果</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>プロジェクトスペースが選択されていません。</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>マスター文書を保存できませんでした。最新の変更を失って閉じますか？</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>保存に失敗しました</translation>
+    </message>
+</context>
 </TS>
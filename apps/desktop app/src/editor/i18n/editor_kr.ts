@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>이름 없음</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>내비게이터</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>스페이스에서 찾기</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>스페이스에서 바꾸기…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>스페이스에서 바꾸기</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>스페이스 바꾸기 실행 취소</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>찾기:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>바꿀 내용:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>선택된 프로젝트 스페이스가 없습니다.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>{files}개 파일에서 {count}개 항목을 바꾸시겠습니까?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{files}개 파일에서 {count}개 항목을 바꿨습니다.</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>실행 취소할 스페이스 바꾸기가 없습니다.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count}개 파일이 바꾸기 이후 변경되어 그대로 두었습니다.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files}개 파일을 복원했습니다.</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>저장 중…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>저장됨</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>저장 실패</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>웹 동기화에 실패했습니다. 자동으로 다시 시도합니다.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>(대기 중 {count}개)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count}개 파일이 바뀌지 않았을 수 있으며 자동으로 실행 취소할 수 없습니다. 확인해 주세요.</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>차이점 강조 표시</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>이 스페이스의 모든 문서 검색…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>스페이스 색인 중…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>결과 {count}개</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>선택된 프로젝트 스페이스가 없습니다.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>마스터 문서를 저장할 수 없습니다. 최근 변경 사항을 잃고 닫으시겠습니까?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>저장 실패</translation>
+    </message>
+</context>
 </TS>
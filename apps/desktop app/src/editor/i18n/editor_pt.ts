@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>Sem nome</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Navegador</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Localizar no espaço</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Substituir no espaço…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Substituir no espaço</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Desfazer substituição no espaço</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>Localizar:</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Substituir por:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Nenhum espaço de projeto selecionado.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>Substituir {count} ocorrência(s) em {files} arquivo(s)?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>{count} ocorrência(s) substituída(s) em {files} arquivo(s).</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>Não há substituição no espaço para desfazer.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} arquivo(s) mudaram após a substituição e não foram alterados.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>{files} arquivo(s) restaurado(s).</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Salvando…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Salvo</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Falha ao salvar</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Falha na sincronização com a web; será tentado novamente automaticamente.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>({count} pendentes)</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} arquivo(s) podem não ter sido substituídos e não podem ser desfeitos automaticamente. Verifique-os.</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>Mostrar destaques de diferenças</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Pesquisar todos os documentos deste espaço…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Indexando o espaço…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} resultado(s)</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Nenhum espaço de projeto selecionado.</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>Não foi possível salvar o documento mestre. Fechar mesmo assim e perder as alterações mais recentes?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Falha ao salvar</translation>
+    </message>
+</context>
 </TS>
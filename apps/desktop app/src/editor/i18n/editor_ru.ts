@@ -535,6 +535,78 @@ Details: {error}</source>
         <source>No name</source>
         <translation>Без имени</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>Навигатор</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>Найти в пространстве</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>Заменить в пространстве…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>Заменить в пространстве</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>Отменить замену в пространстве</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>Заменить на:</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Пространство проекта не выбрано.</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>Заменить вхождений: {count} в файлах: {files}?</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>Заменено вхождений: {count}, файлов: {files}.</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>Нет замены в пространстве для отмены.</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>Файлов изменено после замены и оставлено без изменений: {count}.</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>Восстановлено файлов: {files}.</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>Сохранение…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>Сохранено</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Ошибка сохранения</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>Не удалось синхронизировать с вебом; повторная попытка будет выполнена автоматически.</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>(ожидают: {count})</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} файл(ов) могли не быть заменены, и их нельзя отменить автоматически. Проверьте их.</translation>
+    </message>
 </context>
 <context>
     <name>IncludeContainerWidget</name>
@@ -645,6 +717,14 @@ Details: {error}</source>
         <source>Read only include container</source>
         <translation>Нередактируемый контейнер (только для чтения)</translation>
     </message>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>Не удалось сохранить мастер-документ. Закрыть и потерять последние изменения?</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>Ошибка сохранения</translation>
+    </message>
 </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -697,4 +777,23 @@ Details: {error}</source>
         <translation>Показать подсветку изменений</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>Поиск по всем документам пространства…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>Индексация пространства…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>Результатов: {count}</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>Пространство проекта не выбрано.</translation>
+    </message>
+</context>
 </TS>
@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>未命名</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>导航</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>在空间中查找</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>在空间中替换…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>在空间中替换</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>撤销空间替换</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>查找：</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>替换为：</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>未选择项目空间。</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>在 {files} 个文件中替换 {count} 处？</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>已在 {files} 个文件中替换 {count} 处。</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>没有可撤销的空间替换。</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} 个文件在替换后被修改，已保持不变。</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>已恢复 {files} 个文件。</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>正在保存…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>已保存</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>保存失败</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>网页同步失败；将自动重试。</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>（{count} 个待上传）</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} 个文件可能未被替换，且无法自动撤销。请检查这些文件。</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>显示差异高亮</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>搜索此空间中的所有文档…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>正在为空间建立索引…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} 个结果</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>未选择项目空间。</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>无法保存主文档。仍要关闭并丢失最新更改吗？</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>保存失败</translation>
+    </message>
+</context>
 </TS>
@@ -439,6 +439,82 @@ Details: {error}</translation>
         <source>No name</source>
         <translation>未命名</translation>
     </message>
+    <message>
+        <source>Navigator</source>
+        <translation>導覽</translation>
+    </message>
+    <message>
+        <source>Find in Space</source>
+        <translation>在空間中尋找</translation>
+    </message>
+    <message>
+        <source>Replace in Space…</source>
+        <translation>在空間中取代…</translation>
+    </message>
+    <message>
+        <source>Replace in Space</source>
+        <translation>在空間中取代</translation>
+    </message>
+    <message>
+        <source>Undo Replace in Space</source>
+        <translation>復原空間取代</translation>
+    </message>
+    <message>
+        <source>Find:</source>
+        <translation>尋找：</translation>
+    </message>
+    <message>
+        <source>Replace with:</source>
+        <translation>取代為：</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>未選擇專案空間。</translation>
+    </message>
+    <message>
+        <source>Replace {count} occurrence(s) in {files} file(s)?</source>
+        <translation>在 {files} 個檔案中取代 {count} 處？</translation>
+    </message>
+    <message>
+        <source>Replaced {count} occurrence(s) in {files} file(s).</source>
+        <translation>已在 {files} 個檔案中取代 {count} 處。</translation>
+    </message>
+    <message>
+        <source>There is no Space-wide replace to undo.</source>
+        <translation>沒有可復原的空間取代。</translation>
+    </message>
+    <message>
+        <source>{count} file(s) changed after the replace and were left untouched.</source>
+        <translation>{count} 個檔案在取代後已變更，已保持不變。</translation>
+    </message>
+    <message>
+        <source>Restored {files} file(s).</source>
+        <translation>已還原 {files} 個檔案。</translation>
+    </message>
+    <message>
+        <source>Saving…</source>
+        <translation>正在儲存…</translation>
+    </message>
+    <message>
+        <source>Saved</source>
+        <translation>已儲存</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>儲存失敗</translation>
+    </message>
+    <message>
+        <source>Web sync failed; will retry automatically.</source>
+        <translation>網頁同步失敗；將自動重試。</translation>
+    </message>
+    <message>
+        <source>({count} pending)</source>
+        <translation>（{count} 個待上傳）</translation>
+    </message>
+    <message>
+        <source>{count} file(s) may not have been replaced and cannot be undone automatically. Please check them.</source>
+        <translation>{count} 個檔案可能未被取代，且無法自動復原。請檢查這些檔案。</translation>
+    </message>
   </context>
 <context>
     <name>CompareRevisionsWindow</name>
@@ -447,4 +523,34 @@ Details: {error}</translation>
         <translation>顯示差異高亮</translation>
     </message>
 </context>
+<context>
+    <name>SpaceSearchPanel</name>
+    <message>
+        <source>Search all documents in this Space…</source>
+        <translation>搜尋此空間中的所有文件…</translation>
+    </message>
+    <message>
+        <source>Indexing Space…</source>
+        <translation>正在為空間建立索引…</translation>
+    </message>
+    <message>
+        <source>{count} result(s)</source>
+        <translation>{count} 個結果</translation>
+    </message>
+    <message>
+        <source>No project space selected.</source>
+        <translation>未選擇專案空間。</translation>
+    </message>
+</context>
+<context>
+    <name>MasterDocumentWindow</name>
+    <message>
+        <source>The master document could not be saved. Close anyway and lose the latest changes?</source>
+        <translation>無法儲存主文件。仍要關閉並遺失最新變更嗎？</translation>
+    </message>
+    <message>
+        <source>Save failed</source>
+        <translation>儲存失敗</translation>
+    </message>
+</context>
 </TS>
@@ -0,0 +1,176 @@
+"""Incremental outline (heading) index for documents.
+
+The outline records, per source line, whether the line is a structural
+heading: the story/screenplay title (level 1) or a chapter / scene heading
+(level 2). It is updated from line-range edits exactly like
+:class:`editor.text_stats.IncrementalStats`, so keeping it current costs
+O(edit size + number of headings) rather than a full re-parse.
+
+Heading rules follow :mod:`editor.story_sync` so that sync can build its
+payload from the index (see :func:`story_sync.parse_story_from_outline`):
+
+* ``markdown`` – lines starting with ``#`` (level 1) or exactly ``##``
+  (level 2), with or without a space after the hashes.
+* ``story_v1`` / ``screenplay_v1`` – ``story_title`` / ``screenplay_title``
+  (level 1) and ``chapter_title`` / ``scene_slugline`` (level 2) blocks.
+
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+_DSL_HEADING_TAGS = {
+    "story_title": 1,
+    "screenplay_title": 1,
+    "chapter_title": 2,
+    "scene_slugline": 2,
+}
+
+_Heading = Tuple[int, str]
+
+
+@dataclass(frozen=True)
+class OutlineEntry:
+    """A heading at source line ``line`` (0-based)."""
+
+    line: int
+    level: int
+    title: str
+
+
+def heading_for_line(line: str, storage_format: str = "markdown") -> _Heading | None:
+    """Return ``(level, title)`` when *line* is an outline heading."""
+
+    stripped = line.lstrip()
+    if not stripped:
+        return None
+
+    if storage_format in ("story_v1", "screenplay_v1"):
+        if not stripped.startswith("[") or "]" not in stripped:
+            return None
+        header, body = stripped.split("]", 1)
+        tag = header[1:].split(" ", 1)[0]
+        level = _DSL_HEADING_TAGS.get(tag)
+        closing = f"[/{tag}]"
+        if level is None or not body.rstrip().endswith(closing):
+            return None
+        return level, body.rstrip()[: -len(closing)].strip()
+
+    if not stripped.startswith("#"):
+        return None
+    if stripped.startswith("###"):
+        return None
+    if stripped.startswith("##"):
+        return 2, stripped[2:].strip()
+    return 1, stripped[1:].strip()
+
+
+class OutlineIndex:
+    """Per-line heading records plus a sorted list of heading line numbers.
+
+    Lookups such as "which chapter contains line N" are O(log h) bisects
+    over the heading lines; :meth:`replace_lines` reports whether the set of
+    headings (as opposed to just their line numbers) changed so that views
+    only refresh when something visible changed.
+    """
+
+    def __init__(self, storage_format: str = "markdown") -> None:
+        self.storage_format = storage_format or "markdown"
+        self._headings: List[_Heading | None] = []
+        self._heading_lines: List[int] = []
+
+    # Updates --------------------------------------------------------------
+
+    def reset(self, text: str | Iterable[str], storage_format: str | None = None) -> None:
+        """Rebuild the index from *text* (a string or iterable of lines)."""
+
+        if storage_format:
+            self.storage_format = storage_format
+        lines = text.split("\n") if isinstance(text, str) else list(text)
+        self._headings = []
+        self._heading_lines = []
+        self.replace_lines(0, 0, lines)
+
+    def replace_lines(self, first: int, removed: int, new_lines: Sequence[str]) -> bool:
+        """Replace *removed* lines at *first* with *new_lines*.
+
+        Returns ``True`` when headings were added, removed or retitled.
+        """
+
+        count = len(self._headings)
+        first = max(0, min(first, count))
+        removed = max(0, min(removed, count - first))
+        end = first + removed
+
+        fmt = self.storage_format
+        new_headings = [heading_for_line(line, fmt) for line in new_lines]
+        old_headings = [h for h in self._headings[first:end] if h is not None]
+        changed = old_headings != [h for h in new_headings if h is not None]
+
+        self._headings[first:end] = new_headings
+
+        lo = bisect_left(self._heading_lines, first)
+        hi = bisect_left(self._heading_lines, end)
+        delta = len(new_lines) - removed
+        tail = self._heading_lines[hi:]
+        if delta:
+            tail = [line + delta for line in tail]
+        inserted = [first + i for i, h in enumerate(new_headings) if h is not None]
+        self._heading_lines[lo:] = inserted + tail
+        return changed
+
+    # Queries --------------------------------------------------------------
+
+    def line_count(self) -> int:
+        return len(self._headings)
+
+    def entries(self) -> List[OutlineEntry]:
+        """Return all headings in document order."""
+
+        result: List[OutlineEntry] = []
+        for line in self._heading_lines:
+            level, title = self._headings[line]  # type: ignore[misc]
+            result.append(OutlineEntry(line=line, level=level, title=title))
+        return result
+
+    def entry_at_line(self, line: int) -> OutlineEntry | None:
+        """Return the closest heading at or before *line* (O(log h))."""
+
+        pos = bisect_right(self._heading_lines, line) - 1
+        if pos < 0:
+            return None
+        heading_line = self._heading_lines[pos]
+        level, title = self._headings[heading_line]  # type: ignore[misc]
+        return OutlineEntry(line=heading_line, level=level, title=title)
+
+    def entry_index_at_line(self, line: int) -> int:
+        """Return the index into :meth:`entries` for *line*, or -1."""
+
+        return bisect_right(self._heading_lines, line) - 1
+
+    def chapter_ranges(self) -> List[Tuple[OutlineEntry, int, int]]:
+        """Return ``(heading, first_body_line, end_line)`` for level-2 headings.
+
+        ``end_line`` is exclusive and stops at the next level-2 heading, so
+        exporters and sync can slice chapter bodies without re-parsing.
+        """
+
+        chapters = [e for e in self.entries() if e.level == 2]
+        total = len(self._headings)
+        ranges: List[Tuple[OutlineEntry, int, int]] = []
+        for index, entry in enumerate(chapters):
+            end = chapters[index + 1].line if index + 1 < len(chapters) else total
+            ranges.append((entry, entry.line + 1, end))
+        return ranges
+
+
+def build_outline(text: str, storage_format: str = "markdown") -> OutlineIndex:
+    """Convenience helper: build an :class:`OutlineIndex` for *text*."""
+
+    index = OutlineIndex(storage_format)
+    index.reset(text)
+    return index
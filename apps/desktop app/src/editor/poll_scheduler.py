@@ -0,0 +1,221 @@
+"""Adaptive polling of remote revisions for all open web-bound documents.
+
+Used while the push channel (:mod:`editor.update_channel`) is unavailable.
+:class:`PollScheduler` tracks every open document linked to a story or
+screenplay and decides when each one is checked again:
+
+* a document whose remote revision just changed is checked again after
+  ``min_interval`` (a busy story is followed closely);
+* every check without a change multiplies its interval by ``backoff`` up
+  to ``max_interval`` (a dormant story costs almost nothing);
+* due documents of the same backend are batched into a single
+  ``POST /updates/changes`` call ("what changed since these revisions");
+* at most ``max_in_flight`` batches run at a time;
+* nothing is due while paused (minimised window) or for backends whose
+  push stream is connected.
+
+The scheduler only deals with keys, numbers and an injectable clock. This
+module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
+
+# (kind, remote id), e.g. ("story", "<uuid>").
+Key = Tuple[str, str]
+
+
+@dataclass
+class _Tracked:
+    api_base: str
+    interval: float
+    next_due: float
+    revision: str | None = None
+    in_flight: bool = False
+
+
+@dataclass(frozen=True)
+class PollBatch:
+    """One ``changes`` request: *keys* with the revisions last seen."""
+
+    api_base: str
+    since: Dict[Key, str | None]
+
+    @property
+    def keys(self) -> List[Key]:
+        return list(self.since)
+
+
+class PollScheduler:
+    """Per-document adaptive intervals with batching and an in-flight cap.
+
+    Parameters
+    ----------
+    clock:
+        Monotonic clock in seconds. Defaults to :func:`time.monotonic`.
+    min_interval:
+        Interval after a document was seen changing.
+    initial_interval:
+        Interval for newly tracked documents.
+    max_interval:
+        Ceiling for the backoff of dormant documents.
+    backoff:
+        Factor applied to the interval after each check without a change.
+    max_in_flight:
+        Batches that may be running at the same time.
+    batch_size:
+        Documents per batch.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] | None = None,
+        min_interval: float = 5.0,
+        initial_interval: float = 15.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        max_in_flight: int = 2,
+        batch_size: int = 100,
+    ) -> None:
+        self.clock = clock or time.monotonic
+        self.min_interval = min_interval
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self._docs: Dict[Key, _Tracked] = {}
+        self._covered: set[str] = set()
+        self._in_flight = 0
+        self._paused = False
+
+    # State ------------------------------------------------------------------
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def pause(self) -> None:
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume polling; everything is checked right away."""
+
+        if not self._paused:
+            return
+        self._paused = False
+        now = self.clock()
+        for doc in self._docs.values():
+            doc.next_due = min(doc.next_due, now)
+
+    def set_documents(self, documents: Mapping[Key, str]) -> None:
+        """Track exactly *documents* (key -> API base URL).
+
+        Known documents keep their interval and revision; new ones are due
+        immediately.
+        """
+
+        now = self.clock()
+        for key in list(self._docs):
+            if key not in documents:
+                del self._docs[key]
+        for key, api_base in documents.items():
+            doc = self._docs.get(key)
+            if doc is None:
+                self._docs[key] = _Tracked(api_base=api_base, interval=self.initial_interval, next_due=now)
+            else:
+                doc.api_base = api_base
+
+    def set_covered(self, api_bases: Iterable[str]) -> None:
+        """Skip documents of *api_bases* (their push stream is connected)."""
+
+        covered = {b for b in api_bases if b}
+        if covered == self._covered:
+            return
+        now = self.clock()
+        for doc in self._docs.values():
+            # Coming back from push: check soon, the stream may have
+            # dropped events while it went down.
+            if doc.api_base in self._covered and doc.api_base not in covered:
+                doc.next_due = min(doc.next_due, now)
+        self._covered = covered
+
+    def note_revision(self, key: Key, revision: str) -> None:
+        """Record a revision learnt elsewhere (push event, pull)."""
+
+        doc = self._docs.get(key)
+        if doc is not None:
+            doc.revision = revision
+
+    def interval(self, key: Key) -> float | None:
+        doc = self._docs.get(key)
+        return None if doc is None else doc.interval
+
+    # Scheduling -------------------------------------------------------------
+
+    def _pollable(self) -> List[Tuple[Key, _Tracked]]:
+        return [(k, d) for k, d in self._docs.items() if not d.in_flight and d.api_base not in self._covered]
+
+    def next_due_in(self) -> float | None:
+        """Seconds until the next batch may start, ``None`` if nothing will."""
+
+        if self._paused or self._in_flight >= self.max_in_flight:
+            return None
+        pollable = self._pollable()
+        if not pollable:
+            return None
+        return max(0.0, min(d.next_due for _k, d in pollable) - self.clock())
+
+    def due_batches(self) -> List[PollBatch]:
+        """Return the batches to run now and mark them in flight."""
+
+        if self._paused:
+            return []
+        now = self.clock()
+        by_base: Dict[str, List[Tuple[Key, _Tracked]]] = {}
+        for key, doc in self._pollable():
+            if doc.next_due <= now:
+                by_base.setdefault(doc.api_base, []).append((key, doc))
+
+        batches: List[PollBatch] = []
+        for api_base, due in by_base.items():
+            # Documents that are due soon anyway ride along for free.
+            soon = [
+                (k, d)
+                for k, d in self._pollable()
+                if d.api_base == api_base and d.next_due > now and d.next_due - now <= d.interval / 2
+            ]
+            candidates = due + soon
+            for start in range(0, len(candidates), self.batch_size):
+                if self._in_flight >= self.max_in_flight:
+                    return batches
+                chunk = candidates[start : start + self.batch_size]
+                for _key, doc in chunk:
+                    doc.in_flight = True
+                self._in_flight += 1
+                batches.append(PollBatch(api_base=api_base, since={key: doc.revision for key, doc in chunk}))
+        return batches
+
+    def complete(self, batch: PollBatch, revisions: Mapping[Key, str] | None) -> None:
+        """Finish *batch*; *revisions* holds the changed documents, ``None`` on error."""
+
+        self._in_flight = max(0, self._in_flight - 1)
+        now = self.clock()
+        for key in batch.keys:
+            doc = self._docs.get(key)
+            if doc is None:
+                continue
+            doc.in_flight = False
+            revision = revisions.get(key) if revisions is not None else None
+            if revisions is not None and revision is not None and revision != doc.revision:
+                busy = doc.revision is not None
+                doc.revision = revision
+                if busy:
+                    doc.interval = self.min_interval
+            else:
+                doc.interval = min(self.max_interval, doc.interval * self.backoff)
+            doc.next_due = now + doc.interval
@@ -0,0 +1,239 @@
+"""Persistent rope used as the text buffer of :class:`editor.document.Document`.
+
+A rope stores text as a height-balanced (AVL) binary tree whose leaves are
+short string chunks. Nodes are immutable: :meth:`Rope.insert` and
+:meth:`Rope.delete` copy only the O(log n) nodes on the path to the edit
+and return a new :class:`Rope`, sharing everything else with the old one.
+That makes a snapshot of the text free — keep a reference to the rope —
+and lets background workers read a version while the editor keeps
+changing the document.
+
+Adjacent small leaves are merged on concatenation, so typing character by
+character does not degrade into one leaf per keystroke. Every node also
+counts the characters outside the Basic Multilingual Plane below it, so
+UTF-16 offsets (what Qt reports edits in) map onto character indexes in
+O(log n). This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List
+
+# Leaves produced from bulk text are this long; smaller neighbours are
+# merged while their combined length stays below _MERGE_LIMIT.
+_LEAF_SIZE = 2048
+_MERGE_LIMIT = 1024
+
+
+def _wide_count(text: str) -> int:
+    """Return how many characters of *text* take two UTF-16 code units."""
+
+    if text.isascii():
+        return 0
+    return len(text.encode("utf-16-le")) // 2 - len(text)
+
+
+class _Leaf:
+    __slots__ = ("text", "length", "wide")
+
+    height = 0
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.length = len(text)
+        self.wide = _wide_count(text)
+
+
+class _Node:
+    __slots__ = ("left", "right", "length", "wide", "height")
+
+    def __init__(self, left: "_Leaf | _Node", right: "_Leaf | _Node") -> None:
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.wide = left.wide + right.wide
+        self.height = max(left.height, right.height) + 1
+
+
+def _make(left, right):
+    if isinstance(left, _Leaf) and isinstance(right, _Leaf) and left.length + right.length <= _MERGE_LIMIT:
+        return _Leaf(left.text + right.text)
+    return _Node(left, right)
+
+
+def _balance(left, right):
+    """Combine two trees whose heights differ by at most two."""
+
+    hl, hr = left.height, right.height
+    if hl > hr + 1:
+        if left.left.height >= left.right.height:
+            return _make(left.left, _make(left.right, right))
+        inner = left.right
+        return _make(_make(left.left, inner.left), _make(inner.right, right))
+    if hr > hl + 1:
+        if right.right.height >= right.left.height:
+            return _make(_make(left, right.left), right.right)
+        inner = right.left
+        return _make(_make(left, inner.left), _make(inner.right, right.right))
+    return _make(left, right)
+
+
+def _join(left, right):
+    """Concatenate two trees, keeping the result height-balanced."""
+
+    if left is None or left.length == 0:
+        return right
+    if right is None or right.length == 0:
+        return left
+    if left.height > right.height + 1:
+        return _balance(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_join(left, right.left), right.right)
+    return _make(left, right)
+
+
+def _split(tree, index: int):
+    """Split *tree* into the first *index* characters and the rest."""
+
+    if tree is None:
+        return None, None
+    if index <= 0:
+        return None, tree
+    if index >= tree.length:
+        return tree, None
+    if isinstance(tree, _Leaf):
+        return _Leaf(tree.text[:index]), _Leaf(tree.text[index:])
+    left_len = tree.left.length
+    if index <= left_len:
+        a, b = _split(tree.left, index)
+        return a, _join(b, tree.right)
+    a, b = _split(tree.right, index - left_len)
+    return _join(tree.left, a), b
+
+
+def _build(chunks: List[str]):
+    """Build a balanced tree from leaf chunks in O(n)."""
+
+    if not chunks:
+        return None
+    nodes = [_Leaf(chunk) for chunk in chunks]
+    while len(nodes) > 1:
+        paired = [_Node(nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)]
+        if len(nodes) % 2:
+            paired[-1] = _Node(paired[-1], nodes[-1])
+        nodes = paired
+    return nodes[0]
+
+
+def _leaves(tree) -> Iterator[str]:
+    stack = [tree] if tree is not None else []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _Leaf):
+            yield node.text
+        else:
+            stack.append(node.right)
+            stack.append(node.left)
+
+
+class Rope:
+    """Immutable text value with O(log n) edits.
+
+    Every editing method returns a new rope; existing ropes never change.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, text: str = "") -> None:
+        self._root = _build([text[i : i + _LEAF_SIZE] for i in range(0, len(text), _LEAF_SIZE)])
+
+    @classmethod
+    def _from_root(cls, root) -> "Rope":
+        rope = cls.__new__(cls)
+        rope._root = root
+        return rope
+
+    def __len__(self) -> int:
+        return self._root.length if self._root is not None else 0
+
+    def __str__(self) -> str:
+        return "".join(_leaves(self._root))
+
+    def __repr__(self) -> str:
+        return f"Rope(len={len(self)})"
+
+    def insert(self, index: int, text: str) -> "Rope":
+        if not text:
+            return self
+        left, right = _split(self._root, max(0, min(index, len(self))))
+        middle = Rope(text)._root
+        return Rope._from_root(_join(_join(left, middle), right))
+
+    def delete(self, index: int, count: int) -> "Rope":
+        if count <= 0:
+            return self
+        left, rest = _split(self._root, max(0, index))
+        _removed, right = _split(rest, count)
+        return Rope._from_root(_join(left, right))
+
+    def replace(self, index: int, count: int, text: str) -> "Rope":
+        """Replace *count* characters at *index* with *text*."""
+
+        return self.delete(index, count).insert(index, text)
+
+    def slice(self, start: int, end: int) -> str:
+        """Return ``str(self)[start:end]`` without building the whole text."""
+
+        start = max(0, start)
+        end = min(len(self), end)
+        if end <= start:
+            return ""
+        _, rest = _split(self._root, start)
+        middle, _ = _split(rest, end - start)
+        return "".join(_leaves(middle))
+
+    def utf16_length(self) -> int:
+        """Return the length of the text in UTF-16 code units."""
+
+        root = self._root
+        return root.length + root.wide if root is not None else 0
+
+    def index_from_utf16(self, offset: int) -> int | None:
+        """Map a UTF-16 code unit *offset* to a character index.
+
+        Returns ``None`` when *offset* is out of range or falls between the
+        two halves of a surrogate pair.
+        """
+
+        if offset < 0 or offset > self.utf16_length():
+            return None
+        node = self._root
+        index = 0
+        while isinstance(node, _Node):
+            left = node.left
+            left_units = left.length + left.wide
+            if offset <= left_units:
+                node = left
+            else:
+                offset -= left_units
+                index += left.length
+                node = node.right
+        if node is None or not node.wide:
+            return index + offset
+        units = 0
+        for position, char in enumerate(node.text):
+            if units == offset:
+                return index + position
+            units += 2 if char > "\uffff" else 1
+            if units > offset:
+                return None
+        return index + node.length
+
+    def height(self) -> int:
+        return self._root.height if self._root is not None else 0
+
+    def chunks(self) -> Iterator[str]:
+        """Iterate over the leaf strings in order."""
+
+        return _leaves(self._root)
+
@@ -0,0 +1,263 @@
+"""Background save pipeline.
+
+Autosave used to write the file, update xattrs, render Markdown/HTML and
+append a revision on the GUI thread. With :class:`SaveService` the GUI
+thread only hands over an immutable snapshot (:class:`SaveRequest`) and
+returns immediately; a single worker thread performs the atomic write,
+the metadata update and any post-save hooks.
+
+Requests are keyed by path. A request that is still pending when a newer
+one for the same path arrives is dropped, so a burst of autosaves results
+in one write of the latest text. Because there is one worker, writes for
+a path always happen in submission order. :meth:`SaveService.flush`
+blocks until everything submitted so far is on disk (window close, quit,
+or before a synchronous save to the same file).
+
+Listeners receive ``(path, state)`` notifications on the worker thread;
+GUI code should forward them through a queued Qt signal. This module is
+GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .document import TextSnapshot
+
+STATE_PENDING = "pending"
+STATE_SAVING = "saving"
+STATE_SAVED = "saved"
+# The file already held identical content; nothing was written.
+STATE_UNCHANGED = "unchanged"
+STATE_FAILED = "failed"
+
+Listener = Callable[[Path, str], None]
+
+
+@dataclass(frozen=True)
+class SaveRequest:
+    """Immutable snapshot of a document to persist.
+
+    Parameters
+    ----------
+    path:
+        Target file.
+    text:
+        Full text to write, either a string or an immutable
+        :class:`editor.document.TextSnapshot` that is materialised on the
+        worker.
+    storage_format:
+        When set, ``change_date`` and ``body_format`` metadata are updated
+        after a real write (see :func:`editor.document.write_document`).
+    hooks:
+        Callables run on the worker after a real write, e.g. appending a
+        revision snapshot. They receive the path and must not touch GUI
+        objects.
+    """
+
+    path: Path
+    text: "str | TextSnapshot"
+    storage_format: str | None = None
+    hooks: Tuple[Callable[[Path], None], ...] = field(default_factory=tuple)
+
+
+class SaveService:
+    """Single-worker, per-path coalescing save queue."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # Insertion-ordered: the oldest pending path is written first.
+        self._pending: Dict[str, SaveRequest] = {}
+        self._busy: str | None = None
+        # Seconds the last completed save of each path took.
+        self._durations: Dict[str, float] = {}
+        self._listeners: List[Listener] = []
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="crowdly-save", daemon=True)
+        self._thread.start()
+
+    # Listeners ------------------------------------------------------------
+
+    def add_listener(self, listener: Listener) -> None:
+        with self._cond:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        with self._cond:
+            try:
+                self._listeners.remove(listener)
+            except ValueError:
+                pass
+
+    def _notify(self, path: Path, state: str) -> None:
+        with self._cond:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(path, state)
+            except Exception:
+                # A broken listener must never stop the save worker.
+                continue
+
+    # Public API -----------------------------------------------------------
+
+    def submit(self, request: SaveRequest) -> None:
+        """Queue *request*, replacing any pending request for the same path."""
+
+        key = os.path.abspath(request.path)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("save service has been shut down")
+            # Drop the superseded snapshot but keep the path's queue position.
+            self._pending[key] = request
+            self._cond.notify_all()
+        self._notify(request.path, STATE_PENDING)
+
+    def is_pending(self, path: Path) -> bool:
+        key = os.path.abspath(path)
+        with self._cond:
+            return key in self._pending or self._busy == key
+
+    def last_duration(self, path: Path) -> float | None:
+        """Return how long the last completed save of *path* took, in seconds."""
+
+        with self._cond:
+            return self._durations.get(os.path.abspath(path))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until all submitted saves finished; ``False`` on timeout."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Flush outstanding saves and stop the worker."""
+
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    # Worker ---------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                key = next(iter(self._pending))
+                request = self._pending.pop(key)
+                self._busy = key
+
+            state = STATE_FAILED
+            started = time.monotonic()
+            try:
+                self._notify(request.path, STATE_SAVING)
+                state = STATE_SAVED if self._perform(request) else STATE_UNCHANGED
+            except Exception:
+                state = STATE_FAILED
+            finally:
+                with self._cond:
+                    self._durations[key] = time.monotonic() - started
+                    self._busy = None
+                    self._cond.notify_all()
+            self._notify(request.path, state)
+
+    @staticmethod
+    def _perform(request: SaveRequest) -> bool:
+        # Imported here to keep this module importable from document.py.
+        from .document import write_document
+
+        text = str(request.text)
+        written = write_document(request.path, text, request.storage_format)
+        if written:
+            for hook in request.hooks:
+                try:
+                    hook(request.path)
+                except Exception:
+                    # Post-save work (revisions, ...) must never fail a save.
+                    continue
+        return written
+
+
+def revision_bodies(text: str, storage_format: str | None) -> Tuple[str, str | None]:
+    """Return ``(body_md, body_html)`` for a revision snapshot of *text*.
+
+    Both bodies are rendered from the saved text itself, so they can be
+    produced on the worker instead of being read back from the preview.
+    ``body_md`` is always Markdown, also for `.story` / `.screenplay`
+    documents, so new revisions compare cleanly with older ones.
+    """
+
+    if storage_format is None:
+        return text, None
+    try:
+        if storage_format == "story_v1":
+            from .format import story_markup
+
+            return story_markup.dsl_to_markdown(text), story_markup.dsl_to_html(text)
+        if storage_format == "screenplay_v1":
+            from .format import screenplay_markup
+
+            return screenplay_markup.dsl_to_markdown(text), screenplay_markup.dsl_to_html(text)
+        from .exporting.markdown_utils import render_html_from_markdown
+
+        return text, render_html_from_markdown(text)
+    except Exception:
+        return text, None
+
+
+def revision_hook(
+    *, device_id: str, text: "str | TextSnapshot", storage_format: str | None = None
+) -> Callable[[Path], None]:
+    """Return a post-save hook that appends a local revision snapshot.
+
+    Without *storage_format* only the text is recorded (no HTML body).
+    """
+
+    def hook(path: Path) -> None:
+        from .versioning import local_queue
+
+        body_md, body_html = revision_bodies(str(text), storage_format)
+        local_queue.enqueue_full_snapshot_update(
+            path,
+            device_id=device_id,
+            body_md=body_md,
+            body_html=body_html,
+        )
+
+    return hook
+
+
+_shared: SaveService | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_service() -> SaveService:
+    """Return the process-wide save service shared by all windows.
+
+    A single instance keeps writes to the same file ordered even when it is
+    open in several windows.
+    """
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SaveService()
+        return _shared
@@ -0,0 +1,306 @@
+"""Block-level screenplay sync and Markdown materialisation.
+
+Upload
+------
+A full desktop sync replaces every scene and block of a screenplay. After a
+successful sync we keep a manifest of the uploaded blocks (their content
+hashes in order, plus the scene count and the backend's ``updated_at``).
+A block's identity is its hash together with its position: the next sync
+diffs the current block list against the manifest and sends a patch:
+
+* ``keep``   – a run of old positions reused as-is (a move when the run is
+  out of sequence),
+* ``update`` – an old position whose text changed in place,
+* ``insert`` – a new block,
+* ``delete`` – a run of old positions that no longer exist,
+
+plus the complete, small scene list (slugline and block count per scene).
+The backend resolves positions to block rows, so the patch is only valid
+against exactly the manifest's state; otherwise it answers ``409`` and
+:func:`sync_screenplay` falls back to a full sync, which performs the usual
+conflict check.
+
+Download
+--------
+:func:`render_markdown` turns the scene and block rows of
+``GET /screenplays/:id/scenes`` into the editor's Markdown in a single pass
+over the blocks.
+
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Tuple
+
+from .sync_manifest import ManifestStore, shared_store
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .crowdly_client import CrowdlyClient, ScreenplayBlockRow, ScreenplaySceneRow
+    from .story_sync import StoryPayload
+
+MANIFEST_KIND = "screenplay"
+
+# Statuses meaning "this patch cannot be applied": stale base or a backend
+# without patch support.
+FALLBACK_STATUSES = frozenset({400, 409, 412})
+
+
+def block_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _scene_blocks(scene: Dict[str, Any]) -> List[str]:
+    # The backend skips blank blocks; so must the manifest.
+    return [p for p in scene.get("paragraphs") or [] if isinstance(p, str) and p.strip()]
+
+
+@dataclass(frozen=True)
+class ScreenplayManifest:
+    """Block hashes of a screenplay as of its last successful sync."""
+
+    screenplay_id: str
+    updated_at: str
+    scene_count: int
+    hashes: List[str]
+
+
+def manifest_for(screenplay_id: str, updated_at: str, scenes: Sequence[Dict[str, Any]]) -> ScreenplayManifest:
+    hashes = [block_hash(text) for scene in scenes for text in _scene_blocks(scene)]
+    return ScreenplayManifest(screenplay_id=screenplay_id, updated_at=updated_at, scene_count=len(scenes), hashes=hashes)
+
+
+def compute_patch(manifest: ScreenplayManifest, scenes: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the patch payload that turns *manifest* into *scenes*."""
+
+    texts = [text for scene in scenes for text in _scene_blocks(scene)]
+    hashes = [block_hash(text) for text in texts]
+
+    # One entry per new position: ("keep", old) / ("update", old) / ("insert", None).
+    entries: List[tuple[str, int | None]] = []
+    deleted: List[int] = []
+    matcher = difflib.SequenceMatcher(None, manifest.hashes, hashes)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            entries.extend(("keep", i1 + k) for k in range(i2 - i1))
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        entries.extend(("update", i1 + k) for k in range(paired))
+        entries.extend(("insert", None) for _ in range(j2 - j1 - paired))
+        deleted.extend(range(i1 + paired, i2))
+
+    # Inserted blocks whose content was deleted elsewhere are moves. Repeated
+    # lines (character cues) have several candidates; continuing the previous
+    # block's run keeps a moved scene in one ``keep`` op.
+    removed: Dict[str, List[int]] = {}
+    for old in deleted:
+        removed.setdefault(manifest.hashes[old], []).append(old)
+    for index, (kind, _old) in enumerate(entries):
+        if kind != "insert":
+            continue
+        candidates = removed.get(hashes[index])
+        if not candidates:
+            continue
+        prev_kind, prev_old = entries[index - 1] if index else ("insert", None)
+        follow = prev_old + 1 if prev_kind == "keep" and prev_old is not None else None
+        if follow is not None and follow in candidates:
+            candidates.remove(follow)
+            entries[index] = ("keep", follow)
+        else:
+            entries[index] = ("keep", candidates.pop(0))
+    still_deleted = sorted(old for olds in removed.values() for old in olds)
+
+    ops: List[Dict[str, Any]] = []
+    for index, (kind, old) in enumerate(entries):
+        if kind == "keep":
+            last = ops[-1] if ops else None
+            if last is not None and last["op"] == "keep" and last["from"] + last["count"] == old:
+                last["count"] += 1
+            else:
+                ops.append({"op": "keep", "from": old, "count": 1})
+        elif kind == "update":
+            ops.append({"op": "update", "from": old, "text": texts[index]})
+        else:
+            ops.append({"op": "insert", "text": texts[index]})
+    for old in still_deleted:
+        last = ops[-1] if ops else None
+        if last is not None and last["op"] == "delete" and last["from"] + last["count"] == old:
+            last["count"] += 1
+        else:
+            ops.append({"op": "delete", "from": old, "count": 1})
+
+    return {
+        "baseUpdatedAt": manifest.updated_at,
+        "baseBlockCount": len(manifest.hashes),
+        "baseSceneCount": manifest.scene_count,
+        "scenes": [{"slugline": scene.get("slugline"), "blockCount": len(_scene_blocks(scene))} for scene in scenes],
+        "ops": ops,
+    }
+
+
+def load_manifest(store: ManifestStore, api_base: str, screenplay_id: str) -> ScreenplayManifest | None:
+    raw = store.read(MANIFEST_KIND, api_base, screenplay_id)
+    if raw is None:
+        return None
+    updated_at = raw.get("updated_at")
+    scene_count = raw.get("scene_count")
+    hashes = raw.get("hashes")
+    if not isinstance(updated_at, str) or not updated_at or not isinstance(scene_count, int):
+        return None
+    if not isinstance(hashes, list) or not all(isinstance(h, str) for h in hashes):
+        return None
+    return ScreenplayManifest(screenplay_id=screenplay_id, updated_at=updated_at, scene_count=scene_count, hashes=hashes)
+
+
+def save_manifest(store: ManifestStore, api_base: str, manifest: ScreenplayManifest) -> None:
+    store.write(
+        MANIFEST_KIND,
+        api_base,
+        manifest.screenplay_id,
+        {"updated_at": manifest.updated_at, "scene_count": manifest.scene_count, "hashes": manifest.hashes},
+    )
+
+
+def sync_screenplay(
+    client: "CrowdlyClient",
+    screenplay_id: str,
+    *,
+    title: str,
+    scenes: List[Dict[str, Any]],
+    remote_updated_at: str | None = None,
+    store: ManifestStore | None = None,
+) -> Any:
+    """Sync *scenes* as a block patch when possible, else in full.
+
+    ``scenes`` uses the full-sync payload shape (``sceneIndex``,
+    ``slugline``, ``paragraphs``). Returns the backend response of whichever
+    request succeeded; a conflict on the full sync propagates as
+    :class:`CrowdlyClientError` with status 409.
+    """
+
+    from .crowdly_client import CrowdlyClientError
+
+    store = store or shared_store()
+    api_base = client.base_url
+    manifest = load_manifest(store, api_base, screenplay_id)
+
+    result: Any = None
+    if manifest is not None:
+        try:
+            result = client.sync_desktop_screenplay(
+                screenplay_id=screenplay_id,
+                title=title,
+                scenes=scenes,
+                remote_updated_at=remote_updated_at,
+                patch=compute_patch(manifest, scenes),
+            )
+        except CrowdlyClientError as exc:
+            if exc.status_code not in FALLBACK_STATUSES:
+                raise
+            result = None
+    if result is None:
+        store.discard(MANIFEST_KIND, api_base, screenplay_id)
+        result = client.sync_desktop_screenplay(
+            screenplay_id=screenplay_id,
+            title=title,
+            scenes=scenes,
+            remote_updated_at=remote_updated_at,
+        )
+
+    updated_at = result.get("updatedAt") if isinstance(result, dict) else None
+    if isinstance(updated_at, str) and updated_at:
+        save_manifest(store, api_base, manifest_for(screenplay_id, updated_at, scenes))
+    return result
+
+
+@dataclass(frozen=True)
+class SceneSnapshot:
+    slugline: str
+    paragraphs: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ScreenplaySyncJob:
+    """Immutable snapshot of one screenplay upload.
+
+    Taken on the GUI thread when a sync is requested; a background worker
+    builds the request payload from it, so later edits cannot leak into an
+    upload that is already running.
+    """
+
+    local_path: Path
+    api_base: str
+    screenplay_id: str
+    title: str
+    scenes: Tuple[SceneSnapshot, ...]
+    # When the text was taken (epoch milliseconds).
+    snapshot_ms: int = 0
+
+    @classmethod
+    def from_story(cls, local_path: Path, api_base: str, screenplay_id: str, story: "StoryPayload") -> "ScreenplaySyncJob":
+        """Snapshot *story* as parsed by :func:`editor.story_sync.parse_screenplay_from_content`."""
+
+        return cls(
+            local_path=local_path,
+            api_base=api_base,
+            screenplay_id=screenplay_id,
+            title=story.title,
+            scenes=tuple(SceneSnapshot(ch.chapterTitle, tuple(ch.paragraphs)) for ch in story.chapters),
+            snapshot_ms=time.time_ns() // 1_000_000,
+        )
+
+    def payload_hash(self) -> str:
+        """Content hash of the upload, see :func:`editor.story_sync.payload_hash`."""
+
+        from .story_sync import payload_hash
+
+        return payload_hash({"title": self.title, "scenes": self.scenes_payload()})
+
+    def scenes_payload(self) -> List[Dict[str, Any]]:
+        """The ``scenes`` list of the full-sync request."""
+
+        return [
+            {"sceneIndex": idx, "slugline": scene.slugline, "paragraphs": list(scene.paragraphs)}
+            for idx, scene in enumerate(self.scenes, start=1)
+        ]
+
+
+def group_blocks_by_scene(blocks: Iterable["ScreenplayBlockRow"]) -> Dict[str | None, List["ScreenplayBlockRow"]]:
+    """Group *blocks* by ``scene_id`` in one pass, keeping their order."""
+
+    grouped: Dict[str | None, List["ScreenplayBlockRow"]] = {}
+    for block in blocks:
+        grouped.setdefault(block.scene_id, []).append(block)
+    return grouped
+
+
+def render_markdown(
+    title: str,
+    scenes: Sequence["ScreenplaySceneRow"],
+    blocks: Iterable["ScreenplayBlockRow"],
+) -> str:
+    """Build the editor's screenplay Markdown from backend rows."""
+
+    by_scene = group_blocks_by_scene(blocks)
+    lines: List[str] = [f"# {title}", ""]
+    for scene in scenes:
+        # Use the slugline as-is for the Markdown heading so users can
+        # control scene names freely.
+        lines.append(f"## {scene.slugline}".rstrip())
+        lines.append("")
+        for block in by_scene.get(scene.scene_id, ()):
+            text = block.text or ""
+            bt = (block.block_type or "").lower()
+            if bt == "character":
+                lines.append(text.upper())
+            elif bt == "parenthetical" and not (text.startswith("(") and text.endswith(")")):
+                lines.append(f"({text})")
+            else:
+                lines.append(text)
+            lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
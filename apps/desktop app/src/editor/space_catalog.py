@@ -0,0 +1,508 @@
+"""Persistent catalog of the files in a project space.
+
+The catalog lives in ``<space>/.crowdly/catalog.sqlite3`` and keeps one
+row per file and folder below the space root: size, mtime, BLAKE2b content
+hash and, for documents (``.md`` / ``.story`` / ``.screenplay``), the detected
+kind/format, the Crowdly story id and the last sync date. Callers that
+need "all Crowdly documents" or "what changed" query it instead of
+walking the tree and reading xattrs file by file.
+
+Updates are incremental. :meth:`SpaceCatalog.update` walks the tree but
+only re-hashes (in a thread pool) and re-reads metadata for entries whose
+(mtime, ctime, size) changed; :meth:`SpaceCatalog.refresh_directory` and
+:meth:`SpaceCatalog.refresh_file` apply single change notifications from a
+file watcher (see :mod:`editor.ui.space_catalog_watcher`).
+
+While a watcher keeps the catalog current it is marked *dirty*; a clean
+shutdown marks it clean again. :meth:`SpaceCatalog.is_stale` reports
+whether a startup rescan is needed: after an unclean shutdown, or when a
+folder's mtime shows that entries were added, removed or renamed while
+the app was closed. Edits made in place to existing files while the app
+was not running do not change folder mtimes, and only documents are
+watched for in-place edits; consumers that must be exact, such as the web
+snapshot of :mod:`editor.space_manifest`, call :meth:`SpaceCatalog.update`
+or :meth:`SpaceCatalog.refresh_file`, which only cost a ``stat`` per
+unchanged entry.
+
+Each thread should open its own :class:`SpaceCatalog`. This module is
+GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from . import file_metadata
+
+CATALOG_DIRNAME = ".crowdly"
+CATALOG_FILENAME = "catalog.sqlite3"
+DOCUMENT_SUFFIXES = (".md", ".story", ".screenplay")
+SIDECAR_SUFFIX = ".crowdly.json"
+
+# Bump when the schema changes; older databases are rebuilt from scratch.
+_SCHEMA_VERSION = 2
+
+# Commit after this many changed entries during a rescan.
+_BATCH_SIZE = 100
+
+_HASH_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One file or folder of the space, as recorded in the catalog."""
+
+    path: str  # POSIX path relative to the space root
+    is_dir: bool
+    size: int | None
+    mtime_ns: int
+    content_hash: str | None
+    kind: str | None
+    storage_format: str | None
+    story_id: str | None
+    last_sync_date: str | None
+
+
+def catalog_path_for_space(root: Path) -> Path:
+    """Return the on-disk location of the catalog for space *root*."""
+
+    return Path(root) / CATALOG_DIRNAME / CATALOG_FILENAME
+
+
+def file_hash(path: Path) -> str:
+    """Return the BLAKE2b hex digest of the bytes of *path*."""
+
+    digest = hashlib.blake2b()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_or_none(path: Path) -> str | None:
+    try:
+        return file_hash(path)
+    except OSError:
+        return None
+
+
+def _default_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+def _is_hidden(name: str) -> bool:
+    # Hidden directories hold metadata (.crowdly, .git, ...) and change
+    # constantly, and hidden files include the temporary files of atomic
+    # saves; neither is part of the catalog.
+    return name.startswith(".")
+
+
+def _sidecar_story_id(path: Path) -> str | None:
+    try:
+        raw = json.loads(Path(str(path) + SIDECAR_SUFFIX).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    value = raw.get("story_id") if isinstance(raw, dict) else None
+    return value if isinstance(value, str) and value.strip() else None
+
+
+class SpaceCatalog:
+    """SQLite catalog of the files of one project space.
+
+    Parameters
+    ----------
+    root:
+        The project-space directory.
+    max_workers:
+        Threads hashing changed files during :meth:`update`.
+    """
+
+    def __init__(self, root: Path, *, max_workers: int | None = None) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.max_workers = max_workers or _default_workers()
+        self._changed: set[str] = set()
+        db_path = catalog_path_for_space(self.root)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    # Lifecycle ------------------------------------------------------------
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "SpaceCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == _SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+            self._conn.execute("DROP TABLE IF EXISTS meta")
+            self._conn.execute(
+                "CREATE TABLE entries ("
+                " path TEXT PRIMARY KEY,"
+                " is_dir INTEGER NOT NULL,"
+                " size INTEGER,"
+                " mtime_ns INTEGER NOT NULL,"
+                " ctime_ns INTEGER NOT NULL,"
+                " content_hash TEXT,"
+                " kind TEXT,"
+                " storage_format TEXT,"
+                " story_id TEXT,"
+                " last_sync_date TEXT)"
+            )
+            self._conn.execute("CREATE INDEX entries_story_id ON entries (story_id)")
+            self._conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def mark_dirty(self) -> None:
+        """Record that a watcher is applying changes (cleared by :meth:`mark_clean`)."""
+
+        self._set_meta("clean", "0")
+
+    def mark_clean(self) -> None:
+        """Record that the catalog matched the disk at shutdown."""
+
+        self._set_meta("clean", "1")
+
+    def is_stale(self) -> bool:
+        """Return True when a startup :meth:`rescan` is needed."""
+
+        if self._get_meta("scanned") != "1" or self._get_meta("clean") != "1":
+            return True
+        rows = self._conn.execute("SELECT path, mtime_ns FROM entries WHERE is_dir = 1").fetchall()
+        # The root is stored as "." so structural changes at the top level
+        # are noticed too.
+        for rel, mtime_ns in rows:
+            try:
+                if (self.root / rel).stat().st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return not rows
+
+    # Updates --------------------------------------------------------------
+
+    def _relative(self, path: Path) -> str:
+        resolved = Path(path).resolve()
+        if resolved == self.root:
+            return "."
+        return resolved.relative_to(self.root).as_posix()
+
+    def _known(self, prefix: str | None = None) -> Dict[str, Tuple[int, int, int | None]]:
+        if prefix is None:
+            rows = self._conn.execute("SELECT path, mtime_ns, ctime_ns, size FROM entries")
+        else:
+            rows = self._conn.execute(
+                "SELECT path, mtime_ns, ctime_ns, size FROM entries WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (prefix, _like_prefix(prefix)),
+            )
+        return {rel: (mtime_ns, ctime_ns, size) for rel, mtime_ns, ctime_ns, size in rows}
+
+    @staticmethod
+    def _unchanged(record: Tuple[int, int, int | None] | None, st: os.stat_result, is_dir: bool) -> bool:
+        if record is None:
+            return False
+        if is_dir:
+            return record[0] == st.st_mtime_ns
+        # ctime moves when xattrs change, so story ids and sync dates are
+        # re-read after metadata updates even if the content did not change.
+        return record[0] == st.st_mtime_ns and record[1] == st.st_ctime_ns and record[2] == st.st_size
+
+    def _hash_files(self, rels: List[str]) -> Dict[str, str | None]:
+        paths = [self.root / rel for rel in rels]
+        if len(paths) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="catalog-hash") as pool:
+                digests = list(pool.map(_hash_or_none, paths))
+        else:
+            digests = [_hash_or_none(p) for p in paths]
+        return dict(zip(rels, digests))
+
+    def _write_entry(self, rel: str, st: os.stat_result, is_dir: bool, content_hash: str | None = None) -> None:
+        """Record *rel*; for files, *content_hash* is computed by the caller."""
+
+        kind = storage_format = story_id = last_sync = None
+        size: int | None = None
+        if not is_dir:
+            path = self.root / rel
+            size = st.st_size
+            self._changed.add(rel)
+            if rel.lower().endswith(DOCUMENT_SUFFIXES):
+                from .format import types as format_types
+
+                kind, storage_format = format_types.detect_kind_and_format(path)
+                record = file_metadata.read_record(path)
+                story_id = (
+                    record.get(file_metadata.FIELD_STORY_ID)
+                    or record.get("screenplay_id")
+                    or _sidecar_story_id(path)
+                )
+                last_sync = record.get(file_metadata.FIELD_LAST_SYNC_DATE)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries"
+            " (path, is_dir, size, mtime_ns, ctime_ns, content_hash, kind, storage_format, story_id, last_sync_date)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rel, int(is_dir), size, st.st_mtime_ns, st.st_ctime_ns, content_hash, kind, storage_format, story_id, last_sync),
+        )
+
+    def _delete_entries(self, rel: str) -> int:
+        """Delete *rel* and, for folders, everything below it."""
+
+        where = "(path = ? OR path LIKE ? ESCAPE '\\')"
+        params = (rel, _like_prefix(rel))
+        rows = self._conn.execute(f"SELECT path FROM entries WHERE is_dir = 0 AND {where}", params)
+        self._changed.update(path for (path,) in rows)
+        return self._conn.execute(f"DELETE FROM entries WHERE {where}", params).rowcount
+
+    def _walk(self, top: Path) -> Iterable[Tuple[str, os.stat_result, bool]]:
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not _is_hidden(d)]
+            base = Path(dirpath)
+            try:
+                yield self._relative(base), base.stat(), True
+            except (OSError, ValueError):
+                continue
+            for filename in filenames:
+                if _is_hidden(filename):
+                    continue
+                path = base / filename
+                try:
+                    yield self._relative(path), path.stat(), False
+                except (OSError, ValueError):
+                    continue
+
+    def _sync_tree(self, top: Path, should_stop: Callable[[], bool] | None) -> Tuple[int, int]:
+        try:
+            top_rel = self._relative(top)
+        except ValueError:
+            return 0, 0
+        known = self._known(None if top_rel == "." else top_rel)
+        seen: set[str] = set()
+        pending: List[Tuple[str, os.stat_result, bool]] = []
+        for rel, st, is_dir in self._walk(top):
+            seen.add(rel)
+            if not self._unchanged(known.get(rel), st, is_dir):
+                pending.append((rel, st, is_dir))
+
+        updated = 0
+        for start in range(0, len(pending), _BATCH_SIZE):
+            if should_stop is not None and should_stop():
+                return updated, 0
+            batch = pending[start : start + _BATCH_SIZE]
+            # Hash outside the transaction so other connections are not
+            # kept waiting. The stat is taken first: a file written
+            # meanwhile has a newer mtime and is hashed again next time.
+            digests = self._hash_files([rel for rel, _st, is_dir in batch if not is_dir])
+            with self._conn:
+                for rel, st, is_dir in batch:
+                    self._write_entry(rel, st, is_dir, digests.get(rel))
+                    updated += 1
+
+        removed = 0
+        with self._conn:
+            for rel in known:
+                if rel not in seen:
+                    removed += self._delete_entries(rel)
+        return updated, removed
+
+    def update(self, should_stop: Callable[[], bool] | None = None) -> Tuple[int, int]:
+        """Bring the whole catalog up to date; returns ``(updated, removed)``.
+
+        Costs one ``stat`` per unchanged entry. Unlike :meth:`rescan`, the
+        clean/dirty state is left alone, so it can run next to a watcher.
+        """
+
+        updated, removed = self._sync_tree(self.root, should_stop)
+        if should_stop is None or not should_stop():
+            self._set_meta("scanned", "1")
+        return updated, removed
+
+    def rescan(self, should_stop: Callable[[], bool] | None = None) -> Tuple[int, int]:
+        """Startup :meth:`update` of a stale catalog; returns ``(updated, removed)``.
+
+        An interrupted rescan leaves the catalog marked stale.
+        """
+
+        self.mark_dirty()
+        self._set_meta("scanned", "0")
+        return self.update(should_stop)
+
+    def take_changes(self) -> List[str]:
+        """Return the files written or removed since the last call, and forget them."""
+
+        changed, self._changed = sorted(self._changed), set()
+        return changed
+
+    def refresh_directory(self, path: Path) -> Tuple[int, int]:
+        """Apply a change notification for folder *path*.
+
+        New subfolders are scanned recursively; removed ones are dropped
+        with everything below them. Returns ``(updated, removed)``.
+        """
+
+        try:
+            rel = self._relative(path)
+        except ValueError:
+            return 0, 0
+        if any(_is_hidden(part) for part in Path(rel).parts):
+            return 0, 0
+        if not Path(path).is_dir():
+            with self._conn:
+                return 0, self._delete_entries(rel)
+
+        try:
+            st = Path(path).stat()
+            names = os.listdir(path)
+        except OSError:
+            return 0, 0
+        known = self._known(None if rel == "." else rel)
+        prefix = "" if rel == "." else rel + "/"
+        updated = removed = 0
+        with self._conn:
+            if not self._unchanged(known.get(rel), st, True):
+                self._write_entry(rel, st, True)
+                updated += 1
+            present: set[str] = set()
+            new_dirs: List[Path] = []
+            changed_files: List[Tuple[str, os.stat_result]] = []
+            for name in names:
+                if _is_hidden(name):
+                    continue
+                child = Path(path) / name
+                child_rel = prefix + name
+                present.add(child_rel)
+                try:
+                    child_st = child.stat()
+                except OSError:
+                    continue
+                is_dir = child.is_dir()
+                if is_dir:
+                    if child_rel not in known:
+                        new_dirs.append(child)
+                    continue
+                if not self._unchanged(known.get(child_rel), child_st, False):
+                    changed_files.append((child_rel, child_st))
+            digests = self._hash_files([child_rel for child_rel, _st in changed_files])
+            for child_rel, child_st in changed_files:
+                self._write_entry(child_rel, child_st, False, digests[child_rel])
+                updated += 1
+            # Direct children that disappeared (and, for folders, their
+            # contents).
+            for child_rel in known:
+                if child_rel == rel or not child_rel.startswith(prefix):
+                    continue
+                if "/" in child_rel[len(prefix) :]:
+                    continue
+                if child_rel not in present:
+                    removed += self._delete_entries(child_rel)
+        for child in new_dirs:
+            sub_updated, sub_removed = self._sync_tree(child, None)
+            updated += sub_updated
+            removed += sub_removed
+        return updated, removed
+
+    def refresh_file(self, path: Path) -> bool:
+        """Re-read (or drop) a single file; returns ``True`` when it changed."""
+
+        path = Path(path)
+        name = path.name
+        if name.endswith(SIDECAR_SUFFIX):
+            # A sidecar carries the story id of the document next to it.
+            self.refresh_file(Path(str(path)[: -len(SIDECAR_SUFFIX)]))
+        try:
+            rel = self._relative(path)
+        except ValueError:
+            return False
+        if rel == "." or any(_is_hidden(part) for part in Path(rel).parts):
+            return False
+        with self._conn:
+            try:
+                st = path.stat()
+            except OSError:
+                return self._delete_entries(rel) > 0
+            if path.is_dir():
+                return False
+            record = self._conn.execute(
+                "SELECT mtime_ns, ctime_ns, size FROM entries WHERE path = ?", (rel,)
+            ).fetchone()
+            if self._unchanged(tuple(record) if record else None, st, False):  # type: ignore[arg-type]
+                return False
+            self._write_entry(rel, st, False, _hash_or_none(path))
+        return True
+
+    # Queries --------------------------------------------------------------
+
+    _COLUMNS = "path, is_dir, size, mtime_ns, content_hash, kind, storage_format, story_id, last_sync_date"
+
+    @staticmethod
+    def _entry(row: tuple) -> CatalogEntry:
+        rel, is_dir, size, mtime_ns, content_hash, kind, storage_format, story_id, last_sync = row
+        return CatalogEntry(rel, bool(is_dir), size, mtime_ns, content_hash, kind, storage_format, story_id, last_sync)
+
+    def get(self, path: Path | str) -> CatalogEntry | None:
+        """Return the entry for *path* (absolute, or relative to the root)."""
+
+        rel = path if isinstance(path, str) else self._relative(path)
+        row = self._conn.execute(f"SELECT {self._COLUMNS} FROM entries WHERE path = ?", (rel,)).fetchone()
+        return self._entry(row) if row else None
+
+    def entries(self) -> List[CatalogEntry]:
+        """Return every folder and file, ordered by path."""
+
+        rows = self._conn.execute(f"SELECT {self._COLUMNS} FROM entries WHERE path != '.' ORDER BY path")
+        return [self._entry(row) for row in rows]
+
+    def documents(self) -> List[CatalogEntry]:
+        """Return the ``.md`` / ``.story`` / ``.screenplay`` files."""
+
+        rows = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM entries WHERE is_dir = 0 AND kind IS NOT NULL ORDER BY path"
+        )
+        return [self._entry(row) for row in rows]
+
+    def find_story(self, story_id: str) -> List[CatalogEntry]:
+        """Return the documents linked to Crowdly story/screenplay *story_id*."""
+
+        rows = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM entries WHERE story_id = ? ORDER BY path", (story_id,)
+        )
+        return [self._entry(row) for row in rows]
+
+    def directories(self) -> List[Path]:
+        """Return the absolute paths of all catalogued folders (root included)."""
+
+        rows = self._conn.execute("SELECT path FROM entries WHERE is_dir = 1 ORDER BY path")
+        return [self.root if rel == "." else self.root / rel for (rel,) in rows]
+
+
+def _like_prefix(rel: str) -> str:
+    """Return a LIKE pattern matching everything below folder *rel*."""
+
+    escaped = rel.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "/%"
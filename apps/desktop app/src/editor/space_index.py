@@ -0,0 +1,315 @@
+"""Persistent full-text index for a project space.
+
+The index lives in ``<space>/.crowdly/search_index.sqlite3`` and uses
+SQLite's FTS5 extension. Every ``.md`` / ``.story`` / ``.screenplay`` file
+below the space root is indexed with its raw source text, so a hit's
+character offset maps directly onto a position in the source editor.
+
+Updates are incremental: :meth:`SpaceIndex.update` compares each file's
+``mtime_ns`` and size with what was recorded when it was last indexed and
+only re-reads files that changed, and removes rows for files that no
+longer exist. :meth:`SpaceIndex.update_file` refreshes a single document,
+e.g. right after it was saved.
+
+Each thread should open its own :class:`SpaceIndex`; the database runs in
+WAL mode so searches from the GUI thread are not blocked by a background
+indexer. This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+from . import storage
+
+INDEX_DIRNAME = ".crowdly"
+INDEX_FILENAME = "search_index.sqlite3"
+INDEXED_SUFFIXES = (".md", ".story", ".screenplay")
+
+# Bump when the schema changes; older databases are rebuilt from scratch.
+_SCHEMA_VERSION = 1
+
+# Commit after this many files so readers see progress and a crash never
+# loses more than one batch.
+_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked match inside a file of the space."""
+
+    path: Path
+    offset: int
+    line: int
+    snippet: str
+    score: float
+
+
+def index_path_for_space(root: Path) -> Path:
+    """Return the on-disk location of the index for space *root*."""
+
+    return Path(root) / INDEX_DIRNAME / INDEX_FILENAME
+
+
+def iter_indexable_files(root: Path) -> Iterator[Path]:
+    """Yield indexable documents below *root*, skipping hidden directories."""
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Hidden directories hold metadata (.crowdly, .git, ...), not prose.
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for filename in filenames:
+            if filename.lower().endswith(INDEXED_SUFFIXES):
+                yield Path(dirpath) / filename
+
+
+def build_match_query(text: str) -> str:
+    """Turn free text into an FTS5 query.
+
+    Every word must occur (implicit AND); the last word also matches as a
+    prefix so results appear while the user is still typing.
+    """
+
+    words = [w for w in re.findall(r"\w+", text or "", flags=re.UNICODE)]
+    if not words:
+        return ""
+    terms = ['"' + w.replace('"', '""') + '"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SpaceIndex:
+    """SQLite FTS5 index over the documents of one project space."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root).expanduser().resolve()
+        db_path = index_path_for_space(self.root)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    # Lifecycle ------------------------------------------------------------
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "SpaceIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == _SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute("DROP TABLE IF EXISTS docs")
+            self._conn.execute(
+                "CREATE TABLE files ("
+                " id INTEGER PRIMARY KEY,"
+                " path TEXT NOT NULL UNIQUE,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE docs USING fts5(body, tokenize='unicode61 remove_diacritics 2')"
+            )
+            self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    # Updates --------------------------------------------------------------
+
+    def _relative(self, path: Path) -> str:
+        return Path(path).resolve().relative_to(self.root).as_posix()
+
+    def _known_files(self) -> dict[str, Tuple[int, int, int]]:
+        rows = self._conn.execute("SELECT path, id, mtime_ns, size FROM files")
+        return {path: (file_id, mtime_ns, size) for path, file_id, mtime_ns, size in rows}
+
+    def _write_file(self, rel: str, stat_result: os.stat_result, known: Tuple[int, int, int] | None) -> None:
+        try:
+            body = storage.read_text(self.root / rel)
+        except (OSError, UnicodeDecodeError):
+            body = ""
+        if known is not None:
+            file_id = known[0]
+            self._conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                (stat_result.st_mtime_ns, stat_result.st_size, file_id),
+            )
+            self._conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+        else:
+            cur = self._conn.execute(
+                "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (rel, stat_result.st_mtime_ns, stat_result.st_size),
+            )
+            file_id = cur.lastrowid
+        self._conn.execute("INSERT INTO docs (rowid, body) VALUES (?, ?)", (file_id, body))
+
+    def _delete_file(self, file_id: int) -> None:
+        self._conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def update(
+        self,
+        progress: Callable[[int, int], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> Tuple[int, int]:
+        """Bring the index up to date with the files on disk.
+
+        Parameters
+        ----------
+        progress:
+            Optional callback receiving ``(done, total)`` after each batch.
+        should_stop:
+            Optional callback; when it returns ``True`` the update stops after
+            committing the current batch.
+
+        Returns ``(indexed, removed)`` file counts.
+        """
+
+        known = self._known_files()
+        seen: set[str] = set()
+        pending: List[Tuple[str, os.stat_result]] = []
+
+        for path in iter_indexable_files(self.root):
+            try:
+                rel = self._relative(path)
+                stat_result = path.stat()
+            except (OSError, ValueError):
+                continue
+            seen.add(rel)
+            record = known.get(rel)
+            if record is not None and record[1] == stat_result.st_mtime_ns and record[2] == stat_result.st_size:
+                continue
+            pending.append((rel, stat_result))
+
+        indexed = 0
+        total = len(pending)
+        for start in range(0, total, _BATCH_SIZE):
+            if should_stop is not None and should_stop():
+                break
+            with self._conn:
+                for rel, stat_result in pending[start : start + _BATCH_SIZE]:
+                    self._write_file(rel, stat_result, known.get(rel))
+                    indexed += 1
+            if progress is not None:
+                progress(indexed, total)
+
+        removed = 0
+        if should_stop is None or not should_stop():
+            with self._conn:
+                for rel, record in known.items():
+                    if rel not in seen:
+                        self._delete_file(record[0])
+                        removed += 1
+
+        return indexed, removed
+
+    def update_file(self, path: Path) -> bool:
+        """Re-index (or drop) a single file; returns ``True`` when it changed."""
+
+        try:
+            rel = self._relative(path)
+        except ValueError:
+            return False
+        if not rel.lower().endswith(INDEXED_SUFFIXES):
+            return False
+
+        record = self._known_files_for(rel)
+        with self._conn:
+            try:
+                stat_result = (self.root / rel).stat()
+            except OSError:
+                if record is not None:
+                    self._delete_file(record[0])
+                    return True
+                return False
+            if record is not None and record[1] == stat_result.st_mtime_ns and record[2] == stat_result.st_size:
+                return False
+            self._write_file(rel, stat_result, record)
+        return True
+
+    def _known_files_for(self, rel: str) -> Tuple[int, int, int] | None:
+        row = self._conn.execute("SELECT id, mtime_ns, size FROM files WHERE path = ?", (rel,)).fetchone()
+        return tuple(row) if row else None  # type: ignore[return-value]
+
+    # Queries --------------------------------------------------------------
+
+    def file_count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+    def search(self, text: str, limit: int = 50) -> List[SearchHit]:
+        """Return up to *limit* hits for *text*, best first.
+
+        Each hit carries the offset of the first occurrence of any query
+        word in the file (so the editor can jump there) and a short snippet
+        around it with the matches wrapped in ``[`` / ``]``.
+        """
+
+        query = build_match_query(text)
+        if not query:
+            return []
+
+        try:
+            # Rank first and join afterwards: FTS5's snippet() is evaluated for
+            # every matching row, so snippets are built in Python for the
+            # top hits only.
+            rows = self._conn.execute(
+                "SELECT files.path, docs.body, ranked.score FROM"
+                " (SELECT rowid, bm25(docs) AS score FROM docs"
+                "  WHERE docs MATCH ? ORDER BY score LIMIT ?) AS ranked"
+                " JOIN docs ON docs.rowid = ranked.rowid"
+                " JOIN files ON files.id = ranked.rowid"
+                " ORDER BY ranked.score",
+                (query, int(limit)),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+        words = re.findall(r"\w+", text, flags=re.UNICODE)
+        # The last word is a prefix match, mirroring build_match_query.
+        pattern = re.compile(
+            "|".join(rf"\b{re.escape(w)}\b" for w in words[:-1]) + ("|" if len(words) > 1 else "") + rf"\b{re.escape(words[-1])}",
+            re.IGNORECASE,
+        )
+
+        hits: List[SearchHit] = []
+        for rel, body, score in rows:
+            body = body or ""
+            match = pattern.search(body)
+            offset = match.start() if match else 0
+            hits.append(
+                SearchHit(
+                    path=self.root / rel,
+                    offset=offset,
+                    line=body.count("\n", 0, offset),
+                    snippet=_make_snippet(body, pattern, offset),
+                    score=float(score),
+                )
+            )
+        return hits
+
+
+def _make_snippet(body: str, pattern: "re.Pattern[str]", offset: int, radius: int = 60) -> str:
+    """Return a single-line excerpt around *offset* with matches in brackets."""
+
+    start = max(0, offset - radius)
+    end = min(len(body), offset + radius)
+    excerpt = pattern.sub(lambda m: f"[{m.group(0)}]", body[start:end])
+    excerpt = " ".join(excerpt.split())
+    if start > 0:
+        excerpt = "…" + excerpt
+    if end < len(body):
+        excerpt += "…"
+    return excerpt
@@ -0,0 +1,187 @@
+"""Hashed manifest of a project space for incremental web snapshots.
+
+:func:`editor.websync.sync_space_to_web` used to post a listing of every
+file on each sync, without hashes, so neither side could tell what
+changed. :class:`SpaceManifest` combines two things:
+
+* the current entries with their BLAKE2b hashes, read from the space's
+  :class:`editor.space_catalog.SpaceCatalog` after bringing it up to date
+  (only files whose stat changed are re-hashed, in a thread pool);
+* per remote Space, the items the backend acknowledged last time, kept in
+  ``<space>/.crowdly/space-manifest.json``, so a sync only sends what
+  differs from them (new and changed entries, and ``deleted`` markers for
+  entries that disappeared).
+
+Hidden entries (``.crowdly`` itself, ``.git``, temporary files of atomic
+saves) are not catalogued and so not part of the snapshot. Losing the
+manifest only costs one full snapshot. This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .space_catalog import CATALOG_DIRNAME, SpaceCatalog
+
+MANIFEST_FILENAME = "space-manifest.json"
+
+# Bump when the format changes; older manifests are ignored.
+_MANIFEST_VERSION = 2
+
+KIND_FILE = "file"
+KIND_FOLDER = "folder"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One file or folder of the space as of the last scan."""
+
+    kind: str
+    size: int | None = None
+    hash: str | None = None
+
+    def item(self) -> Tuple[str, int | None, str | None]:
+        """What the backend stores for the entry: ``(kind, size, hash)``."""
+
+        return (self.kind, self.size, self.hash)
+
+
+def manifest_path_for_space(root: Path) -> Path:
+    return Path(root) / CATALOG_DIRNAME / MANIFEST_FILENAME
+
+
+def entries_from_catalog(catalog: SpaceCatalog) -> Dict[str, ManifestEntry]:
+    """Return the snapshot entries of the files and folders in *catalog*."""
+
+    return {
+        e.path: ManifestEntry(kind=KIND_FOLDER) if e.is_dir else ManifestEntry(kind=KIND_FILE, size=e.size, hash=e.content_hash)
+        for e in catalog.entries()
+    }
+
+
+def diff_items(acknowledged: Mapping[str, ManifestEntry], current: Mapping[str, ManifestEntry]) -> List[Dict[str, Any]]:
+    """Return the ``POST /creative-spaces/:id/sync`` items turning *acknowledged* into *current*."""
+
+    items: List[Dict[str, Any]] = []
+    for rel, entry in sorted(current.items()):
+        known = acknowledged.get(rel)
+        if known is not None and known.item() == entry.item():
+            continue
+        items.append(
+            {
+                "relativePath": rel,
+                "kind": entry.kind,
+                "sizeBytes": entry.size,
+                "hash": entry.hash,
+                "deleted": False,
+            }
+        )
+    for rel, entry in sorted(acknowledged.items()):
+        if rel not in current:
+            items.append(
+                {
+                    "relativePath": rel,
+                    "kind": entry.kind,
+                    "sizeBytes": None,
+                    "hash": None,
+                    "deleted": True,
+                }
+            )
+    return items
+
+
+class SpaceManifest:
+    """Current entries and acknowledged snapshots of one project space.
+
+    Parameters
+    ----------
+    root:
+        The project-space directory.
+    max_workers:
+        Threads hashing changed files during :meth:`scan`.
+    """
+
+    def __init__(self, root: Path, *, max_workers: int | None = None) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.path = manifest_path_for_space(self.root)
+        self.max_workers = max_workers
+        self._acknowledged: Dict[str, Dict[str, ManifestEntry]] = {}
+        self._load()
+
+    # Scanning ---------------------------------------------------------------
+
+    def scan(self) -> Dict[str, ManifestEntry]:
+        """Update the space catalog and return its entries.
+
+        Only files whose stat changed since the catalog last saw them are
+        re-hashed; acknowledged snapshots are not touched.
+        """
+
+        # A connection of its own: scans run on sync threads.
+        with SpaceCatalog(self.root, max_workers=self.max_workers) as catalog:
+            catalog.update()
+            return entries_from_catalog(catalog)
+
+    # Acknowledged snapshots ---------------------------------------------------
+
+    def changes_since_ack(self, remote_key: str, current: Mapping[str, ManifestEntry]) -> List[Dict[str, Any]]:
+        """Items to send so the backend *remote_key* ends up holding *current*."""
+
+        return diff_items(self._acknowledged.get(remote_key) or {}, current)
+
+    def acknowledge(self, remote_key: str, current: Mapping[str, ManifestEntry]) -> None:
+        """Record that the backend *remote_key* now holds *current*."""
+
+        self._acknowledged[remote_key] = dict(current)
+        self._save()
+
+    # Persistence ----------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(raw, dict) or raw.get("version") != _MANIFEST_VERSION:
+            return
+        remotes = raw.get("acknowledged")
+        if isinstance(remotes, dict):
+            for key, entries in remotes.items():
+                if isinstance(key, str):
+                    self._acknowledged[key] = _decode_entries(entries)
+
+    def _save(self) -> None:
+        from . import storage
+
+        data = {
+            "version": _MANIFEST_VERSION,
+            "acknowledged": {key: _encode_entries(entries) for key, entries in self._acknowledged.items()},
+        }
+        try:
+            storage.write_text_atomic(self.path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        except OSError:
+            # Best-effort: the next sync sends more than needed.
+            pass
+
+
+def _encode_entries(entries: Mapping[str, ManifestEntry]) -> Dict[str, list]:
+    return {rel: [e.kind, e.size, e.hash] for rel, e in entries.items()}
+
+
+def _decode_entries(raw: object) -> Dict[str, ManifestEntry]:
+    entries: Dict[str, ManifestEntry] = {}
+    if not isinstance(raw, dict):
+        return entries
+    for rel, value in raw.items():
+        if not isinstance(rel, str) or not isinstance(value, list) or len(value) != 3:
+            continue
+        kind, size, digest = value
+        if kind not in (KIND_FILE, KIND_FOLDER):
+            continue
+        if not (size is None or isinstance(size, int)) or not (digest is None or isinstance(digest, str)):
+            continue
+        entries[rel] = ManifestEntry(kind=kind, size=size, hash=digest)
+    return entries
@@ -0,0 +1,489 @@
+"""Project-wide find and replace with an undo journal.
+
+Replacing text across a project space happens in three steps:
+
+1. :func:`scan_space` counts matches per file so the user can preview the
+   change. Files are scanned in worker processes.
+2. :func:`apply_replace` rewrites every matching file with an atomic write
+   (again in worker processes) and returns a :class:`ReplaceJournal`.
+   For each file the journal records the hash of the text before and after
+   the change plus an inverse patch. Files whose worker died are listed in
+   :attr:`ReplaceJournal.failed` instead of being rewritten a second time.
+3. :func:`undo_replace` applies the inverse patches of a saved journal.
+   A file is only touched when its current hash still equals the recorded
+   "after" hash, so later edits are never clobbered.
+
+Documents that are open in the editor are passed in as *overrides*
+(path -> in-memory text). Their in-memory text is used instead of the copy
+on disk, which lets the UI update open tabs through the same minimal edit
+used by the single-document Replace All.
+
+Journals are stored as JSON under ``<space>/.crowdly/replace_journal``.
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from . import storage
+from . import text_replace
+from .space_index import INDEX_DIRNAME, iter_indexable_files
+from .text_replace import TextEdit
+
+JOURNAL_DIRNAME = "replace_journal"
+
+# Below this many files the cost of starting worker processes outweighs
+# the parallel speed-up.
+_PARALLEL_THRESHOLD = 32
+
+# Result of a job whose worker failed and that must not run again.
+_FAILED = object()
+
+
+@dataclass(frozen=True)
+class ReplaceOptions:
+    """Match options, mirroring the search bar."""
+
+    case_sensitive: bool = False
+    whole_word: bool = False
+
+
+@dataclass(frozen=True)
+class FileMatches:
+    """Preview row: number of matches in one file."""
+
+    path: Path
+    count: int
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """What happened to one file during a project-wide replace."""
+
+    path: str  # relative to the space root, POSIX separators
+    old_hash: str
+    new_hash: str
+    # Inverse patch in *new* text coordinates, ascending and non-overlapping.
+    inverse: Tuple[TextEdit, ...]
+
+
+@dataclass
+class ReplaceJournal:
+    """Undo record for one project-wide replace operation."""
+
+    root: Path
+    search: str
+    replacement: str
+    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    entries: List[JournalEntry] = field(default_factory=list)
+    # Files whose outcome is unknown (their worker died); relative paths.
+    failed: List[str] = field(default_factory=list)
+    journal_path: Path | None = None
+
+    @property
+    def total_replacements(self) -> int:
+        return sum(len(entry.inverse) for entry in self.entries)
+
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "created": self.created,
+            "search": self.search,
+            "replacement": self.replacement,
+            "entries": [
+                {
+                    "path": entry.path,
+                    "old_hash": entry.old_hash,
+                    "new_hash": entry.new_hash,
+                    "inverse": [[e.start, e.end, e.replacement] for e in entry.inverse],
+                }
+                for entry in self.entries
+            ],
+            "failed": list(self.failed),
+        }
+
+    @classmethod
+    def from_json(cls, root: Path, data: Mapping[str, object], journal_path: Path | None = None) -> "ReplaceJournal":
+        entries = [
+            JournalEntry(
+                path=str(item["path"]),
+                old_hash=str(item["old_hash"]),
+                new_hash=str(item["new_hash"]),
+                inverse=tuple(TextEdit(int(s), int(e), str(r)) for s, e, r in item.get("inverse", [])),
+            )
+            for item in data.get("entries", [])  # type: ignore[union-attr]
+        ]
+        return cls(
+            root=Path(root),
+            search=str(data.get("search", "")),
+            replacement=str(data.get("replacement", "")),
+            created=str(data.get("created", "")),
+            entries=entries,
+            failed=[str(p) for p in data.get("failed", [])],  # type: ignore[union-attr]
+            journal_path=journal_path,
+        )
+
+    def save(self) -> Path:
+        """Write the journal to the space's journal directory."""
+
+        directory = journal_dir(self.root)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        target = directory / f"{stamp}-{uuid.uuid4().hex[:8]}.json"
+        storage.write_text_atomic(target, json.dumps(self.to_json(), ensure_ascii=False))
+        self.journal_path = target
+        return target
+
+    def discard(self) -> None:
+        """Delete the saved journal file (after a successful undo)."""
+
+        if self.journal_path is not None:
+            try:
+                self.journal_path.unlink()
+            except OSError:
+                pass
+            self.journal_path = None
+
+
+def journal_dir(root: Path) -> Path:
+    return Path(root) / INDEX_DIRNAME / JOURNAL_DIRNAME
+
+
+def latest_journal(root: Path) -> ReplaceJournal | None:
+    """Return the most recent undoable journal for space *root*, if any."""
+
+    directory = journal_dir(root)
+    try:
+        candidates = sorted(directory.glob("*.json"))
+    except OSError:
+        return None
+    for candidate in reversed(candidates):
+        try:
+            data = json.loads(storage.read_text(candidate))
+            return ReplaceJournal.from_json(root, data, journal_path=candidate)
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return None
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Pure text helpers --------------------------------------------------------
+
+
+def inverse_patch(spans: Sequence[text_replace.Span], originals: Sequence[str], replacement: str) -> Tuple[TextEdit, ...]:
+    """Return edits that turn the replaced text back into the original.
+
+    *spans* are match spans in the original text and *originals* the
+    matched strings; the returned edits use positions in the new text.
+    """
+
+    edits: List[TextEdit] = []
+    shift = 0
+    for (start, end), original in zip(spans, originals):
+        new_start = start + shift
+        edits.append(TextEdit(new_start, new_start + len(replacement), original))
+        shift += len(replacement) - (end - start)
+    return tuple(edits)
+
+
+def apply_edits(text: str, edits: Iterable[TextEdit]) -> str:
+    """Apply ascending, non-overlapping *edits* to *text* in one pass."""
+
+    parts: List[str] = []
+    pos = 0
+    for edit in edits:
+        parts.append(text[pos : edit.start])
+        parts.append(edit.replacement)
+        pos = edit.end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def collapse_edits(text: str, edits: Sequence[TextEdit]) -> TextEdit | None:
+    """Merge *edits* into one edit spanning the first to the last of them."""
+
+    if not edits:
+        return None
+    start = edits[0].start
+    end = edits[-1].end
+    shifted = [TextEdit(e.start - start, e.end - start, e.replacement) for e in edits]
+    return TextEdit(start, end, apply_edits(text[start:end], shifted))
+
+
+def replace_in_text(text: str, search: str, replacement: str, options: ReplaceOptions) -> Tuple[str, Tuple[TextEdit, ...]] | None:
+    """Return ``(new_text, inverse_patch)`` or ``None`` when nothing matched."""
+
+    spans = text_replace.find_spans(
+        text,
+        search,
+        case_sensitive=options.case_sensitive,
+        whole_word=options.whole_word,
+    )
+    if not spans:
+        return None
+    new_text = text_replace.replace_spans(text, spans, replacement)
+    originals = [text[s:e] for s, e in spans]
+    return new_text, inverse_patch(spans, originals, replacement)
+
+
+def undo_text(text: str, entry: JournalEntry) -> str | None:
+    """Return the pre-replace text, or ``None`` if *text* changed since."""
+
+    if text_hash(text) != entry.new_hash:
+        return None
+    restored = apply_edits(text, entry.inverse)
+    if text_hash(restored) != entry.old_hash:
+        return None
+    return restored
+
+
+# Worker functions (top-level so they can be pickled) ----------------------
+
+
+def _count_file(args: Tuple[str, str, ReplaceOptions]) -> Tuple[str, int]:
+    path, search, options = args
+    try:
+        text = storage.read_text(Path(path))
+    except (OSError, UnicodeDecodeError):
+        return path, 0
+    spans = text_replace.find_spans(
+        text,
+        search,
+        case_sensitive=options.case_sensitive,
+        whole_word=options.whole_word,
+    )
+    return path, len(spans)
+
+
+def _replace_file(args: Tuple[str, str, str, ReplaceOptions]) -> Tuple[str, str, str, Tuple[TextEdit, ...]] | None:
+    path, search, replacement, options = args
+    try:
+        text = storage.read_text(Path(path))
+    except (OSError, UnicodeDecodeError):
+        return None
+    result = replace_in_text(text, search, replacement, options)
+    if result is None:
+        return None
+    new_text, inverse = result
+    storage.write_text_atomic(Path(path), new_text)
+    return path, text_hash(text), text_hash(new_text), inverse
+
+
+def _undo_file(args: Tuple[str, JournalEntry]) -> Tuple[str, bool]:
+    path, entry = args
+    try:
+        text = storage.read_text(Path(path))
+    except (OSError, UnicodeDecodeError):
+        return path, False
+    if text_hash(text) == entry.old_hash:
+        # Already restored (e.g. by an earlier attempt of this job).
+        return path, True
+    restored = undo_text(text, entry)
+    if restored is None:
+        return path, False
+    storage.write_text_atomic(Path(path), restored)
+    return path, True
+
+
+def _run(func: Callable, jobs: List, max_workers: int | None, *, retry: bool = True) -> List:
+    """Map *func* over *jobs*, in worker processes when worthwhile.
+
+    If the pool cannot be used (sandboxed or frozen builds without process
+    support) the jobs that were never handed to a worker run in this
+    process instead. Jobs whose worker failed are run again here only with
+    *retry*; otherwise their result is ``_FAILED``, since a job that writes
+    may have completed before its worker died.
+    """
+
+    results: Dict[int, object] = {}
+    submitted: set[int] = set()
+    if len(jobs) >= _PARALLEL_THRESHOLD and max_workers != 1:
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        try:
+            # Forking a process that runs Qt and other threads can deadlock
+            # the children; start them fresh instead.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = {}
+                for i, job in enumerate(jobs):
+                    futures[pool.submit(func, job)] = i
+                    submitted.add(i)
+                for future, i in futures.items():
+                    try:
+                        results[i] = future.result()
+                    except (OSError, RuntimeError):
+                        continue
+        except (OSError, RuntimeError, ImportError):
+            pass
+    outcomes: List = []
+    for i, job in enumerate(jobs):
+        if i in results:
+            outcomes.append(results[i])
+        elif retry or i not in submitted:
+            outcomes.append(func(job))
+        else:
+            outcomes.append(_FAILED)
+    return outcomes
+
+
+def _normalise_overrides(overrides: Mapping[Path, str] | None) -> Dict[str, str]:
+    result: Dict[str, str] = {}
+    for path, text in (overrides or {}).items():
+        try:
+            result[str(Path(path).resolve())] = text
+        except OSError:
+            continue
+    return result
+
+
+# Public operations --------------------------------------------------------
+
+
+def scan_space(
+    root: Path,
+    search: str,
+    options: ReplaceOptions = ReplaceOptions(),
+    *,
+    overrides: Mapping[Path, str] | None = None,
+    max_workers: int | None = None,
+) -> List[FileMatches]:
+    """Return per-file match counts for *search* below *root*.
+
+    Parameters
+    ----------
+    overrides:
+        In-memory text for open documents, used instead of the disk copy.
+    max_workers:
+        Number of worker processes; ``1`` scans in this process.
+    """
+
+    if not search:
+        return []
+    root = Path(root).expanduser().resolve()
+    memory = _normalise_overrides(overrides)
+
+    jobs = []
+    results: List[Tuple[str, int]] = []
+    for path in iter_indexable_files(root):
+        key = str(path.resolve())
+        if key in memory:
+            spans = text_replace.find_spans(
+                memory[key],
+                search,
+                case_sensitive=options.case_sensitive,
+                whole_word=options.whole_word,
+            )
+            results.append((key, len(spans)))
+        else:
+            jobs.append((key, search, options))
+    results.extend(_run(_count_file, jobs, max_workers))
+
+    matches = [FileMatches(Path(path), count) for path, count in results if count]
+    matches.sort(key=lambda m: str(m.path))
+    return matches
+
+
+def apply_replace(
+    root: Path,
+    paths: Iterable[Path],
+    search: str,
+    replacement: str,
+    options: ReplaceOptions = ReplaceOptions(),
+    *,
+    overrides: Mapping[Path, str] | None = None,
+    max_workers: int | None = None,
+) -> ReplaceJournal:
+    """Replace *search* in *paths* and return the (unsaved) journal.
+
+    Every file, including those given in *overrides*, is written to disk
+    atomically; for overridden paths the in-memory text is the source.
+    Files that may or may not have been rewritten are reported in
+    ``journal.failed`` and have no undo entry.
+    """
+
+    root = Path(root).expanduser().resolve()
+    memory = _normalise_overrides(overrides)
+    journal = ReplaceJournal(root=root, search=search, replacement=replacement)
+
+    jobs = []
+    outcomes = []
+    for path in paths:
+        key = str(Path(path).resolve())
+        if key in memory:
+            text = memory[key]
+            result = replace_in_text(text, search, replacement, options)
+            if result is None:
+                continue
+            new_text, inverse = result
+            storage.write_text_atomic(Path(key), new_text)
+            outcomes.append((key, text_hash(text), text_hash(new_text), inverse))
+        else:
+            jobs.append((key, search, replacement, options))
+    for job, outcome in zip(jobs, _run(_replace_file, jobs, max_workers, retry=False)):
+        if outcome is _FAILED:
+            journal.failed.append(Path(job[0]).relative_to(root).as_posix())
+        elif outcome is not None:
+            outcomes.append(outcome)
+    journal.failed.sort()
+
+    for path, old_hash, new_hash, inverse in sorted(outcomes):
+        journal.entries.append(
+            JournalEntry(
+                path=Path(path).relative_to(root).as_posix(),
+                old_hash=old_hash,
+                new_hash=new_hash,
+                inverse=inverse,
+            )
+        )
+    return journal
+
+
+def undo_replace(
+    journal: ReplaceJournal,
+    *,
+    overrides: Mapping[Path, str] | None = None,
+    max_workers: int | None = None,
+) -> Tuple[Dict[Path, str], List[Path], List[Path]]:
+    """Revert *journal* on disk.
+
+    Returns ``(restored_overrides, restored, conflicts)``: the restored text
+    of every overridden (open) document, the paths restored on disk and the
+    paths skipped because they changed after the replace.
+    """
+
+    root = Path(journal.root).expanduser().resolve()
+    memory = _normalise_overrides(overrides)
+
+    restored_memory: Dict[Path, str] = {}
+    restored: List[Path] = []
+    conflicts: List[Path] = []
+    jobs = []
+    for entry in journal.entries:
+        path = root / entry.path
+        key = str(path)
+        if key in memory:
+            text = undo_text(memory[key], entry)
+            if text is None:
+                conflicts.append(path)
+                continue
+            storage.write_text_atomic(path, text)
+            restored_memory[path] = text
+            restored.append(path)
+        else:
+            jobs.append((key, entry))
+
+    for key, ok in _run(_undo_file, jobs, max_workers):
+        (restored if ok else conflicts).append(Path(key))
+    return restored_memory, restored, conflicts
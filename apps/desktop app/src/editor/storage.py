@@ -1,12 +1,71 @@
 """Filesystem helpers used by the distraction-free editor.
 
 This module is GUI-agnostic and centralises basic file IO.
+
+Writes are atomic (temporary file, fsync, ``os.replace``) so a crash or a
+full disk can never leave a truncated manuscript behind. The module also
+remembers the hash of the text last read from or written to each path;
+:func:`write_text` skips the write when the new text is identical and the
+file has not been touched by anyone else since.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 
+from . import file_metadata
+
+# path -> (content hash, mtime_ns, size) as of the last read/write through
+# this module.
+_persisted: dict[str, tuple[str, int, int]] = {}
+_persisted_lock = threading.Lock()
+
+
+def content_hash(text: str, encoding: str = "utf-8") -> str:
+    """Return the hex digest used to detect unchanged content."""
+
+    return hashlib.sha256(text.encode(encoding)).hexdigest()
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+def _remember(path: Path, digest: str) -> None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    with _persisted_lock:
+        _persisted[_key(path)] = (digest, st.st_mtime_ns, st.st_size)
+
+
+def forget(path: Path) -> None:
+    """Drop the remembered hash for *path* (e.g. after it was deleted)."""
+
+    with _persisted_lock:
+        _persisted.pop(_key(path), None)
+
+
+def is_persisted(path: Path, digest: str) -> bool:
+    """Return True if *path* on disk still holds content with *digest*."""
+
+    with _persisted_lock:
+        record = _persisted.get(_key(path))
+    if record is None or record[0] != digest:
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    # An external edit changes mtime or size; then the cached hash is stale.
+    return (st.st_mtime_ns, st.st_size) == record[1:]
+
 
 def read_text(path: Path, encoding: str = "utf-8") -> str:
     """Read a UTF-8 text file from *path*.
@@ -14,11 +73,118 @@ def read_text(path: Path, encoding: str = "utf-8") -> str:
     For now this assumes reasonably small text/Markdown files.
     """
 
-    return path.read_text(encoding=encoding)
+    text = path.read_text(encoding=encoding)
+    _remember(path, content_hash(text, encoding))
+    return text
 
 
-def write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
-    """Write *text* to *path* as UTF-8, creating parent directories if needed."""
+def write_text(path: Path, text: str, encoding: str = "utf-8") -> bool:
+    """Write *text* to *path* as UTF-8, creating parent directories if needed.
+
+    Returns ``False`` without touching the file when it already holds
+    exactly *text*, ``True`` after an (atomic) write.
+    """
+
+    if is_persisted(path, content_hash(text, encoding)):
+        return False
+    write_text_atomic(path, text, encoding)
+    return True
+
+
+def _copy_xattrs(src: Path, dst: Path) -> dict[str, bytes]:
+    """Best-effort copy of extended attributes (Crowdly metadata) to *dst*.
+
+    Returns the attributes that were copied.
+    """
+
+    copied: dict[str, bytes] = {}
+    if not hasattr(os, "listxattr"):
+        return copied
+    try:
+        names = os.listxattr(src)
+    except OSError:
+        return copied
+    for name in names:
+        try:
+            value = os.getxattr(src, name)
+            os.setxattr(dst, name, value)
+        except OSError:
+            continue
+        copied[name] = value
+    return copied
+
+
+_umask: int | None = None
+_umask_lock = threading.Lock()
+
+
+def _process_umask() -> int:
+    """Return the process umask (read once; ``os.umask`` can only swap it)."""
+
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+        return _umask
+
+
+def _fsync_directory(directory: Path) -> None:
+    # Makes the rename itself durable. Not supported on every platform
+    # (e.g. Windows cannot open directories); best-effort there.
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Write *text* to *path* without ever leaving a truncated file behind.
+
+    The text goes to a temporary file in the same directory, which is
+    fsynced and then moved over *path* with ``os.replace``; the directory is
+    fsynced afterwards so the rename survives a crash too. Permissions and
+    extended attributes of an existing *path* are copied onto the temporary
+    file first so story metadata survives the swap; new files get the
+    usual ``0666 & ~umask`` mode rather than the private mode of temporary
+    files.
+    """
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding=encoding)
+    copied: dict[str, bytes] = {}
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if path.exists():
+            try:
+                shutil.copymode(path, tmp_path)
+            except OSError:
+                pass
+            copied = _copy_xattrs(path, tmp_path)
+        else:
+            try:
+                os.chmod(tmp_path, 0o666 & ~_process_umask())
+            except OSError:
+                pass
+        os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    _remember(path, content_hash(text, encoding))
+    # The new inode carries exactly the copied attributes; seed the metadata
+    # cache so the post-save metadata update does not list them again.
+    file_metadata.remember_copied(path, copied)
@@ -0,0 +1,168 @@
+"""Chapter-level delta sync for stories.
+
+A full desktop sync posts every chapter of the story. After a successful
+sync we remember a *manifest*: the content hash of each chapter (in
+order) and the ``updated_at`` the backend returned. The next sync compares
+the current chapters against it and only sends what changed:
+
+* ``order[i]`` is the old position whose content is kept at new position
+  ``i`` (unchanged or moved chapters), or ``None``;
+* ``chapters`` holds the content of every position whose ``order`` entry is
+  ``None`` (new or edited chapters). Positions not listed are deleted.
+
+The delta carries the manifest's ``updated_at`` and chapter count as a
+precondition. When the story was changed by someone else in the meantime
+the backend answers ``409`` and :func:`sync_story` falls back to a full
+sync; older backends that do not know deltas answer ``400`` and are
+handled the same way.
+
+Manifests are kept in :class:`editor.sync_manifest.ManifestStore`. This
+module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
+
+from .sync_manifest import ManifestStore, shared_store
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .crowdly_client import CrowdlyClient
+
+MANIFEST_KIND = "story"
+
+# Statuses meaning "this delta cannot be applied": stale precondition or a
+# backend without delta support.
+FALLBACK_STATUSES = frozenset({400, 409, 412})
+
+
+def chapter_hash(chapter: Dict[str, Any]) -> str:
+    """Return a stable content hash for one chapter payload."""
+
+    title = chapter.get("chapterTitle")
+    paragraphs = chapter.get("paragraphs")
+    raw = json.dumps([title if isinstance(title, str) else "", paragraphs if isinstance(paragraphs, list) else []])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class StoryManifest:
+    """Chapter hashes of a story as of its last successful sync."""
+
+    story_id: str
+    updated_at: str
+    hashes: List[str]
+
+
+def compute_delta(manifest: StoryManifest, chapters: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the delta payload that turns *manifest* into *chapters*."""
+
+    # Old positions by hash; a hash can occur more than once (e.g. empty
+    # chapters), each old position is reused at most once.
+    free: Dict[str, List[int]] = {}
+    for index, digest in enumerate(manifest.hashes):
+        free.setdefault(digest, []).append(index)
+
+    hashes = [chapter_hash(ch) for ch in chapters]
+    order: List[int | None] = [None] * len(hashes)
+    # Chapters that stayed in place first, so a move elsewhere does not
+    # steal their old position.
+    for index, digest in enumerate(hashes):
+        candidates = free.get(digest)
+        if candidates and index in candidates:
+            candidates.remove(index)
+            order[index] = index
+    for index, digest in enumerate(hashes):
+        candidates = free.get(digest)
+        if order[index] is None and candidates:
+            order[index] = candidates.pop(0)
+
+    sent = [
+        {"index": index, "chapterTitle": chapters[index].get("chapterTitle"), "paragraphs": chapters[index].get("paragraphs")}
+        for index, source in enumerate(order)
+        if source is None
+    ]
+    return {
+        "baseUpdatedAt": manifest.updated_at,
+        "baseChapterCount": len(manifest.hashes),
+        "order": order,
+        "chapters": sent,
+    }
+
+
+def load_manifest(store: ManifestStore, api_base: str, story_id: str) -> StoryManifest | None:
+    raw = store.read(MANIFEST_KIND, api_base, story_id)
+    if raw is None:
+        return None
+    updated_at = raw.get("updated_at")
+    hashes = raw.get("hashes")
+    if not isinstance(updated_at, str) or not updated_at or not isinstance(hashes, list):
+        return None
+    if not all(isinstance(h, str) for h in hashes):
+        return None
+    return StoryManifest(story_id=story_id, updated_at=updated_at, hashes=list(hashes))
+
+
+def save_manifest(store: ManifestStore, api_base: str, manifest: StoryManifest) -> None:
+    store.write(MANIFEST_KIND, api_base, manifest.story_id, {"updated_at": manifest.updated_at, "hashes": manifest.hashes})
+
+
+def sync_story(
+    client: "CrowdlyClient",
+    story_id: str,
+    *,
+    title: str,
+    chapters: List[Dict[str, Any]],
+    metadata: Dict[str, Any] | None,
+    creative_space_id: str | None = None,
+    store: ManifestStore | None = None,
+) -> Any:
+    """Sync *chapters* as a delta when possible, else in full.
+
+    Returns the backend response of whichever request succeeded. Errors
+    other than a rejected delta propagate as :class:`CrowdlyClientError`.
+    """
+
+    from .crowdly_client import CrowdlyClientError
+
+    store = store or shared_store()
+    api_base = client.base_url
+    manifest = load_manifest(store, api_base, story_id)
+
+    result: Any = None
+    if manifest is not None:
+        try:
+            result = client.sync_desktop_story(
+                story_id,
+                title=title,
+                chapters=chapters,
+                metadata=metadata,
+                creative_space_id=creative_space_id,
+                delta=compute_delta(manifest, chapters),
+            )
+        except CrowdlyClientError as exc:
+            if exc.status_code not in FALLBACK_STATUSES:
+                raise
+            result = None
+    if result is None:
+        # Without a manifest the next attempt must be a full sync as well.
+        store.discard(MANIFEST_KIND, api_base, story_id)
+        result = client.sync_desktop_story(
+            story_id,
+            title=title,
+            chapters=chapters,
+            metadata=metadata,
+            creative_space_id=creative_space_id,
+        )
+
+    updated_at = result.get("updatedAt") if isinstance(result, dict) else None
+    if isinstance(updated_at, str) and updated_at:
+        save_manifest(
+            store,
+            api_base,
+            StoryManifest(story_id=story_id, updated_at=updated_at, hashes=[chapter_hash(ch) for ch in chapters]),
+        )
+    return result
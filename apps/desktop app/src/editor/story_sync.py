@@ -17,9 +17,15 @@ chapter with paragraphs split by blank lines.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+import hashlib
+import json
 import re
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .file_metadata import StoryMetadata
+    from .outline import OutlineIndex
+
 
 @dataclass(frozen=True)
 class ChapterPayload:
@@ -136,6 +142,61 @@ def parse_story_from_content(content: str, *, body_format: str | None = None) ->
     return StoryPayload(title=title, chapters=chapters)
 
 
+def parse_story_from_outline(lines: Sequence[str], outline: "OutlineIndex") -> StoryPayload:
+    """Build the same payload as :func:`parse_story_from_content` from an index.
+
+    *outline* must be a Markdown :class:`editor.outline.OutlineIndex` built
+    over exactly *lines*. Headings are taken from the index instead of being
+    re-detected, so only chapter bodies are scanned (for paragraphs).
+    """
+
+    entries = outline.entries()
+
+    title = None
+    title_line = -1
+    for entry in entries:
+        if entry.level == 1:
+            title = entry.title or "Untitled"
+            title_line = entry.line
+            break
+
+    # Level-1 headings after the title are ordinary body lines, exactly as
+    # in the line-by-line parser.
+    chapter_entries = [e for e in entries if e.level == 2]
+
+    def body(start: int, end: int) -> list[str]:
+        if start <= title_line < end:
+            return list(lines[start:title_line]) + list(lines[title_line + 1 : end])
+        return list(lines[start:end])
+
+    chapters: list[ChapterPayload] = []
+    first_chapter_line = chapter_entries[0].line if chapter_entries else len(lines)
+    leading = body(0, first_chapter_line)
+    # Text before the first chapter heading opens an implicit chapter, but
+    # only once a non-blank line is seen.
+    for index, line in enumerate(leading):
+        if line.strip():
+            chapters.append(ChapterPayload(chapterTitle="Chapter", paragraphs=_split_paragraphs(leading[index:])))
+            break
+
+    for index, entry in enumerate(chapter_entries):
+        end = chapter_entries[index + 1].line if index + 1 < len(chapter_entries) else len(lines)
+        chapters.append(
+            ChapterPayload(
+                chapterTitle=entry.title or "Chapter",
+                paragraphs=_split_paragraphs(body(entry.line + 1, end)),
+            )
+        )
+
+    if title is None:
+        title = "Untitled"
+
+    if not chapters:
+        chapters = [ChapterPayload(chapterTitle="Chapter", paragraphs=_split_paragraphs(list(lines)))]
+
+    return StoryPayload(title=title, chapters=chapters)
+
+
 def parse_screenplay_from_content(content: str) -> StoryPayload:
     """Parse a screenplay into a StoryPayload-like structure.
 
@@ -234,3 +295,31 @@ def to_json_payload(story: StoryPayload) -> dict[str, Any]:
             for ch in story.chapters
         ],
     }
+
+
+def metadata_payload(md: "StoryMetadata") -> dict[str, Any]:
+    """The ``metadata`` object of a desktop story sync request."""
+
+    tags_list = None
+    if md.tags:
+        # Accept comma-separated list.
+        tags_list = [t.strip() for t in md.tags.split(",") if t.strip()]
+
+    return {
+        "author_id": md.author_id,
+        "initiator_id": md.initiator_id,
+        "genre": md.genre,
+        "tags": tags_list,
+        "description": md.description,
+    }
+
+
+def payload_hash(payload: Mapping[str, Any]) -> str:
+    """Stable content hash of a sync request body.
+
+    Recorded after a successful sync; a later sync whose payload hashes the
+    same has nothing to send.
+    """
+
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
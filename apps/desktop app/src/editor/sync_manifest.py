@@ -0,0 +1,76 @@
+"""Persistent manifests of what the last successful web sync uploaded.
+
+Delta syncs (:mod:`editor.story_delta`, :mod:`editor.screenplay_sync`)
+describe changes relative to the state the backend accepted last time.
+:class:`ManifestStore` keeps one small JSON document per (kind, backend,
+item) under ``~/.cache/crowdly_editor/sync/``; the callers decide what goes
+into it. Losing a manifest only costs one full sync. This module is
+GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+CACHE_DIR_NAME = "crowdly_editor"
+
+
+def default_manifest_dir() -> Path:
+    return Path.home().joinpath(".cache", CACHE_DIR_NAME, "sync")
+
+
+class ManifestStore:
+    """One JSON manifest per (kind, backend, item id)."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_manifest_dir()
+        self._lock = threading.Lock()
+
+    def _path(self, kind: str, api_base: str, item_id: str) -> Path:
+        digest = hashlib.sha256(f"{api_base.rstrip('/')}\n{item_id}".encode("utf-8")).hexdigest()
+        return self.directory / f"{kind}-{digest}.json"
+
+    def read(self, kind: str, api_base: str, item_id: str) -> Dict[str, Any] | None:
+        try:
+            raw = json.loads(self._path(kind, api_base, item_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(raw, dict) or raw.get("id") != item_id:
+            return None
+        return raw
+
+    def write(self, kind: str, api_base: str, item_id: str, payload: Dict[str, Any]) -> None:
+        from . import storage
+
+        data = dict(payload)
+        data["id"] = item_id
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+                storage.write_text_atomic(self._path(kind, api_base, item_id), json.dumps(data))
+            except OSError:
+                pass
+
+    def discard(self, kind: str, api_base: str, item_id: str) -> None:
+        try:
+            self._path(kind, api_base, item_id).unlink()
+        except OSError:
+            pass
+
+
+_shared: ManifestStore | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_store() -> ManifestStore:
+    """Return the process-wide manifest store."""
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ManifestStore()
+        return _shared
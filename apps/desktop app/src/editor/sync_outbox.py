@@ -0,0 +1,286 @@
+"""Durable outbox of pending story/screenplay uploads.
+
+Every web sync request is recorded here before it is attempted and removed
+only once the backend accepted it, so an offline session (or a crash, or a
+restart) cannot lose the fact that local changes were never pushed.
+
+* One file per project: ``<project space>/.crowdly/sync-outbox.json`` for
+  documents inside a project space, ``~/.config/crowdly_editor/`` for the
+  rest.
+* Entries coalesce per document. The outbox records *that* a document
+  needs uploading, not what to upload: the payload is rebuilt from the file
+  when the upload runs, so any number of offline saves results in one
+  upload of the latest text.
+* Each entry carries a generation that every new request bumps; an upload
+  only clears the entry when no newer request arrived while it ran.
+* Failed uploads are retried with jittered exponential backoff;
+  :func:`probe` checks that a backend is reachable before retrying, and
+  :meth:`SyncOutbox.retry_now` cuts the wait short once connectivity is
+  known to be back.
+
+This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .http_transport import HttpTransport, TransportError, shared_transport
+from .settings import CONFIG_DIR_NAME
+
+KIND_STORY = "story"
+KIND_SCREENPLAY = "screenplay"
+
+OUTBOX_FILE_NAME = "sync-outbox.json"
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A document that has changes the backend has not accepted yet."""
+
+    kind: str
+    local_path: str
+    remote_id: str
+    api_base: str
+    generation: int = 1
+    enqueued_at: float = 0.0
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    last_error: str | None = None
+
+
+def outbox_path_for(project_root: Path | None) -> Path:
+    if project_root is not None:
+        return Path(project_root) / ".crowdly" / OUTBOX_FILE_NAME
+    return Path.home().joinpath(".config", CONFIG_DIR_NAME, OUTBOX_FILE_NAME)
+
+
+def is_retryable(kind: str | None, status_code: int | None) -> bool:
+    """Whether an upload that failed this way may succeed unchanged later."""
+
+    if kind == "network":
+        return True
+    return isinstance(status_code, int) and (status_code >= 500 or status_code in (408, 429))
+
+
+def probe(api_base: str, *, transport: HttpTransport | None = None, timeout: float = 3.0) -> bool:
+    """Return whether *api_base* answers its health check."""
+
+    try:
+        resp = (transport or shared_transport()).get(f"{api_base.rstrip('/')}/health", timeout=timeout)
+    except TransportError:
+        return False
+    return resp.ok
+
+
+class SyncOutbox:
+    """Persistent, coalescing queue of pending uploads; thread-safe.
+
+    Parameters
+    ----------
+    path:
+        JSON file holding the entries.
+    clock:
+        Wall clock in seconds (retry times survive restarts).
+    backoff_base, backoff_max:
+        After the *n*-th consecutive failure the next attempt is due after
+        ``min(backoff_max, backoff_base * 2 ** (n - 1))`` seconds, +/- 20%.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        clock: Callable[[], float] | None = None,
+        backoff_base: float = 5.0,
+        backoff_max: float = 600.0,
+    ) -> None:
+        self.path = Path(path)
+        self.clock = clock or time.time
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._entries: Dict[str, OutboxEntry] = {}
+        # Documents whose upload is running right now (not persisted: after
+        # a restart nothing is running).
+        self._in_flight: set[str] = set()
+        self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def entries(self) -> List[OutboxEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, local_path: Path | str) -> OutboxEntry | None:
+        with self._lock:
+            return self._entries.get(str(local_path))
+
+    # Requests ---------------------------------------------------------------
+
+    def enqueue(self, kind: str, local_path: Path | str, remote_id: str, api_base: str, *, claim: bool = False) -> int | None:
+        """Record that *local_path* needs uploading.
+
+        With *claim*, the caller uploads it right away: returns the
+        generation to pass to :meth:`succeeded`, or ``None`` when an upload
+        of the document is already running (it will be repeated afterwards).
+        """
+
+        key = str(local_path)
+        with self._lock:
+            now = self.clock()
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = OutboxEntry(kind=kind, local_path=key, remote_id=remote_id, api_base=api_base, enqueued_at=now, next_attempt_at=now)
+            else:
+                # Keep the backoff of a failing document; a new save does
+                # not make an unreachable backend reachable.
+                entry = replace(entry, kind=kind, remote_id=remote_id, api_base=api_base, generation=entry.generation + 1)
+            self._entries[key] = entry
+            self._save()
+            if not claim:
+                return None
+            if key in self._in_flight:
+                return None
+            self._in_flight.add(key)
+            return entry.generation
+
+    def claim_due(self) -> List[OutboxEntry]:
+        """Return the entries whose retry is due and mark them running."""
+
+        with self._lock:
+            now = self.clock()
+            due = [e for k, e in self._entries.items() if k not in self._in_flight and e.next_attempt_at <= now]
+            self._in_flight.update(e.local_path for e in due)
+            return due
+
+    def next_due_in(self) -> float | None:
+        """Seconds until an entry is due, ``None`` when nothing is waiting."""
+
+        with self._lock:
+            waiting = [e.next_attempt_at for k, e in self._entries.items() if k not in self._in_flight]
+            if not waiting:
+                return None
+            return max(0.0, min(waiting) - self.clock())
+
+    # Outcomes -----------------------------------------------------------------
+
+    def succeeded(self, local_path: Path | str, generation: int) -> bool:
+        """Finish an upload; return whether the entry was cleared."""
+
+        key = str(local_path)
+        with self._lock:
+            self._in_flight.discard(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                return True
+            if entry.generation != generation:
+                # Saved again meanwhile: upload once more, right away.
+                self._entries[key] = replace(entry, attempts=0, next_attempt_at=self.clock(), last_error=None)
+                self._save()
+                return False
+            del self._entries[key]
+            self._save()
+            return True
+
+    def failed(self, local_path: Path | str, error: str) -> None:
+        """Finish an upload that should be retried later."""
+
+        key = str(local_path)
+        with self._lock:
+            self._in_flight.discard(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            attempts = entry.attempts + 1
+            delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+            delay *= random.uniform(0.8, 1.2)
+            self._entries[key] = replace(
+                entry, attempts=attempts, next_attempt_at=self.clock() + delay, last_error=error
+            )
+            self._save()
+
+    def release(self, local_path: Path | str) -> None:
+        """Finish an upload without an outcome (e.g. it could not start)."""
+
+        with self._lock:
+            self._in_flight.discard(str(local_path))
+
+    def discard(self, local_path: Path | str) -> None:
+        """Drop the entry (the upload cannot succeed without user action)."""
+
+        key = str(local_path)
+        with self._lock:
+            self._in_flight.discard(key)
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def retry_now(self, api_base: str | None = None) -> None:
+        """Make waiting entries (of *api_base*) due immediately."""
+
+        with self._lock:
+            now = self.clock()
+            changed = False
+            for key, entry in self._entries.items():
+                if entry.next_attempt_at > now and (api_base is None or entry.api_base == api_base):
+                    self._entries[key] = replace(entry, next_attempt_at=now)
+                    changed = True
+            if changed:
+                self._save()
+
+    # Persistence (called with ``_lock`` held) ---------------------------------
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        items = raw.get("entries") if isinstance(raw, dict) else None
+        for item in items if isinstance(items, list) else []:
+            try:
+                entry = OutboxEntry(**item)
+            except TypeError:
+                continue
+            if entry.kind in (KIND_STORY, KIND_SCREENPLAY) and entry.local_path and entry.remote_id:
+                self._entries[entry.local_path] = entry
+
+    def _save(self) -> None:
+        from . import storage
+
+        if not self._entries and not self.path.exists():
+            return
+        data = {"version": 1, "entries": [asdict(e) for e in self._entries.values()]}
+        try:
+            storage.write_text_atomic(self.path, json.dumps(data, ensure_ascii=False))
+        except OSError:
+            # Best-effort: the queue keeps working in memory.
+            pass
+
+
+_outboxes: Dict[Path, SyncOutbox] = {}
+_outboxes_lock = threading.Lock()
+
+
+def outbox_for(project_root: Path | None) -> SyncOutbox:
+    """Return the process-wide outbox of *project_root* (``None``: default)."""
+
+    path = outbox_path_for(project_root)
+    with _outboxes_lock:
+        outbox = _outboxes.get(path)
+        if outbox is None:
+            outbox = SyncOutbox(path)
+            _outboxes[path] = outbox
+        return outbox
+
+
+def loaded_outboxes() -> List[SyncOutbox]:
+    with _outboxes_lock:
+        return list(_outboxes.values())
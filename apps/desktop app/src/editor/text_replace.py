@@ -0,0 +1,114 @@
+"""Plain-string search and replace helpers.
+
+Replace All used to drive the text widget through ``find()`` and
+``insertText()`` once per match, which re-ran every change handler and
+left one undo step per occurrence. These helpers compute all match spans
+on the plain text in one pass and describe the result as a single minimal
+edit that the GUI can apply inside one edit block.
+
+Options mirror the search bar: case sensitivity and whole-word matching
+(with the same "not adjacent to a word character" rule as
+``QTextDocument.FindWholeWords``). This module is GUI-agnostic.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Pattern, Tuple
+
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replace ``text[start:end]`` with ``replacement``."""
+
+    start: int
+    end: int
+    replacement: str
+
+
+def compile_search(pattern: str, *, case_sensitive: bool = False, whole_word: bool = False, regex: bool = False) -> Pattern[str]:
+    """Compile *pattern* with the search bar options applied."""
+
+    body = pattern if regex else re.escape(pattern)
+    if whole_word:
+        body = rf"(?<!\w)(?:{body})(?!\w)"
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(body, flags)
+
+
+def find_spans(text: str, pattern: str, *, case_sensitive: bool = False, whole_word: bool = False, regex: bool = False) -> List[Span]:
+    """Return non-overlapping ``(start, end)`` spans of *pattern* in *text*."""
+
+    if not pattern:
+        return []
+    compiled = compile_search(pattern, case_sensitive=case_sensitive, whole_word=whole_word, regex=regex)
+    return [m.span() for m in compiled.finditer(text) if m.end() > m.start()]
+
+
+def replace_spans(text: str, spans: List[Span], replacement: str) -> str:
+    """Build the new text for *spans* in a single pass."""
+
+    parts: List[str] = []
+    pos = 0
+    for start, end in spans:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def minimal_edit(text: str, spans: List[Span], replacement: str) -> TextEdit | None:
+    """Return one edit covering the first to last span, or ``None``.
+
+    Text outside the outermost matches is untouched, so editors keep
+    their blocks (and formatting) before and after the changed region.
+    """
+
+    if not spans:
+        return None
+    start = spans[0][0]
+    end = spans[-1][1]
+    shifted = [(s - start, e - start) for s, e in spans]
+    return TextEdit(start=start, end=end, replacement=replace_spans(text[start:end], shifted, replacement))
+
+
+def utf16_length(text: str) -> int:
+    """Return the length of *text* in UTF-16 code units."""
+
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def utf16_spans(text: str, spans: List[Span]) -> List[Span]:
+    """Map sorted character *spans* of *text* to UTF-16 positions.
+
+    Spans are computed on Python strings, which index code points, while
+    ``QTextCursor.setPosition`` counts UTF-16 code units; every character
+    outside the Basic Multilingual Plane (emoji, ...) before a span shifts
+    it by one.
+    """
+
+    mapped: List[Span] = []
+    offset = 0
+    pos = 0
+    for start, end in spans:
+        offset += utf16_length(text[pos:start])
+        first = offset
+        offset += utf16_length(text[start:end])
+        mapped.append((first, offset))
+        pos = end
+    return mapped
+
+
+def replace_all(text: str, pattern: str, replacement: str, *, case_sensitive: bool = False, whole_word: bool = False, regex: bool = False) -> Tuple[str, int]:
+    """Return ``(new_text, count)`` after replacing every match."""
+
+    spans = find_spans(text, pattern, case_sensitive=case_sensitive, whole_word=whole_word, regex=regex)
+    if not spans:
+        return text, 0
+    return replace_spans(text, spans, replacement), len(spans)
@@ -0,0 +1,180 @@
+"""Incremental document statistics.
+
+The status bar shows word, paragraph and chapter counts for the active
+document. Recomputing them from the full text on every keystroke costs
+O(document size); :class:`IncrementalStats` instead keeps per-line counts
+plus running totals and only re-examines the lines touched by an edit.
+
+Lines are interpreted according to the document's storage format:
+
+* ``markdown`` – ``# `` / ``## `` headings, everything else is body text.
+* ``story_v1`` / ``screenplay_v1`` – one-line ``[tag attrs]body[/tag]``
+  blocks; only the body is counted and title/chapter/scene tags map to
+  heading levels 1 and 2.
+
+A paragraph is a run of non-empty lines separated by blank lines, which
+matches how the editor has always counted them. This module is
+GUI-agnostic; the Qt glue lives in :mod:`editor.ui.document_index`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+_HEADING_TAGS = {
+    "story_title": 1,
+    "screenplay_title": 1,
+    "chapter_title": 2,
+    "scene_slugline": 2,
+}
+
+
+@dataclass(frozen=True)
+class LineStats:
+    words: int = 0
+    characters: int = 0
+    heading_level: int = 0
+    blank: bool = True
+
+
+@dataclass(frozen=True)
+class DocumentStats:
+    words: int = 0
+    characters: int = 0
+    paragraphs: int = 0
+    chapters: int = 0
+
+
+_BLANK = LineStats()
+
+
+def _strip_dsl_tags(line: str) -> tuple[str, int]:
+    """Return (body, heading level) for a one-line DSL block."""
+
+    if not line.startswith("[") or "]" not in line:
+        return line, 0
+    header, body = line.split("]", 1)
+    tag = header[1:].split(" ", 1)[0]
+    closing = f"[/{tag}]"
+    if body.endswith(closing):
+        body = body[: -len(closing)]
+    elif tag == "image":
+        return "", 0
+    return body, _HEADING_TAGS.get(tag, 0)
+
+
+def line_stats(line: str, storage_format: str = "markdown") -> LineStats:
+    """Compute the statistics contributed by a single source line."""
+
+    stripped = line.strip()
+    if not stripped:
+        return _BLANK
+
+    level = 0
+    body = stripped
+    if storage_format in ("story_v1", "screenplay_v1"):
+        body, level = _strip_dsl_tags(stripped)
+    elif stripped.startswith("## "):
+        level, body = 2, stripped[3:]
+    elif stripped.startswith("# "):
+        level, body = 1, stripped[2:]
+
+    words = body.split()
+    return LineStats(
+        words=len(words),
+        characters=sum(len(w) for w in words),
+        heading_level=level,
+        blank=False,
+    )
+
+
+class IncrementalStats:
+    """Per-line statistics with running totals.
+
+    Callers report edits as "lines ``first .. first + removed - 1`` were
+    replaced by *new_lines*" via :meth:`replace_lines`; only those lines and
+    the one directly after them (whose paragraph boundary may change) are
+    re-examined.
+    """
+
+    def __init__(self, storage_format: str = "markdown") -> None:
+        self.storage_format = storage_format or "markdown"
+        self._lines: List[LineStats] = []
+        self._words = 0
+        self._characters = 0
+        self._paragraphs = 0
+        self._h1 = 0
+        self._h2 = 0
+
+    # Public API -----------------------------------------------------------
+
+    def reset(self, text: str | Iterable[str], storage_format: str | None = None) -> None:
+        """Recompute everything from *text* (a string or iterable of lines)."""
+
+        if storage_format:
+            self.storage_format = storage_format
+        lines = text.split("\n") if isinstance(text, str) else list(text)
+        self._lines = []
+        self._words = self._characters = self._paragraphs = self._h1 = self._h2 = 0
+        self.replace_lines(0, 0, lines)
+
+    def replace_lines(self, first: int, removed: int, new_lines: Sequence[str]) -> None:
+        """Replace *removed* lines starting at *first* with *new_lines*."""
+
+        count = len(self._lines)
+        first = max(0, min(first, count))
+        removed = max(0, min(removed, count - first))
+        end = first + removed
+
+        for index in range(first, end):
+            self._account(index, -1)
+        # The line following the edited range may gain or lose its status as
+        # the start of a paragraph.
+        if end < count:
+            self._account_paragraph_start(end, -1)
+
+        fmt = self.storage_format
+        self._lines[first:end] = [line_stats(line, fmt) for line in new_lines]
+
+        new_end = first + len(new_lines)
+        for index in range(first, new_end):
+            self._account(index, 1)
+        if new_end < len(self._lines):
+            self._account_paragraph_start(new_end, 1)
+
+    def totals(self) -> DocumentStats:
+        """Return the current totals in O(1)."""
+
+        # Prefer level-2 headings as chapters when present (a single "# Title"
+        # followed by "## 1." style chapters), otherwise fall back to level-1.
+        chapters = self._h2 if self._h2 else self._h1
+        return DocumentStats(
+            words=self._words,
+            characters=self._characters,
+            paragraphs=self._paragraphs,
+            chapters=chapters,
+        )
+
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    # Internal helpers -----------------------------------------------------
+
+    def _account(self, index: int, sign: int) -> None:
+        stats = self._lines[index]
+        if stats.blank:
+            return
+        self._words += sign * stats.words
+        self._characters += sign * stats.characters
+        if stats.heading_level == 1:
+            self._h1 += sign
+        elif stats.heading_level == 2:
+            self._h2 += sign
+        self._account_paragraph_start(index, sign)
+
+    def _account_paragraph_start(self, index: int, sign: int) -> None:
+        if self._lines[index].blank:
+            return
+        if index == 0 or self._lines[index - 1].blank:
+            self._paragraphs += sign
@@ -0,0 +1,108 @@
+"""Qt glue keeping per-block document indexes current.
+
+:class:`DocumentIndexTracker` listens to ``QTextDocument.contentsChange``
+and maps each reported character range onto the affected blocks. The
+blocks are then handed to the GUI-agnostic line models:
+
+* :class:`editor.text_stats.IncrementalStats` – word/paragraph/chapter
+  counts for the status bar.
+* :class:`editor.outline.OutlineIndex` – headings for the navigator and
+  for sync payloads.
+
+Both are updated in O(edit size) instead of re-reading the document.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QTextDocument
+
+from ..outline import OutlineIndex
+from ..text_stats import DocumentStats, IncrementalStats
+
+
+class DocumentIndexTracker(QObject):
+    """Maintain statistics and an outline for a QTextDocument."""
+
+    # Emitted when headings were added, removed or retitled (not when they
+    # merely moved because lines were inserted above them).
+    outlineChanged = Signal()
+
+    def __init__(self, document: QTextDocument, storage_format: str = "markdown") -> None:
+        super().__init__(document)
+        self._document = document
+        self._stats = IncrementalStats(storage_format)
+        self._outline = OutlineIndex(storage_format)
+        self._block_count = 0
+        self.rebuild()
+        document.contentsChange.connect(self._on_contents_change)
+
+    # Public API -----------------------------------------------------------
+
+    @property
+    def outline(self) -> OutlineIndex:
+        return self._outline
+
+    @property
+    def storage_format(self) -> str:
+        return self._stats.storage_format
+
+    def totals(self) -> DocumentStats:
+        return self._stats.totals()
+
+    def set_storage_format(self, storage_format: str) -> None:
+        """Switch how lines are interpreted, rebuilding only on change."""
+
+        storage_format = storage_format or "markdown"
+        if storage_format != self._stats.storage_format:
+            self._stats.storage_format = storage_format
+            self._outline.storage_format = storage_format
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute all per-block data from the document."""
+
+        lines: list[str] = []
+        block = self._document.begin()
+        while block.isValid():
+            lines.append(block.text())
+            block = block.next()
+        self._stats.reset(lines)
+        self._outline.reset(lines)
+        self._block_count = self._document.blockCount()
+        self.outlineChanged.emit()
+
+    # Slots ----------------------------------------------------------------
+
+    def _on_contents_change(self, position: int, _removed: int, added: int) -> None:  # pragma: no cover - UI wiring
+        doc = self._document
+        new_count = doc.blockCount()
+
+        first_block = doc.findBlock(position)
+        if not first_block.isValid():
+            self.rebuild()
+            return
+        last_block = doc.findBlock(position + added)
+        if not last_block.isValid():
+            last_block = doc.lastBlock()
+
+        first = first_block.blockNumber()
+        last = last_block.blockNumber()
+        # Blocks first..last now hold the edited text; they replaced however
+        # many blocks were there before, which follows from the block delta.
+        removed_blocks = (last - first + 1) - (new_count - self._block_count)
+        if removed_blocks < 0 or self._stats.line_count() != self._block_count:
+            self.rebuild()
+            return
+
+        texts: list[str] = []
+        block = first_block
+        while block.isValid() and block.blockNumber() <= last:
+            texts.append(block.text())
+            block = block.next()
+
+        self._stats.replace_lines(first, removed_blocks, texts)
+        outline_changed = self._outline.replace_lines(first, removed_blocks, texts)
+        self._block_count = new_count
+        if outline_changed:
+            self.outlineChanged.emit()
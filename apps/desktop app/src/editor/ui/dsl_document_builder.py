@@ -0,0 +1,150 @@
+"""Build `.story` / `.screenplay` previews directly into a QTextDocument.
+
+The HTML path (``dsl_to_html`` followed by ``QTextEdit.setHtml``) renders
+the DSL into a markup string only for Qt to parse it straight back into
+blocks. This module walks the parsed DSL blocks instead and emits them
+through a :class:`QTextCursor`, reusing interned block/char formats for
+every distinct attribute combination.
+
+The resulting document matches what Qt produces from the HTML export:
+titles and chapter/scene headings carry heading levels 1/2 (which
+:meth:`PreviewWidget.build_story_dsl` relies on), and paragraphs use the
+same default margins as ``<p>``.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Mapping, Tuple
+
+from PySide6.QtGui import (
+    QFont,
+    QTextBlockFormat,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+    QTextFormat,
+    QTextImageFormat,
+)
+
+from ..format import dsl, screenplay_markup, story_markup, styles
+
+STORY_HEADING_LEVELS: Mapping[str, int] = {"story_title": 1, "chapter_title": 2}
+SCREENPLAY_HEADING_LEVELS: Mapping[str, int] = {"screenplay_title": 1, "scene_slugline": 2}
+
+# Default margins and font size adjustments used by Qt's HTML importer for
+# <h1>, <h2> and <p>; keeping them identical avoids a visual jump when a
+# document switches between the HTML and the direct rendering path.
+_HEADING_MARGINS = {1: (18.0, 12.0), 2: (16.0, 12.0)}
+_HEADING_SIZE_ADJUSTMENT = {1: 3, 2: 2}
+_PARAGRAPH_MARGINS = (12.0, 12.0)
+
+_FormatKey = Tuple[styles.AttrKey, int, bool]
+_FORMATS: Dict[_FormatKey, Tuple[QTextBlockFormat, QTextCharFormat]] = {}
+
+
+def _formats_for(attrs: styles.AttrKey, level: int, bold_headings: bool) -> Tuple[QTextBlockFormat, QTextCharFormat]:
+    key = (attrs, level, bold_headings)
+    cached = _FORMATS.get(key)
+    if cached is not None:
+        return cached
+
+    attrs_dict = dict(attrs)
+    block_fmt = QTextBlockFormat(styles.block_format_for_attrs(attrs_dict))
+    char_fmt = QTextCharFormat(styles.char_format_for_attrs(attrs_dict))
+
+    if level:
+        top, bottom = _HEADING_MARGINS.get(level, _PARAGRAPH_MARGINS)
+        block_fmt.setHeadingLevel(level)
+        char_fmt.setProperty(QTextFormat.FontSizeAdjustment, _HEADING_SIZE_ADJUSTMENT.get(level, 0))
+        if bold_headings or "bold" in attrs_dict:
+            char_fmt.setFontWeight(QFont.Bold)
+        else:
+            char_fmt.setFontWeight(QFont.Normal)
+    else:
+        top, bottom = _PARAGRAPH_MARGINS
+    block_fmt.setTopMargin(top)
+    block_fmt.setBottomMargin(bottom)
+
+    _FORMATS[key] = (block_fmt, char_fmt)
+    return block_fmt, char_fmt
+
+
+def _image_format(block: dsl.DslBlock) -> QTextImageFormat:
+    fmt = QTextImageFormat()
+    fmt.setName(block.src or "")
+    attrs = block.attrs_dict
+    for name, setter in (("width", fmt.setWidth), ("height", fmt.setHeight)):
+        value = (attrs.get(name) or "").strip()
+        if value.endswith("px"):
+            value = value[:-2]
+        try:
+            setter(float(value))
+        except ValueError:
+            # Percentages and other units are ignored, as in Qt's own HTML
+            # importer for inline styles.
+            pass
+    return fmt
+
+
+def build_document(
+    document: QTextDocument,
+    blocks: Iterable[dsl.DslBlock],
+    heading_levels: Mapping[str, int],
+    bold_headings: bool = True,
+) -> None:
+    """Replace the contents of *document* with *blocks*.
+
+    Like ``setHtml`` this clears the undo history; the whole rebuild runs
+    inside a single edit block so layout happens once.
+    """
+
+    undo_enabled = document.isUndoRedoEnabled()
+    document.setUndoRedoEnabled(False)
+    try:
+        document.clear()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        try:
+            first = True
+            for block in blocks:
+                level = 0 if block.tag in (dsl.TAG_RAW, dsl.TAG_IMAGE) else heading_levels.get(block.tag, 0)
+                block_fmt, char_fmt = _formats_for(block.attrs if block.tag != dsl.TAG_IMAGE else (), level, bold_headings)
+
+                if first:
+                    cursor.setBlockFormat(block_fmt)
+                    cursor.setBlockCharFormat(char_fmt)
+                    first = False
+                else:
+                    cursor.insertBlock(block_fmt, char_fmt)
+
+                if block.tag == dsl.TAG_IMAGE:
+                    cursor.insertImage(_image_format(block))
+                else:
+                    # HTML collapses runs of whitespace; mirror that so both
+                    # rendering paths produce identical text.
+                    cursor.insertText(" ".join(block.text.split()), char_fmt)
+        finally:
+            cursor.endEditBlock()
+    finally:
+        document.setUndoRedoEnabled(undo_enabled)
+
+
+def build_story_document(document: QTextDocument, text: str) -> None:
+    """Render `.story` DSL *text* into *document*."""
+
+    build_document(document, story_markup.dsl_to_blocks(text), STORY_HEADING_LEVELS)
+
+
+def build_screenplay_document(document: QTextDocument, text: str) -> None:
+    """Render `.screenplay` DSL *text* into *document*.
+
+    Screenplay headings are rendered in normal weight unless the DSL header
+    carries an explicit ``bold`` flag, matching ``dsl_to_html``.
+    """
+
+    build_document(
+        document,
+        screenplay_markup.dsl_to_blocks(text),
+        SCREENPLAY_HEADING_LEVELS,
+        bold_headings=False,
+    )
@@ -2,6 +2,13 @@
 
 This widget is responsible only for text editing concerns. Higher-level
 behaviour (document loading/saving) is handled by the main window.
+
+Changes are reported as deltas rather than full-text copies: every edit
+emits ``contentsDelta(position, chars_removed, inserted_text, version)``
+with plain-text offsets in UTF-16 code units, as Qt reports them (see
+:meth:`editor.document.Document.apply_delta`), followed by ``contentChanged(version)`` once the
+edit is complete. The full text is only built when :meth:`get_text` is
+called, and cached per version.
 """
 
 from __future__ import annotations
@@ -10,16 +17,23 @@ from PySide6.QtCore import Signal, Qt, QEvent
 from PySide6.QtWidgets import QPlainTextEdit
 from PySide6.QtGui import QTextCursor
 
+from .. import text_replace
+from .document_index import DocumentIndexTracker
+
 
 class EditorWidget(QPlainTextEdit):
-    """Plain text editor that emits the full content on change.
+    """Plain text editor that emits edit deltas and a document version.
 
-    In addition to the usual ``textChangedWithContent`` signal, the editor
-    emits ``paneFocused`` whenever it gains focus so that the main window can
-    treat the Markdown pane as the active one for save/format decisions.
+    The editor also emits ``paneFocused`` whenever it gains focus so that the
+    main window can treat the Markdown pane as the active one for save/format
+    decisions.
     """
 
-    textChangedWithContent = Signal(str)
+    # (position, chars_removed, inserted_text, version) for each change;
+    # position and chars_removed are UTF-16 code units.
+    contentsDelta = Signal(int, int, str, int)
+    # Emitted once per completed edit with the new version.
+    contentChanged = Signal(int)
     paneFocused = Signal(str)
 
     def __init__(self, parent: object | None = None) -> None:
@@ -28,6 +42,18 @@ class EditorWidget(QPlainTextEdit):
         # Track zoom level so that we can keep zooming within a sensible range.
         self._zoom_level = 0
 
+        # Incremental statistics/outline index, created on first use.
+        self._document_index: DocumentIndexTracker | None = None
+
+        # Monotonic version of the text, its plain-text length and the text
+        # built for a version (if any was requested).
+        self._version = 0
+        self._length = 0
+        self._text_cache: tuple[int, str] | None = None
+        # Set while a programmatic multi-step edit runs so contentChanged is
+        # emitted once at the end.
+        self._batch_edit = False
+
         # Ensure we see wheel events even when they are delivered to the
         # internal viewport widget. This keeps Ctrl+wheel zooming reliable
         # across all tabs.
@@ -39,6 +65,7 @@ class EditorWidget(QPlainTextEdit):
 
         # Use a monospaced font by default; the exact font will be chosen by Qt
         # based on platform defaults.
+        self.document().contentsChange.connect(self._on_contents_change)
         self.textChanged.connect(self._on_text_changed)
 
     def eventFilter(self, obj, event):
@@ -62,24 +89,71 @@ class EditorWidget(QPlainTextEdit):
 
     # Public API -----------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Version of the text; increases with every change."""
+
+        return self._version
+
     def set_text(self, text: str) -> None:
-        """Replace the entire editor content without emitting change twice."""
+        """Replace the entire editor content, emitting ``contentChanged`` once."""
 
-        # Block signals so that setting text programmatically does not trigger
-        # redundant updates.
-        old_state = self.blockSignals(True)
+        self._batch_edit = True
         try:
             self.setPlainText(text)
         finally:
-            self.blockSignals(old_state)
+            self._batch_edit = False
 
-        # Emit a single consolidated signal with the new content.
-        self.textChangedWithContent.emit(self.toPlainText())
+        self.contentChanged.emit(self._version)
 
     def get_text(self) -> str:
-        """Return the current editor content."""
+        """Return the current editor content (built once per version)."""
+
+        cache = self._text_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        text = self.toPlainText()
+        self._text_cache = (self._version, text)
+        return text
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> None:
+        """Replace characters ``start..end`` as a single undoable edit.
+
+        The edit is reported through ``contentsDelta`` as usual and
+        ``contentChanged`` is emitted exactly once afterwards, so listeners
+        (preview, stats, master sync) run a single time. *start* and *end*
+        index the plain text as a Python string.
+        """
+
+        ((start, end),) = text_replace.utf16_spans(self.get_text(), [(start, end)])
+        cursor = QTextCursor(self.document())
+        self._batch_edit = True
+        try:
+            cursor.beginEditBlock()
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(replacement)
+            cursor.endEditBlock()
+        finally:
+            self._batch_edit = False
+
+        self.setTextCursor(cursor)
+        self.contentChanged.emit(self._version)
 
-        return self.toPlainText()
+    def document_index(self, storage_format: str = "markdown") -> DocumentIndexTracker:
+        """Return the incremental statistics/outline tracker for this editor.
+
+        The tracker follows ``contentsChange`` of the underlying document,
+        so reading its totals or outline does not touch the full text.
+        """
+
+        tracker = self._document_index
+        if tracker is None:
+            tracker = DocumentIndexTracker(self.document(), storage_format)
+            self._document_index = tracker
+        else:
+            tracker.set_storage_format(storage_format)
+        return tracker
 
     def get_cursor_state(self) -> dict:
         """Return the current caret and scroll position.
@@ -148,8 +222,41 @@ class EditorWidget(QPlainTextEdit):
 
     # Internal slots ------------------------------------------------------
 
+    def _text_range(self, start: int, end: int) -> str:
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        # Match toPlainText(): paragraph/line separators become newlines and
+        # non-breaking spaces plain spaces.
+        return (
+            cursor.selectedText()
+            .replace("\u2029", "\n")
+            .replace("\u2028", "\n")
+            .replace("\u00a0", " ")
+        )
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:  # pragma: no cover - UI wiring
+        new_length = max(0, self.document().characterCount() - 1)
+        old_length = self._length
+
+        # Whole-document changes are reported including the implicit final
+        # paragraph separator; clamp both counts to the plain text.
+        removed = max(0, min(removed, old_length - position))
+        added = max(0, min(added, new_length - position))
+
+        self._version += 1
+        self._length = new_length
+
+        if old_length - removed + added != new_length:
+            # Inconsistent report: describe it as a full replacement.
+            self.contentsDelta.emit(0, old_length, self.get_text(), self._version)
+            return
+        inserted = self._text_range(position, position + added) if added else ""
+        self.contentsDelta.emit(position, removed, inserted, self._version)
+
     def _on_text_changed(self) -> None:  # pragma: no cover - thin wrapper
-        self.textChangedWithContent.emit(self.toPlainText())
+        if not self._batch_edit:
+            self.contentChanged.emit(self._version)
 
     # Focus handling ------------------------------------------------------
 
@@ -7,6 +7,7 @@ layered on top of this layout.
 
 from __future__ import annotations
 
+import os
 import uuid
 from pathlib import Path
 from datetime import datetime
@@ -32,6 +33,8 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QCheckBox,
     QPushButton,
+    QDockWidget,
+    QApplication,
 )
 from PySide6.QtCore import Qt, QTimer, QEvent, QCoreApplication, QObject, QThread, Signal, QUrl
 from PySide6.QtGui import (
@@ -44,12 +47,17 @@ from PySide6.QtGui import (
     QShortcut,
 )
 
-from ..document import Document
+from ..document import Document, TextSnapshot
 from ..settings import Settings, save_settings, load_spaces_status_log
 from .. import file_metadata
 from .. import story_sync
+from .. import story_delta
+from .. import screenplay_sync
+from .. import poll_scheduler
+from .. import sync_outbox
 from .. import websync
 from .. import auth as local_auth
+from .. import crowdly_session
 from .. import websync
 from ..versioning import local_queue
 from ..format import types as format_types
@@ -59,10 +67,19 @@ from ..exporting import controller as exporting_controller
 from ..exporting.base import ExportError, ExportFormat, ExportRequest
 from ..exporting.markdown_utils import render_html_from_markdown
 from .. import storage
+from .. import text_replace
+from .. import save_service
+from .. import autosave_policy
+from .. import space_replace
 from ..format import story_markup, screenplay_markup
 from .editor_widget import EditorWidget
 from .preview_widget import PreviewWidget
 from .compare_revisions import CompareRevisionsWindow
+from .outline_navigator import OutlineNavigatorWidget
+from .space_search_panel import SpaceSearchPanel
+from .space_catalog_watcher import SpaceCatalogWatcher
+from .web_update_listener import WebUpdateListener
+from .save_state_relay import SaveStateRelay
 from .master_document_window import MasterDocumentWindow, master_sync_bus
 
 
@@ -115,10 +132,13 @@ class MainWindow(QMainWindow):
         self._web_sync_timer.setSingleShot(True)
         self._web_sync_timer.timeout.connect(self._maybe_sync_story_to_web)
 
-        # Polling timer to pull updates from the web (bi-directional sync).
+        # Polling fallback for remote updates (bi-directional sync): fires
+        # when the poll scheduler next has documents due.
         self._web_pull_timer = QTimer(self)
-        self._web_pull_timer.setInterval(8000)
+        self._web_pull_timer.setSingleShot(True)
         self._web_pull_timer.timeout.connect(self._poll_web_updates)
+        self._web_poll_scheduler = poll_scheduler.PollScheduler()
+        self._web_poll_threads: list[_WebChangesThread] = []
 
         # Cached Crowdly web credentials for the current app session.
         self._crowdly_web_credentials: tuple[str, str] | None = None
@@ -159,12 +179,27 @@ class MainWindow(QMainWindow):
         self._tab_user_renamed: set[int] = set()
         self._current_tab_index: int = 0
 
-        # Simple debounced autosave timer (milliseconds).
-        self._autosave_interval_ms = 2000
+        # Autosave timer; the delay for each edit comes from the adaptive
+        # policy (debounce, max wait, save-cost backoff). Its settings are
+        # per project space and reloaded when the space changes.
+        self._autosave_policy = autosave_policy.AutosavePolicy()
+        self._autosave_policy_space: Path | None = None
         self._autosave_timer = QTimer(self)
         self._autosave_timer.setSingleShot(True)
         self._autosave_timer.timeout.connect(self._perform_autosave)
 
+        # Typing only updates the rope; the preview and master-document
+        # windows get the full text once these short debounces fire.
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(150)
+        self._preview_refresh_timer.timeout.connect(self._refresh_preview_from_document)
+        self._broadcast_document: Document | None = None
+        self._broadcast_timer = QTimer(self)
+        self._broadcast_timer.setSingleShot(True)
+        self._broadcast_timer.setInterval(300)
+        self._broadcast_timer.timeout.connect(self._flush_document_broadcast)
+
         # Track whether we've already shown the "no Space set" warning in this
         # window so that it appears at most once.
         self._no_space_warning_shown: bool = False
@@ -407,6 +442,15 @@ class MainWindow(QMainWindow):
         self._action_search_replace = search_menu.addAction(
             self.tr("Replace"), self._show_replace_dialog
         )
+        self._action_search_in_space = search_menu.addAction(
+            self.tr("Find in Space"), self._show_find_in_space
+        )
+        self._action_replace_in_space = search_menu.addAction(
+            self.tr("Replace in Space…"), self._replace_in_space
+        )
+        self._action_undo_replace_in_space = search_menu.addAction(
+            self.tr("Undo Replace in Space"), self._undo_replace_in_space
+        )
 
         story_settings_menu = menu.addMenu(self.tr("Story settings"))
         self._story_settings_menu = story_settings_menu
@@ -449,6 +493,11 @@ class MainWindow(QMainWindow):
         self._chk_wysiwyg.toggled.connect(self._on_wysiwyg_checkbox_toggled)
         top_layout.addWidget(self._chk_wysiwyg)
 
+        self._chk_navigator = QCheckBox(self.tr("Navigator"), top_bar)
+        self._chk_navigator.setChecked(False)
+        self._chk_navigator.toggled.connect(self._on_navigator_checkbox_toggled)
+        top_layout.addWidget(self._chk_navigator)
+
         # Inline search / replace bar (initially hidden).
         self._search_bar = QWidget(container)
         search_layout = QHBoxLayout(self._search_bar)
@@ -530,6 +579,60 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(container)
 
+        # Outline navigator (title, chapters / scenes) docked on the left and
+        # hidden until enabled via the top-bar checkbox.
+        self._outline_navigator = OutlineNavigatorWidget(self)
+        self._outline_navigator.headingActivated.connect(self._jump_to_outline_line)
+        self._navigator_dock = QDockWidget(self.tr("Navigator"), self)
+        self._navigator_dock.setObjectName("outlineNavigatorDock")
+        self._navigator_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable)
+        self._navigator_dock.setWidget(self._outline_navigator)
+        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self._navigator_dock)
+        self._navigator_dock.setVisible(False)
+
+        # "Find in Space" results, backed by the persistent full-text index
+        # in <space>/.crowdly/. Hidden until requested.
+        self._space_search_panel = SpaceSearchPanel(self)
+        self._space_search_panel.hitActivated.connect(self._open_path_at_offset)
+        self._space_search_dock = QDockWidget(self.tr("Find in Space"), self)
+        self._space_search_dock.setObjectName("spaceSearchDock")
+        self._space_search_dock.setWidget(self._space_search_panel)
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self._space_search_dock)
+        self._space_search_dock.setVisible(False)
+
+        # Catalog of the files in the active space (<space>/.crowdly/), kept
+        # current by a file system watcher; follows the project space.
+        # Files changed outside the editor are re-indexed for search.
+        self._space_catalog_watcher = SpaceCatalogWatcher(self)
+        self._space_catalog_watcher.catalogChanged.connect(self._on_space_catalog_changed)
+
+        # Push channel announcing remote changes of the open documents while
+        # web sync is on; documents it does not cover are polled.
+        self._web_update_listener = WebUpdateListener(self)
+        self._web_update_listener.updateReceived.connect(self._on_web_update_event)
+        self._web_update_listener.connectedChanged.connect(self._on_web_update_channel_changed)
+        # (kind, remote id) -> open document paths, for every web-linked tab.
+        self._web_subscribed: dict[tuple[str, str], list[Path]] = {}
+        # Backend the push channel follows (one stream at a time).
+        self._web_stream_base: str | None = None
+        # Open documents announced as changed while not the current tab.
+        self._web_pending_pulls: set[Path] = set()
+        # Stories whose pulled content was set aside for unsynced local
+        # edits; their next check must fetch even when the row is a 304.
+        self._deferred_story_pulls: set[Path] = set()
+
+        # Durable record of uploads the backend has not accepted yet; the
+        # timer fires when the next retry is due.
+        self._outbox_timer = QTimer(self)
+        self._outbox_timer.setSingleShot(True)
+        self._outbox_timer.timeout.connect(self._drain_sync_outbox)
+        self._outbox_thread: _OutboxReplayThread | None = None
+
+        # Screenplay upload in flight, and the follow-up job per file for
+        # saves made meanwhile (newest snapshot wins).
+        self._screenplay_sync_thread: _ScreenplaySyncThread | None = None
+        self._screenplay_sync_pending: dict[Path, tuple[screenplay_sync.ScreenplaySyncJob, tuple[str, str]]] = {}
+
         # Keyboard shortcuts for search / replace (similar to typical text editors).
         self._shortcut_find = QShortcut(QKeySequence("Ctrl+F"), self)
         self._shortcut_find.activated.connect(self._show_find_dialog)
@@ -543,6 +646,9 @@ class MainWindow(QMainWindow):
         self._shortcut_replace = QShortcut(QKeySequence("Ctrl+H"), self)
         self._shortcut_replace.activated.connect(self._show_replace_dialog)
 
+        self._shortcut_find_in_space = QShortcut(QKeySequence("Ctrl+Shift+F"), self)
+        self._shortcut_find_in_space.activated.connect(self._show_find_in_space)
+
         # After the first tab is created, keep the per-tab document mapping in
         # sync with the active document.
         if not self._tab_documents:
@@ -562,6 +668,10 @@ class MainWindow(QMainWindow):
         self._stats_label = QLabel(self)
         bar.addPermanentWidget(self._stats_label, 0)
 
+        # "Saving…" / "Saved" state of the active tab's file.
+        self._save_state_label = QLabel(self)
+        bar.addPermanentWidget(self._save_state_label, 0)
+
         # Sync status label (between stats and user info).
         self._sync_status_label = QLabel(self)
         bar.addPermanentWidget(self._sync_status_label, 0)
@@ -580,6 +690,14 @@ class MainWindow(QMainWindow):
         self._user_label = QLabel(self)
         bar.addPermanentWidget(self._user_label, 0)
 
+        # Autosaves are written by the shared background save service; the
+        # relay brings its notifications back to the GUI thread.
+        self._save_service = save_service.shared_service()
+        self._save_states: dict[str, str] = {}
+        self._save_state_relay = SaveStateRelay(self)
+        self._save_state_relay.stateChanged.connect(self._on_save_state_changed)
+        self._save_service.add_listener(self._save_state_relay.forward)
+
         self._update_document_stats_label()
         self._update_sync_status_label()
         self._update_user_status_label()
@@ -669,6 +787,18 @@ class MainWindow(QMainWindow):
             if bar is not None:
                 bar.showMessage(text)
 
+        # Every project space change ends up here; keep the catalog on it.
+        watcher = getattr(self, "_space_catalog_watcher", None)
+        if watcher is not None:
+            try:
+                watcher.set_space(self._project_space_path)
+            except Exception:
+                pass
+
+    def _on_space_catalog_changed(self, _root: object, paths: object) -> None:  # pragma: no cover - UI wiring
+        if isinstance(paths, list) and paths:
+            self._space_search_panel.notify_files_changed(paths)
+
     def _space_and_project_space_unset(self) -> bool:
         """Return True when there is no active project space configured.
 
@@ -724,25 +854,50 @@ class MainWindow(QMainWindow):
 
         return True
 
-    def _broadcast_document_content_update(self) -> None:
-        """Notify any master document windows that the current file changed.
+    def _schedule_document_broadcast(self) -> None:
+        """Broadcast the current document to master windows once typing pauses."""
+
+        pending = self._broadcast_document
+        if pending is not None and pending is not self._document:
+            self._flush_document_broadcast()
+        self._broadcast_document = self._document
+        self._broadcast_timer.start()
+
+    def _flush_document_broadcast(self) -> None:
+        """Send a scheduled broadcast now (e.g. before its document goes away)."""
 
-        This is a best-effort helper; when no MasterDocumentWindow is
-        interested in the current path the call is effectively a no-op.
+        document, self._broadcast_document = self._broadcast_document, None
+        self._broadcast_timer.stop()
+        if document is not None:
+            self._broadcast_document_content_update(document)
+
+    def _broadcast_document_content_update(self, document: Document | None = None) -> None:
+        """Notify any master document windows that *document* changed.
+
+        Defaults to the current document. This is a best-effort helper; when
+        no MasterDocumentWindow is interested in the path the call is
+        effectively a no-op.
         """
 
         bus = getattr(self, "_master_sync_bus", None)
         if bus is None:
             return
 
+        if document is None:
+            document = self._document
+        if document is self._broadcast_document:
+            # Superseded by this immediate broadcast.
+            self._broadcast_document = None
+            self._broadcast_timer.stop()
+
         # Only sync documents that have a concrete on-disk path; pure
         # in-memory drafts are not part of any master document.
-        path = self._get_current_document_path()
-        if path is None:
+        path = getattr(document, "path", None)
+        if not isinstance(path, Path) or not path.exists():
             return
 
         try:
-            text = getattr(self._document, "content", "") or ""
+            text = getattr(document, "content", "") or ""
         except Exception:
             text = ""
 
@@ -801,6 +956,8 @@ class MainWindow(QMainWindow):
             return
         if not isinstance(document, Document):
             return
+        if document is self._broadcast_document:
+            self._flush_document_broadcast()
 
         path = getattr(document, "path", None)
         if not isinstance(path, Path):
@@ -1127,13 +1284,44 @@ class MainWindow(QMainWindow):
         self._update_project_space_status()
         self._rebuild_spaces_menu()
 
-    def _on_editor_text_changed(self, text: str) -> None:  # pragma: no cover - UI wiring
+    def _document_for_editor(self, editor: object) -> Document | None:
+        for index, (tab_editor, _preview) in enumerate(self._tab_widgets):
+            if tab_editor is editor and index < len(self._tab_documents):
+                return self._tab_documents[index]
+        return None
+
+    def _on_editor_delta(self, position: int, removed: int, inserted: str, version: int) -> None:  # pragma: no cover - UI wiring
+        """Apply an edit delta from a tab's editor to that tab's document."""
+
+        editor = self.sender()
+        if not isinstance(editor, EditorWidget):
+            return
+        document = self._document_for_editor(editor)
+        if document is None:
+            return
+        if not document.apply_delta(position, removed, inserted, version - 1, version):
+            # The document was changed behind the editor's back (or missed
+            # a blocked edit); pull the full text once to resynchronise.
+            document.sync_text(editor.get_text(), version)
+
+    def _on_editor_content_changed(self, version: int) -> None:  # pragma: no cover - UI wiring
+        """Run the change handlers once an edit in the active editor is done."""
+
+        if self.sender() is not self.editor:
+            return
+        if not self._document.synced_with(version):
+            self._document.sync_text(self.editor.get_text(), version)
+        # The document already holds the edit; pass an O(1) snapshot so no
+        # full string is built per keystroke.
+        self._on_editor_text_changed(self._document.snapshot())
+
+    def _on_editor_text_changed(self, text: "str | TextSnapshot") -> None:  # pragma: no cover - UI wiring
         """Handle text changes from the editor.
 
-        Updates the in-memory document, refreshes the preview, and schedules
-        an autosave after a short delay. When the preview is updated
-        programmatically, we preserve its caret/scroll state so that switching
-        between panes does not jump the cursor back to the top.
+        Updates the in-memory document (for full-text updates; a
+        :class:`TextSnapshot` means the document already has the edit),
+        schedules preview and master-document refreshes and an autosave.
+        The full text is only materialised when those debounces fire.
         """
 
         # If there is no configured Space / project space yet, warn once so
@@ -1144,53 +1332,50 @@ class MainWindow(QMainWindow):
         # subsequent save/format decisions regardless of focus quirks.
         self._active_pane = "md"
 
-        # For story/screenplay documents the Markdown pane edits the raw DSL
-        # directly; for plain Markdown documents it edits Markdown as before.
-        storage_format = getattr(self._document, "storage_format", "markdown") or "markdown"
-
-        self._document.set_content(text)
+        if isinstance(text, str):
+            self._document.set_content(text)
         self._last_change_from_preview = False
 
         # Keep any master document window in sync while the user types.
-        self._broadcast_document_content_update()
+        self._schedule_document_broadcast()
 
-        preview_state = None
         if self.preview.isVisible():
-            try:
-                preview_state = self.preview.get_cursor_state()
-            except Exception:
-                preview_state = None
+            self._preview_refresh_timer.start()
 
-            if storage_format == "story_v1":
-                # Render DSL → HTML.
-                try:
-                    html = story_markup.dsl_to_html(text)
-                except Exception:
-                    html = ""
-                self.preview.set_html(html)
-            elif storage_format == "screenplay_v1":
-                try:
-                    html = screenplay_markup.dsl_to_html(text)
-                except Exception:
-                    html = ""
-                self.preview.set_html(html)
-            else:
-                # Plain Markdown path (existing behaviour).
-                self.preview.set_markdown(text)
+        self._schedule_autosave()
 
-            # Restore caret/scroll position so the preview pane does not jump.
-            if preview_state:
-                try:
-                    self.preview.restore_cursor_state(preview_state)
-                except Exception:
-                    pass
+        self._update_document_stats_label()
 
-        # Restart autosave timer.
-        if self._autosave_timer.isActive():
-            self._autosave_timer.stop()
-        self._autosave_timer.start(self._autosave_interval_ms)
+    def _refresh_preview_from_document(self) -> None:  # pragma: no cover - UI wiring
+        """Render the current document into the preview, keeping its caret.
 
-        self._update_document_stats_label()
+        For story/screenplay documents the Markdown pane edits the raw DSL
+        directly; for plain Markdown documents it edits Markdown as before.
+        """
+
+        if not self.preview.isVisible():
+            return
+        storage_format = getattr(self._document, "storage_format", "markdown") or "markdown"
+        text = self._document.content or ""
+
+        try:
+            preview_state = self.preview.get_cursor_state()
+        except Exception:
+            preview_state = None
+
+        if storage_format in ("story_v1", "screenplay_v1"):
+            # Render the DSL straight into the preview document.
+            self.preview.set_dsl(text, storage_format)
+        else:
+            # Plain Markdown path (existing behaviour).
+            self.preview.set_markdown(text)
+
+        # Restore caret/scroll position so the preview pane does not jump.
+        if preview_state:
+            try:
+                self.preview.restore_cursor_state(preview_state)
+            except Exception:
+                pass
 
     def _on_preview_markdown_changed(self, text: str) -> None:  # pragma: no cover
         """Handle text changes from the WYSIWYG preview.
@@ -1248,6 +1433,9 @@ class MainWindow(QMainWindow):
             canonical_text = text
 
         self._last_change_from_preview = True
+        # The preview is the source of this change; a refresh scheduled by
+        # earlier typing in the Markdown pane would only reset it.
+        self._preview_refresh_timer.stop()
 
         # Keep any master document window in sync while editing via WYSIWYG.
         self._broadcast_document_content_update()
@@ -1273,10 +1461,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-        # Restart autosave timer.
-        if self._autosave_timer.isActive():
-            self._autosave_timer.stop()
-        self._autosave_timer.start(self._autosave_interval_ms)
+        self._schedule_autosave()
 
         self._update_document_stats_label()
 
@@ -1298,8 +1483,11 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(0, 3)
         splitter.setStretchFactor(1, 2)
 
-        # Keep document and preview in sync with editor content for this tab.
-        editor.textChangedWithContent.connect(self._on_editor_text_changed)
+        # Keep document and preview in sync with editor content for this tab:
+        # deltas update the document model, contentChanged then runs the
+        # preview/autosave handlers once per edit.
+        editor.contentsDelta.connect(self._on_editor_delta)
+        editor.contentChanged.connect(self._on_editor_content_changed)
         preview.markdownEdited.connect(self._on_preview_markdown_changed)
 
         # Track which pane currently has focus so save/autosave can select the
@@ -1545,6 +1733,18 @@ class MainWindow(QMainWindow):
             except Exception:
                 state["wysiwyg"] = None
 
+        # Save the tab being left right away instead of waiting for its
+        # autosave timer, which would otherwise fire for the new tab.
+        if (
+            0 <= prev_index < len(self._tab_documents)
+            and self._tab_documents[prev_index] is self._document
+            and self._current_autosave_policy().config.save_on_tab_switch
+        ):
+            try:
+                self._force_autosave()
+            except Exception:
+                pass
+
         self._current_tab_index = index
 
         # Update active widgets.
@@ -1567,6 +1767,8 @@ class MainWindow(QMainWindow):
         # of showing raw tags as Markdown.
         self._refresh_preview_from_document(source="document")
         self._update_document_stats_label()
+        self._update_save_state_label()
+        self._refresh_outline_navigator()
         self._update_story_link_label()
         self._update_window_title()
 
@@ -1621,6 +1823,11 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+        # Follow remote changes of the open documents (tabs were opened,
+        # closed or switched) and apply a pull announced in the background.
+        self._refresh_web_subscriptions()
+        self._flush_pending_web_pull()
+
     def _on_pane_focused(self, pane: str) -> None:  # pragma: no cover - UI wiring
         """Remember which pane ("md" or "wysiwyg") is currently active.
 
@@ -1645,26 +1852,12 @@ class MainWindow(QMainWindow):
         except Exception:
             storage_format = "markdown"
 
-        if storage_format == "story_v1":
-            try:
-                text = getattr(self._document, "content", "") or ""
-            except Exception:
-                text = ""
-            try:
-                html = story_markup.dsl_to_html(text)
-            except Exception:
-                html = ""
-            self.preview.set_html(html)
-        elif storage_format == "screenplay_v1":
+        if storage_format in ("story_v1", "screenplay_v1"):
             try:
                 text = getattr(self._document, "content", "") or ""
             except Exception:
                 text = ""
-            try:
-                html = screenplay_markup.dsl_to_html(text)
-            except Exception:
-                html = ""
-            self.preview.set_html(html)
+            self.preview.set_dsl(text, storage_format)
         else:
             # Plain Markdown or unknown formats: keep the original behaviour.
             if source == "editor":
@@ -1767,17 +1960,48 @@ class MainWindow(QMainWindow):
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         return self._project_space_path / f"{stem}-copy-{timestamp}{suffix}"
 
+    def _current_autosave_policy(self) -> autosave_policy.AutosavePolicy:
+        """Return the autosave policy, reloading settings if the space changed."""
+
+        space = self._project_space_path
+        if space != self._autosave_policy_space:
+            self._autosave_policy.config = autosave_policy.load_config(space)
+            self._autosave_policy_space = space
+        return self._autosave_policy
+
+    def _schedule_autosave(self) -> None:  # pragma: no cover - UI wiring
+        """(Re)start the autosave timer after an edit."""
+
+        delay_ms = self._current_autosave_policy().note_edit()
+        self._autosave_timer.start(delay_ms)
+
+    def _force_autosave(self) -> None:  # pragma: no cover - UI wiring
+        """Save the active document now if it has unsaved edits."""
+
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+        if self._document.is_dirty:
+            self._perform_autosave()
+
     def _perform_autosave(self) -> None:  # pragma: no cover - UI wiring
+        """Persist the current document and restart the policy's max-wait window."""
+
+        self._autosave_document()
+        # Either the edits were handed to the save worker or there is nothing
+        # that could be saved; in both cases the max-wait window starts over.
+        self._current_autosave_policy().reset()
+
+    def _autosave_document(self) -> bool:  # pragma: no cover - UI wiring
         """Persist the current document to disk if possible.
 
         Autosave is a no-op when there are no changes. If the document has a
         concrete path, it is saved there regardless of whether a project
         space is configured. Otherwise, we require a project space and create
-        a new file inside it.
+        a new file inside it. Returns ``True`` when a save was queued.
         """
 
         if not self._document.is_dirty:
-            return
+            return False
 
         if self._document.path is not None:
             # Start from the current path but, when editing via the WYSIWYG pane,
@@ -1799,7 +2023,7 @@ class MainWindow(QMainWindow):
             target_path = self._generate_default_document_path()
         else:
             # No file path and no project space to create one in.
-            return
+            return False
 
         # Update the document's storage_format based on the target extension so
         # that downstream components (metadata, exports, sync) can reason about
@@ -1880,7 +2104,30 @@ class MainWindow(QMainWindow):
             # Never let classification issues prevent a save.
             pass
 
-        self._document.save(target_path)
+        # Hand an immutable snapshot to the save worker and return at once;
+        # the write, metadata update and revision snapshot (a local
+        # versioning entry under `.crowdly`) run off the GUI thread. Revision
+        # bodies are derived from the snapshot rather than read back from the
+        # preview widget. The snapshot is O(1); the full string is built on
+        # the worker.
+        text = self._document.snapshot()
+        storage_format = getattr(self._document, "storage_format", "markdown") or "markdown"
+        device_id = getattr(self._settings, "device_id", None) or "desktop"
+        self._save_service.submit(
+            save_service.SaveRequest(
+                path=target_path,
+                text=text,
+                storage_format=storage_format,
+                hooks=(
+                    save_service.revision_hook(
+                        device_id=device_id,
+                        text=text,
+                        storage_format=storage_format,
+                    ),
+                ),
+            )
+        )
+        self._document.mark_saved(target_path)
         self._update_window_title()
 
         # Update the tab title to the filename once the document has been saved,
@@ -1890,26 +2137,50 @@ class MainWindow(QMainWindow):
                 self._tab_widget.setTabText(self._current_tab_index, target_path.name)
         except Exception:
             pass
+        return True
 
-        # Enqueue a local versioning snapshot under the `.crowdly` directory
-        # so that all changes are captured for later revision/diff pipelines.
-        try:
-            device_id = getattr(self._settings, "device_id", None) or "desktop"
-            body_md = self.preview.get_markdown()
-            body_html = self.preview.get_html()
-            local_queue.enqueue_full_snapshot_update(
-                target_path,
-                device_id=device_id,
-                body_md=body_md,
-                body_html=body_html,
-            )
-        except Exception:
-            # Versioning must never interfere with core autosave.
-            pass
+    def _on_save_state_changed(self, path: Path, state: str) -> None:  # pragma: no cover - UI wiring
+        """Track background save progress and run GUI-side post-save work."""
 
-        # After a successful save, optionally sync to the web backend.
-        if self._sync_web_platform:
-            self._schedule_web_sync()
+        key = os.path.abspath(path)
+        self._save_states[key] = state
+
+        if state in (save_service.STATE_SAVED, save_service.STATE_UNCHANGED):
+            duration = self._save_service.last_duration(path)
+            if duration is not None:
+                self._autosave_policy.record_cost(duration)
+
+        if state == save_service.STATE_SAVED:
+            self._space_search_panel.notify_file_saved(path)
+            # After a successful save, optionally sync to the web backend.
+            current = getattr(self._document, "path", None)
+            if self._sync_web_platform and current is not None and os.path.abspath(current) == key:
+                self._schedule_web_sync()
+        elif state == save_service.STATE_FAILED:
+            # Keep the text dirty so the next autosave retries the write.
+            for doc in self._tab_documents:
+                doc_path = getattr(doc, "path", None)
+                if doc_path is not None and os.path.abspath(doc_path) == key:
+                    doc.is_dirty = True
+
+        self._update_save_state_label()
+
+    def _update_save_state_label(self) -> None:
+        label = getattr(self, "_save_state_label", None)
+        if label is None:
+            return
+        path = getattr(self._document, "path", None)
+        states = getattr(self, "_save_states", {})
+        state = states.get(os.path.abspath(path)) if path is not None else None
+        if state in (save_service.STATE_PENDING, save_service.STATE_SAVING):
+            text = self.tr("Saving…")
+        elif state in (save_service.STATE_SAVED, save_service.STATE_UNCHANGED):
+            text = self.tr("Saved")
+        elif state == save_service.STATE_FAILED:
+            text = self.tr("Save failed")
+        else:
+            text = ""
+        label.setText(text)
 
     def _guess_document_title(self) -> str | None:
         """Return a best-effort title for the current document, if any."""
@@ -2130,6 +2401,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # Wait for the background writer so nothing queued is lost on quit.
+        try:
+            self._save_service.flush()
+        except Exception:
+            pass
+
         # Notify master document windows that any chapter files open in this
         # window are now closed.
         try:
@@ -2195,6 +2472,24 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # Stop a running space indexer before its parent widget goes away.
+        try:
+            self._space_search_panel.shutdown()
+        except Exception:
+            pass
+        try:
+            self._space_catalog_watcher.shutdown()
+        except Exception:
+            pass
+        try:
+            self._web_update_listener.stop()
+        except Exception:
+            pass
+        try:
+            self._save_service.remove_listener(self._save_state_relay.forward)
+        except Exception:
+            pass
+
         super().closeEvent(event)
 
     def _update_language_actions(self) -> None:
@@ -2206,15 +2501,34 @@ class MainWindow(QMainWindow):
                 action.setChecked(code == current)
 
     def changeEvent(self, event):  # pragma: no cover - UI wiring
-        """Handle language change events from Qt.
+        """Handle language change and window activation events from Qt.
 
         When the active translator changes, Qt sends a ``LanguageChange``
         event to top-level widgets. We respond by re-applying all
-        translatable strings.
+        translatable strings. Losing activation forces an autosave; polling
+        for remote updates pauses while the window is minimised.
         """
 
         if event.type() == QEvent.LanguageChange:
             self._retranslate_ui()
+        elif event.type() == QEvent.WindowStateChange:
+            # Nobody watches a minimised window: stop polling until restored.
+            try:
+                if self.isMinimized():
+                    self._web_poll_scheduler.pause()
+                else:
+                    self._web_poll_scheduler.resume()
+                self._reschedule_web_poll()
+            except Exception:
+                pass
+        elif event.type() == QEvent.ActivationChange and not self.isActiveWindow():
+            # Focus left the window (another app, dialog, window): save now
+            # rather than after the debounce.
+            try:
+                if self._current_autosave_policy().config.save_on_focus_out:
+                    self._force_autosave()
+            except Exception:
+                pass
 
         super().changeEvent(event)
 
@@ -2289,6 +2603,16 @@ class MainWindow(QMainWindow):
             self._action_search_find.setText(self.tr("Find"))
         if hasattr(self, "_action_search_replace"):
             self._action_search_replace.setText(self.tr("Replace"))
+        if hasattr(self, "_action_search_in_space"):
+            self._action_search_in_space.setText(self.tr("Find in Space"))
+        if hasattr(self, "_action_replace_in_space"):
+            self._action_replace_in_space.setText(self.tr("Replace in Space…"))
+        if hasattr(self, "_action_undo_replace_in_space"):
+            self._action_undo_replace_in_space.setText(self.tr("Undo Replace in Space"))
+        if hasattr(self, "_space_search_dock"):
+            self._space_search_dock.setWindowTitle(self.tr("Find in Space"))
+        if hasattr(self, "_space_search_panel"):
+            self._space_search_panel.retranslate_ui()
         if hasattr(self, "_story_settings_menu"):
             self._story_settings_menu.setTitle(self.tr("Story settings"))
 
@@ -2407,6 +2731,7 @@ class MainWindow(QMainWindow):
 
         # Update status bar dynamic labels that depend on translations.
         self._update_document_stats_label()
+        self._update_save_state_label()
         self._update_sync_status_label()
         self._update_user_status_label()
         self._update_story_link_label()
@@ -2444,18 +2769,35 @@ class MainWindow(QMainWindow):
             self._chk_md_editor.setText(self.tr("Markdown (MD) / HTML"))
         if hasattr(self, "_chk_wysiwyg"):
             self._chk_wysiwyg.setText(self.tr("WYSIWYG"))
+        if hasattr(self, "_chk_navigator"):
+            self._chk_navigator.setText(self.tr("Navigator"))
+        if hasattr(self, "_navigator_dock"):
+            self._navigator_dock.setWindowTitle(self.tr("Navigator"))
 
     def _compute_document_stats(self) -> tuple[int, int, int]:
         """Return (words, paragraphs, chapters) for the current document.
 
-        - Words: whitespace-separated tokens in the source text.
+        - Words: whitespace-separated tokens in the source text, excluding
+          heading markers and DSL tags.
         - Paragraphs: groups of non-empty lines separated by blank lines.
         - Chapters: Markdown headings, preferring level-2 ("## ") sections
           when present, otherwise falling back to level-1 ("# ") headings.
+          For `.story` / `.screenplay` the title, chapter and scene tags
+          play the same role.
+
+        Counts come from the editor's incremental tracker, which is updated
+        per edited block, so this is cheap enough to call on every
+        keystroke.
         """
 
-        # Base stats on the WYSIWYG content so that what you see is what is
-        # counted. We use the preview's markdown representation.
+        try:
+            storage_format = getattr(self._document, "storage_format", "markdown") or "markdown"
+            totals = self.editor.document_index(storage_format).totals()
+            return totals.words, totals.paragraphs, totals.chapters
+        except Exception:
+            pass
+
+        # Fallback: full recomputation from the WYSIWYG content.
         text = self.preview.get_markdown()
         words = len(text.split()) if text else 0
 
@@ -2499,111 +2841,516 @@ class MainWindow(QMainWindow):
             .format(words=words, paras=paragraphs, chapters=chapters)
         )
 
-    def _update_user_status_label(self) -> None:
-        """Update the bottom-right user status label."""
+    # Outline navigator --------------------------------------------------
 
-        label = getattr(self, "_user_label", None)
-        if label is None:
+    def _current_document_index(self):
+        """Return the incremental index tracker for the active editor."""
+
+        storage_format = getattr(self._document, "storage_format", "markdown") or "markdown"
+        return self.editor.document_index(storage_format)
+
+    def _on_navigator_checkbox_toggled(self, checked: bool) -> None:  # pragma: no cover - UI wiring
+        dock = getattr(self, "_navigator_dock", None)
+        if dock is None:
             return
+        dock.setVisible(bool(checked))
+        if checked:
+            self._refresh_outline_navigator()
 
-        label.setText(
-            self.tr("Logged in as: {username}").format(username=self._username)
-        )
+    def _refresh_outline_navigator(self) -> None:  # pragma: no cover - UI wiring
+        """Show the active document's outline in the navigator panel."""
 
-    def _update_sync_status_label(self) -> None:
-        """Update the sync status label in the status bar."""
+        navigator = getattr(self, "_outline_navigator", None)
+        dock = getattr(self, "_navigator_dock", None)
+        if navigator is None or dock is None or not dock.isVisible():
+            return
 
-        label = getattr(self, "_sync_status_label", None)
-        if label is None:
+        try:
+            tracker = self._current_document_index()
+        except Exception:
+            navigator.set_outline(None)
             return
 
-        if getattr(self, "_sync_web_platform", False):
-            # Prefer the explicit web credentials username when available,
-            # otherwise fall back to the desktop username.
-            web_user = None
-            try:
-                creds = getattr(self, "_crowdly_web_credentials", None)
-                if isinstance(creds, tuple) and len(creds) >= 1:
-                    web_user = creds[0]
-            except Exception:
-                web_user = None
+        # Connect each editor's tracker once; handlers ignore editors that
+        # are not active.
+        if not tracker.property("navigatorConnected"):
+            tracker.setProperty("navigatorConnected", True)
+            editor = self.editor
+            tracker.outlineChanged.connect(lambda ed=editor: self._on_outline_changed(ed))
+            editor.cursorPositionChanged.connect(lambda ed=editor: self._on_outline_cursor_moved(ed))
 
-            if not web_user:
-                try:
-                    candidate = getattr(self, "_username", None)
-                    if isinstance(candidate, str) and candidate and candidate != "username":
-                        web_user = candidate
-                except Exception:
-                    web_user = None
+        navigator.set_outline(tracker.outline)
+        try:
+            navigator.set_current_line(self.editor.textCursor().blockNumber())
+        except Exception:
+            pass
 
-            if web_user:
-                text = self.tr("Web sync: connected as {username}").format(username=web_user)
-            else:
-                text = self.tr("Web sync: enabled")
-        else:
-            text = self.tr("Web sync: off")
+    def _on_outline_changed(self, editor: EditorWidget) -> None:  # pragma: no cover - UI wiring
+        if editor is self.editor:
+            self._refresh_outline_navigator()
 
-        label.setText(text)
+    def _on_outline_cursor_moved(self, editor: EditorWidget) -> None:  # pragma: no cover - UI wiring
+        dock = getattr(self, "_navigator_dock", None)
+        if editor is not self.editor or dock is None or not dock.isVisible():
+            return
+        try:
+            self._outline_navigator.set_current_line(editor.textCursor().blockNumber())
+        except Exception:
+            pass
 
-    def _update_story_link_label(self) -> None:
-        """Update the status-bar link for the current story/screenplay, if any."""
+    def _jump_to_outline_line(self, line: int) -> None:  # pragma: no cover - UI wiring
+        """Move the caret to the heading at source *line*.
 
-        label = getattr(self, "_story_link_label", None)
-        if label is None:
-            return
+        ``findBlockByNumber`` is a logarithmic lookup in Qt's block map, so
+        jumping stays fast in long manuscripts. When only the WYSIWYG pane
+        is visible, the heading text is searched there instead.
+        """
 
-        # Default: hide label when there is no associated story/screenplay.
-        text = ""
-        url: str | None = None
-        identifier: str | None = None
-        kind: str | None = None
+        if self.editor.isVisible():
+            block = self.editor.document().findBlockByNumber(line)
+            if not block.isValid():
+                return
+            cursor = self.editor.textCursor()
+            cursor.setPosition(block.position())
+            self.editor.setTextCursor(cursor)
+            self.editor.centerCursor()
+            self.editor.setFocus()
+            return
 
         try:
-            path = self._get_current_document_path()
+            entry = self._current_document_index().outline.entry_at_line(line)
         except Exception:
-            path = None
+            entry = None
+        if entry is None or not entry.title:
+            return
+        cursor = self.preview.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        self.preview.setTextCursor(cursor)
+        self.preview.find(entry.title, QTextDocument.FindFlags())
 
-        if path is not None:
-            try:
-                md = file_metadata.read_story_metadata(path)
+    def _show_find_in_space(self) -> None:  # pragma: no cover - UI wiring
+        """Show the "Find in Space" panel and refresh the space index."""
 
-                # Prefer explicit story association when present.
-                story_id = md.story_id or file_metadata.get_attr(path, "story_id")
-                screenplay_id = file_metadata.get_attr(path, "screenplay_id")
-                source_url = md.source_url or file_metadata.get_attr(path, "screenplay_url")
+        self._space_search_panel.set_space(self._project_space_path)
+        self._space_search_dock.setVisible(True)
+        self._space_search_dock.raise_()
+        self._space_search_panel.focus_query()
 
-                if story_id:
-                    identifier = story_id
-                    kind = "story"
-                    url = md.source_url or None
-                    if not url:
-                        base = getattr(self, "_settings", None)
-                        base = getattr(base, "crowdly_base_url", None)
-                        if isinstance(base, str) and base.strip():
-                            url = f"{base.rstrip('/')}/story/{identifier}"
-                elif screenplay_id:
-                    identifier = screenplay_id
-                    kind = "screenplay"
-                    url = source_url or None
-                    if not url:
-                        base = getattr(self, "_settings", None)
-                        base = getattr(base, "crowdly_base_url", None)
-                        if isinstance(base, str) and base.strip():
-                            url = f"{base.rstrip('/')}/screenplay/{identifier}"
-            except Exception:
-                identifier = None
-                url = None
-                kind = None
+    def _open_path_at_offset(self, path: Path, offset: int) -> None:  # pragma: no cover - UI wiring
+        """Show *path* (reusing its tab when open) with the caret at *offset*."""
 
-        self._current_story_or_screenplay_id = identifier
-        self._current_story_or_screenplay_url = url
+        target = Path(path)
+        try:
+            resolved = target.resolve()
+        except Exception:
+            resolved = target
 
-        if identifier and kind:
-            if kind == "story":
-                label_text = self.tr('Story ID: <a href="id">{id}</a>').format(id=identifier)
-            else:
-                label_text = self.tr('Screenplay ID: <a href="id">{id}</a>').format(id=identifier)
-            text = label_text.replace("id", identifier)
+        tab_index = -1
+        for index, doc in enumerate(self._tab_documents):
+            doc_path = getattr(doc, "path", None)
+            if doc_path is None:
+                continue
+            try:
+                if Path(doc_path).resolve() == resolved:
+                    tab_index = index
+                    break
+            except Exception:
+                continue
+
+        if tab_index >= 0:
+            self._tab_widget.setCurrentIndex(tab_index)
+        else:
+            if not target.is_file():
+                return
+            try:
+                self._new_tab()
+                self._load_document_from_path(target)
+                self._tab_widget.setTabText(self._current_tab_index, target.name)
+            except Exception:
+                return
+
+        if not self.editor.isVisible():
+            return
+        cursor = self.editor.textCursor()
+        cursor.setPosition(max(0, min(int(offset), self.editor.document().characterCount() - 1)))
+        self.editor.setTextCursor(cursor)
+        self.editor.centerCursor()
+        self.editor.setFocus()
+
+    def _open_tabs_by_path(self) -> dict[Path, int]:
+        """Map the resolved path of every open, saved document to its tab."""
+
+        result: dict[Path, int] = {}
+        for index, doc in enumerate(self._tab_documents):
+            doc_path = getattr(doc, "path", None)
+            if doc_path is None:
+                continue
+            try:
+                result[Path(doc_path).resolve()] = index
+            except Exception:
+                continue
+        return result
+
+    def _apply_text_to_tab(self, index: int, old_text: str, new_text: str, edit: text_replace.TextEdit | None) -> None:
+        """Update an open tab whose file was rewritten by a Space-wide edit.
+
+        The tab's editor receives *edit* as one minimal edit (one undo step)
+        instead of reloading the whole document; when its text no longer
+        matches *old_text* it is reset to *new_text* so it never keeps text
+        the file and the journal no longer hold. The file on disk already
+        holds *new_text*, so the document is left clean.
+        """
+
+        editor, _preview = self._tab_widgets[index]
+        document = self._tab_documents[index]
+        is_current = index == self._current_tab_index
+        reset = False
+
+        if edit is not None and editor.get_text() == old_text:
+            if is_current:
+                # Runs the usual change handlers once (preview, stats, sync).
+                editor.apply_edit(edit.start, edit.end, edit.replacement)
+            else:
+                old_state = editor.blockSignals(True)
+                try:
+                    editor.apply_edit(edit.start, edit.end, edit.replacement)
+                finally:
+                    editor.blockSignals(old_state)
+        elif editor.get_text() != new_text:
+            old_state = editor.blockSignals(True)
+            try:
+                editor.setPlainText(new_text)
+            finally:
+                editor.blockSignals(old_state)
+            reset = True
+
+        # The editor now shows new_text; record that so its next delta
+        # applies on top instead of resyncing the whole text.
+        document.sync_text(new_text, editor.version)
+        document.is_dirty = False
+        if reset and is_current:
+            self._refresh_preview_from_document(source="document")
+
+    def _space_replace_options(self) -> space_replace.ReplaceOptions:
+        try:
+            return space_replace.ReplaceOptions(
+                case_sensitive=bool(self._chk_match_case.isChecked()),
+                whole_word=bool(self._chk_whole_word.isChecked()),
+            )
+        except Exception:
+            return space_replace.ReplaceOptions()
+
+    def _replace_in_space(self) -> None:  # pragma: no cover - UI wiring
+        """Replace text in every document of the project space.
+
+        Matches are counted in worker processes and previewed per file
+        before anything is written. The operation is journaled so it can be
+        reverted in one step via "Undo Replace in Space".
+        """
+
+        root = self._project_space_path
+        if root is None or not Path(root).is_dir():
+            QMessageBox.information(
+                self,
+                self.tr("Replace in Space"),
+                self.tr("No project space selected."),
+            )
+            return
+
+        search_text, ok = QInputDialog.getText(
+            self,
+            self.tr("Replace in Space"),
+            self.tr("Find:"),
+            QLineEdit.EchoMode.Normal,
+            self._search_entry.text() or self._search_text,
+        )
+        if not ok or not search_text:
+            return
+        replace_text, ok = QInputDialog.getText(
+            self,
+            self.tr("Replace in Space"),
+            self.tr("Replace with:"),
+            QLineEdit.EchoMode.Normal,
+            self._replace_entry.text() or self._replace_text,
+        )
+        if not ok:
+            return
+
+        options = self._space_replace_options()
+        open_tabs = self._open_tabs_by_path()
+        overrides = {path: self._tab_documents[i].content or "" for path, i in open_tabs.items()}
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            matches = space_replace.scan_space(root, search_text, options, overrides=overrides)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not matches:
+            QMessageBox.information(
+                self,
+                self.tr("Replace in Space"),
+                self.tr("The specified text was not found."),
+            )
+            return
+
+        total = sum(m.count for m in matches)
+        root_resolved = Path(root).resolve()
+        details = []
+        for match in matches:
+            try:
+                rel = match.path.relative_to(root_resolved).as_posix()
+            except ValueError:
+                rel = str(match.path)
+            details.append(f"{rel}: {match.count}")
+
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle(self.tr("Replace in Space"))
+        box.setText(
+            self.tr("Replace {count} occurrence(s) in {files} file(s)?").format(
+                count=total, files=len(matches)
+            )
+        )
+        box.setDetailedText("\n".join(details))
+        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if box.exec() != QMessageBox.StandardButton.Yes:
+            return
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            journal = space_replace.apply_replace(
+                root,
+                [m.path for m in matches],
+                search_text,
+                replace_text,
+                options,
+                overrides=overrides,
+            )
+            journal.save()
+        except Exception as exc:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, self.tr("Replace in Space"), str(exc))
+            return
+        QApplication.restoreOverrideCursor()
+
+        for path, index in open_tabs.items():
+            old_text = overrides[path]
+            spans = text_replace.find_spans(
+                old_text,
+                search_text,
+                case_sensitive=options.case_sensitive,
+                whole_word=options.whole_word,
+            )
+            if not spans:
+                continue
+            edit = text_replace.minimal_edit(old_text, spans, replace_text)
+            self._apply_text_to_tab(index, old_text, text_replace.replace_spans(old_text, spans, replace_text), edit)
+
+        self._space_search_panel.reindex()
+        if journal.failed:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle(self.tr("Replace in Space"))
+            box.setText(
+                self.tr(
+                    "{count} file(s) may not have been replaced and cannot be undone automatically. "
+                    "Please check them."
+                ).format(count=len(journal.failed))
+            )
+            box.setDetailedText("\n".join(journal.failed))
+            box.exec()
+        bar = self.statusBar()
+        if bar is not None:
+            bar.showMessage(
+                self.tr("Replaced {count} occurrence(s) in {files} file(s).").format(
+                    count=journal.total_replacements, files=len(journal.entries)
+                ),
+                5000,
+            )
+
+    def _undo_replace_in_space(self) -> None:  # pragma: no cover - UI wiring
+        """Revert the most recent "Replace in Space" from its journal."""
+
+        root = self._project_space_path
+        journal = space_replace.latest_journal(root) if root is not None else None
+        if journal is None:
+            QMessageBox.information(
+                self,
+                self.tr("Undo Replace in Space"),
+                self.tr("There is no Space-wide replace to undo."),
+            )
+            return
+
+        open_tabs = self._open_tabs_by_path()
+        overrides = {path: self._tab_documents[i].content or "" for path, i in open_tabs.items()}
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            restored_open, restored, conflicts = space_replace.undo_replace(journal, overrides=overrides)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        entries = {(Path(journal.root) / e.path).resolve(): e for e in journal.entries}
+        for path, new_text in restored_open.items():
+            index = open_tabs.get(path.resolve())
+            entry = entries.get(path.resolve())
+            if index is None or entry is None:
+                continue
+            old_text = overrides[path.resolve()]
+            edit = space_replace.collapse_edits(old_text, entry.inverse)
+            self._apply_text_to_tab(index, old_text, new_text, edit)
+
+        journal.discard()
+        self._space_search_panel.reindex()
+
+        if conflicts:
+            QMessageBox.warning(
+                self,
+                self.tr("Undo Replace in Space"),
+                self.tr("{count} file(s) changed after the replace and were left untouched.").format(
+                    count=len(conflicts)
+                ),
+            )
+        bar = self.statusBar()
+        if bar is not None:
+            bar.showMessage(
+                self.tr("Restored {files} file(s).").format(files=len(restored)),
+                5000,
+            )
+
+    def _parse_story_for_sync(self, body_format: str | None) -> story_sync.StoryPayload:
+        """Parse the active document for story sync.
+
+        Markdown documents reuse the editor's outline index for chapter
+        boundaries; anything else (or a stale index) takes the full parse.
+        """
+
+        content = getattr(self._document, "content", "") or ""
+        if (body_format or "").lower() == "markdown":
+            try:
+                tracker = self._current_document_index()
+                lines = content.split("\n")
+                if tracker.storage_format == "markdown" and tracker.outline.line_count() == len(lines):
+                    return story_sync.parse_story_from_outline(lines, tracker.outline)
+            except Exception:
+                pass
+        return story_sync.parse_story_from_content(content, body_format=body_format)
+
+    def _update_user_status_label(self) -> None:
+        """Update the bottom-right user status label."""
+
+        label = getattr(self, "_user_label", None)
+        if label is None:
+            return
+
+        label.setText(
+            self.tr("Logged in as: {username}").format(username=self._username)
+        )
+
+    def _update_sync_status_label(self) -> None:
+        """Update the sync status label in the status bar."""
+
+        label = getattr(self, "_sync_status_label", None)
+        if label is None:
+            return
+
+        if getattr(self, "_sync_web_platform", False):
+            # Prefer the explicit web credentials username when available,
+            # otherwise fall back to the desktop username.
+            web_user = None
+            try:
+                creds = getattr(self, "_crowdly_web_credentials", None)
+                if isinstance(creds, tuple) and len(creds) >= 1:
+                    web_user = creds[0]
+            except Exception:
+                web_user = None
+
+            if not web_user:
+                try:
+                    candidate = getattr(self, "_username", None)
+                    if isinstance(candidate, str) and candidate and candidate != "username":
+                        web_user = candidate
+                except Exception:
+                    web_user = None
+
+            if web_user:
+                text = self.tr("Web sync: connected as {username}").format(username=web_user)
+            else:
+                text = self.tr("Web sync: enabled")
+        else:
+            text = self.tr("Web sync: off")
+
+        # Uploads recorded in the sync outbox that the backend has not
+        # accepted yet (offline, or sync turned off).
+        try:
+            pending = sum(len(outbox) for outbox in self._sync_outboxes())
+        except Exception:
+            pending = 0
+        if pending:
+            text = text + " " + self.tr("({count} pending)").format(count=pending)
+
+        label.setText(text)
+
+    def _update_story_link_label(self) -> None:
+        """Update the status-bar link for the current story/screenplay, if any."""
+
+        label = getattr(self, "_story_link_label", None)
+        if label is None:
+            return
+
+        # Default: hide label when there is no associated story/screenplay.
+        text = ""
+        url: str | None = None
+        identifier: str | None = None
+        kind: str | None = None
+
+        try:
+            path = self._get_current_document_path()
+        except Exception:
+            path = None
+
+        if path is not None:
+            try:
+                md = file_metadata.read_story_metadata(path)
+
+                # Prefer explicit story association when present.
+                story_id = md.story_id or file_metadata.get_attr(path, "story_id")
+                screenplay_id = file_metadata.get_attr(path, "screenplay_id")
+                source_url = md.source_url or file_metadata.get_attr(path, "screenplay_url")
+
+                if story_id:
+                    identifier = story_id
+                    kind = "story"
+                    url = md.source_url or None
+                    if not url:
+                        base = getattr(self, "_settings", None)
+                        base = getattr(base, "crowdly_base_url", None)
+                        if isinstance(base, str) and base.strip():
+                            url = f"{base.rstrip('/')}/story/{identifier}"
+                elif screenplay_id:
+                    identifier = screenplay_id
+                    kind = "screenplay"
+                    url = source_url or None
+                    if not url:
+                        base = getattr(self, "_settings", None)
+                        base = getattr(base, "crowdly_base_url", None)
+                        if isinstance(base, str) and base.strip():
+                            url = f"{base.rstrip('/')}/screenplay/{identifier}"
+            except Exception:
+                identifier = None
+                url = None
+                kind = None
+
+        self._current_story_or_screenplay_id = identifier
+        self._current_story_or_screenplay_url = url
+
+        if identifier and kind:
+            if kind == "story":
+                label_text = self.tr('Story ID: <a href="id">{id}</a>').format(id=identifier)
+            else:
+                label_text = self.tr('Screenplay ID: <a href="id">{id}</a>').format(id=identifier)
+            text = label_text.replace("id", identifier)
 
         label.setText(text)
 
@@ -3431,6 +4178,8 @@ class MainWindow(QMainWindow):
             # Save via the Document model so metadata and dirty flags stay consistent.
             self._document.storage_format = "markdown"
             self._document.kind = "generic"
+            # Let queued autosaves land first so they cannot overwrite this.
+            self._save_service.flush()
             self._document.save(target_path)
             self._document.is_dirty = False
 
@@ -3553,8 +4302,7 @@ class MainWindow(QMainWindow):
 
             # Refresh preview
             try:
-                html = story_markup.dsl_to_html(dsl_content)
-                self.preview.set_html(html)
+                self.preview.set_dsl(dsl_content, "story_v1")
             except Exception:
                 self.preview.set_markdown(dsl_content)
 
@@ -3679,8 +4427,7 @@ class MainWindow(QMainWindow):
 
             # Refresh preview
             try:
-                html = screenplay_markup.dsl_to_html(dsl_content)
-                self.preview.set_html(html)
+                self.preview.set_dsl(dsl_content, "screenplay_v1")
             except Exception:
                 self.preview.set_markdown(dsl_content)
 
@@ -3846,9 +4593,10 @@ class MainWindow(QMainWindow):
                 self._retranslate_ui()
                 self._update_sync_status_label()
 
-                if self._web_pull_timer.isActive():
-                    self._web_pull_timer.stop()
-                self._web_pull_timer.start()
+                # Poll until the push channel is up and covers the documents.
+                self._refresh_web_subscriptions()
+                # Upload what was saved while sync was off or offline.
+                self._retry_outbox_now(None)
 
                 # On enable, force a pull once so toggling OFF->ON always has an
                 # effect (it reconciles local state with the remote state
@@ -3886,6 +4634,7 @@ class MainWindow(QMainWindow):
             else:
                 # Turning sync off: stop polling + pending push debounce.
                 self._sync_web_platform = False
+                self._refresh_web_subscriptions()
                 if self._web_pull_timer.isActive():
                     self._web_pull_timer.stop()
                 if self._web_sync_timer.isActive():
@@ -4515,9 +5264,14 @@ class MainWindow(QMainWindow):
             dialog.exec()
             return
 
-        # Logged in -> perform a simple logout.
+        # Logged in -> perform a simple logout. Backend sessions persisted
+        # for background syncs would otherwise stay valid for hours.
         self._logged_in = False
         self._username = "username"
+        try:
+            crowdly_session.shared_sessions().clear()
+        except Exception:
+            pass
         self._retranslate_ui()
         self._update_user_status_label()
         self._update_sync_status_label()
@@ -4865,21 +5619,37 @@ class MainWindow(QMainWindow):
         self._search_text = search_text
         self._replace_text = replace_text
 
-        cursor = target.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-        target.setTextCursor(cursor)
+        # Find every match on the plain text in one pass and apply them as a
+        # single edit (one undo step, one round of change handlers) instead of
+        # driving find()/insertText() through the widget per occurrence.
+        try:
+            case_sensitive = bool(self._chk_match_case.isChecked())
+            whole_word = bool(self._chk_whole_word.isChecked())
+        except Exception:
+            case_sensitive = whole_word = False
 
-        flags = self._search_get_find_flags(backwards=False)
-        count = 0
+        if target is self.preview:
+            text = self.preview.get_plain_text()
+        else:
+            text = target.toPlainText()
 
-        while True:
-            found = target.find(search_text, flags)
-            if not found:
-                break
-            cursor = target.textCursor()
-            cursor.insertText(replace_text)
-            target.setTextCursor(cursor)
-            count += 1
+        spans = text_replace.find_spans(
+            text,
+            search_text,
+            case_sensitive=case_sensitive,
+            whole_word=whole_word,
+        )
+        count = len(spans)
+
+        if spans:
+            if target is self.preview:
+                # Per-span edits keep the rich-text formatting around each
+                # match; they still form a single undo step.
+                self.preview.apply_replacements(spans, replace_text)
+            else:
+                edit = text_replace.minimal_edit(text, spans, replace_text)
+                if edit is not None:
+                    target.apply_edit(edit.start, edit.end, edit.replacement)
 
         if count == 0:
             QMessageBox.information(
@@ -5357,6 +6127,7 @@ class MainWindow(QMainWindow):
                 try:
                     self._crowdly_web_credentials = (creds.username, creds.password)
                     self._update_sync_status_label()
+                    self._refresh_web_subscriptions()
                 except Exception:
                     pass
 
@@ -5608,18 +6379,8 @@ class MainWindow(QMainWindow):
         doc.kind = kind
         doc.storage_format = storage_format
 
-        if storage_format == "story_v1":
-            try:
-                html = story_markup.dsl_to_html(doc.content)
-            except Exception:
-                html = ""
-            self.preview.set_html(html)
-        elif storage_format == "screenplay_v1":
-            try:
-                html = screenplay_markup.dsl_to_html(doc.content)
-            except Exception:
-                html = ""
-            self.preview.set_html(html)
+        if storage_format in ("story_v1", "screenplay_v1"):
+            self.preview.set_dsl(doc.content, storage_format)
         else:
             self.preview.set_markdown(doc.content)
 
@@ -6165,6 +6926,8 @@ class MainWindow(QMainWindow):
 
         self._crowdly_web_credentials = (creds.username, creds.password)
         self._update_sync_status_label()
+        # The push channel only announces private documents to their users.
+        self._refresh_web_subscriptions()
         return self._crowdly_web_credentials
 
     def _handle_web_auth_failure(self, message: str | None) -> None:  # pragma: no cover - UI wiring
@@ -6175,14 +6938,20 @@ class MainWindow(QMainWindow):
         - Shows a clear, actionable error message.
         """
 
-        # Clear cached credentials so the next attempt asks again.
+        # Clear cached credentials so the next attempt asks again; the
+        # persisted backend sessions must not outlive them.
         try:
             self._crowdly_web_credentials = None
+            crowdly_session.shared_sessions().clear()
         except Exception:
             pass
 
         # Ensure sync is turned off and timers are stopped.
         self._sync_web_platform = False
+        try:
+            self._refresh_web_subscriptions()
+        except Exception:
+            pass
         try:
             if self._web_pull_timer.isActive():
                 self._web_pull_timer.stop()
@@ -6227,24 +6996,169 @@ class MainWindow(QMainWindow):
             pass
 
     def _poll_web_updates(self) -> None:  # pragma: no cover
-        """Poll the backend for remote updates and pull if needed.
+        """Check the due documents for remote updates, one request per batch.
 
-        When web credentials are available we use them, so private stories do
-        not trigger additional login prompts.
+        Changed documents are handled like push events, so only the current
+        tab is pulled right away and the others when they are shown.
         """
 
-        try:
-            creds = getattr(self, "_crowdly_web_credentials", None)
-        except Exception:
-            creds = None
+        if not self._sync_web_platform:
+            return
+        for batch in self._web_poll_scheduler.due_batches():
+            thread = _WebChangesThread(batch=batch, credentials=self._crowdly_web_credentials, parent=self)
+            thread.changesFetched.connect(self._on_web_changes_fetched)
+            thread.finished.connect(thread.deleteLater)
+            self._web_poll_threads.append(thread)
+            thread.start()
+        self._reschedule_web_poll()
 
-        try:
-            self._start_pull_from_web(force=False, credentials=creds)
-        except Exception:
+    def _on_web_changes_fetched(self, payload: object) -> None:  # pragma: no cover - UI wiring
+        thread = self.sender()
+        if thread in self._web_poll_threads:
+            self._web_poll_threads.remove(thread)
+        if not isinstance(payload, dict):
             return
+        batch = payload.get("batch")
+        events = payload.get("events")
+        if isinstance(batch, poll_scheduler.PollBatch):
+            revisions = None
+            if isinstance(events, list):
+                revisions = {(e.kind, e.item_id): e.updated_at for e in events}
+                # The backend answered: uploads waiting for it can go now.
+                self._retry_outbox_now(batch.api_base)
+            self._web_poll_scheduler.complete(batch, revisions)
+        for event in events or []:
+            self._on_web_update_event(event)
+        if payload.get("unsupported") and self._sync_web_platform:
+            # Backend without the batch endpoint: check the current document
+            # on its own, as before.
+            try:
+                self._start_pull_from_web(force=False, credentials=self._crowdly_web_credentials)
+            except Exception:
+                pass
+        self._reschedule_web_poll()
 
-    def _start_pull_from_web(self, *, force: bool, credentials: tuple[str, str] | None = None) -> None:  # pragma: no cover
-        """Start a background pull if the remote story/screenplay has changed."""
+    def _reschedule_web_poll(self) -> None:  # pragma: no cover - UI wiring
+        """Arm the poll timer for the scheduler's next due documents."""
+
+        delay = None
+        if self._sync_web_platform:
+            delay = self._web_poll_scheduler.next_due_in()
+        if delay is None:
+            self._web_pull_timer.stop()
+            return
+        self._web_pull_timer.start(max(50, int(delay * 1000)))
+
+    def _refresh_web_subscriptions(self) -> None:  # pragma: no cover - UI wiring
+        """Subscribe the push channel to the web-linked open documents."""
+
+        listener = getattr(self, "_web_update_listener", None)
+        if listener is None:
+            return
+        if not self._sync_web_platform:
+            self._web_subscribed = {}
+            self._web_stream_base = None
+            self._web_pending_pulls.clear()
+            self._web_poll_scheduler.set_documents({})
+            self._web_poll_scheduler.set_covered(())
+            self._reschedule_web_poll()
+            listener.stop()
+            return
+
+        from ..crowdly_client import api_base_url_from_story_url
+
+        subscribed: dict[tuple[str, str], list[Path]] = {}
+        bases: dict[tuple[str, str], str] = {}
+        for document in self._tab_documents:
+            path = getattr(document, "path", None)
+            if not isinstance(path, Path):
+                continue
+            try:
+                record = file_metadata.read_record(path)
+            except Exception:
+                continue
+            screenplay_id = record.get("screenplay_id")
+            if screenplay_id:
+                key, url = ("screenplay", screenplay_id), record.get("screenplay_url")
+            else:
+                key, url = ("story", record.get(file_metadata.FIELD_STORY_ID)), record.get(file_metadata.FIELD_SOURCE_URL)
+            if not key[1] or not url:
+                continue
+            try:
+                bases[key] = api_base_url_from_story_url(url)
+            except Exception:
+                continue
+            subscribed.setdefault(key, []).append(path)
+
+        # One stream per backend: follow the current document's backend.
+        # Documents on other backends (and all of them while the stream is
+        # down) are left to the poll scheduler.
+        api_base = None
+        current = self._get_current_document_path()
+        for key, paths in subscribed.items():
+            if api_base is None or current in paths:
+                api_base = bases[key]
+        streamed = [key for key in subscribed if bases[key] == api_base]
+
+        self._web_subscribed = subscribed
+        self._web_stream_base = api_base
+        listener.set_subscriptions(
+            api_base,
+            [item_id for kind, item_id in streamed if kind == "story"],
+            [item_id for kind, item_id in streamed if kind == "screenplay"],
+            self._crowdly_web_credentials,
+        )
+        self._web_poll_scheduler.set_documents(bases)
+        self._web_poll_scheduler.set_covered([api_base] if api_base and listener.connected else ())
+        self._reschedule_web_poll()
+
+    def _on_web_update_event(self, event: object) -> None:  # pragma: no cover - UI wiring
+        """Queue a pull for open documents whose remote revision moved."""
+
+        kind = getattr(event, "kind", None)
+        item_id = getattr(event, "item_id", None)
+        updated_at = getattr(event, "updated_at", None)
+        if not self._sync_web_platform or not kind or not item_id:
+            return
+        if isinstance(updated_at, str):
+            self._web_poll_scheduler.note_revision((kind, item_id), updated_at)
+        for path in self._web_subscribed.get((kind, item_id), []):
+            try:
+                local_remote = file_metadata.get_attr(path, file_metadata.FIELD_REMOTE_UPDATED_AT)
+            except Exception:
+                local_remote = None
+            if local_remote != updated_at:
+                self._web_pending_pulls.add(path)
+        self._flush_pending_web_pull()
+
+    def _flush_pending_web_pull(self) -> None:  # pragma: no cover - UI wiring
+        """Pull the current document if a remote change was announced for it."""
+
+        pending = getattr(self, "_web_pending_pulls", None)
+        path = self._get_current_document_path()
+        if not pending or path is None or path not in pending:
+            return
+        for attr, cls in (("_story_pull_thread", _StoryPullThread), ("_screenplay_pull_thread", _ScreenplayPullThread)):
+            thread = getattr(self, attr, None)
+            if isinstance(thread, cls) and thread.isRunning():
+                # Retried from the pull's finished handler.
+                return
+        pending.discard(path)
+        self._start_pull_from_web(force=False, credentials=self._crowdly_web_credentials)
+
+    def _on_web_update_channel_changed(self, connected: bool) -> None:  # pragma: no cover - UI wiring
+        """Poll the streamed backend only while the push channel is down."""
+
+        if not self._sync_web_platform:
+            return
+        base = self._web_stream_base
+        self._web_poll_scheduler.set_covered([base] if connected and base else ())
+        self._reschedule_web_poll()
+        if connected and base:
+            self._retry_outbox_now(base)
+
+    def _start_pull_from_web(self, *, force: bool, credentials: tuple[str, str] | None = None) -> None:  # pragma: no cover
+        """Start a background pull if the remote story/screenplay has changed."""
 
         import traceback
 
@@ -6297,6 +7211,7 @@ class MainWindow(QMainWindow):
             credentials=credentials,
             local_path=path,
             force=force,
+            deferred=path in self._deferred_story_pulls,
             parent=self,
         )
         thread.pullAvailable.connect(self._on_story_pull_available)
@@ -6311,6 +7226,60 @@ class MainWindow(QMainWindow):
 
         thread.start()
 
+    def _project_root_for_path(self, path: Path) -> Path | None:
+        """Return the project-space root (local creative Space) owning *path*."""
+
+        project_root: Path | None = None
+        try:
+            if self._project_space_path is not None:
+                candidate_root = self._project_space_path.resolve()
+                try:
+                    inside = path.resolve().is_relative_to(candidate_root)  # type: ignore[attr-defined]
+                except AttributeError:  # Python < 3.9 fallback
+                    inside = str(path.resolve()).startswith(str(candidate_root))
+                if inside:
+                    project_root = candidate_root
+        except Exception:
+            project_root = None
+
+        # If we could not match against the active project-space root, fall
+        # back to any known Space whose path is a prefix of the document
+        # path. This allows multiple Spaces while still providing a
+        # deterministic mapping.
+        if project_root is None:
+            try:
+                for space in getattr(self, "_spaces", []) or []:
+                    try:
+                        candidate_root = space.resolve()
+                    except Exception:
+                        candidate_root = space
+                    try:
+                        inside = path.resolve().is_relative_to(candidate_root)  # type: ignore[attr-defined]
+                    except AttributeError:
+                        inside = str(path.resolve()).startswith(str(candidate_root))
+                    if inside:
+                        project_root = candidate_root
+                        break
+            except Exception:
+                project_root = None
+
+        return project_root
+
+    def _creative_space_id_for_root(self, project_root: Path | None) -> str | None:
+        """Return the remote creative Space mapped to *project_root*, if any."""
+
+        try:
+            if project_root is not None:
+                state = getattr(self._settings, "space_sync_state", {}) or {}
+                mapping = state.get(str(project_root)) if isinstance(state, dict) else None
+                if isinstance(mapping, dict):
+                    val = mapping.get("remote_space_id")
+                    if isinstance(val, str) and val:
+                        return val
+        except Exception:
+            pass
+        return None
+
     def _maybe_sync_story_to_web(self) -> None:  # pragma: no cover
         """Best-effort: sync the current local story or screenplay to Crowdly.
 
@@ -6355,39 +7324,7 @@ class MainWindow(QMainWindow):
             # Derive the project-space root (local creative Space) that owns
             # this file, if any, so we can map the story to a specific
             # creative_space on the backend.
-            project_root: Path | None = None
-            try:
-                if self._project_space_path is not None:
-                    candidate_root = self._project_space_path.resolve()
-                    try:
-                        inside = path.resolve().is_relative_to(candidate_root)  # type: ignore[attr-defined]
-                    except AttributeError:  # Python < 3.9 fallback
-                        inside = str(path.resolve()).startswith(str(candidate_root))
-                    if inside:
-                        project_root = candidate_root
-            except Exception:
-                project_root = None
-
-            # If we could not match against the active project-space root, fall
-            # back to any known Space whose path is a prefix of the document
-            # path. This allows multiple Spaces while still providing a
-            # deterministic mapping.
-            if project_root is None:
-                try:
-                    for space in getattr(self, "_spaces", []) or []:
-                        try:
-                            candidate_root = space.resolve()
-                        except Exception:
-                            candidate_root = space
-                        try:
-                            inside = path.resolve().is_relative_to(candidate_root)  # type: ignore[attr-defined]
-                        except AttributeError:
-                            inside = str(path.resolve()).startswith(str(candidate_root))
-                        if inside:
-                            project_root = candidate_root
-                            break
-                except Exception:
-                    project_root = None
+            project_root = self._project_root_for_path(path)
 
             # When a document lives under a project-space root that has not yet
             # been linked to a remote creative Space, show a one-time
@@ -6426,40 +7363,57 @@ class MainWindow(QMainWindow):
             # root using the existing space_sync_state structure. If there is no
             # mapping yet, we still sync the story content but omit the
             # creative_space_id hint so behaviour remains backward compatible.
-            creative_space_id: str | None = None
+            creative_space_id = self._creative_space_id_for_root(project_root)
+
+            md = file_metadata.read_story_metadata(path)
+
+            # Parse content into chapters.
+            snapshot_ms = file_metadata.now_ms()
+            story = self._parse_story_for_sync(body_format)
+            chapters = story_sync.to_json_payload(story)["chapters"]
+            meta_payload = story_sync.metadata_payload(md)
+
+            # Skip sync when the backend already has exactly this content.
+            content_hash = story_sync.payload_hash(
+                {"title": story.title, "chapters": chapters, "metadata": meta_payload}
+            )
+            if md.synced_hash == content_hash:
+                return
+
+            api_base = None
             try:
-                if project_root is not None:
-                    state = getattr(self._settings, "space_sync_state", {}) or {}
-                    mapping = state.get(str(project_root)) if isinstance(state, dict) else None
-                    if isinstance(mapping, dict):
-                        val = mapping.get("remote_space_id")
-                        if isinstance(val, str) and val:
-                            creative_space_id = val
+                from ..crowdly_client import api_base_url_from_story_url
+
+                api_base = api_base_url_from_story_url(source_url)
             except Exception:
-                creative_space_id = None
+                api_base = None
 
-            # If a sync is already running, don't start a second one.
+            if not api_base:
+                return
+
+            # Record the request durably first; it is cleared only once the
+            # backend accepted an upload at least this recent.
+            outbox = sync_outbox.outbox_for(project_root)
+
+            # If a sync is already running, don't start a second one: the
+            # outbox uploads the document again once it finished.
             thread = getattr(self, "_story_sync_thread", None)
             if isinstance(thread, _StorySyncThread) and thread.isRunning():
+                outbox.enqueue(sync_outbox.KIND_STORY, path, story_id, api_base)
+                self._schedule_outbox_drain()
                 return
 
             creds = self._ensure_crowdly_web_credentials()
             if creds is None:
+                outbox.enqueue(sync_outbox.KIND_STORY, path, story_id, api_base)
+                self._schedule_outbox_drain()
                 return
 
-            md = file_metadata.read_story_metadata(path)
-
-            # Skip sync when nothing changed since last sync.
-            try:
-                changed_at = file_metadata.parse_human(md.change_date)
-                synced_at = file_metadata.parse_human(md.last_sync_date)
-                if changed_at is not None and synced_at is not None and changed_at <= synced_at:
-                    return
-            except Exception:
-                pass
-
-            # Parse content into chapters.
-            story = story_sync.parse_story_from_content(self._document.content, body_format=body_format)
+            generation = outbox.enqueue(sync_outbox.KIND_STORY, path, story_id, api_base, claim=True)
+            self._update_sync_status_label()
+            if generation is None:
+                # The outbox worker is uploading this document right now.
+                return
 
             # Keep file metadata story_title in sync with parsed title.
             try:
@@ -6467,42 +7421,20 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-            # Prepare metadata payload.
-            tags_list = None
-            if md.tags:
-                # Accept comma-separated list.
-                tags_list = [t.strip() for t in md.tags.split(",") if t.strip()]
-
-            meta_payload = {
-                "author_id": md.author_id,
-                "initiator_id": md.initiator_id,
-                "genre": md.genre,
-                "tags": tags_list,
-                "description": md.description,
-            }
-
-            api_base = None
-            try:
-                from ..crowdly_client import api_base_url_from_story_url
-
-                api_base = api_base_url_from_story_url(source_url)
-            except Exception:
-                api_base = None
-
-            if not api_base:
-                return
-
             # Start thread.
             thread = _StorySyncThread(
                 api_base=api_base,
                 story_id=story_id,
                 title=story.title,
-                chapters=story_sync.to_json_payload(story)["chapters"],
+                chapters=chapters,
                 metadata=meta_payload,
                 credentials=creds,
                 local_path=path,
                 creative_space_id=creative_space_id,
                 project_root=project_root,
+                generation=generation,
+                payload_hash=content_hash,
+                snapshot_ms=snapshot_ms,
                 parent=self,
             )
 
@@ -6660,8 +7592,9 @@ class MainWindow(QMainWindow):
         """Best-effort: sync the current local screenplay back to the backend.
 
         This mirrors the story sync pipeline but targets the screenplay
-        endpoints. All early returns are logged to stderr so issues can be
-        debugged more easily.
+        endpoints: the document is snapshotted here and uploaded by a
+        :class:`_ScreenplaySyncThread`. All early returns are logged to
+        stderr so issues can be debugged more easily.
         """
 
         import traceback
@@ -6670,11 +7603,7 @@ class MainWindow(QMainWindow):
         try:
             print(f"[web-sync][screenplay] attempting sync for {path} (id={screenplay_id})", file=sys.stderr)
             try:
-                from ..crowdly_client import (
-                    CrowdlyClient,
-                    CrowdlyClientError,
-                    api_base_url_from_story_url,
-                )
+                from ..crowdly_client import api_base_url_from_story_url
             except Exception as exc:
                 print(f"[web-sync][screenplay] CrowdlyClient import failed: {exc}", file=sys.stderr)
                 return
@@ -6721,6 +7650,18 @@ class MainWindow(QMainWindow):
                 print("[web-sync][screenplay] no chapters/scenes parsed from content; nothing to sync", file=sys.stderr)
                 return
 
+            # The upload runs in the background from an immutable snapshot.
+            job = screenplay_sync.ScreenplaySyncJob.from_story(path, api_base, screenplay_id, screenplay_story)
+
+            # Skip sync when the backend already has exactly this content.
+            try:
+                md = file_metadata.read_story_metadata(path)
+            except Exception:
+                md = None
+            if md is not None and md.synced_hash == job.payload_hash():
+                print("[web-sync][screenplay] content unchanged since last sync; skipping", file=sys.stderr)
+                return
+
             # Best-effort: keep local metadata in sync for screenplays so the
             # Story metadata dialog reflects title, dates, and source URL.
             try:
@@ -6745,73 +7686,318 @@ class MainWindow(QMainWindow):
             except Exception as exc:
                 print(f"[web-sync][screenplay] metadata update failed: {exc}", file=sys.stderr)
 
-            scenes_payload = []
-            for idx, ch in enumerate(screenplay_story.chapters, start=1):
-                scenes_payload.append(
-                    {
-                        "sceneIndex": idx,
-                        "slugline": ch.chapterTitle,
-                        "paragraphs": ch.paragraphs,
-                    }
-                )
-
-            client = CrowdlyClient(api_base, credentials=creds)
-            print(
-                f"[web-sync][screenplay] POSTing {len(scenes_payload)} scenes to {api_base} for {screenplay_id}",
-                file=sys.stderr,
-            )
-
-            # Use remote_updated_at (if any) for conflict detection on the
-            # server so we do not overwrite newer web changes silently.
+            self._start_screenplay_sync(job, creds)
+        except Exception:
+            traceback.print_exc()
             try:
-                md = file_metadata.read_story_metadata(path)
-                remote_updated_at = md.remote_updated_at
+                bar = self.statusBar()
+                if bar is not None:
+                    bar.showMessage(self.tr("Screenplay sync failed."), 5000)
             except Exception:
-                remote_updated_at = None
+                pass
 
-            try:
-                client.sync_desktop_screenplay(
-                    screenplay_id=screenplay_id,
-                    title=screenplay_story.title,
-                    scenes=scenes_payload,
-                    metadata=None,
-                    remote_updated_at=remote_updated_at,
-                )
-            except CrowdlyClientError as exc:
-                if getattr(exc, "status_code", None) == 409:
-                    # Conflict: screenplay changed on the server since last sync.
-                    bar = self.statusBar()
-                    if bar is not None:
-                        bar.showMessage(
-                            self.tr("Screenplay has changed on the web; please refresh from web before syncing."),
-                            7000,
-                        )
-                    print(f"[web-sync][screenplay] conflict from server: {exc}", file=sys.stderr)
-                    return
-                raise
+    def _start_screenplay_sync(self, job: "screenplay_sync.ScreenplaySyncJob", credentials: tuple[str, str]) -> None:  # pragma: no cover
+        """Run *job* on a worker thread, or keep it as the follow-up sync.
 
-            # On success, mark last_sync_date for this screenplay file.
-            try:
-                file_metadata.touch_last_sync_date(path)
-            except Exception as exc:
-                print(f"[web-sync][screenplay] touch_last_sync_date failed: {exc}", file=sys.stderr)
+        Only one screenplay upload runs at a time. Saves made meanwhile
+        replace the pending job of their file, so a burst of saves results
+        in one follow-up sync with the latest text.
+        """
+
+        import sys
+
+        outbox = sync_outbox.outbox_for(self._project_root_for_path(job.local_path))
+        thread = getattr(self, "_screenplay_sync_thread", None)
+        if isinstance(thread, _ScreenplaySyncThread) and thread.isRunning():
+            outbox.enqueue(sync_outbox.KIND_SCREENPLAY, job.local_path, job.screenplay_id, job.api_base)
+            self._screenplay_sync_pending[job.local_path] = (job, credentials)
+            self._update_sync_status_label()
+            return
+
+        generation = outbox.enqueue(
+            sync_outbox.KIND_SCREENPLAY, job.local_path, job.screenplay_id, job.api_base, claim=True
+        )
+        self._update_sync_status_label()
+        if generation is None:
+            # The outbox worker is uploading this document right now.
+            return
+
+        # Read at start rather than when snapshotting: a follow-up must use
+        # the revision the previous upload produced.
+        try:
+            remote_updated_at = file_metadata.get_attr(job.local_path, file_metadata.FIELD_REMOTE_UPDATED_AT)
+        except Exception:
+            remote_updated_at = None
+
+        print(
+            f"[web-sync][screenplay] syncing {len(job.scenes)} scenes to {job.api_base} for {job.screenplay_id}",
+            file=sys.stderr,
+        )
+        thread = _ScreenplaySyncThread(
+            job=job,
+            credentials=credentials,
+            remote_updated_at=remote_updated_at,
+            generation=generation,
+            parent=self,
+        )
+        thread.syncSucceeded.connect(self._on_screenplay_sync_succeeded)
+        thread.syncFailed.connect(self._on_screenplay_sync_failed)
+        thread.finished.connect(self._on_screenplay_sync_finished)
+        thread.finished.connect(thread.deleteLater)
+        self._screenplay_sync_thread = thread
+        thread.start()
+
+    def _on_screenplay_sync_succeeded(self, payload: object) -> None:  # pragma: no cover
+        import traceback
+
+        try:
+            if not isinstance(payload, dict):
+                return
+            path = payload.get("local_path")
+            result = payload.get("result")
+            if not isinstance(path, Path):
+                return
+            self._record_sync_outcome(path, payload.get("generation"), None)
+
+            # Remember the server's new updated_at so the next sync is not
+            # mistaken for a conflict with our own upload. Edits made while
+            # the upload ran stay unsynced: they are newer than the snapshot.
+            self._mark_synced(path, payload)
+            self._remember_remote_updated_at(path, result)
 
             bar = self.statusBar()
             if bar is not None:
                 bar.showMessage(self.tr("Screenplay synced to the web."), 5000)
-            print("[web-sync][screenplay] sync completed successfully", file=sys.stderr)
-        except Exception as exc:
+        except Exception:
             traceback.print_exc()
+
+    def _on_screenplay_sync_failed(self, error: object) -> None:  # pragma: no cover
+        import traceback
+
+        try:
+            kind = error.get("kind") if isinstance(error, dict) else None
+            status_code = error.get("status_code") if isinstance(error, dict) else None
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            print(f"[web-sync][screenplay] failed: {message}")
+            if isinstance(error, dict):
+                self._record_sync_outcome(error.get("local_path"), error.get("generation"), error)
+
+            if kind in ("auth_required", "auth_failed"):
+                self._screenplay_sync_pending.clear()
+                self._handle_web_auth_failure(message)
+                return
+
+            bar = self.statusBar()
+            if bar is None:
+                return
+            if status_code == 409:
+                # Conflict: screenplay changed on the server since last sync.
+                bar.showMessage(
+                    self.tr("Screenplay has changed on the web; please refresh from web before syncing."),
+                    7000,
+                )
+            elif sync_outbox.is_retryable(kind, status_code):
+                bar.showMessage(self.tr("Web sync failed; will retry automatically."), 5000)
+            else:
+                bar.showMessage(self.tr("Screenplay sync failed."), 5000)
+        except Exception:
+            traceback.print_exc()
+
+    def _on_screenplay_sync_finished(self) -> None:  # pragma: no cover
+        self._screenplay_sync_thread = None
+        if not self._sync_web_platform:
+            # Still recorded in the outbox for when sync is enabled again.
+            self._screenplay_sync_pending.clear()
+            return
+        pending = self._screenplay_sync_pending
+        if pending:
+            path = next(iter(pending))
+            job, credentials = pending.pop(path)
+            self._start_screenplay_sync(job, credentials)
+        self._schedule_outbox_drain()
+
+    # Sync outbox ------------------------------------------------------------
+
+    def _sync_outboxes(self) -> list[sync_outbox.SyncOutbox]:
+        """The outboxes of the default location and every known Space.
+
+        Uploads left in a Space that is not the active one after a restart
+        are retried (and counted) too; each outbox is loaded once.
+        """
+
+        sync_outbox.outbox_for(None)
+        roots = list(self._spaces)
+        if self._project_space_path is not None:
+            roots.append(self._project_space_path)
+        for root in roots:
             try:
-                bar = self.statusBar()
-                if bar is not None:
-                    bar.showMessage(self.tr("Screenplay sync failed."), 5000)
+                sync_outbox.outbox_for(root.resolve())
             except Exception:
                 pass
+        return sync_outbox.loaded_outboxes()
+
+    def _record_sync_outcome(self, path: object, generation: object, error: dict | None) -> None:  # pragma: no cover - UI wiring
+        """Update the outbox entry of *path* after an upload attempt."""
+
+        if not isinstance(path, Path) or not isinstance(generation, int):
+            return
+        try:
+            outbox = sync_outbox.outbox_for(self._project_root_for_path(path))
+            if error is None:
+                outbox.succeeded(path, generation)
+            else:
+                kind, status_code = error.get("kind"), error.get("status_code")
+                if kind in ("auth_required", "auth_failed") or status_code in (401, 403):
+                    # Kept until the user logs in again.
+                    outbox.release(path)
+                elif sync_outbox.is_retryable(kind, status_code):
+                    outbox.failed(path, str(error.get("message") or kind))
+                else:
+                    # Conflicts and rejected payloads need the user.
+                    outbox.discard(path)
+        except Exception:
+            pass
+        self._schedule_outbox_drain()
+
+    def _schedule_outbox_drain(self) -> None:  # pragma: no cover - UI wiring
+        """Arm the outbox timer for the next due upload; refresh the status."""
+
+        self._update_sync_status_label()
+        timer = getattr(self, "_outbox_timer", None)
+        if timer is None:
+            return
+        delay = None
+        if self._sync_web_platform and self._crowdly_web_credentials is not None:
+            for outbox in self._sync_outboxes():
+                due = outbox.next_due_in()
+                if due is not None and (delay is None or due < delay):
+                    delay = due
+        if delay is None:
+            timer.stop()
+            return
+        timer.start(max(100, int(delay * 1000)))
+
+    def _drain_sync_outbox(self) -> None:  # pragma: no cover - UI wiring
+        """Upload the due outbox entries on a worker thread."""
+
+        import traceback
+
+        creds = self._crowdly_web_credentials
+        if not self._sync_web_platform or creds is None:
+            return
+        thread = getattr(self, "_outbox_thread", None)
+        if isinstance(thread, _OutboxReplayThread) and thread.isRunning():
+            return
+
+        # Uploads read the files; pending autosaves must land first.
+        try:
+            self._save_service.flush()
+        except Exception:
+            pass
+
+        jobs: list[dict] = []
+        for outbox in self._sync_outboxes():
+            for entry in outbox.claim_due():
+                path = Path(entry.local_path)
+                try:
+                    md = file_metadata.read_story_metadata(path)
+                    project_root = self._project_root_for_path(path)
+                    jobs.append(
+                        {
+                            "entry": entry,
+                            "body_format": md.body_format,
+                            "metadata": story_sync.metadata_payload(md),
+                            "creative_space_id": self._creative_space_id_for_root(project_root),
+                            "remote_updated_at": md.remote_updated_at,
+                            "synced_hash": md.synced_hash,
+                        }
+                    )
+                except Exception:
+                    traceback.print_exc()
+                    if not path.exists():
+                        outbox.discard(path)
+                    else:
+                        outbox.failed(path, "could not read document metadata")
+        if not jobs:
+            self._schedule_outbox_drain()
+            return
+
+        thread = _OutboxReplayThread(jobs=jobs, credentials=creds, parent=self)
+        thread.entryFinished.connect(self._on_outbox_entry_finished)
+        thread.finished.connect(self._on_outbox_replay_finished)
+        thread.finished.connect(thread.deleteLater)
+        self._outbox_thread = thread
+        thread.start()
+
+    def _on_outbox_entry_finished(self, payload: object) -> None:  # pragma: no cover - UI wiring
+        if not isinstance(payload, dict):
+            return
+        entry = payload.get("entry")
+        error = payload.get("error")
+        if not isinstance(entry, sync_outbox.OutboxEntry):
+            return
+        path = Path(entry.local_path)
+        if error is None and entry.kind == sync_outbox.KIND_SCREENPLAY:
+            self._on_screenplay_sync_succeeded(dict(payload, local_path=path, generation=entry.generation))
+            return
+        self._record_sync_outcome(path, entry.generation, error)
+        if error is None:
+            self._mark_synced(path, payload)
+            self._remember_remote_updated_at(path, payload.get("result"))
+            bar = self.statusBar()
+            if bar is not None:
+                bar.showMessage(self.tr("Story synced to the web."), 5000)
+        elif error.get("kind") in ("auth_required", "auth_failed") and self._sync_web_platform:
+            self._handle_web_auth_failure(str(error.get("message") or ""))
+
+    def _on_outbox_replay_finished(self) -> None:  # pragma: no cover - UI wiring
+        self._outbox_thread = None
+        self._schedule_outbox_drain()
+
+    def _retry_outbox_now(self, api_base: str | None) -> None:  # pragma: no cover - UI wiring
+        """Connectivity to *api_base* is back: retry its uploads right away."""
+
+        for outbox in self._sync_outboxes():
+            outbox.retry_now(api_base)
+        self._schedule_outbox_drain()
+
+    def _mark_synced(self, path: object, payload: dict) -> None:  # pragma: no cover - UI wiring
+        """Record the hash and snapshot time of an accepted upload on *path*."""
+
+        content_hash = payload.get("payload_hash")
+        snapshot_ms = payload.get("snapshot_ms")
+        if not isinstance(path, Path) or not isinstance(content_hash, str) or not isinstance(snapshot_ms, int):
+            return
+        try:
+            file_metadata.mark_synced(path, content_hash, snapshot_ms=snapshot_ms)
+        except Exception:
+            pass
+
+    def _remember_remote_updated_at(self, path: Path, result: object) -> None:  # pragma: no cover - UI wiring
+        """Store the ``updatedAt`` returned by an upload of *path*.
+
+        Without it, the update event for our own upload looks like a remote
+        change and triggers a pull of what we just sent.
+        """
+
+        updated_at = result.get("updatedAt") if isinstance(result, dict) else None
+        if not isinstance(updated_at, str) or not updated_at:
+            return
+        try:
+            file_metadata.set_attr(path, file_metadata.FIELD_REMOTE_UPDATED_AT, updated_at)
+        except Exception:
+            pass
 
     def _on_story_sync_succeeded(self, result: object) -> None:  # pragma: no cover
         import traceback
 
+        if isinstance(result, dict):
+            path = result.get("local_path")
+            self._record_sync_outcome(path, result.get("generation"), None)
+            self._mark_synced(path, result)
+            if isinstance(path, Path):
+                self._remember_remote_updated_at(path, result.get("result"))
+
         try:
             # When the sync thread provides Space information, persist the
             # mapping between the local project-space root and the remote
@@ -6907,12 +8093,21 @@ class MainWindow(QMainWindow):
     def _on_story_sync_failed(self, error: object) -> None:  # pragma: no cover
         import traceback
 
+        if isinstance(error, dict):
+            self._record_sync_outcome(error.get("local_path"), error.get("generation"), error)
+            if sync_outbox.is_retryable(error.get("kind"), error.get("status_code")):
+                # Kept in the outbox; retried in the background.
+                bar = self.statusBar()
+                if bar is not None:
+                    bar.showMessage(self.tr("Web sync failed; will retry automatically."), 5000)
+                return
+
         try:
             bar = self.statusBar()
             if bar is not None:
                 bar.clearMessage()
 
-            msg = str(error)
+            msg = str(error.get("message") if isinstance(error, dict) else error)
             # If the backend reports an authentication failure, treat it as a
             # login problem and guide the user to correct their credentials.
             if "Login failed" in msg or "auth" in msg.lower():
@@ -6951,14 +8146,10 @@ class MainWindow(QMainWindow):
             # If local has unsynced changes, avoid noisy modal prompts.
             # For now we prefer the local copy and simply schedule a web sync
             # (the backend/CRDT layer is responsible for reconciling changes).
-            try:
-                changed_at = file_metadata.parse_human(md.change_date)
-                synced_at = file_metadata.parse_human(md.last_sync_date)
-                local_unsynced = changed_at is not None and synced_at is not None and changed_at > synced_at
-            except Exception:
-                local_unsynced = False
+            local_unsynced = file_metadata.has_unsynced_changes(md)
 
             if local_unsynced:
+                self._deferred_story_pulls.add(path)
                 try:
                     self._schedule_web_sync()
                 except Exception:
@@ -6966,6 +8157,7 @@ class MainWindow(QMainWindow):
                 return
 
             # Apply content.
+            self._deferred_story_pulls.discard(path)
             self._document.set_content(new_content)
             self._last_change_from_preview = False
 
@@ -6978,8 +8170,10 @@ class MainWindow(QMainWindow):
             self.preview.set_markdown(new_content)
             self._update_document_stats_label()
 
-            # Save immediately and update xattrs.
+            # Save immediately and update xattrs. Queued autosaves of the old
+            # text must land first so they cannot overwrite the pulled text.
             try:
+                self._save_service.flush()
                 self._document.save(path)
             except Exception:
                 pass
@@ -7030,6 +8224,7 @@ class MainWindow(QMainWindow):
     def _on_story_pull_finished(self) -> None:  # pragma: no cover
         # Clear stale thread reference so future pulls aren't blocked.
         self._story_pull_thread = None
+        self._flush_pending_web_pull()
 
     def _on_screenplay_pull_available(self, payload: object) -> None:  # pragma: no cover
         """Apply pulled screenplay content if it's newer and safe."""
@@ -7056,12 +8251,7 @@ class MainWindow(QMainWindow):
             # If local has unsynced changes, prefer local and schedule a sync
             # instead of overwriting with the remote version, unless this pull
             # was explicitly forced (e.g. via "Refresh from web").
-            try:
-                changed_at = file_metadata.parse_human(md.change_date)
-                synced_at = file_metadata.parse_human(md.last_sync_date)
-                local_unsynced = changed_at is not None and synced_at is not None and changed_at > synced_at
-            except Exception:
-                local_unsynced = False
+            local_unsynced = file_metadata.has_unsynced_changes(md)
 
             if local_unsynced and not force:
                 try:
@@ -7083,8 +8273,10 @@ class MainWindow(QMainWindow):
             self.preview.set_markdown(new_content)
             self._update_document_stats_label()
 
-            # Save immediately and update xattrs.
+            # Save immediately and update xattrs. Queued autosaves of the old
+            # text must land first so they cannot overwrite the pulled text.
             try:
+                self._save_service.flush()
                 self._document.save(path)
             except Exception:
                 pass
@@ -7119,9 +8311,11 @@ class MainWindow(QMainWindow):
     def _on_screenplay_pull_finished(self) -> None:  # pragma: no cover
         # Clear stale thread reference so future pulls aren't blocked.
         self._screenplay_pull_thread = None
+        self._flush_pending_web_pull()
 
     def _on_story_sync_finished(self) -> None:  # pragma: no cover
         self._story_sync_thread = None
+        self._schedule_outbox_drain()
 
 
 class _NewStoryInitThread(QThread):
@@ -7187,6 +8381,7 @@ class _StoryPullThread(QThread):
         credentials: tuple[str, str] | None,
         local_path: Path,
         force: bool,
+        deferred: bool = False,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
@@ -7195,6 +8390,7 @@ class _StoryPullThread(QThread):
         self._credentials = credentials
         self._local_path = local_path
         self._force = force
+        self._deferred = deferred
 
     def run(self) -> None:
         import traceback
@@ -7205,17 +8401,25 @@ class _StoryPullThread(QThread):
             api_base = api_base_url_from_story_url(self._source_url)
             client = CrowdlyClient(api_base, credentials=self._credentials)
 
-            # 1) Check story_title.updated_at
-            title_row = client.get_story_title_row(self._story_id)
+            # 1) Check story_title.updated_at. The row is revalidated against
+            # the local response cache, so an unchanged story costs one 304.
+            title_row, not_modified = client.check_story_title_row(self._story_id)
             updated_raw = title_row.get("updated_at") or title_row.get("updatedAt")
             remote_updated_at = updated_raw if isinstance(updated_raw, str) else None
 
             local_remote = file_metadata.get_attr(self._local_path, file_metadata.FIELD_REMOTE_UPDATED_AT)
-            if not self._force and remote_updated_at and local_remote and remote_updated_at == local_remote:
-                return
+            if not self._force and local_remote:
+                # A 304 means nothing changed since the last check, whatever
+                # form the stored timestamp took; only a pull that was set
+                # aside for unsynced local edits still has to be offered.
+                if not_modified and not self._deferred:
+                    return
+                if remote_updated_at == local_remote:
+                    return
 
-            # 2) Fetch full story markdown
-            story = client.fetch_story(self._source_url)
+            # 2) Fetch full story markdown, reusing the title row; unchanged
+            # chapters revalidate with a 304 and come from the cache.
+            story = client.fetch_story(self._source_url, title_row=title_row)
 
             self.pullAvailable.emit(
                 {
@@ -7260,6 +8464,9 @@ class _StorySyncThread(QThread):
         local_path: Path,
         creative_space_id: str | None,
         project_root: Path | None,
+        generation: int,
+        payload_hash: str,
+        snapshot_ms: int,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
@@ -7272,6 +8479,9 @@ class _StorySyncThread(QThread):
         self._local_path = local_path
         self._creative_space_id = creative_space_id
         self._project_root = project_root
+        self._generation = generation
+        self._payload_hash = payload_hash
+        self._snapshot_ms = snapshot_ms
 
     def run(self) -> None:
         import traceback
@@ -7304,7 +8514,10 @@ class _StorySyncThread(QThread):
                     # Space creation is best-effort; continue without a Space on failure.
                     pass
 
-            result = client.sync_desktop_story(
+            # Only changed chapters are sent when the previous sync left a
+            # manifest; falls back to a full sync otherwise.
+            result = story_delta.sync_story(
+                client,
                 self._story_id,
                 title=self._title,
                 chapters=self._chapters,
@@ -7324,11 +8537,23 @@ class _StorySyncThread(QThread):
                 "result": result,
                 "project_root": str(self._project_root) if self._project_root is not None else None,
                 "creative_space_id": self._creative_space_id,
+                "local_path": self._local_path,
+                "generation": self._generation,
+                "payload_hash": self._payload_hash,
+                "snapshot_ms": self._snapshot_ms,
             }
             self.syncSucceeded.emit(payload)
         except Exception as exc:
             traceback.print_exc()
-            self.syncFailed.emit(str(exc))
+            self.syncFailed.emit(
+                {
+                    "local_path": self._local_path,
+                    "generation": self._generation,
+                    "kind": getattr(exc, "kind", "unknown"),
+                    "status_code": getattr(exc, "status_code", None),
+                    "message": str(exc),
+                }
+            )
 
     def _sync_attachments_to_space(self, client: "CrowdlyClient") -> None:
         """Best-effort: register story attachment files under the mapped Space.
@@ -7385,34 +8610,30 @@ class _StorySyncThread(QThread):
                 # avoid duplicates when possible.
                 try:
                     from urllib.parse import urlencode as _urlencode
-                    import json as _json
-                    from urllib import request as _request
 
+                    # All calls go through the client's keep-alive pool, so
+                    # the per-file requests share one connection.
+                    transport = client.transport
                     space_id = self._creative_space_id
 
                     # Check if an item already exists at this relative_path.
                     items_url = f"{client.base_url}/creative-spaces/{space_id}/items?" + _urlencode({"path": parent_rel})
-                    req = _request.Request(
-                        items_url,
-                        headers={"User-Agent": "crowdly-editor/0.1", "Accept": "application/json"},
-                        method="GET",
-                    )
                     existing_id = None
                     try:
-                        with _request.urlopen(req, timeout=10.0) as resp:  # type: ignore[arg-type]
-                            if "json" in (resp.headers.get_content_type() or "").lower():
-                                data = _json.loads(resp.read().decode(resp.headers.get_content_charset() or "utf-8"))
-                                items = data.get("items") if isinstance(data, dict) else None
-                                if isinstance(items, list):
-                                    for row in items:
-                                        try:
-                                            if str(row.get("relative_path") or "").strip() == rel_posix:
-                                                cid = row.get("id")
-                                                if isinstance(cid, str) and cid:
-                                                    existing_id = cid
-                                                    break
-                                        except Exception:
-                                            continue
+                        resp = transport.get(items_url, timeout=10.0)
+                        if resp.ok and "json" in resp.content_type:
+                            data = resp.json()
+                            items = data.get("items") if isinstance(data, dict) else None
+                            if isinstance(items, list):
+                                for row in items:
+                                    try:
+                                        if str(row.get("relative_path") or "").strip() == rel_posix:
+                                            cid = row.get("id")
+                                            if isinstance(cid, str) and cid:
+                                                existing_id = cid
+                                                break
+                                    except Exception:
+                                        continue
                     except Exception:
                         existing_id = None
 
@@ -7426,25 +8647,14 @@ class _StorySyncThread(QThread):
                             "hash": None,
                             "userId": None,
                         }
-                        raw = _json.dumps(payload).encode("utf-8")
                         file_url = f"{client.base_url}/creative-spaces/{space_id}/items/file"
-                        file_req = _request.Request(
-                            file_url,
-                            data=raw,
-                            headers={
-                                "User-Agent": "crowdly-editor/0.1",
-                                "Accept": "application/json",
-                                "Content-Type": "application/json",
-                            },
-                            method="POST",
-                        )
                         try:
-                            with _request.urlopen(file_req, timeout=10.0) as resp:  # type: ignore[arg-type]
-                                if "json" in (resp.headers.get_content_type() or "").lower():
-                                    data = _json.loads(resp.read().decode(resp.headers.get_content_charset() or "utf-8"))
-                                    cid = data.get("id")
-                                    if isinstance(cid, str) and cid:
-                                        existing_id = cid
+                            resp = transport.post_json(file_url, payload, timeout=10.0)
+                            if resp.ok and "json" in resp.content_type:
+                                data = resp.json()
+                                cid = data.get("id")
+                                if isinstance(cid, str) and cid:
+                                    existing_id = cid
                         except Exception:
                             existing_id = None
 
@@ -7470,20 +8680,9 @@ class _StorySyncThread(QThread):
                         "kind": kind,
                         "role": None,
                     }
-                    raw_attach = _json.dumps(attach_payload).encode("utf-8")
                     attach_url = f"{client.base_url}/stories/{self._story_id}/attachments"
-                    attach_req = _request.Request(
-                        attach_url,
-                        data=raw_attach,
-                        headers={
-                            "User-Agent": "crowdly-editor/0.1",
-                            "Accept": "application/json",
-                            "Content-Type": "application/json",
-                        },
-                        method="POST",
-                    )
                     try:
-                        _request.urlopen(attach_req, timeout=10.0)  # type: ignore[arg-type]
+                        transport.post_json(attach_url, attach_payload, timeout=10.0)
                     except Exception:
                         # Attachment linking is best-effort.
                         continue
@@ -7492,6 +8691,162 @@ class _StorySyncThread(QThread):
                     continue
 
 
+class _OutboxReplayThread(QThread):
+    """Background thread that uploads due sync outbox entries from disk.
+
+    Each entry's document is read and parsed here, so the upload carries
+    the latest saved text however often it changed while offline. Backends
+    that failed before are probed first; when one is unreachable, its
+    entries fail without a request each.
+    """
+
+    entryFinished = Signal(object)
+
+    def __init__(self, *, jobs: list[dict], credentials: tuple[str, str], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._jobs = jobs
+        self._credentials = credentials
+
+    def run(self) -> None:
+        import traceback
+
+        from ..crowdly_client import CrowdlyClient
+
+        clients: dict[str, CrowdlyClient] = {}
+        reachable: dict[str, bool] = {}
+        for job in self._jobs:
+            entry: sync_outbox.OutboxEntry = job["entry"]
+            try:
+                if entry.attempts and entry.api_base not in reachable:
+                    reachable[entry.api_base] = sync_outbox.probe(entry.api_base)
+                if not reachable.get(entry.api_base, True):
+                    self.entryFinished.emit(
+                        {"entry": entry, "error": {"kind": "network", "status_code": None, "message": "backend unreachable"}}
+                    )
+                    continue
+
+                client = clients.get(entry.api_base)
+                if client is None:
+                    client = clients[entry.api_base] = CrowdlyClient(entry.api_base, credentials=self._credentials)
+                path = Path(entry.local_path)
+                snapshot_ms = file_metadata.now_ms()
+                content = path.read_text(encoding="utf-8")
+                # Edits that were undone while offline leave nothing to send.
+                result = None
+                if entry.kind == sync_outbox.KIND_SCREENPLAY:
+                    sp_job = screenplay_sync.ScreenplaySyncJob.from_story(
+                        path, entry.api_base, entry.remote_id, story_sync.parse_screenplay_from_content(content)
+                    )
+                    content_hash = sp_job.payload_hash()
+                    if content_hash != job.get("synced_hash"):
+                        result = screenplay_sync.sync_screenplay(
+                            client,
+                            entry.remote_id,
+                            title=sp_job.title,
+                            scenes=sp_job.scenes_payload(),
+                            remote_updated_at=job.get("remote_updated_at"),
+                        )
+                else:
+                    story = story_sync.parse_story_from_content(content, body_format=job.get("body_format"))
+                    chapters = story_sync.to_json_payload(story)["chapters"]
+                    content_hash = story_sync.payload_hash(
+                        {"title": story.title, "chapters": chapters, "metadata": job.get("metadata")}
+                    )
+                    if content_hash != job.get("synced_hash"):
+                        result = story_delta.sync_story(
+                            client,
+                            entry.remote_id,
+                            title=story.title,
+                            chapters=chapters,
+                            metadata=job.get("metadata"),
+                            creative_space_id=job.get("creative_space_id"),
+                        )
+                self.entryFinished.emit(
+                    {
+                        "entry": entry,
+                        "result": result,
+                        "error": None,
+                        "payload_hash": content_hash,
+                        "snapshot_ms": snapshot_ms,
+                    }
+                )
+            except Exception as exc:
+                traceback.print_exc()
+                kind = getattr(exc, "kind", "unknown")
+                if kind == "network":
+                    reachable[entry.api_base] = False
+                self.entryFinished.emit(
+                    {
+                        "entry": entry,
+                        "error": {
+                            "kind": kind,
+                            "status_code": getattr(exc, "status_code", None),
+                            "message": str(exc),
+                        },
+                    }
+                )
+
+
+class _ScreenplaySyncThread(QThread):
+    """Background thread that uploads a screenplay snapshot to the Crowdly backend."""
+
+    syncSucceeded = Signal(object)
+    syncFailed = Signal(object)
+
+    def __init__(
+        self,
+        *,
+        job: screenplay_sync.ScreenplaySyncJob,
+        credentials: tuple[str, str],
+        remote_updated_at: str | None,
+        generation: int,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._job = job
+        self._credentials = credentials
+        self._remote_updated_at = remote_updated_at
+        self._generation = generation
+
+    def run(self) -> None:
+        import traceback
+
+        job = self._job
+        try:
+            from ..crowdly_client import CrowdlyClient
+
+            client = CrowdlyClient(job.api_base, credentials=self._credentials)
+            # Only changed blocks are sent when the previous sync left a
+            # manifest; falls back to the full snapshot otherwise.
+            result = screenplay_sync.sync_screenplay(
+                client,
+                job.screenplay_id,
+                title=job.title,
+                scenes=job.scenes_payload(),
+                remote_updated_at=self._remote_updated_at,
+            )
+            self.syncSucceeded.emit(
+                {
+                    "local_path": job.local_path,
+                    "generation": self._generation,
+                    "result": result,
+                    "payload_hash": job.payload_hash(),
+                    "snapshot_ms": job.snapshot_ms,
+                }
+            )
+        except Exception as exc:
+            traceback.print_exc()
+            self.syncFailed.emit(
+                {
+                    "local_path": job.local_path,
+                    "generation": self._generation,
+                    "kind": getattr(exc, "kind", "unknown"),
+                    "status_code": getattr(exc, "status_code", None),
+                    "message": str(exc),
+                }
+            )
+
+
 class _ScreenplayPullThread(QThread):
     """Background thread that checks and pulls a screenplay from the backend."""
 
@@ -7540,30 +8895,7 @@ class _ScreenplayPullThread(QThread):
             scenes, blocks = client.get_screenplay_structure(self._screenplay_id, include_blocks=True)
 
             title = title_row.get("title") or "Untitled Screenplay"
-            lines: list[str] = []
-            lines.append(f"# {title}")
-            lines.append("")
-            for scene in scenes:
-                # Use the slugline as-is for the Markdown heading so users can
-                # control scene names freely.
-                lines.append(f"## {scene.slugline}".rstrip())
-                lines.append("")
-                scene_blocks = [b for b in blocks if b.scene_id == scene.scene_id]
-                for block in scene_blocks:
-                    text = block.text or ""
-                    bt = (block.block_type or "").lower()
-                    if bt == "character":
-                        lines.append(text.upper())
-                    elif bt == "parenthetical":
-                        if not (text.startswith("(") and text.endswith(")")):
-                            lines.append(f"({text})")
-                        else:
-                            lines.append(text)
-                    else:
-                        lines.append(text)
-                    lines.append("")
-
-            body_md = "\n".join(lines).rstrip() + "\n"
+            body_md = screenplay_sync.render_markdown(title, scenes, blocks)
 
             self.pullAvailable.emit(
                 {
@@ -7776,29 +9108,7 @@ class _ScreenplayFetchThread(QThread):
             remote_updated_at = updated_raw if isinstance(updated_raw, str) else None
             creator_id = title_row.get("creator_id") or title_row.get("creatorId")
 
-            # Build Markdown body from scenes/blocks (mirrors _ScreenplayPullThread).
-            lines: list[str] = []
-            lines.append(f"# {title}")
-            lines.append("")
-            for scene in scenes:
-                lines.append(f"## {scene.slugline}".rstrip())
-                lines.append("")
-                scene_blocks = [b for b in blocks if b.scene_id == scene.scene_id]
-                for block in scene_blocks:
-                    text = block.text or ""
-                    bt = (block.block_type or "").lower()
-                    if bt == "character":
-                        lines.append(text.upper())
-                    elif bt == "parenthetical":
-                        if not (text.startswith("(") and text.endswith(")")):
-                            lines.append(f"({text})")
-                        else:
-                            lines.append(text)
-                    else:
-                        lines.append(text)
-                    lines.append("")
-
-            body_md = "\n".join(lines).rstrip() + "\n"
+            body_md = screenplay_sync.render_markdown(title, scenes, blocks)
 
             self.screenplayFetched.emit(
                 {
@@ -7824,3 +9134,39 @@ class _ScreenplayFetchThread(QThread):
             self.fetchFailed.emit(
                 {"kind": "unknown", "message": f"Unexpected error: {exc}"}
             )
+
+
+class _WebChangesThread(QThread):
+    """Background thread asking one backend which documents of a batch changed."""
+
+    changesFetched = Signal(object)
+
+    def __init__(
+        self,
+        *,
+        batch: poll_scheduler.PollBatch,
+        credentials: tuple[str, str] | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._batch = batch
+        self._credentials = credentials
+
+    def run(self) -> None:
+        from ..crowdly_client import CrowdlyClient, CrowdlyClientError
+
+        events = None
+        unsupported = False
+        try:
+            client = CrowdlyClient(self._batch.api_base, credentials=self._credentials)
+            since = self._batch.since
+            events = client.fetch_changes(
+                stories={item_id: rev for (kind, item_id), rev in since.items() if kind == "story"},
+                screenplays={item_id: rev for (kind, item_id), rev in since.items() if kind == "screenplay"},
+            )
+        except CrowdlyClientError as exc:
+            # Counted as a check without changes; the scheduler backs off.
+            unsupported = exc.status_code == 404
+        except Exception:
+            pass
+        self.changesFetched.emit({"batch": self._batch, "events": events, "unsupported": unsupported})
@@ -11,6 +11,7 @@ This module implements a dedicated full-window workspace for composing a
 
 from __future__ import annotations
 
+import os
 import uuid
 from pathlib import Path
 from typing import Dict
@@ -40,10 +41,11 @@ from PySide6.QtWidgets import (
 
 from .. import storage
 from .. import file_metadata
+from .. import save_service
 from ..format import story_markup, screenplay_markup
 from ..settings import save_settings
-from ..versioning import local_queue
 from .file_explorer_widget import FileExplorerWidget
+from .save_state_relay import SaveStateRelay
 
 
 class MasterSyncBus(QObject):
@@ -914,9 +916,17 @@ class MasterDocumentWindow(QMainWindow):
         self._container_items: Dict[IncludeContainerWidget, QListWidgetItem] = {}
         self._explorer: FileExplorerWidget | None = None
 
-        # Path to the backing `.master` file and simple dirty flag.
+        # Path to the backing `.master` file and simple dirty flag. The flag
+        # is only cleared once the save service reports that the text of
+        # the latest edit reached the disk.
         self._master_path: Path | None = master_path
         self._dirty: bool = False
+        self._edit_serial = 0
+        self._submitted_serial: int | None = None
+
+        self._save_state_relay = SaveStateRelay(self)
+        self._save_state_relay.stateChanged.connect(self._on_save_state_changed)
+        save_service.shared_service().add_listener(self._save_state_relay.forward)
 
         # Debounced autosave timer for the master document itself.
         self._autosave_timer = QTimer(self)
@@ -1785,6 +1795,7 @@ class MasterDocumentWindow(QMainWindow):
         """Mark the master document as dirty and schedule an autosave."""
 
         self._dirty = True
+        self._edit_serial += 1
         if self._autosave_timer.isActive():
             self._autosave_timer.stop()
         self._autosave_timer.start()
@@ -1863,28 +1874,41 @@ class MasterDocumentWindow(QMainWindow):
         if path is None:
             return
 
+        # Serialise on the GUI thread, then let the shared save service write
+        # the file and enqueue the versioning snapshot in the background,
+        # mirroring the behaviour used for regular documents.
         try:
             body_md = self._serialise_to_text()
-            storage.write_text(path, body_md)
-            self._dirty = False
+            device_id = getattr(self._settings, "device_id", None) or "desktop"
+            save_service.shared_service().submit(
+                save_service.SaveRequest(
+                    path=path,
+                    text=body_md,
+                    hooks=(save_service.revision_hook(device_id=device_id, text=body_md),),
+                )
+            )
+            self._submitted_serial = self._edit_serial
         except Exception:
-            # Core persistence must be robust; if writing fails we keep the
+            # Core persistence must be robust; if queuing fails we keep the
             # dirty flag so that a later attempt may still succeed.
             return
 
-        # Enqueue a full-snapshot update for versioning, mirroring the
-        # behaviour used for regular documents.
-        try:
-            device_id = getattr(self._settings, "device_id", None) or "desktop"
-            local_queue.enqueue_full_snapshot_update(
-                path,
-                device_id=device_id,
-                body_md=body_md,
-                body_html=None,
-            )
-        except Exception:
-            # Versioning must never interfere with core behaviour.
-            pass
+    def _on_save_state_changed(self, path: Path, state: str) -> None:  # pragma: no cover - UI wiring
+        """Clear or keep the dirty flag depending on the background write."""
+
+        if self._master_path is None or os.path.abspath(path) != os.path.abspath(self._master_path):
+            return
+        if state in (save_service.STATE_SAVED, save_service.STATE_UNCHANGED):
+            # Edits made after the submitted snapshot are still unsaved.
+            if self._submitted_serial == self._edit_serial:
+                self._dirty = False
+        elif state == save_service.STATE_FAILED:
+            # Keep the text dirty so the next autosave (or close) retries.
+            self._dirty = True
+            try:
+                self.statusBar().showMessage(self.tr("Save failed"), 5000)
+            except Exception:
+                pass
 
     # ------------------------------------------------------------------
     # Save as helpers
@@ -2249,6 +2273,25 @@ class MasterDocumentWindow(QMainWindow):
         if self._autosave_timer.isActive():
             self._autosave_timer.stop()
         self._perform_autosave()
+        service = save_service.shared_service()
+        service.flush()
+        path = self._master_path
+        if (
+            self._dirty
+            and path is not None
+            and self._save_state_relay.last_state(path) == save_service.STATE_FAILED
+        ):
+            answer = QMessageBox.warning(
+                self,
+                self.tr("Save failed"),
+                self.tr("The master document could not be saved. Close anyway and lose the latest changes?"),
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        service.remove_listener(self._save_state_relay.forward)
         super().closeEvent(event)
 
     def _retranslate_window_ui(self) -> None:
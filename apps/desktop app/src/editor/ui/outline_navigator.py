@@ -0,0 +1,76 @@
+"""Outline navigator panel.
+
+Shows the headings of the active document (title, chapters or scenes)
+as a flat, indented list. Activating an entry emits the source line so
+the main window can move the caret there; the heading containing the
+caret is highlighted via an O(log n) lookup in the outline index.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QListWidget, QListWidgetItem
+
+from ..outline import OutlineEntry, OutlineIndex
+
+
+class OutlineNavigatorWidget(QListWidget):
+    """Flat list of outline headings with jump-to-heading support."""
+
+    # Emits the 0-based source line of the activated heading.
+    headingActivated = Signal(int)
+
+    def __init__(self, parent: object | None = None) -> None:
+        super().__init__(parent)
+        self._outline: OutlineIndex | None = None
+        self._updating = False
+
+        self.setUniformItemSizes(True)
+        self.itemActivated.connect(self._on_item_activated)
+        self.itemClicked.connect(self._on_item_activated)
+
+    def set_outline(self, outline: OutlineIndex | None) -> None:
+        """Rebuild the list from *outline* (``None`` clears it)."""
+
+        self._outline = outline
+        entries: Sequence[OutlineEntry] = outline.entries() if outline is not None else []
+
+        self._updating = True
+        try:
+            self.clear()
+            for entry in entries:
+                indent = "    " * max(0, entry.level - 1)
+                item = QListWidgetItem(indent + (entry.title or "…"))
+                item.setData(Qt.ItemDataRole.UserRole, entry.level)
+                self.addItem(item)
+        finally:
+            self._updating = False
+
+    def set_current_line(self, line: int) -> None:
+        """Highlight the heading that contains source *line*."""
+
+        if self._outline is None:
+            return
+        row = self._outline.entry_index_at_line(line)
+        if row == self.currentRow():
+            return
+        self._updating = True
+        try:
+            self.setCurrentRow(row)
+        finally:
+            self._updating = False
+
+    # Slots ----------------------------------------------------------------
+
+    def _on_item_activated(self, item: QListWidgetItem) -> None:  # pragma: no cover - UI wiring
+        if self._updating or self._outline is None:
+            return
+        row = self.row(item)
+        # Look the line up at activation time: headings shift as text is
+        # inserted above them, while the list is only rebuilt when headings
+        # themselves change.
+        entries = self._outline.entries()
+        if 0 <= row < len(entries):
+            self.headingActivated.emit(entries[row].line)
@@ -21,6 +21,8 @@ from PySide6.QtGui import QTextCharFormat, QTextCursor, QFont, QColor, QTextBloc
 import markdown
 import re
 
+from .. import text_replace
+
 
 
 # Canonical color names for DSL attributes, keyed by QColor.name() hex.
@@ -254,6 +256,72 @@ class PreviewWidget(QWidget):
         finally:
             self._updating_from_source = False
 
+    def set_dsl(self, text: str, storage_format: str) -> None:
+        """Render `.story` / `.screenplay` DSL *text* without emitting Markdown.
+
+        Blocks are written straight into the underlying ``QTextDocument``
+        (see :mod:`.dsl_document_builder`) instead of going through a
+        DSL → HTML → ``setHtml`` round-trip. Falls back to the HTML path
+        if the direct builder fails for any reason.
+        """
+
+        from ..format import screenplay_markup, story_markup
+        from . import dsl_document_builder
+
+        self._updating_from_source = True
+        try:
+            document = self._editor.document()
+            if storage_format == "screenplay_v1":
+                dsl_document_builder.build_screenplay_document(document, text or "")
+            else:
+                dsl_document_builder.build_story_document(document, text or "")
+        except Exception:
+            if storage_format == "screenplay_v1":
+                html = screenplay_markup.dsl_to_html(text or "")
+            else:
+                html = story_markup.dsl_to_html(text or "")
+            self.set_html(html)
+        finally:
+            self._updating_from_source = False
+
+    def get_plain_text(self) -> str:
+        """Return the document text; positions match the rich-text document."""
+
+        return self._editor.toPlainText()
+
+    def apply_replacements(self, spans: list[tuple[int, int]], replacement: str) -> None:
+        """Replace each ``(start, end)`` span with *replacement* in one undo step.
+
+        Spans index :meth:`get_plain_text` as a Python string. They are
+        applied from last to first so earlier positions stay valid and each
+        replacement inherits the formatting at its own location.
+        ``markdownEdited`` is emitted once when done.
+        """
+
+        if not spans:
+            return
+
+        spans = text_replace.utf16_spans(self.get_plain_text(), spans)
+        replacement_length = text_replace.utf16_length(replacement)
+
+        cursor = QTextCursor(self._editor.document())
+        self._updating_from_source = True
+        try:
+            cursor.beginEditBlock()
+            for start, end in reversed(spans):
+                cursor.setPosition(start)
+                cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+                cursor.insertText(replacement)
+            cursor.endEditBlock()
+        finally:
+            self._updating_from_source = False
+
+        # Leave the caret after the last replacement.
+        last_start = spans[-1][0] + sum(replacement_length - (e - s) for s, e in spans[:-1])
+        cursor.setPosition(last_start + replacement_length)
+        self._editor.setTextCursor(cursor)
+        self.markdownEdited.emit(self._editor.toMarkdown())
+
     def get_html(self) -> str:
         """Return the current content as HTML.
 
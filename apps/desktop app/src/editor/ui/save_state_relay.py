@@ -0,0 +1,43 @@
+"""Qt bridge for :class:`editor.save_service.SaveService` notifications.
+
+The save service notifies its listeners on the save worker thread;
+:class:`SaveStateRelay` re-emits them as a Qt signal, which is delivered
+to GUI-thread receivers as a queued call.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+
+class SaveStateRelay(QObject):
+    """Forward save service notifications to the GUI thread."""
+
+    # (path, state)
+    stateChanged = Signal(object, str)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._states: dict[str, str] = {}
+
+    def forward(self, path: Path, state: str) -> None:
+        """Listener for :meth:`SaveService.add_listener` (any thread)."""
+
+        with self._lock:
+            self._states[os.path.abspath(path)] = state
+        self.stateChanged.emit(path, state)
+
+    def last_state(self, path: Path) -> str | None:
+        """Latest state reported for *path*, before its queued signal arrives.
+
+        Lets a window check the outcome right after
+        :meth:`SaveService.flush`, e.g. while closing.
+        """
+
+        with self._lock:
+            return self._states.get(os.path.abspath(path))
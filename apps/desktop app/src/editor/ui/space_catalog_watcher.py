@@ -0,0 +1,204 @@
+"""Keep the project-space catalog current with a file system watcher.
+
+:class:`SpaceCatalogWatcher` opens the :class:`editor.space_catalog.SpaceCatalog`
+of the active space, rescans it in the background only when it is stale,
+and then applies :class:`QFileSystemWatcher` notifications (inotify on
+Linux) for the catalogued folders and documents; other files are only
+re-read by :meth:`SpaceCatalog.update`. Notifications are coalesced for a
+short moment and applied on a worker thread.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, Signal
+
+from ..space_catalog import SpaceCatalog
+
+
+class SpaceCatalogWatcher(QObject):
+    """Owns the catalog of the active space and its file system watcher."""
+
+    # Emitted after the catalog changed; carries the space root and the
+    # absolute paths of the files that were written or removed.
+    catalogChanged = Signal(object, object)
+
+    _DEBOUNCE_MS = 300
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self._root: Path | None = None
+        self._thread: _CatalogThread | None = None
+        self._dirty_dirs: set[Path] = set()
+        self._dirty_files: set[Path] = set()
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+
+    @property
+    def root(self) -> Path | None:
+        return self._root
+
+    def set_space(self, root: Path | None) -> None:
+        """Follow project space *root* (``None`` stops watching)."""
+
+        try:
+            resolved = Path(root).expanduser().resolve() if root is not None else None
+        except Exception:
+            resolved = None
+        if resolved is not None and not resolved.is_dir():
+            resolved = None
+        if resolved == self._root:
+            return
+
+        self.shutdown()
+        self._root = resolved
+        if resolved is not None:
+            self._start(startup=True)
+
+    def shutdown(self) -> None:
+        """Apply pending notifications, mark the catalog clean and stop watching."""
+
+        self._timer.stop()
+        thread = self._thread
+        interrupted = False
+        if thread is not None and thread.isRunning():
+            thread.requestInterruption()
+            thread.wait(5000)
+            interrupted = True
+        self._thread = None
+
+        root = self._root
+        if root is not None:
+            try:
+                with SpaceCatalog(root) as catalog:
+                    _apply(catalog, self._dirty_dirs, self._dirty_files)
+                    # An interrupted rescan leaves the catalog flagged as
+                    # unscanned, so it is rescanned next time regardless.
+                    if not interrupted:
+                        catalog.mark_clean()
+            except Exception:
+                pass
+
+        self._dirty_dirs.clear()
+        self._dirty_files.clear()
+        paths = self._watcher.directories() + self._watcher.files()
+        if paths:
+            self._watcher.removePaths(paths)
+        self._root = None
+
+    # Internal helpers -----------------------------------------------------
+
+    def _start(self, startup: bool = False) -> None:
+        if self._root is None:
+            return
+        dirs, self._dirty_dirs = self._dirty_dirs, set()
+        files, self._dirty_files = self._dirty_files, set()
+        thread = _CatalogThread(self._root, dirs, files, startup=startup, parent=self)
+        thread.catalogUpdated.connect(self._on_catalog_updated)
+        self._thread = thread
+        thread.start()
+
+    def _schedule(self) -> None:
+        self._timer.start(self._DEBOUNCE_MS)
+
+    # Slots ----------------------------------------------------------------
+
+    def _on_directory_changed(self, path: str) -> None:  # pragma: no cover - UI wiring
+        self._dirty_dirs.add(Path(path))
+        self._schedule()
+
+    def _on_file_changed(self, path: str) -> None:  # pragma: no cover - UI wiring
+        self._dirty_files.add(Path(path))
+        self._schedule()
+
+    def _flush(self) -> None:  # pragma: no cover - UI wiring
+        thread = self._thread
+        if thread is not None and thread.isRunning():
+            # Picked up again when the running update finishes.
+            return
+        if self._dirty_dirs or self._dirty_files:
+            self._start()
+
+    def _on_catalog_updated(self, payload: object) -> None:  # pragma: no cover - UI wiring
+        if self.sender() is self._thread:
+            self._thread = None
+        if not isinstance(payload, dict) or payload.get("root") != self._root:
+            return
+
+        # Watch folders for added/removed entries and files for in-place
+        # edits. Paths that disappear are dropped by Qt automatically.
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        new_paths = [p for p in payload.get("paths") or [] if p not in watched]
+        if new_paths:
+            self._watcher.addPaths(new_paths)
+
+        if payload.get("changed"):
+            self.catalogChanged.emit(self._root, payload.get("files") or [])
+        if self._dirty_dirs or self._dirty_files:
+            self._schedule()
+
+
+def _apply(catalog: SpaceCatalog, dirs: Iterable[Path], files: Iterable[Path]) -> int:
+    changed = 0
+    for path in sorted(dirs):
+        updated, removed = catalog.refresh_directory(path)
+        changed += updated + removed
+    for path in sorted(files):
+        if catalog.refresh_file(path):
+            changed += 1
+    return changed
+
+
+class _CatalogThread(QThread):
+    """Rescan a stale catalog or apply watcher notifications in the background."""
+
+    catalogUpdated = Signal(object)
+
+    def __init__(
+        self,
+        root: Path,
+        dirs: Iterable[Path],
+        files: Iterable[Path],
+        startup: bool = False,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._root = root
+        self._dirs = list(dirs)
+        self._files = list(files)
+        self._startup = startup
+
+    def run(self) -> None:  # pragma: no cover - thread body
+        payload: dict = {"root": self._root, "changed": 0, "paths": [], "files": [], "error": None}
+        try:
+            # A dedicated connection: SQLite connections must stay on the
+            # thread that created them.
+            with SpaceCatalog(self._root) as catalog:
+                changed = 0
+                if self._startup:
+                    if catalog.is_stale():
+                        updated, removed = catalog.rescan(should_stop=self.isInterruptionRequested)
+                        changed += updated + removed
+                    else:
+                        # Changes are applied by the watcher from now on; an
+                        # unclean exit must trigger a rescan next time.
+                        catalog.mark_dirty()
+                changed += _apply(catalog, self._dirs, self._files)
+                payload["changed"] = changed
+                payload["files"] = [catalog.root / rel for rel in catalog.take_changes()]
+                if self._startup or changed:
+                    paths: List[str] = [str(p) for p in catalog.directories()]
+                    paths.extend(str(catalog.root / e.path) for e in catalog.documents())
+                    payload["paths"] = paths
+        except Exception as exc:
+            payload["error"] = str(exc)
+        self.catalogUpdated.emit(payload)
@@ -0,0 +1,239 @@
+""""Find in Space" panel backed by the persistent full-text index.
+
+The panel owns a :class:`editor.space_index.SpaceIndex` for queries on
+the GUI thread and refreshes it in the background with
+:class:`_SpaceIndexThread`, which only re-reads files whose mtime or size
+changed since the last run. Activating a result emits the file path and
+the character offset of the first match.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal
+from PySide6.QtWidgets import (
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..space_index import SpaceIndex
+
+
+class SpaceSearchPanel(QWidget):
+    """Search box plus ranked results for the current project space."""
+
+    # Emits (Path, offset) for the activated hit.
+    hitActivated = Signal(object, int)
+
+    _SEARCH_DELAY_MS = 200
+
+    def __init__(self, parent: object | None = None) -> None:
+        super().__init__(parent)
+
+        self._root: Path | None = None
+        self._index: SpaceIndex | None = None
+        self._index_thread: _SpaceIndexThread | None = None
+        self._indexing = False
+        self._last_count = 0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(4)
+
+        self._query_entry = QLineEdit(self)
+        self._query_entry.setClearButtonEnabled(True)
+        self._query_entry.textChanged.connect(self._schedule_search)
+        self._query_entry.returnPressed.connect(self._run_search)
+        layout.addWidget(self._query_entry)
+
+        self._status_label = QLabel(self)
+        layout.addWidget(self._status_label)
+
+        self._results = QListWidget(self)
+        self._results.setWordWrap(True)
+        self._results.itemActivated.connect(self._on_item_activated)
+        self._results.itemClicked.connect(self._on_item_activated)
+        layout.addWidget(self._results, 1)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self._run_search)
+
+        self.retranslate_ui()
+
+    # Public API -----------------------------------------------------------
+
+    def retranslate_ui(self) -> None:
+        self._query_entry.setPlaceholderText(self.tr("Search all documents in this Space…"))
+        self._update_status()
+
+    def focus_query(self) -> None:
+        self._query_entry.setFocus()
+        self._query_entry.selectAll()
+
+    def set_space(self, root: Path | None) -> None:
+        """Point the panel at project space *root* and start indexing it."""
+
+        try:
+            resolved = Path(root).expanduser().resolve() if root is not None else None
+        except Exception:
+            resolved = None
+        if resolved == self._root and self._index is not None:
+            self.reindex()
+            return
+
+        self._stop_thread()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._root = resolved
+        self._results.clear()
+
+        if resolved is not None and resolved.is_dir():
+            try:
+                self._index = SpaceIndex(resolved)
+            except Exception:
+                self._index = None
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Start a background refresh unless one is already running."""
+
+        if self._root is None or self._index is None:
+            self._update_status()
+            return
+        thread = self._index_thread
+        if thread is not None and thread.isRunning():
+            return
+
+        thread = _SpaceIndexThread(self._root, parent=self)
+        thread.indexFinished.connect(self._on_index_finished)
+        self._index_thread = thread
+        self._indexing = True
+        self._update_status()
+        thread.start()
+
+    def notify_file_saved(self, path: Path) -> None:
+        """Re-index a single saved file so new text is searchable at once."""
+
+        self.notify_files_changed([path])
+
+    def notify_files_changed(self, paths: Iterable[Path]) -> None:
+        """Re-index (or drop) *paths*, e.g. files changed outside the editor."""
+
+        if self._index is None or self._root is None:
+            return
+        try:
+            changed = False
+            for path in paths:
+                changed = self._index.update_file(path) or changed
+            if changed and self._query_entry.text().strip():
+                self._run_search()
+        except Exception:
+            # Indexing is a convenience; never interfere with saving.
+            pass
+
+    def shutdown(self) -> None:
+        """Stop background work and close the index (window close)."""
+
+        self._stop_thread()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    # Internal helpers -----------------------------------------------------
+
+    def _stop_thread(self) -> None:
+        thread = self._index_thread
+        if thread is not None and thread.isRunning():
+            thread.requestInterruption()
+            thread.wait(5000)
+        self._index_thread = None
+        self._indexing = False
+
+    def _update_status(self) -> None:
+        if self._root is None or self._index is None:
+            text = self.tr("No project space selected.")
+        elif self._indexing:
+            text = self.tr("Indexing Space…")
+        elif self._query_entry.text().strip():
+            text = self.tr("{count} result(s)").format(count=self._last_count)
+        else:
+            text = ""
+        self._status_label.setText(text)
+
+    def _schedule_search(self, _text: str = "") -> None:  # pragma: no cover - UI wiring
+        self._search_timer.start(self._SEARCH_DELAY_MS)
+
+    def _run_search(self) -> None:  # pragma: no cover - UI wiring
+        self._search_timer.stop()
+        self._results.clear()
+        self._last_count = 0
+
+        query = self._query_entry.text().strip()
+        if not query or self._index is None:
+            self._update_status()
+            return
+
+        try:
+            hits = self._index.search(query)
+        except Exception:
+            hits = []
+
+        for hit in hits:
+            try:
+                rel = hit.path.relative_to(self._root).as_posix() if self._root else hit.path.name
+            except ValueError:
+                rel = hit.path.name
+            item = QListWidgetItem(f"{rel}:{hit.line + 1}\n{hit.snippet}")
+            item.setData(Qt.ItemDataRole.UserRole, (hit.path, hit.offset))
+            self._results.addItem(item)
+
+        self._last_count = len(hits)
+        self._update_status()
+
+    # Slots ----------------------------------------------------------------
+
+    def _on_item_activated(self, item: QListWidgetItem) -> None:  # pragma: no cover - UI wiring
+        data = item.data(Qt.ItemDataRole.UserRole)
+        if not data:
+            return
+        path, offset = data
+        self.hitActivated.emit(path, int(offset))
+
+    def _on_index_finished(self, _payload: object) -> None:  # pragma: no cover - UI wiring
+        self._indexing = False
+        self._index_thread = None
+        if self._query_entry.text().strip():
+            self._run_search()
+        else:
+            self._update_status()
+
+
+class _SpaceIndexThread(QThread):
+    """Bring the on-disk index of a space up to date in the background."""
+
+    indexFinished = Signal(object)
+
+    def __init__(self, root: Path, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._root = root
+
+    def run(self) -> None:  # pragma: no cover - thread body
+        payload: dict = {"root": self._root, "indexed": 0, "removed": 0, "error": None}
+        try:
+            # A dedicated connection: SQLite connections must stay on the
+            # thread that created them.
+            with SpaceIndex(self._root) as index:
+                indexed, removed = index.update(should_stop=self.isInterruptionRequested)
+            payload["indexed"] = indexed
+            payload["removed"] = removed
+        except Exception as exc:
+            payload["error"] = str(exc)
+        self.indexFinished.emit(payload)
@@ -0,0 +1,70 @@
+"""Qt wrapper around :class:`editor.update_channel.UpdateChannel`.
+
+The channel calls back on its own thread; :class:`WebUpdateListener`
+re-emits those callbacks as Qt signals, which are delivered to GUI-thread
+receivers as queued calls.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from PySide6.QtCore import QObject, Signal
+
+from ..update_channel import UpdateChannel, UpdateEvent
+
+
+class WebUpdateListener(QObject):
+    """Subscribe to remote change events for the open documents."""
+
+    # Carries an UpdateEvent.
+    updateReceived = Signal(object)
+    # True while the push stream is established.
+    connectedChanged = Signal(bool)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._channel: UpdateChannel | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._channel is not None and self._channel.connected
+
+    def set_subscriptions(
+        self,
+        api_base: str | None,
+        stories: Iterable[str],
+        screenplays: Iterable[str],
+        credentials: tuple[str, str] | None = None,
+    ) -> None:
+        stories = list(stories)
+        screenplays = list(screenplays)
+        if self._channel is None:
+            if not api_base or not (stories or screenplays):
+                return
+            channel = UpdateChannel(
+                lambda event: self._forward_event(channel, event),
+                on_state=lambda connected: self._forward_state(channel, connected),
+            )
+            self._channel = channel
+        self._channel.set_subscriptions(api_base, stories, screenplays, credentials)
+
+    def stop(self) -> None:
+        """Close the stream; a later :meth:`set_subscriptions` starts anew."""
+
+        channel, self._channel = self._channel, None
+        if channel is not None:
+            channel.stop()
+            if channel.connected:
+                self.connectedChanged.emit(False)
+
+    # Called on the channel thread; callbacks of a stopped channel that are
+    # still in flight are dropped.
+
+    def _forward_event(self, channel: UpdateChannel, event: UpdateEvent) -> None:
+        if channel is self._channel:
+            self.updateReceived.emit(event)
+
+    def _forward_state(self, channel: UpdateChannel, connected: bool) -> None:
+        if channel is self._channel:
+            self.connectedChanged.emit(connected)
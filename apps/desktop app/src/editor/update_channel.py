@@ -0,0 +1,294 @@
+"""Push channel for remote story/screenplay changes.
+
+Instead of pulling every open document on a timer, the editor subscribes to
+``GET /updates/stream`` on the backend, a Server-Sent Events stream of
+``update`` events::
+
+    event: update
+    data: {"kind": "story", "id": "<uuid>", "updatedAt": "<iso timestamp>"}
+
+Subscriptions made with credentials log in first and pass the ``userId``;
+the backend only follows items that user may read (anonymous streams get
+public items only). The backend sends the current revision of every
+subscribed item right after connecting (so nothing is missed across reconnects) and then one event per
+change. :class:`UpdateChannel` keeps that stream open on a daemon thread,
+re-subscribes when the set of open documents changes and reconnects with
+jittered exponential backoff after errors. Callbacks run on the channel
+thread. This module is GUI-agnostic and uses only the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Iterable, List, Tuple
+from urllib.parse import urlencode
+
+from .http_transport import HttpStream, HttpTransport, TransportError, shared_transport
+
+KIND_STORY = "story"
+KIND_SCREENPLAY = "screenplay"
+
+
+@dataclass(frozen=True)
+class UpdateEvent:
+    """``item_id`` of ``kind`` is now at revision ``updated_at``."""
+
+    kind: str
+    item_id: str
+    updated_at: str
+
+
+class SseParser:
+    """Incremental ``text/event-stream`` parser (one decoded line at a time)."""
+
+    def __init__(self) -> None:
+        self._event = ""
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Tuple[str, str] | None:
+        """Consume *line*; return ``(event, data)`` when an event completes."""
+
+        line = line.rstrip("\r\n")
+        if not line:
+            if not self._data:
+                self._event = ""
+                return None
+            event = (self._event or "message", "\n".join(self._data))
+            self._event = ""
+            self._data = []
+            return event
+        if line.startswith(":"):
+            return None  # comment / heartbeat
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        return None
+
+
+def parse_update(data: str) -> UpdateEvent | None:
+    try:
+        raw = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(raw, dict):
+        return None
+    kind, item_id, updated_at = raw.get("kind"), raw.get("id"), raw.get("updatedAt")
+    if kind not in (KIND_STORY, KIND_SCREENPLAY) or not isinstance(item_id, str) or not isinstance(updated_at, str):
+        return None
+    return UpdateEvent(kind=kind, item_id=item_id, updated_at=updated_at)
+
+
+_Credentials = Tuple[str, str]
+_Subscription = Tuple[str, FrozenSet[str], FrozenSet[str], "_Credentials | None"]
+
+
+def _client_login(api_base: str, credentials: _Credentials) -> str:
+    # Shares the process-wide session cache with every other client.
+    from .crowdly_client import CrowdlyClient
+
+    return CrowdlyClient(api_base, credentials=credentials).login()
+
+
+class UpdateChannel:
+    """Background SSE subscription with reconnect.
+
+    Parameters
+    ----------
+    on_event:
+        Called with each :class:`UpdateEvent`.
+    on_state:
+        Called with ``True`` once a stream is established and ``False`` when
+        it is lost (callers typically fall back to polling meanwhile).
+    transport:
+        Source of streaming connections; defaults to the shared transport.
+    read_timeout:
+        Seconds without any data (the server sends heartbeats every 15 s)
+        after which the connection is considered dead.
+    backoff_base, backoff_max:
+        Reconnect delay after the *n*-th consecutive failure is uniform in
+        ``[0, min(backoff_max, backoff_base * 2 ** n)]``.
+    login:
+        Returns the user id for ``(api_base, credentials)``; called on the
+        channel thread before each connection. Defaults to a
+        :class:`editor.crowdly_client.CrowdlyClient` login.
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[UpdateEvent], None],
+        *,
+        on_state: Callable[[bool], None] | None = None,
+        transport: HttpTransport | None = None,
+        read_timeout: float = 45.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        login: Callable[[str, _Credentials], str] | None = None,
+    ) -> None:
+        self._on_event = on_event
+        self._login = login or _client_login
+        self._on_state = on_state
+        self._transport = transport or shared_transport()
+        self.read_timeout = read_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._cond = threading.Condition()
+        self._subscription: _Subscription | None = None
+        self._generation = 0
+        self._stream: HttpStream | None = None
+        self._stopped = False
+        self._connected = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def set_subscriptions(
+        self,
+        api_base: str | None,
+        stories: Iterable[str],
+        screenplays: Iterable[str],
+        credentials: _Credentials | None = None,
+    ) -> None:
+        """Follow *stories* and *screenplays* on *api_base* (empty: idle).
+
+        Without *credentials* only public items are announced.
+        """
+
+        story_ids = frozenset(s for s in stories if s)
+        screenplay_ids = frozenset(s for s in screenplays if s)
+        subscription: _Subscription | None = None
+        if api_base and (story_ids or screenplay_ids):
+            subscription = (api_base.rstrip("/"), story_ids, screenplay_ids, credentials)
+
+        with self._cond:
+            if self._stopped or subscription == self._subscription:
+                return
+            self._subscription = subscription
+            self._generation += 1
+            stream = self._stream
+            self._cond.notify_all()
+            if self._thread is None and subscription is not None:
+                self._thread = threading.Thread(target=self._run, name="crowdly-updates", daemon=True)
+                self._thread.start()
+        if stream is not None:
+            # Interrupt the blocked read; the loop reconnects right away.
+            stream.close()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            stream = self._stream
+            self._cond.notify_all()
+        if stream is not None:
+            stream.close()
+
+    # Worker -----------------------------------------------------------------
+
+    def _set_connected(self, value: bool) -> None:
+        if value == self._connected:
+            return
+        self._connected = value
+        if self._on_state is not None:
+            try:
+                self._on_state(value)
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        failures = 0
+        while True:
+            with self._cond:
+                idle = self._subscription is None
+            if idle:
+                self._set_connected(False)
+            with self._cond:
+                while not self._stopped and self._subscription is None:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+                subscription = self._subscription
+                generation = self._generation
+
+            if self._listen(subscription, generation):
+                failures = 0
+            else:
+                self._set_connected(False)
+            with self._cond:
+                if self._stopped:
+                    break
+                if self._generation != generation:
+                    continue  # re-subscribed: reconnect immediately
+            failures += 1
+            delay = random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2 ** failures)))
+            with self._cond:
+                self._cond.wait_for(lambda: self._stopped or self._generation != generation, timeout=delay)
+        self._set_connected(False)
+
+    def _listen(self, subscription: _Subscription, generation: int) -> bool:
+        """Consume one stream; return whether it was ever established."""
+
+        api_base, stories, screenplays, credentials = subscription
+        params = {"stories": ",".join(sorted(stories)), "screenplays": ",".join(sorted(screenplays))}
+        if credentials is not None:
+            try:
+                params["userId"] = self._login(api_base, credentials)
+            except Exception:
+                return False
+        query = urlencode(params)
+        try:
+            stream = self._transport.open_stream(
+                f"{api_base}/updates/stream?{query}",
+                headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"},
+                timeout=self.read_timeout,
+            )
+        except TransportError:
+            return False
+        if stream.status != 200 or stream.content_type != "text/event-stream":
+            # e.g. 404 from a backend without the endpoint: back off.
+            stream.close()
+            return False
+
+        with self._cond:
+            if self._stopped or self._generation != generation:
+                stream.close()
+                return False
+            self._stream = stream
+
+        self._set_connected(True)
+        parser = SseParser()
+        try:
+            while True:
+                line = stream.readline()
+                if not line:
+                    break
+                completed = parser.feed(line.decode("utf-8", errors="replace"))
+                if completed is None or completed[0] != "update":
+                    continue
+                event = parse_update(completed[1])
+                if event is not None:
+                    try:
+                        self._on_event(event)
+                    except Exception:
+                        pass
+        except TransportError:
+            pass
+        finally:
+            with self._cond:
+                if self._stream is stream:
+                    self._stream = None
+                resubscribing = not self._stopped and self._generation != generation
+            stream.close()
+            if not resubscribing:
+                # Stay "connected" across a quick re-subscribe so callers do
+                # not flip to polling and back.
+                self._set_connected(False)
+        return True
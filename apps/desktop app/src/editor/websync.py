@@ -10,12 +10,12 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Tuple
 import json
-import os
-from urllib import request, error
 from urllib.parse import quote as _urlquote
 
+from .http_transport import shared_transport
+from .space_manifest import SpaceManifest
 from .settings import Settings, save_settings, write_spaces_status_log
 
 
@@ -41,33 +41,19 @@ def _request_json(url: str, *, method: str = "GET", payload: Dict[str, Any] | No
   backend error messages.
   """
 
-  data: bytes | None
-  if payload is None:
-    data = None
-  else:
-    data = json.dumps(payload).encode("utf-8")
-
-  req = request.Request(url, data=data, headers={"Content-Type": "application/json"})
-  req.get_method = lambda: method  # type: ignore[assignment]
-
+  # Requests share the pooled keep-alive transport, so the several calls
+  # of one Space sync reuse a single connection.
   try:
-    with request.urlopen(req, timeout=timeout) as resp:  # type: ignore[call-arg]
-      body_bytes = resp.read()
-      try:
-        body = json.loads(body_bytes.decode("utf-8"))
-      except Exception:
-        body = {}
-      return resp.getcode(), body
-  except error.HTTPError as exc:  # pragma: no cover - network dependent
-    try:
-      raw = exc.read().decode("utf-8")
-      body = json.loads(raw) if raw else {}
-    except Exception:
-      body = {"error": str(exc)}
-    return exc.code, body  # type: ignore[return-value]
+    resp = shared_transport().request(method, url, json_body=payload, timeout=timeout)
   except Exception as exc:  # pragma: no cover - network dependent
     raise RuntimeError(str(exc)) from exc
 
+  try:
+    body = json.loads(resp.body.decode("utf-8")) if resp.body else {}
+  except Exception:
+    body = {} if resp.ok else {"error": f"HTTP {resp.status}"}
+  return resp.status, body
+
 
 def _get_json(url: str, timeout: float = 10.0) -> Tuple[int, Dict[str, Any]]:
   """Shortcut for a JSON GET request."""
@@ -81,66 +67,37 @@ def _post_json(url: str, payload: Dict[str, Any], timeout: float = 10.0) -> Tupl
   return _request_json(url, method="POST", payload=payload, timeout=timeout)
 
 
-def build_space_snapshot(root: Path) -> Dict[str, Any]:
-  """Return a snapshot payload for the given project-space *root*.
-
-  The payload shape is compatible with the backend
-  ``POST /creative-spaces/:spaceId/sync`` endpoint and consists of a
-  ``snapshotGeneratedAt`` timestamp and an ``items`` list containing
-  folders and files.
-  """
-
+def _space_root(root: Path) -> Path:
   root = root.expanduser().resolve()
   if not root.exists() or not root.is_dir():
     raise ValueError(f"Project space does not exist or is not a directory: {root}")
+  return root
 
-  items: List[Dict[str, Any]] = []
 
-  for dirpath, dirnames, filenames in os.walk(root):
-    base = Path(dirpath)
-    try:
-      rel_dir = base.relative_to(root)
-    except ValueError:
-      # Should not happen, but guard against it.
-      rel_dir = Path(".")
-
-    # For the root directory we do not emit an explicit folder item; the
-    # backend treats the space itself as the root.
-    if rel_dir != Path("."):
-      rel_str = rel_dir.as_posix()
-      items.append(
-        {
-          "relativePath": rel_str,
-          "kind": "folder",
-          "sizeBytes": None,
-          "hash": None,
-          "deleted": False,
-        }
-      )
+def build_space_snapshot(root: Path) -> Dict[str, Any]:
+  """Return a full snapshot payload for the given project-space *root*.
 
-    for filename in filenames:
-      full_path = base / filename
-      try:
-        stat_result = full_path.stat()
-        size_bytes = int(stat_result.st_size)
-      except OSError:
-        size_bytes = None
-
-      rel_file = filename if rel_dir == Path(".") else (rel_dir / filename).as_posix()
-
-      items.append(
-        {
-          "relativePath": rel_file,
-          "kind": "file",
-          "sizeBytes": size_bytes,
-          "hash": None,
-          "deleted": False,
-        }
-      )
+  The payload shape is compatible with the backend
+  ``POST /creative-spaces/:spaceId/sync`` endpoint and consists of a
+  ``snapshotGeneratedAt`` timestamp and an ``items`` list containing
+  folders and files with their BLAKE2b hashes. Hashes come from the
+  space's catalog (see :class:`editor.space_manifest.SpaceManifest`), so
+  only files that changed since it last saw them are read.
+  """
 
+  current = SpaceManifest(_space_root(root)).scan()
   return {
     "snapshotGeneratedAt": datetime.now(timezone.utc).isoformat(),
-    "items": items,
+    "items": [
+      {
+        "relativePath": rel,
+        "kind": entry.kind,
+        "sizeBytes": entry.size,
+        "hash": entry.hash,
+        "deleted": False,
+      }
+      for rel, entry in sorted(current.items())
+    ],
   }
 
 
@@ -164,12 +121,11 @@ def sync_space_to_web(settings: Settings, project_space: Path, user_id: str) ->
   """
 
   api_base = _build_api_base(settings)
-  snapshot = build_space_snapshot(project_space)
 
   # Normalise the project-space root path and folder name once; this is
   # used both for matching existing creative spaces and for creating
   # new ones when necessary.
-  root = project_space.expanduser().resolve()
+  root = _space_root(project_space)
   root_path = str(root)
   folder_name = root.name
 
@@ -261,12 +217,23 @@ def sync_space_to_web(settings: Settings, project_space: Path, user_id: str) ->
       # Non-fatal; path is only advisory metadata.
       pass
 
-  # 3) Push the snapshot into the resolved creative space.
+  # 3) Push the snapshot into the resolved creative space. Only entries
+  #    that differ from what this Space acknowledged last time are sent
+  #    (the backend upserts items one by one and leaves the rest alone);
+  #    a Space we never synced to gets the full listing.
+  manifest = SpaceManifest(root)
+  current = manifest.scan()
+  remote_key = f"{api_base}|{space_id}"
   sync_url = f"{api_base}/creative-spaces/{space_id}/sync"
-  payload = {"userId": user_id, **snapshot}
+  payload = {
+    "userId": user_id,
+    "snapshotGeneratedAt": datetime.now(timezone.utc).isoformat(),
+    "items": manifest.changes_since_ack(remote_key, current),
+  }
   status, body = _post_json(sync_url, payload)
   if status != 200 or not body.get("ok"):
     raise RuntimeError(body.get("error") or f"Sync failed with status {status}")
+  manifest.acknowledge(remote_key, current)
 
   created = int(body.get("created", 0))
   updated = int(body.get("updated", 0))
@@ -1,5 +1,10 @@
+import multiprocessing
+
 from editor.app import main
 
 
 if __name__ == "__main__":  # pragma: no cover - PyInstaller entrypoint
+    # Frozen builds re-execute this entrypoint in worker processes used by
+    # the project-wide replace; let them run the worker instead of the GUI.
+    multiprocessing.freeze_support()
     main()
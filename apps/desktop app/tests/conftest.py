@@ -0,0 +1,128 @@
+"""Shared fixtures: an in-process stand-in for the Crowdly backend."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from editor.crowdly_client import CrowdlyClient
+from editor.crowdly_session import SessionManager
+from editor.http_cache import HttpCache
+from editor.http_transport import HttpTransport
+from editor.sync_manifest import ManifestStore
+
+USER_ID = "user-1"
+
+# handler(match, json_body) -> (status, json_response)
+Handler = Callable[[re.Match, Any], Tuple[int, Any]]
+
+
+class StubBackend:
+    """JSON routes registered by a test, served on a local port.
+
+    Every request is recorded as ``(method, path, body)`` in
+    :attr:`requests`. ``POST /auth/login`` is answered out of the box.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, str, Any]] = []
+        self._routes: List[Tuple[str, re.Pattern, Handler]] = []
+        self.route("POST", r"/auth/login")(lambda _m, _body: (200, {"id": USER_ID}))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, method: str, pattern: str) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            # Later registrations win, so tests can override the defaults.
+            self._routes.insert(0, (method, re.compile(pattern + r"$"), handler))
+            return handler
+
+        return register
+
+    def calls(self, method: str, pattern: str) -> List[Any]:
+        """Bodies of the recorded requests matching *method* and *pattern*."""
+
+        regex = re.compile(pattern + r"$")
+        return [body for m, path, body in self.requests if m == method and regex.match(path)]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _dispatch(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        self.requests.append((method, path, body))
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return handler(match, body)
+        return 404, {"error": "not found"}
+
+    def _handler_class(self) -> type:
+        backend = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                body = json.loads(raw) if raw else None
+                status, payload = backend._dispatch(self.command, self.path.split("?", 1)[0], body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        return _Handler
+
+
+@pytest.fixture
+def backend():
+    stub = StubBackend()
+    stub.start()
+    try:
+        yield stub
+    finally:
+        stub.stop()
+
+
+@pytest.fixture
+def manifest_store(tmp_path: Path) -> ManifestStore:
+    return ManifestStore(tmp_path / "manifests")
+
+
+@pytest.fixture
+def client(backend: StubBackend, tmp_path: Path) -> CrowdlyClient:
+    return CrowdlyClient(
+        backend.base_url,
+        credentials=("writer@example.com", "secret"),
+        transport=HttpTransport(retries=0),
+        cache=HttpCache(tmp_path / "http-cache"),
+        sessions=SessionManager(),
+    )
+
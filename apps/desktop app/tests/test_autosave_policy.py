@@ -0,0 +1,111 @@
+"""Autosave debounce, max-wait and cost backoff driven by a fake clock."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from editor import autosave_policy
+from editor.autosave_policy import AutosaveConfig, AutosavePolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance_ms(self, ms: float) -> None:
+        self.now += ms / 1000.0
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _type(policy: AutosavePolicy, clock: FakeClock, *, every_ms: int, for_ms: int) -> list[int]:
+    """Edit every *every_ms* for *for_ms*; return the delays after each edit."""
+
+    delays = []
+    for _ in range(for_ms // every_ms):
+        delays.append(policy.note_edit())
+        clock.advance_ms(every_ms)
+    return delays
+
+
+def test_debounce_restarts_with_every_edit(clock: FakeClock) -> None:
+    policy = AutosavePolicy(AutosaveConfig(debounce_ms=2000, max_wait_ms=30000), clock=clock)
+    assert not policy.has_pending_edits()
+
+    assert policy.note_edit() == 2000
+    clock.advance_ms(1500)
+    # A pause shorter than the debounce pushes the save out again.
+    assert policy.note_edit() == 2000
+    assert policy.has_pending_edits()
+
+    policy.reset()
+    assert not policy.has_pending_edits()
+
+
+def test_continuous_typing_is_saved_within_max_wait(clock: FakeClock) -> None:
+    policy = AutosavePolicy(AutosaveConfig(debounce_ms=2000, max_wait_ms=5000), clock=clock)
+
+    delays = _type(policy, clock, every_ms=250, for_ms=5000)
+
+    # The debounce is capped by the time left until max wait, and a save is
+    # due exactly max_wait after the first unsaved edit.
+    assert delays[:12] == [2000] * 12
+    assert delays[-4:] == [1000, 750, 500, 250]
+    assert policy.note_edit() == 0
+
+    # After the save the window starts at the next edit.
+    policy.reset()
+    assert policy.note_edit() == 2000
+
+
+def test_expensive_saves_back_off_up_to_the_ceiling(clock: FakeClock) -> None:
+    config = AutosaveConfig(debounce_ms=1000, max_wait_ms=60000, max_debounce_ms=8000, cost_factor=20.0)
+    policy = AutosavePolicy(config, clock=clock)
+
+    # Cheap saves keep the configured debounce.
+    policy.record_cost(0.01)
+    assert policy.debounce_ms() == 1000
+
+    # 100 ms per save means waiting 20x that between saves.
+    policy = AutosavePolicy(config, clock=clock)
+    policy.record_cost(0.1)
+    assert policy.average_cost_ms == pytest.approx(100.0)
+    assert policy.note_edit() == 2000
+
+    # A moving average: one slow save moves it by alpha, not all the way.
+    policy.record_cost(0.2)
+    assert policy.average_cost_ms == pytest.approx(130.0)
+    assert policy.debounce_ms() == 2600
+
+    for _ in range(50):
+        policy.record_cost(2.0)
+    assert policy.debounce_ms() == 8000
+    # Max wait still bounds the delay of a long burst of edits.
+    clock.advance_ms(57000)
+    assert policy.note_edit() == 3000
+
+
+def test_space_config_falls_back_to_defaults(tmp_path: Path) -> None:
+    assert autosave_policy.load_config(None) == AutosaveConfig()
+    assert autosave_policy.load_config(tmp_path) == AutosaveConfig()
+
+    path = autosave_policy.config_path_for_space(tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        json.dumps({"debounce_ms": 500, "max_wait_ms": -1, "cost_factor": "fast", "save_on_focus_out": 0}),
+        encoding="utf-8",
+    )
+    config = autosave_policy.load_config(tmp_path)
+    assert config == AutosaveConfig(debounce_ms=500)
+
+    autosave_policy.save_config(tmp_path, AutosaveConfig(max_wait_ms=9000, save_on_tab_switch=False))
+    assert autosave_policy.load_config(tmp_path) == AutosaveConfig(max_wait_ms=9000, save_on_tab_switch=False)
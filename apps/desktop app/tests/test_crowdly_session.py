@@ -0,0 +1,39 @@
+"""Persisted backend sessions and logging out."""
+
+from __future__ import annotations
+
+import stat
+from pathlib import Path
+
+from editor.crowdly_session import SessionManager
+
+API = "https://api.example"
+CREDS = ("writer@example.com", "secret")
+
+
+def test_cleared_sessions_are_gone_after_a_restart(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.json"
+    sessions = SessionManager(path)
+    assert sessions.login(API, CREDS, lambda: "user-1") == ("user-1", False)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert "secret" not in path.read_text(encoding="utf-8")
+
+    # Another run reuses the session without logging in again...
+    assert SessionManager(path).login(API, CREDS, lambda: "unexpected") == ("user-1", True)
+
+    # ...until the user logs out.
+    sessions.clear()
+    assert SessionManager(path).get(API, CREDS) is None
+
+
+def test_invalidate_drops_only_that_backend(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.json"
+    sessions = SessionManager(path)
+    sessions.login(API, CREDS, lambda: "user-1")
+    sessions.login("https://other.example", CREDS, lambda: "user-2")
+
+    sessions.invalidate(API, CREDS)
+
+    restarted = SessionManager(path)
+    assert restarted.get(API, CREDS) is None
+    assert restarted.get("https://other.example", CREDS).user_id == "user-2"
@@ -0,0 +1,82 @@
+"""Editor deltas in UTF-16 code units applied to the code-point rope."""
+
+from __future__ import annotations
+
+import random
+
+from editor.document import Document
+from editor.rope import Rope
+
+
+def _units(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+class _QtEditor:
+    """Reports edits the way ``QTextDocument.contentsChange`` does."""
+
+    def __init__(self, document: Document) -> None:
+        self.document = document
+        self.text = document.content
+        self.version = 0
+        document.sync_text(self.text, self.version)
+
+    def edit(self, start: int, end: int, replacement: str) -> bool:
+        position = _units(self.text[:start])
+        removed = _units(self.text[start:end])
+        self.text = self.text[:start] + replacement + self.text[end:]
+        self.version += 1
+        return self.document.apply_delta(position, removed, replacement, self.version - 1, self.version)
+
+
+def test_typing_after_emoji_lands_at_the_caret() -> None:
+    editor = _QtEditor(Document(content="😀 smile 𝄞 clef\n"))
+
+    assert editor.edit(7, 7, "!")
+    assert editor.edit(len(editor.text), len(editor.text), "🎉 end")
+    assert editor.edit(0, 1, "🙂")
+
+    assert editor.document.content == editor.text == "🙂 smile! 𝄞 clef\n🎉 end"
+
+
+def test_removal_spanning_astral_characters() -> None:
+    editor = _QtEditor(Document(content="a😀b𝄞c🎉d"))
+
+    assert editor.edit(1, 5, "-")
+
+    assert editor.document.content == "a-🎉d"
+
+
+def test_offset_inside_a_surrogate_pair_is_rejected() -> None:
+    document = Document(content="a😀b")
+    document.sync_text("a😀b", 0)
+
+    assert not document.apply_delta(2, 0, "x", 0, 1)
+    assert document.content == "a😀b"
+    assert not document.synced_with(1)
+
+
+def test_random_edits_keep_document_and_editor_aligned() -> None:
+    rng = random.Random(35)
+    alphabet = "ab \n😀𝄞é中🎉"
+    text = "".join(rng.choice(alphabet) for _ in range(5_000))
+    editor = _QtEditor(Document(content=text))
+
+    for _ in range(500):
+        start = rng.randrange(len(editor.text) + 1)
+        end = min(len(editor.text), start + rng.randrange(20))
+        replacement = "".join(rng.choice(alphabet) for _ in range(rng.randrange(6)))
+        assert editor.edit(start, end, replacement)
+
+    assert editor.document.content == editor.text
+
+
+def test_rope_maps_utf16_offsets_across_leaves() -> None:
+    text = ("x" * 1500 + "😀") * 8
+    rope = Rope(text)
+
+    assert rope.utf16_length() == _units(text)
+    for index in range(0, len(text) + 1, 97):
+        assert rope.index_from_utf16(_units(text[:index])) == index
+    assert rope.index_from_utf16(1501) is None
+    assert rope.index_from_utf16(_units(text) + 1) is None
@@ -0,0 +1,28 @@
+"""Response cache entries stay private to the user."""
+
+from __future__ import annotations
+
+import stat
+from pathlib import Path
+
+from editor.http_cache import CachedResponse, HttpCache
+
+
+def test_entries_are_written_owner_only(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path / "http")
+    entry = CachedResponse(
+        url="https://api.example/story-titles/s1",
+        user="user-1",
+        body='{"title": "Private draft"}',
+        content_type="application/json",
+        etag='"v1"',
+    )
+
+    cache.store(entry)
+
+    files = list((tmp_path / "http").iterdir())
+    assert [f.suffix for f in files] == [".json"]
+    assert stat.S_IMODE(files[0].stat().st_mode) == 0o600
+    assert stat.S_IMODE((tmp_path / "http").stat().st_mode) == 0o700
+    assert cache.lookup(entry.url, "user-1") == entry
+    assert cache.lookup(entry.url, "user-2") is None
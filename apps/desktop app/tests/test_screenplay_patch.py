@@ -0,0 +1,267 @@
+"""Block-level screenplay patches, checked against a port of the backend's planner."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from editor import screenplay_sync
+
+SCREENPLAY_ID = "sp-1"
+SYNC_PATH = rf"/screenplays/{SCREENPLAY_ID}/sync-desktop"
+
+
+def plan_screenplay_patch(old_blocks: List[Dict[str, Any]], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Port of ``planScreenplayPatch`` in ``backend/src/server.js``."""
+
+    covered = [False] * len(old_blocks)
+
+    def claim(pos: Any) -> bool:
+        if not isinstance(pos, int) or pos < 0 or pos >= len(old_blocks) or covered[pos]:
+            return False
+        covered[pos] = True
+        return True
+
+    target: List[Dict[str, Any]] = []
+    deleted: List[Any] = []
+    for op in patch["ops"]:
+        count = op.get("count") if isinstance(op.get("count"), int) and op["count"] > 0 else 1
+        kind = op.get("op")
+        if kind == "keep":
+            for k in range(count):
+                if not claim(op["from"] + k):
+                    return {"error": f"invalid keep of block {op['from'] + k}"}
+                target.append({"old": old_blocks[op["from"] + k]})
+        elif kind == "update":
+            if not isinstance(op.get("text"), str) or not claim(op["from"]):
+                return {"error": f"invalid update of block {op['from']}"}
+            target.append({"old": old_blocks[op["from"]], "text": op["text"]})
+        elif kind == "insert":
+            if not isinstance(op.get("text"), str):
+                return {"error": "insert requires text"}
+            target.append({"old": None, "text": op["text"]})
+        elif kind == "delete":
+            for k in range(count):
+                if not claim(op["from"] + k):
+                    return {"error": f"invalid delete of block {op['from'] + k}"}
+                deleted.append(old_blocks[op["from"] + k]["block_id"])
+        else:
+            return {"error": f"unknown op {kind}"}
+    if not all(covered):
+        return {"error": "patch does not account for every existing block"}
+    return {"target": target, "deleted": deleted}
+
+
+class ScreenplayServer:
+    """Scenes and blocks of one screenplay, synced like the backend does."""
+
+    def __init__(self, backend) -> None:
+        self._ids = itertools.count(1)
+        self.scenes: List[Dict[str, Any]] = []
+        self.blocks: List[Dict[str, Any]] = []
+        self.revision = 0
+        self.last_stats: Dict[str, int] = {}
+        backend.route("POST", SYNC_PATH)(self.sync)
+
+    @property
+    def updated_at(self) -> str:
+        return f"2026-01-01T00:{self.revision // 60:02d}:{self.revision % 60:02d}.000Z"
+
+    def texts_by_scene(self) -> List[List[str]]:
+        return [[b["text"] for b in self.blocks if b["scene_id"] == scene["scene_id"]] for scene in self.scenes]
+
+    def sync(self, _match, body: Dict[str, Any]):
+        patch = body.get("patch")
+        if patch is None:
+            self._replace(body["scenes"])
+        else:
+            if (
+                patch["baseUpdatedAt"] != self.updated_at
+                or patch["baseBlockCount"] != len(self.blocks)
+                or patch["baseSceneCount"] != len(self.scenes)
+            ):
+                return 409, {"error": "precondition_failed", "code": "precondition_failed"}
+            plan = plan_screenplay_patch(self.blocks, patch)
+            if "error" not in plan and sum(sc["blockCount"] for sc in patch["scenes"]) != len(plan["target"]):
+                plan = {"error": "scene block counts do not match the patch"}
+            if "error" in plan:
+                return 400, {"error": "Invalid screenplay patch", "details": plan["error"]}
+            self._apply(patch["scenes"], plan)
+        self.revision += 1
+        return 200, {"ok": True, "screenplayId": SCREENPLAY_ID, "updatedAt": self.updated_at, **self.last_stats}
+
+    def _replace(self, scenes: List[Dict[str, Any]]) -> None:
+        self.scenes, self.blocks = [], []
+        for scene in scenes:
+            scene_id = next(self._ids)
+            self.scenes.append({"scene_id": scene_id, "slugline": scene["slugline"]})
+            for text in scene["paragraphs"]:
+                if text.strip():
+                    self.blocks.append({"block_id": next(self._ids), "scene_id": scene_id, "text": text})
+        self.last_stats = {}
+
+    def _apply(self, patch_scenes: List[Dict[str, Any]], plan: Dict[str, Any]) -> None:
+        # Mirrors applyScreenplayPatchTx: scene rows reused by position.
+        scenes = []
+        for index, scene in enumerate(patch_scenes):
+            scene_id = self.scenes[index]["scene_id"] if index < len(self.scenes) else next(self._ids)
+            scenes.append({"scene_id": scene_id, "slugline": scene["slugline"]})
+        stats = {"inserted": 0, "updated": 0, "moved": 0, "deleted": len(plan["deleted"])}
+        old_positions = {b["block_id"]: i for i, b in enumerate(self.blocks)}
+        owners = [scene for scene, p in zip(scenes, patch_scenes) for _ in range(p["blockCount"])]
+        blocks = []
+        for position, (scene, entry) in enumerate(zip(owners, plan["target"])):
+            old = entry["old"]
+            if old is None:
+                stats["inserted"] += 1
+                blocks.append({"block_id": next(self._ids), "scene_id": scene["scene_id"], "text": entry["text"]})
+                continue
+            text = entry.get("text", old["text"])
+            if text != old["text"]:
+                stats["updated"] += 1
+            elif old["scene_id"] != scene["scene_id"] or old_positions[old["block_id"]] != position:
+                stats["moved"] += 1
+            blocks.append({"block_id": old["block_id"], "scene_id": scene["scene_id"], "text": text})
+        self.scenes, self.blocks, self.last_stats = scenes, blocks, stats
+
+
+def _scenes(texts_by_scene: List[List[str]]) -> List[Dict[str, Any]]:
+    return [
+        {"sceneIndex": index, "slugline": f"INT. ROOM {index} - DAY", "paragraphs": list(texts)}
+        for index, texts in enumerate(texts_by_scene, start=1)
+    ]
+
+
+def _flat(texts_by_scene: List[List[str]]) -> List[str]:
+    return [text for texts in texts_by_scene for text in texts]
+
+
+def _resolve(old_texts: List[str], new_texts_by_scene: List[List[str]]) -> List[str]:
+    """Apply ``compute_patch`` through the ported planner; return the new texts."""
+
+    manifest = screenplay_sync.manifest_for(SCREENPLAY_ID, "base", _scenes([old_texts]))
+    patch = screenplay_sync.compute_patch(manifest, _scenes(new_texts_by_scene))
+    old_blocks = [{"block_id": i, "text": text} for i, text in enumerate(old_texts)]
+    plan = plan_screenplay_patch(old_blocks, patch)
+    assert "error" not in plan, plan
+    assert sum(sc["blockCount"] for sc in patch["scenes"]) == len(plan["target"])
+    return [entry["text"] if "text" in entry else entry["old"]["text"] for entry in plan["target"]]
+
+
+_CUES = ["BOB", "ALICE", "(beat)", "Yes.", "No.", "CUT TO:"]
+
+
+def _random_blocks(rng: random.Random, count: int) -> List[str]:
+    # Plenty of repeated lines, like character cues in a real screenplay.
+    return [rng.choice(_CUES) if rng.random() < 0.4 else f"Line {rng.randrange(10_000)}" for _ in range(count)]
+
+
+def _mutate(rng: random.Random, blocks: List[str]) -> List[str]:
+    blocks = list(blocks)
+    for _ in range(rng.randint(1, 6)):
+        action = rng.choice(["edit", "insert", "delete", "move"])
+        if action == "insert" or not blocks:
+            blocks.insert(rng.randint(0, len(blocks)), rng.choice(_CUES + [f"New {rng.random()}"]))
+        elif action == "edit":
+            blocks[rng.randrange(len(blocks))] = f"Edited {rng.random()}"
+        elif action == "delete":
+            start = rng.randrange(len(blocks))
+            del blocks[start : start + rng.randint(1, 4)]
+        else:
+            start = rng.randrange(len(blocks))
+            run = blocks[start : start + rng.randint(1, 8)]
+            del blocks[start : start + len(run)]
+            position = rng.randint(0, len(blocks))
+            blocks[position:position] = run
+    return blocks
+
+
+def _split(rng: random.Random, blocks: List[str]) -> List[List[str]]:
+    cuts = sorted(rng.sample(range(len(blocks) + 1), k=min(3, len(blocks) + 1)))
+    bounds = [0] + cuts + [len(blocks)]
+    return [blocks[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def test_random_patches_are_accepted_by_the_backend_planner() -> None:
+    rng = random.Random(43)
+    for _ in range(500):
+        old = _random_blocks(rng, rng.randint(0, 40))
+        new = _split(rng, _mutate(rng, old))
+        assert _resolve(old, new) == _flat(new)
+
+
+def test_blank_blocks_are_left_out_like_the_backend_does() -> None:
+    new = [["BOB", "  ", "Hello."], ["", "ALICE"]]
+    assert _resolve(["BOB", "Hi."], new) == ["BOB", "Hello.", "ALICE"]
+
+
+def test_moved_scene_becomes_a_single_keep() -> None:
+    old = [f"Line {i}" for i in range(20)]
+    manifest = screenplay_sync.manifest_for(SCREENPLAY_ID, "base", _scenes([old]))
+    patch = screenplay_sync.compute_patch(manifest, _scenes([old[10:], old[:10]]))
+    assert patch["ops"] == [{"op": "keep", "from": 10, "count": 10}, {"op": "keep", "from": 0, "count": 10}]
+
+
+@pytest.fixture
+def server(backend) -> ScreenplayServer:
+    return ScreenplayServer(backend)
+
+
+@pytest.fixture
+def sync(client, manifest_store):
+    def run(texts_by_scene: List[List[str]]) -> Any:
+        return screenplay_sync.sync_screenplay(
+            client, SCREENPLAY_ID, title="Play", scenes=_scenes(texts_by_scene), store=manifest_store
+        )
+
+    return run
+
+
+def test_one_edit_in_a_3000_block_screenplay_sends_one_update(backend, server, sync) -> None:
+    rng = random.Random(3_000)
+    blocks = _random_blocks(rng, 3_000)
+    local = [blocks[i : i + 30] for i in range(0, 3_000, 30)]
+    sync(local)
+    assert server.texts_by_scene() == local
+    before = {b["block_id"] for b in server.blocks}
+
+    local[42][7] = "A brand new line."
+    result = sync(local)
+
+    patch = backend.calls("POST", SYNC_PATH)[-1]["patch"]
+    assert [op["op"] for op in patch["ops"]] == ["keep", "update", "keep"]
+    assert (result["inserted"], result["updated"], result["moved"], result["deleted"]) == (0, 1, 0, 0)
+    assert server.texts_by_scene() == local
+    assert {b["block_id"] for b in server.blocks} == before
+
+
+def test_scene_moves_and_edits_in_a_3000_block_screenplay(backend, server, sync) -> None:
+    rng = random.Random(3_001)
+    blocks = _random_blocks(rng, 3_000)
+    local = [blocks[i : i + 30] for i in range(0, 3_000, 30)]
+    sync(local)
+
+    local.insert(10, local.pop(80))  # move a scene
+    del local[50][3:6]  # delete a few blocks
+    local[20].insert(0, "ALICE")  # insert a cue
+    local[60][12] = "Rewritten."  # edit one
+    result = sync(local)
+
+    assert "patch" in backend.calls("POST", SYNC_PATH)[-1]
+    assert server.texts_by_scene() == local
+    assert result["inserted"] <= 1 and result["updated"] <= 1 and result["deleted"] <= 3
+
+
+def test_stale_base_falls_back_to_a_full_sync(backend, server, sync) -> None:
+    sync([["BOB", "Hi."], ["ALICE", "Bye."]])
+    server.revision += 1  # changed from the web app meanwhile
+
+    local = [["BOB", "Hello."], ["ALICE", "Bye."]]
+    sync(local)
+
+    bodies = backend.calls("POST", SYNC_PATH)
+    assert ["patch" in body for body in bodies] == [False, True, False]
+    assert server.texts_by_scene() == local
@@ -0,0 +1,189 @@
+"""Chapter-level delta sync against a stand-in for ``POST /story-titles/:id/sync-desktop``."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from editor import story_delta
+
+STORY_ID = "story-1"
+SYNC_PATH = rf"/story-titles/{STORY_ID}/sync-desktop"
+
+
+def chapters(*specs: str) -> List[Dict[str, Any]]:
+    """``chapters("One:a|b", "Two:c")`` -> chapter payloads."""
+
+    result = []
+    for spec in specs:
+        title, _, paragraphs = spec.partition(":")
+        result.append({"chapterTitle": title, "paragraphs": paragraphs.split("|") if paragraphs else []})
+    return result
+
+
+class StoryServer:
+    """The backend's story state and its delta/full sync rules."""
+
+    def __init__(self, backend, *, supports_delta: bool = True) -> None:
+        self.chapters: List[Dict[str, Any]] = []
+        self.revision = 0
+        self.supports_delta = supports_delta
+        backend.route("POST", SYNC_PATH)(self.sync)
+
+    @property
+    def updated_at(self) -> str:
+        return f"2026-01-01T00:00:{self.revision:02d}.000Z"
+
+    def edit_elsewhere(self, new_chapters: List[Dict[str, Any]]) -> None:
+        """A change made from the web app."""
+
+        self.chapters = new_chapters
+        self.revision += 1
+
+    def sync(self, _match, body: Dict[str, Any]):
+        delta = body.get("delta")
+        if delta is not None:
+            if not self.supports_delta:
+                return 400, {"error": "chapters[] is required"}
+            if delta["baseUpdatedAt"] != self.updated_at or delta["baseChapterCount"] != len(self.chapters):
+                return 409, {"error": "Story changed since the last desktop sync", "updatedAt": self.updated_at}
+            sent = {c["index"]: c for c in delta["chapters"]}
+            incoming = []
+            for index, source in enumerate(delta["order"]):
+                if source is not None:
+                    incoming.append(self.chapters[source])
+                elif index in sent:
+                    incoming.append({"chapterTitle": sent[index]["chapterTitle"], "paragraphs": sent[index]["paragraphs"]})
+                else:
+                    return 400, {"error": f"delta is missing content for chapter {index}"}
+        else:
+            incoming = body["chapters"]
+        self.chapters = [dict(c) for c in incoming]
+        self.revision += 1
+        return 200, {"ok": True, "storyTitleId": STORY_ID, "updatedAt": self.updated_at}
+
+
+@pytest.fixture
+def server(backend) -> StoryServer:
+    return StoryServer(backend)
+
+
+@pytest.fixture
+def sync(client, manifest_store):
+    def run(local: List[Dict[str, Any]]) -> Any:
+        return story_delta.sync_story(client, STORY_ID, title="Title", chapters=local, metadata=None, store=manifest_store)
+
+    return run
+
+
+def _bodies(backend) -> List[Dict[str, Any]]:
+    return backend.calls("POST", SYNC_PATH)
+
+
+def test_first_sync_is_full_and_leaves_a_manifest(backend, server, sync, client, manifest_store) -> None:
+    local = chapters("One:a|b", "Two:c")
+    result = sync(local)
+
+    (body,) = _bodies(backend)
+    assert "delta" not in body and body["chapters"] == local
+    assert server.chapters == local
+    manifest = story_delta.load_manifest(manifest_store, client.base_url, STORY_ID)
+    assert manifest is not None and manifest.updated_at == result["updatedAt"]
+    assert manifest.hashes == [story_delta.chapter_hash(ch) for ch in local]
+
+
+def test_edit_sends_only_the_edited_chapter(backend, server, sync) -> None:
+    sync(chapters("One:a", "Two:b", "Three:c"))
+    local = chapters("One:a", "Two:b, revised", "Three:c")
+    sync(local)
+
+    delta = _bodies(backend)[-1]["delta"]
+    assert delta["order"] == [0, None, 2]
+    assert [c["index"] for c in delta["chapters"]] == [1]
+    assert server.chapters == local
+
+
+def test_insert_sends_only_the_new_chapter(backend, server, sync) -> None:
+    sync(chapters("One:a", "Two:b"))
+    local = chapters("One:a", "New:n", "Two:b")
+    sync(local)
+
+    delta = _bodies(backend)[-1]["delta"]
+    assert delta["order"] == [0, None, 1]
+    assert delta["chapters"] == [{"index": 1, "chapterTitle": "New", "paragraphs": ["n"]}]
+    assert server.chapters == local
+
+
+def test_delete_sends_no_content(backend, server, sync) -> None:
+    sync(chapters("One:a", "Two:b", "Three:c"))
+    local = chapters("One:a", "Three:c")
+    sync(local)
+
+    delta = _bodies(backend)[-1]["delta"]
+    assert delta["order"] == [0, 2]
+    assert delta["chapters"] == []
+    assert server.chapters == local
+
+
+def test_reorder_sends_no_content(backend, server, sync) -> None:
+    sync(chapters("One:a", "Two:b", "Three:c"))
+    local = chapters("Three:c", "One:a", "Two:b")
+    sync(local)
+
+    delta = _bodies(backend)[-1]["delta"]
+    assert delta["order"] == [2, 0, 1]
+    assert delta["chapters"] == []
+    assert server.chapters == local
+
+
+def test_duplicate_chapters_each_reuse_one_old_position(backend, server, sync) -> None:
+    sync(chapters("Empty:", "Empty:"))
+    local = chapters("Empty:", "Empty:", "Empty:")
+    sync(local)
+
+    delta = _bodies(backend)[-1]["delta"]
+    assert delta["order"] == [0, 1, None]
+    assert server.chapters == local
+
+
+def test_conflict_falls_back_to_a_full_sync(backend, server, sync, client, manifest_store) -> None:
+    sync(chapters("One:a", "Two:b"))
+    server.edit_elsewhere(chapters("One:a", "Two:b", "Web:w"))
+
+    local = chapters("One:a", "Two:b, local")
+    result = sync(local)
+
+    first, second, third = _bodies(backend)
+    assert "delta" in second and "delta" not in third
+    assert third["chapters"] == local
+    assert server.chapters == local
+    manifest = story_delta.load_manifest(manifest_store, client.base_url, STORY_ID)
+    assert manifest is not None and manifest.updated_at == result["updatedAt"]
+
+    # The fresh manifest makes the next sync a delta again.
+    sync(chapters("One:a", "Two:b, local", "Three:c"))
+    assert "delta" in _bodies(backend)[-1]
+
+
+def test_backend_without_delta_support_gets_full_syncs(backend, sync) -> None:
+    server = StoryServer(backend, supports_delta=False)
+    sync(chapters("One:a"))
+    local = chapters("One:a", "Two:b")
+    sync(local)
+
+    bodies = _bodies(backend)
+    assert ["delta" in body for body in bodies] == [False, True, False]
+    assert server.chapters == local
+
+
+def test_other_errors_are_not_retried_in_full(backend, server, sync) -> None:
+    from editor.crowdly_client import CrowdlyClientError
+
+    sync(chapters("One:a"))
+    backend.route("POST", SYNC_PATH)(lambda _m, _body: (500, {"error": "boom"}))
+
+    with pytest.raises(CrowdlyClientError) as excinfo:
+        sync(chapters("One:b"))
+    assert excinfo.value.status_code == 500
+    assert len(_bodies(backend)) == 2
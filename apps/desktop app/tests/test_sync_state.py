@@ -0,0 +1,109 @@
+"""Unsynced-change detection with millisecond timestamps and payload hashes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from editor import file_metadata, story_sync
+from editor.document import write_document
+from editor.screenplay_sync import ScreenplaySyncJob
+
+# 2026-03-14 09:26:00 UTC; every edit below happens within that minute.
+START_MS = 1_773_480_360_000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"ms": START_MS}
+    monkeypatch.setattr(file_metadata, "now_ms", lambda: now["ms"])
+    monkeypatch.setattr(file_metadata, "now_human", lambda: "14032026 09:26")
+    return now
+
+
+@pytest.fixture
+def story(tmp_path: Path) -> Path:
+    path = tmp_path / "story.md"
+    path.write_text("# Title\n\n## One\n\nFirst.\n", encoding="utf-8")
+    if not file_metadata.set_attr(path, file_metadata.FIELD_STORY_ID, "story-1"):
+        pytest.skip("extended attributes are not supported here")
+    return path
+
+
+def _story_hash(text: str) -> str:
+    payload = story_sync.to_json_payload(story_sync.parse_story_from_content(text, body_format="markdown"))
+    return story_sync.payload_hash({"title": payload["title"], "chapters": payload["chapters"], "metadata": None})
+
+
+def _sync(path: Path, clock: dict) -> None:
+    # What the upload handlers do: snapshot, upload, then mark as synced.
+    snapshot_ms = file_metadata.now_ms()
+    clock["ms"] += 300
+    file_metadata.mark_synced(path, _story_hash(path.read_text(encoding="utf-8")), snapshot_ms=snapshot_ms)
+
+
+def _unsynced(path: Path) -> bool:
+    return file_metadata.has_unsynced_changes(file_metadata.read_story_metadata(path))
+
+
+def test_second_edit_within_the_same_minute_is_unsynced(story: Path, clock: dict) -> None:
+    write_document(story, "# Title\n\n## One\n\nFirst edit.\n", "markdown")
+    assert _unsynced(story) is False  # never synced: no last_sync yet
+
+    clock["ms"] += 1_000
+    _sync(story, clock)
+    assert _unsynced(story) is False
+
+    clock["ms"] += 20_000
+    write_document(story, "# Title\n\n## One\n\nSecond edit.\n", "markdown")
+    md = file_metadata.read_story_metadata(story)
+    # The minute-resolution dates cannot tell the edits apart ...
+    assert md.change_date == md.last_sync_date
+    # ... the millisecond fields can.
+    assert file_metadata.has_unsynced_changes(md) is True
+
+
+def test_edit_made_while_the_upload_runs_stays_unsynced(story: Path, clock: dict) -> None:
+    snapshot_ms = file_metadata.now_ms()
+    clock["ms"] += 100
+    write_document(story, "# Title\n\n## One\n\nTyped during the upload.\n", "markdown")
+    clock["ms"] += 100
+    file_metadata.mark_synced(story, _story_hash("# Title\n\n## One\n\nFirst.\n"), snapshot_ms=snapshot_ms)
+
+    assert _unsynced(story) is True
+
+
+def test_minute_dates_are_used_for_files_without_ms_fields(story: Path) -> None:
+    file_metadata.set_attr(story, file_metadata.FIELD_CHANGE_DATE, "14032026 09:27")
+    file_metadata.set_attr(story, file_metadata.FIELD_LAST_SYNC_DATE, "14032026 09:26")
+    assert _unsynced(story) is True
+
+
+def test_unchanged_payload_hash_skips_the_upload(story: Path, clock: dict) -> None:
+    text = story.read_text(encoding="utf-8")
+    _sync(story, clock)
+    synced_hash = file_metadata.read_story_metadata(story).synced_hash
+
+    # Saving the same text again (or undoing back to it) needs no upload.
+    assert _story_hash(text) == synced_hash
+    assert _story_hash(text.replace("First.", "Changed.")) != synced_hash
+
+
+def test_payload_hash_ignores_key_order() -> None:
+    a = {"title": "T", "chapters": [{"chapterTitle": "One", "paragraphs": ["p"]}], "metadata": {"a": 1, "b": 2}}
+    b = {"metadata": {"b": 2, "a": 1}, "chapters": [{"paragraphs": ["p"], "chapterTitle": "One"}], "title": "T"}
+    assert story_sync.payload_hash(a) == story_sync.payload_hash(b)
+
+
+def test_screenplay_job_hash_follows_the_scenes(tmp_path: Path) -> None:
+    text = "INT. ROOM - DAY\nBob enters.\n\nEXT. STREET - NIGHT\nRain.\n"
+    path = tmp_path / "play.screenplay"
+    first = ScreenplaySyncJob.from_story(path, "http://api", "sp-1", story_sync.parse_screenplay_from_content(text))
+    again = ScreenplaySyncJob.from_story(path, "http://api", "sp-1", story_sync.parse_screenplay_from_content(text))
+    edited = ScreenplaySyncJob.from_story(
+        path, "http://api", "sp-1", story_sync.parse_screenplay_from_content(text.replace("Rain.", "Snow."))
+    )
+
+    assert first.payload_hash() == again.payload_hash()
+    assert first.payload_hash() != edited.payload_hash()
@@ -0,0 +1,33 @@
+"""Replace All spans mapped onto UTF-16 editor positions."""
+
+from __future__ import annotations
+
+from editor import text_replace
+
+
+def _apply_utf16(text: str, spans, replacement: str) -> str:
+    # What QTextCursor.setPosition/insertText do: positions in code units.
+    units = text.encode("utf-16-le")
+    for start, end in reversed(spans):
+        units = units[: start * 2] + replacement.encode("utf-16-le") + units[end * 2 :]
+    return units.decode("utf-16-le")
+
+
+def test_spans_after_emoji_replace_the_matches() -> None:
+    text = "😀 cat, 𝄞🎉 cat and cat"
+    spans = text_replace.find_spans(text, "cat")
+
+    mapped = text_replace.utf16_spans(text, spans)
+
+    assert mapped == [(3, 6), (13, 16), (21, 24)]
+    assert _apply_utf16(text, mapped, "🐈") == text_replace.replace_spans(text, spans, "🐈")
+
+
+def test_minimal_edit_maps_to_the_same_range() -> None:
+    text = "🎉 a b 😀 a"
+    spans = text_replace.find_spans(text, "a")
+    edit = text_replace.minimal_edit(text, spans, "xy")
+
+    ((start, end),) = text_replace.utf16_spans(text, [(edit.start, edit.end)])
+
+    assert _apply_utf16(text, [(start, end)], edit.replacement) == "🎉 xy b 😀 xy"
@@ -0,0 +1,305 @@
+"""The SSE update channel against a local ``GET /updates/stream`` stand-in."""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from editor import update_channel
+from editor.crowdly_client import CrowdlyClient
+from editor.http_transport import HttpTransport
+from editor.update_channel import SseParser, UpdateChannel, UpdateEvent
+
+_DROP = object()
+
+
+class SseServer:
+    """Streams ``update`` events for the subscribed ids, like the backend.
+
+    The current revision of every subscribed item is sent right after
+    connecting; :meth:`publish` sends one more event to the streams that
+    follow the item.
+    """
+
+    def __init__(self) -> None:
+        self.revisions: Dict[tuple, str] = {}
+        self.subscriptions: List[Dict[str, set]] = []
+        self.user_ids: List[str | None] = []
+        self.refuse = 0  # answer this many connection attempts with 503
+        self.attempts = 0
+        self._streams: List[tuple] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def publish(self, kind: str, item_id: str, updated_at: str) -> None:
+        self.revisions[(kind, item_id)] = updated_at
+        with self._lock:
+            streams = list(self._streams)
+        for wanted, events in streams:
+            if item_id in wanted[kind]:
+                events.put(_event(kind, item_id, updated_at))
+
+    def heartbeat(self) -> None:
+        with self._lock:
+            for _wanted, events in self._streams:
+                events.put(b": ping\n\n")
+
+    def drop(self) -> None:
+        """Close every open stream, as a restarting server would."""
+
+        with self._lock:
+            streams, self._streams = self._streams, []
+        for _wanted, events in streams:
+            events.put(_DROP)
+
+    def stop(self) -> None:
+        self.drop()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            # The event stream is delimited by closing the connection.
+            protocol_version = "HTTP/1.0"
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                if parts.path != "/updates/stream":
+                    self.send_error(404)
+                    return
+                server.attempts += 1
+                if server.refuse > 0:
+                    server.refuse -= 1
+                    self.send_error(503)
+                    return
+                query = parse_qs(parts.query)
+                wanted = {
+                    kind: {i for i in (query.get(param) or [""])[0].split(",") if i}
+                    for kind, param in (("story", "stories"), ("screenplay", "screenplays"))
+                }
+                events: queue.Queue = queue.Queue()
+                with server._lock:
+                    server.subscriptions.append(wanted)
+                    server.user_ids.append((query.get("userId") or [None])[0])
+                    server._streams.append((wanted, events))
+                for (kind, item_id), updated_at in sorted(server.revisions.items()):
+                    if item_id in wanted[kind]:
+                        events.put(_event(kind, item_id, updated_at))
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                try:
+                    while True:
+                        chunk = events.get()
+                        if chunk is _DROP:
+                            return
+                        self.wfile.write(chunk)
+                        self.wfile.flush()
+                except OSError:
+                    pass
+                finally:
+                    with server._lock:
+                        if (wanted, events) in server._streams:
+                            server._streams.remove((wanted, events))
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        return _Handler
+
+
+def _event(kind: str, item_id: str, updated_at: str) -> bytes:
+    data = json.dumps({"kind": kind, "id": item_id, "updatedAt": updated_at})
+    return f"event: update\ndata: {data}\n\n".encode("utf-8")
+
+
+def wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def sse():
+    server = SseServer()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: List[UpdateEvent] = []
+        self.states: List[bool] = []
+
+
+@pytest.fixture
+def channel():
+    recorder = Recorder()
+    chan = UpdateChannel(
+        recorder.events.append,
+        on_state=recorder.states.append,
+        transport=HttpTransport(),
+        read_timeout=5.0,
+        backoff_base=0.05,
+        backoff_max=0.2,
+    )
+    chan.recorder = recorder  # type: ignore[attr-defined]
+    try:
+        yield chan
+    finally:
+        chan.stop()
+
+
+def test_parser_handles_multiline_data_and_heartbeats() -> None:
+    parser = SseParser()
+    lines = [": ping", "event: update", "data: a", "data: b", "", "", "data: x", ""]
+    assert [parser.feed(line) for line in lines] == [None, None, None, None, ("update", "a\nb"), None, None, ("message", "x")]
+
+
+def test_events_are_delivered(sse: SseServer, channel: UpdateChannel) -> None:
+    rec = channel.recorder  # type: ignore[attr-defined]
+    sse.publish("story", "s1", "r1")
+    channel.set_subscriptions(sse.base_url, ["s1"], [])
+
+    # The current revision arrives right after connecting.
+    wait_for(lambda: rec.events == [UpdateEvent("story", "s1", "r1")])
+    assert rec.states == [True]
+
+    sse.heartbeat()
+    sse.publish("story", "s1", "r2")
+    sse.publish("story", "other", "r9")
+    wait_for(lambda: len(rec.events) == 2)
+    assert rec.events[-1] == UpdateEvent("story", "s1", "r2")
+    assert channel.connected
+
+
+def test_resubscribing_reconnects_with_the_new_ids(sse: SseServer, channel: UpdateChannel) -> None:
+    rec = channel.recorder  # type: ignore[attr-defined]
+    sse.publish("screenplay", "p1", "r1")
+    channel.set_subscriptions(sse.base_url, ["s1"], [])
+    wait_for(lambda: len(sse.subscriptions) == 1)
+
+    channel.set_subscriptions(sse.base_url, ["s1"], ["p1"])
+    # The open stream is interrupted, not left to time out (read_timeout=5).
+    wait_for(lambda: UpdateEvent("screenplay", "p1", "r1") in rec.events, timeout=2.0)
+    assert sse.subscriptions[-1] == {"story": {"s1"}, "screenplay": {"p1"}}
+    # A quick re-subscribe does not make callers fall back to polling.
+    assert False not in rec.states
+
+    # An unchanged subscription keeps the stream.
+    channel.set_subscriptions(sse.base_url, ["s1"], ["p1"])
+    time.sleep(0.2)
+    assert len(sse.subscriptions) == 2
+
+
+def test_reconnects_with_backoff_after_the_server_drops(sse: SseServer, channel: UpdateChannel, monkeypatch) -> None:
+    rec = channel.recorder  # type: ignore[attr-defined]
+    bounds: List[float] = []
+    real_uniform = update_channel.random.uniform
+
+    def uniform(low: float, high: float) -> float:
+        bounds.append(high)
+        return real_uniform(low, high)
+
+    monkeypatch.setattr(update_channel.random, "uniform", uniform)
+
+    sse.publish("story", "s1", "r1")
+    channel.set_subscriptions(sse.base_url, ["s1"], [])
+    wait_for(lambda: len(rec.events) == 1)
+
+    # The server goes away, refuses the next attempts, then comes back
+    # with a revision published while we were disconnected.
+    sse.refuse = 3
+    sse.drop()
+    sse.revisions[("story", "s1")] = "r2"
+
+    wait_for(lambda: len(rec.events) == 2)
+    assert rec.events[-1] == UpdateEvent("story", "s1", "r2")
+    assert sse.attempts == 5
+    assert rec.states == [True, False, True]
+    # Delays grow exponentially after consecutive failures, up to the cap.
+    assert bounds[:4] == [0.1, 0.2, 0.2, 0.2]
+
+
+def test_silent_connection_is_dropped_after_the_read_timeout(sse: SseServer) -> None:
+    rec = Recorder()
+    chan = UpdateChannel(
+        rec.events.append, on_state=rec.states.append, transport=HttpTransport(), read_timeout=0.3, backoff_base=0.01
+    )
+    try:
+        chan.set_subscriptions(sse.base_url, ["s1"], [])
+        wait_for(lambda: len(sse.subscriptions) >= 2)
+        assert rec.states[:2] == [True, False]
+    finally:
+        chan.stop()
+
+
+def test_stop_ends_the_stream(sse: SseServer, channel: UpdateChannel) -> None:
+    rec = channel.recorder  # type: ignore[attr-defined]
+    channel.set_subscriptions(sse.base_url, ["s1"], [])
+    wait_for(lambda: rec.states == [True])
+
+    channel.stop()
+    wait_for(lambda: rec.states == [True, False], timeout=2.0)
+    assert not channel.connected
+
+
+def test_streams_with_credentials_identify_the_user(sse: SseServer) -> None:
+    rec = Recorder()
+    logins: List[tuple] = []
+    failures = [RuntimeError("backend down")]
+
+    def login(api_base: str, credentials: tuple) -> str:
+        logins.append((api_base, credentials))
+        if failures:
+            raise failures.pop()
+        return "user-1"
+
+    chan = UpdateChannel(
+        rec.events.append, transport=HttpTransport(), read_timeout=5.0, backoff_base=0.01, login=login
+    )
+    try:
+        chan.set_subscriptions(sse.base_url, ["s1"], [])
+        wait_for(lambda: sse.user_ids == [None])
+
+        # Logging in re-subscribes; a failed login backs off and retries.
+        chan.set_subscriptions(sse.base_url, ["s1"], [], ("writer@example.com", "secret"))
+        wait_for(lambda: sse.user_ids == [None, "user-1"])
+        assert logins == [(sse.base_url, ("writer@example.com", "secret"))] * 2
+    finally:
+        chan.stop()
+
+
+def test_polled_changes_identify_the_user(backend, client: CrowdlyClient) -> None:
+    @backend.route("POST", r"/updates/changes")
+    def _changes(_match, _body):
+        return 200, {"changes": [{"kind": "story", "id": "s1", "updatedAt": "r2"}]}
+
+    events = client.fetch_changes(stories={"s1": "r1"})
+
+    assert events == [UpdateEvent("story", "s1", "r2")]
+    (body,) = backend.calls("POST", r"/updates/changes")
+    assert body["userId"] == client.login()
+    assert body["stories"] == {"s1": "r1"}
@@ -6,6 +6,7 @@ import { pool } from './db.js';
 import { loginWithEmailPassword, registerWithEmailPassword, changePassword, deleteAccountWithPassword } from './auth.js';
 import bcrypt from 'bcryptjs';
 import { sendInvitationEmail, sendApplicationConfirmationEmail, sendApplicationToInvitationEmail } from './email.js';
+import { createUpdateHub } from './updates.js';
 
 dotenv.config();
 
@@ -13,6 +14,44 @@ const app = express();
 app.use(cors());
 app.use(express.json({ limit: '5mb' }));
 
+const updateHub = createUpdateHub(pool);
+
+// Push channel for desktop clients: Server-Sent Events announcing
+// story/screenplay revisions, and the batched polling fallback (see updates.js).
+app.get('/updates/stream', (req, res) => updateHub.handleStream(req, res));
+app.post('/updates/changes', (req, res) => updateHub.handleChanges(req, res));
+
+// Every writer of `stories` rows bumps story_title.updated_at: desktop delta
+// syncs use it as the precondition for position-based chapter keeps, and the
+// update channel announces it. Pass the transaction client when inside one
+// and publish the returned revision after COMMIT.
+async function touchStoryTitle(db, storyTitleId) {
+  const { rows } = await db.query(
+    'UPDATE story_title SET updated_at = now() WHERE story_title_id = $1 RETURNING updated_at',
+    [storyTitleId],
+  );
+  return rows[0]?.updated_at ?? null;
+}
+
+// Same rule for screenplay_scene / screenplay_block rows and
+// screenplay_title.updated_at (the desktop patch precondition).
+async function touchScreenplayTitle(db, screenplayId) {
+  const { rows } = await db.query(
+    'UPDATE screenplay_title SET updated_at = now() WHERE screenplay_id = $1 RETURNING updated_at',
+    [screenplayId],
+  );
+  return rows[0]?.updated_at ?? null;
+}
+
+// Best-effort variant for single-statement endpoints outside a transaction.
+async function bumpScreenplayTitle(screenplayId, route) {
+  try {
+    updateHub.publish('screenplay', screenplayId, await touchScreenplayTitle(pool, screenplayId));
+  } catch (errTs) {
+    console.error(`[${route}] failed to bump screenplay_title.updated_at:`, errTs);
+  }
+}
+
 // Ensure auxiliary tables / columns exist (best-effort)
 async function ensureStoryAccessTable() {
   try {
@@ -2487,6 +2526,7 @@ app.post('/screenplays/:screenplayId/scenes', async (req, res) => {
     if (userId) {
       await ensureScreenplayAccessRow(screenplayId, userId, 'contributor');
     }
+    await bumpScreenplayTitle(screenplayId, 'POST /screenplays/:screenplayId/scenes');
 
     res.status(201).json(rows[0]);
   } catch (err) {
@@ -2583,6 +2623,9 @@ app.patch('/screenplay-scenes/:sceneId', async (req, res) => {
         console.error('[PATCH /screenplay-scenes/:sceneId] revision insert failed:', revErr);
       }
     }
+    if (updated.screenplay_id) {
+      await bumpScreenplayTitle(updated.screenplay_id, 'PATCH /screenplay-scenes/:sceneId');
+    }
 
     res.json(updated);
   } catch (err) {
@@ -2596,13 +2639,14 @@ app.delete('/screenplay-scenes/:sceneId', async (req, res) => {
   const { sceneId } = req.params;
 
   try {
-    const { rowCount } = await pool.query(
-      'DELETE FROM screenplay_scene WHERE scene_id = $1',
+    const { rows } = await pool.query(
+      'DELETE FROM screenplay_scene WHERE scene_id = $1 RETURNING screenplay_id',
       [sceneId],
     );
-    if (rowCount === 0) {
+    if (rows.length === 0) {
       return res.status(404).json({ error: 'Scene not found' });
     }
+    await bumpScreenplayTitle(rows[0].screenplay_id, 'DELETE /screenplay-scenes/:sceneId');
     res.status(204).send();
   } catch (err) {
     console.error('[DELETE /screenplay-scenes/:sceneId] failed:', err);
@@ -2631,6 +2675,7 @@ app.post('/screenplays/:screenplayId/blocks', async (req, res) => {
     if (userId) {
       await ensureScreenplayAccessRow(screenplayId, userId, 'contributor');
     }
+    await bumpScreenplayTitle(screenplayId, 'POST /screenplays/:screenplayId/blocks');
 
     res.status(201).json(rows[0]);
   } catch (err) {
@@ -2723,6 +2768,9 @@ app.patch('/screenplay-blocks/:blockId', async (req, res) => {
         console.error('[PATCH /screenplay-blocks/:blockId] revision insert failed:', revErr);
       }
     }
+    if (updated.screenplay_id) {
+      await bumpScreenplayTitle(updated.screenplay_id, 'PATCH /screenplay-blocks/:blockId');
+    }
 
     res.json(updated);
   } catch (err) {
@@ -2736,13 +2784,14 @@ app.delete('/screenplay-blocks/:blockId', async (req, res) => {
   const { blockId } = req.params;
 
   try {
-    const { rowCount } = await pool.query(
-      'DELETE FROM screenplay_block WHERE block_id = $1',
+    const { rows } = await pool.query(
+      'DELETE FROM screenplay_block WHERE block_id = $1 RETURNING screenplay_id',
       [blockId],
     );
-    if (rowCount === 0) {
+    if (rows.length === 0) {
       return res.status(404).json({ error: 'Block not found' });
     }
+    await bumpScreenplayTitle(rows[0].screenplay_id, 'DELETE /screenplay-blocks/:blockId');
     res.status(204).send();
   } catch (err) {
     console.error('[DELETE /screenplay-blocks/:blockId] failed:', err);
@@ -2773,14 +2822,193 @@ app.post('/screenplays/import/pdf', async (_req, res) => {
   res.status(501).json({ error: 'PDF import not implemented yet' });
 });
 
+// Best-effort block type inference based on common screenplay conventions
+// so that the web UI can render richer element types.
+const inferScreenplayBlockType = (text) => {
+  const trimmed = (text || '').trim();
+  if (!trimmed) return 'action';
+  const isAllCaps = trimmed === trimmed.toUpperCase() && /[A-Z]/.test(trimmed);
+  if (isAllCaps && !trimmed.endsWith(':')) {
+    // CHARACTER NAME or similar.
+    return 'character';
+  }
+  if (trimmed.startsWith('(') && trimmed.endsWith(')')) {
+    return 'parenthetical';
+  }
+  if (isAllCaps && trimmed.endsWith(':')) {
+    return 'transition';
+  }
+  return 'action';
+};
+
+// Resolve a desktop screenplay patch against the current blocks (ordered by
+// block_index). Returns { target, deleted } where `target` lists the new
+// block order as { old, text } entries (old = existing row or null for an
+// insert, text = new text or undefined when unchanged), or { error }.
+const planScreenplayPatch = (oldBlocks, patch) => {
+  const covered = new Array(oldBlocks.length).fill(false);
+  const claim = (pos) => {
+    if (!Number.isInteger(pos) || pos < 0 || pos >= oldBlocks.length || covered[pos]) return false;
+    covered[pos] = true;
+    return true;
+  };
+  const target = [];
+  const deleted = [];
+  for (const op of patch.ops) {
+    const count = Number.isInteger(op?.count) && op.count > 0 ? op.count : 1;
+    switch (op?.op) {
+      case 'keep':
+        for (let k = 0; k < count; k += 1) {
+          if (!claim(op.from + k)) return { error: `invalid keep of block ${op.from + k}` };
+          target.push({ old: oldBlocks[op.from + k] });
+        }
+        break;
+      case 'update':
+        if (typeof op.text !== 'string' || !claim(op.from)) return { error: `invalid update of block ${op.from}` };
+        target.push({ old: oldBlocks[op.from], text: op.text });
+        break;
+      case 'insert':
+        if (typeof op.text !== 'string') return { error: 'insert requires text' };
+        target.push({ old: null, text: op.text });
+        break;
+      case 'delete':
+        for (let k = 0; k < count; k += 1) {
+          if (!claim(op.from + k)) return { error: `invalid delete of block ${op.from + k}` };
+          deleted.push(oldBlocks[op.from + k].block_id);
+        }
+        break;
+      default:
+        return { error: `unknown op ${op?.op}` };
+    }
+  }
+  if (covered.some((c) => !c)) {
+    return { error: 'patch does not account for every existing block' };
+  }
+  return { target, deleted };
+};
+
+// Apply a planned patch: reuse scene rows by position and touch only the
+// blocks whose text, scene or index actually changed.
+const applyScreenplayPatchTx = async (client, screenplayId, patchScenes, oldScenes, plan) => {
+  const sceneIds = [];
+  for (let i = 0; i < patchScenes.length; i += 1) {
+    const sceneIndex = i + 1;
+    const raw = patchScenes[i]?.slugline;
+    const slugline = typeof raw === 'string' && raw.trim() ? raw.trim() : `Scene ${sceneIndex}`;
+    const existing = oldScenes[i];
+    if (existing) {
+      if (Number(existing.scene_index) !== sceneIndex || existing.slugline !== slugline) {
+        await client.query(
+          'UPDATE screenplay_scene SET scene_index = $1, slugline = $2 WHERE scene_id = $3',
+          [sceneIndex, slugline, existing.scene_id],
+        );
+      }
+      sceneIds.push(existing.scene_id);
+    } else {
+      const sceneRes = await client.query(
+        'INSERT INTO screenplay_scene (screenplay_id, scene_index, slugline, location, time_of_day, is_interior, synopsis) VALUES ($1, $2, $3, $4, $5, $6, $7) RETURNING scene_id',
+        [screenplayId, sceneIndex, slugline, null, null, null, null],
+      );
+      sceneIds.push(sceneRes.rows[0].scene_id);
+    }
+  }
+
+  const moved = { ids: [], sceneIds: [], indexes: [] };
+  const updated = { ids: [], sceneIds: [], indexes: [], types: [], texts: [] };
+  const inserted = { sceneIds: [], indexes: [], types: [], texts: [] };
+
+  let pos = 0;
+  for (let s = 0; s < patchScenes.length; s += 1) {
+    const count = Number(patchScenes[s]?.blockCount) || 0;
+    for (let k = 0; k < count; k += 1, pos += 1) {
+      const entry = plan.target[pos];
+      const sceneId = sceneIds[s];
+      const blockIndex = pos + 1;
+      if (!entry.old) {
+        inserted.sceneIds.push(sceneId);
+        inserted.indexes.push(blockIndex);
+        inserted.types.push(inferScreenplayBlockType(entry.text));
+        inserted.texts.push(entry.text);
+      } else if (entry.text !== undefined && entry.text !== entry.old.text) {
+        updated.ids.push(entry.old.block_id);
+        updated.sceneIds.push(sceneId);
+        updated.indexes.push(blockIndex);
+        updated.types.push(inferScreenplayBlockType(entry.text));
+        updated.texts.push(entry.text);
+      } else if (entry.old.scene_id !== sceneId || Number(entry.old.block_index) !== blockIndex) {
+        moved.ids.push(entry.old.block_id);
+        moved.sceneIds.push(sceneId);
+        moved.indexes.push(blockIndex);
+      }
+    }
+  }
+
+  if (plan.deleted.length > 0) {
+    await client.query('DELETE FROM screenplay_block WHERE block_id = ANY($1::uuid[])', [plan.deleted]);
+  }
+  if (moved.ids.length > 0) {
+    await client.query(
+      `UPDATE screenplay_block AS b SET scene_id = t.scene_id, block_index = t.block_index
+       FROM unnest($1::uuid[], $2::uuid[], $3::int[]) AS t(block_id, scene_id, block_index)
+       WHERE b.block_id = t.block_id`,
+      [moved.ids, moved.sceneIds, moved.indexes],
+    );
+  }
+  if (updated.ids.length > 0) {
+    await client.query(
+      `UPDATE screenplay_block AS b
+       SET scene_id = t.scene_id, block_index = t.block_index, block_type = t.block_type, text = t.text, updated_at = now()
+       FROM unnest($1::uuid[], $2::uuid[], $3::int[], $4::text[], $5::text[]) AS t(block_id, scene_id, block_index, block_type, text)
+       WHERE b.block_id = t.block_id`,
+      [updated.ids, updated.sceneIds, updated.indexes, updated.types, updated.texts],
+    );
+  }
+  if (inserted.texts.length > 0) {
+    await client.query(
+      `INSERT INTO screenplay_block (screenplay_id, scene_id, block_index, block_type, text, metadata)
+       SELECT $1, t.scene_id, t.block_index, t.block_type, t.text, NULL
+       FROM unnest($2::uuid[], $3::int[], $4::text[], $5::text[]) AS t(scene_id, block_index, block_type, text)`,
+      [screenplayId, inserted.sceneIds, inserted.indexes, inserted.types, inserted.texts],
+    );
+  }
+  const removedSceneIds = oldScenes.slice(patchScenes.length).map((sc) => sc.scene_id);
+  if (removedSceneIds.length > 0) {
+    await client.query('DELETE FROM screenplay_scene WHERE scene_id = ANY($1::uuid[])', [removedSceneIds]);
+  }
+
+  return {
+    inserted: inserted.texts.length,
+    updated: updated.ids.length,
+    moved: moved.ids.length,
+    deleted: plan.deleted.length,
+  };
+};
+
 // Desktop sync endpoint for screenplays. This replaces the full set of
 // scenes and blocks for a screenplay based on a structured snapshot coming
 // from the desktop editor. The operation is transactional: on success the
 // database state matches the payload; on failure the previous state is
 // preserved.
+//
+// Instead of `scenes`, the client may send a block-level patch against the
+// state it last synced:
+//   patch: {
+//     baseUpdatedAt: string,     // screenplay_title.updated_at returned by that sync
+//     baseBlockCount: number,
+//     baseSceneCount: number,
+//     scenes: [{ slugline: string, blockCount: number }],   // complete new scene list
+//     ops: [                     // new block order, blocks addressed by old position
+//       { op: 'keep', from, count },   // unchanged run (a move when out of sequence)
+//       { op: 'update', from, text },
+//       { op: 'insert', text },
+//       { op: 'delete', from, count },
+//     ],
+//   }
+// Scene rows are reused by position. A stale base is answered with 409
+// (code 'precondition_failed') so the client can fall back to a full sync.
 app.post('/screenplays/:screenplayId/sync-desktop', async (req, res) => {
   const { screenplayId } = req.params;
-  const { userId, title, formatType, scenes, remoteUpdatedAt } = req.body ?? {};
+  const { userId, title, formatType, scenes, patch, remoteUpdatedAt } = req.body ?? {};
 
   if (!userId) {
     return res.status(400).json({ error: 'userId is required' });
@@ -2791,7 +3019,12 @@ app.post('/screenplays/:screenplayId/sync-desktop', async (req, res) => {
   if (typeof title !== 'string' || !title.trim()) {
     return res.status(400).json({ error: 'title is required' });
   }
-  if (!Array.isArray(scenes) || scenes.length === 0) {
+  const isPatch = patch != null && typeof patch === 'object';
+  if (isPatch) {
+    if (!Array.isArray(patch.scenes) || patch.scenes.length === 0 || !Array.isArray(patch.ops)) {
+      return res.status(400).json({ error: 'patch.scenes[] and patch.ops[] are required' });
+    }
+  } else if (!Array.isArray(scenes) || scenes.length === 0) {
     return res.status(400).json({ error: 'scenes[] is required' });
   }
 
@@ -2834,13 +3067,79 @@ app.post('/screenplays/:screenplayId/sync-desktop', async (req, res) => {
       // On comparison failure, fall back to best-effort last-writer-wins.
     }
 
+    let patchPlan = null;
+    let oldScenes = [];
+    if (isPatch) {
+      const { rows: sceneRows } = await client.query(
+        'SELECT scene_id, scene_index, slugline FROM screenplay_scene WHERE screenplay_id = $1 ORDER BY scene_index ASC',
+        [screenplayId],
+      );
+      const { rows: blockRows } = await client.query(
+        'SELECT block_id, scene_id, block_index, text FROM screenplay_block WHERE screenplay_id = $1 ORDER BY block_index ASC',
+        [screenplayId],
+      );
+      oldScenes = sceneRows;
+
+      // The patch addresses blocks by position, so it only applies to
+      // exactly the state the client last synced.
+      const currentTs = row.updated_at ? new Date(row.updated_at).getTime() : null;
+      const baseTs = patch.baseUpdatedAt ? new Date(patch.baseUpdatedAt).getTime() : NaN;
+      if (
+        currentTs !== baseTs ||
+        Number(patch.baseBlockCount) !== blockRows.length ||
+        Number(patch.baseSceneCount) !== sceneRows.length
+      ) {
+        await client.query('ROLLBACK');
+        return res.status(409).json({
+          error: 'precondition_failed',
+          code: 'precondition_failed',
+          message: 'Screenplay has changed on the server since the patch base.',
+          remoteUpdatedAt: row.updated_at,
+        });
+      }
+
+      patchPlan = planScreenplayPatch(blockRows, patch);
+      const declared = patch.scenes.reduce((sum, sc) => sum + (Number(sc?.blockCount) || 0), 0);
+      if (!patchPlan.error && declared !== patchPlan.target.length) {
+        patchPlan = { error: 'scene block counts do not match the patch' };
+      }
+      if (patchPlan.error) {
+        await client.query('ROLLBACK');
+        return res.status(400).json({ error: 'Invalid screenplay patch', details: patchPlan.error });
+      }
+    }
+
     const newTitle = title.trim();
     const newFormatType = formatType !== undefined ? formatType : row.format_type;
 
-    await client.query(
-      'UPDATE screenplay_title SET title = $1, format_type = $2, updated_at = now() WHERE screenplay_id = $3',
+    const titleUpdateRes = await client.query(
+      'UPDATE screenplay_title SET title = $1, format_type = $2, updated_at = now() WHERE screenplay_id = $3 RETURNING updated_at',
       [newTitle, newFormatType, screenplayId],
     );
+    const updatedAt = titleUpdateRes.rows[0]?.updated_at ?? null;
+
+    if (isPatch) {
+      const stats = await applyScreenplayPatchTx(client, screenplayId, patch.scenes, oldScenes, patchPlan);
+
+      try {
+        await ensureScreenplayAccessRow(screenplayId, userId, 'contributor');
+      } catch (errAccess) {
+        console.error(
+          '[POST /screenplays/:screenplayId/sync-desktop] failed to insert screenplay_access row:',
+          errAccess,
+        );
+      }
+
+      await client.query('COMMIT');
+      updateHub.publish('screenplay', screenplayId, updatedAt);
+      return res.json({
+        ok: true,
+        screenplayId,
+        syncedScenes: patch.scenes.length,
+        updatedAt,
+        ...stats,
+      });
+    }
 
     // Replace scenes and blocks in a simple, deterministic way.
     await client.query('DELETE FROM screenplay_block WHERE screenplay_id = $1', [screenplayId]);
@@ -2870,22 +3169,7 @@ app.post('/screenplays/:screenplayId/sync-desktop', async (req, res) => {
 
         const blockIndex = nextBlockIndex;
         nextBlockIndex += 1;
-
-        // Best-effort block type inference based on common screenplay
-        // conventions so that the web UI can render richer element types.
-        let blockType = 'action';
-        const trimmed = text.trim();
-        if (trimmed) {
-          const isAllCaps = trimmed === trimmed.toUpperCase() && /[A-Z]/.test(trimmed);
-          if (isAllCaps && !trimmed.endsWith(':')) {
-            // CHARACTER NAME or similar.
-            blockType = 'character';
-          } else if (trimmed.startsWith('(') && trimmed.endsWith(')')) {
-            blockType = 'parenthetical';
-          } else if (isAllCaps && trimmed.endsWith(':')) {
-            blockType = 'transition';
-          }
-        }
+        const blockType = inferScreenplayBlockType(text);
 
         await client.query(
           'INSERT INTO screenplay_block (screenplay_id, scene_id, block_index, block_type, text, metadata) VALUES ($1, $2, $3, $4, $5, $6)',
@@ -2905,11 +3189,13 @@ app.post('/screenplays/:screenplayId/sync-desktop', async (req, res) => {
     }
 
     await client.query('COMMIT');
+    updateHub.publish('screenplay', screenplayId, updatedAt);
 
     return res.json({
       ok: true,
       screenplayId,
       syncedScenes: scenes.length,
+      updatedAt,
     });
   } catch (err) {
     await client.query('ROLLBACK');
@@ -3817,8 +4103,10 @@ app.patch('/stories/:storyTitleId/chapters/reorder', async (req, res) => {
         [idx++, chapterId, storyTitleId],
       );
     }
+    const updatedAt = await touchStoryTitle(client, storyTitleId);
 
     await client.query('COMMIT');
+    updateHub.publish('story', storyTitleId, updatedAt);
     res.status(204).send();
   } catch (err) {
     await client.query('ROLLBACK');
@@ -5186,7 +5474,7 @@ app.post('/chapters', async (req, res) => {
 
     // Bump story_title.updated_at so desktop clients can detect remote changes.
     try {
-      await pool.query('UPDATE story_title SET updated_at = now() WHERE story_title_id = $1', [storyTitleId]);
+      updateHub.publish('story', storyTitleId, await touchStoryTitle(pool, storyTitleId));
     } catch (errTs) {
       console.error('[POST /chapters] failed to bump story_title.updated_at:', errTs);
     }
@@ -5296,7 +5584,7 @@ app.patch('/chapters/:chapterId', async (req, res) => {
     // Bump story_title.updated_at so desktop clients can detect remote changes.
     try {
       if (existing.story_title_id) {
-        await pool.query('UPDATE story_title SET updated_at = now() WHERE story_title_id = $1', [existing.story_title_id]);
+        updateHub.publish('story', existing.story_title_id, await touchStoryTitle(pool, existing.story_title_id));
       }
     } catch (errTs) {
       console.error('[PATCH /chapters/:chapterId] failed to bump story_title.updated_at:', errTs);
@@ -5784,7 +6072,7 @@ app.delete('/chapters/:chapterId', async (req, res) => {
 
     if (storyTitleId) {
       try {
-        await pool.query('UPDATE story_title SET updated_at = now() WHERE story_title_id = $1', [storyTitleId]);
+        updateHub.publish('story', storyTitleId, await touchStoryTitle(pool, storyTitleId));
       } catch (errTs) {
         console.error('[DELETE /chapters/:chapterId] failed to bump story_title.updated_at:', errTs);
       }
@@ -6247,6 +6535,8 @@ app.post('/proposals/:proposalId/approve', async (req, res) => {
         return res.status(400).json({ error: 'Proposal already approved' });
       }
 
+      let touchedStory = null;
+
       if (proposal.target_type === 'paragraph') {
         const chapterId = proposal.target_chapter_id;
         const idx = proposal.target_path ? parseInt(proposal.target_path, 10) : null;
@@ -6256,7 +6546,7 @@ app.post('/proposals/:proposalId/approve', async (req, res) => {
         }
 
         const existingRes = await client.query(
-          'SELECT chapter_title, paragraphs FROM stories WHERE chapter_id = $1',
+          'SELECT story_title_id, chapter_title, paragraphs FROM stories WHERE chapter_id = $1',
           [chapterId],
         );
         if (existingRes.rows.length === 0) {
@@ -6285,6 +6575,10 @@ app.post('/proposals/:proposalId/approve', async (req, res) => {
           'UPDATE stories SET paragraphs = $1 WHERE chapter_id = $2',
           [paragraphs, chapterId],
         );
+        touchedStory = {
+          id: existing.story_title_id,
+          updatedAt: await touchStoryTitle(client, existing.story_title_id),
+        };
       } else if (proposal.target_type === 'branch') {
         const branchId = proposal.target_branch_id;
         if (!branchId) {
@@ -6319,6 +6613,7 @@ app.post('/proposals/:proposalId/approve', async (req, res) => {
       }
 
       await client.query('COMMIT');
+      if (touchedStory) updateHub.publish('story', touchedStory.id, touchedStory.updatedAt);
       res.status(204).send();
     } catch (err) {
       await client.query('ROLLBACK');
@@ -6892,9 +7187,20 @@ app.patch('/story-titles/:storyTitleId/settings', async (req, res) => {
 //   metadata?: { author_id?: uuid, initiator_id?: uuid, genre?: string|null, tags?: string[]|null },
 //   chapters: [{ chapterTitle: string, paragraphs: string[] }]
 // }
+// Instead of `chapters`, the client may send a chapter-level delta against
+// the state it last synced:
+//   delta: {
+//     baseUpdatedAt: string,        // story_title.updated_at returned by that sync
+//     baseChapterCount: number,     // number of chapters at that time
+//     order: (number|null)[],       // per new position: old position to keep, or null
+//     chapters: [{ index: number, chapterTitle: string, paragraphs: string[] }],
+//   }
+// `chapters` carries the content of every position whose `order` entry is
+// null. When the base no longer matches the server, 409 is returned and
+// the client falls back to a full sync.
 app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
   const { storyTitleId } = req.params;
-  const { userId, title, metadata, chapters, bodyType, creativeSpaceId, spaceId } = req.body ?? {};
+  const { userId, title, metadata, chapters, delta, bodyType, creativeSpaceId, spaceId } = req.body ?? {};
 
   if (!userId) {
     return res.status(400).json({ error: 'userId is required' });
@@ -6905,7 +7211,12 @@ app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
   if (typeof title !== 'string' || !title.trim()) {
     return res.status(400).json({ error: 'title is required' });
   }
-  if (!Array.isArray(chapters) || chapters.length === 0) {
+  const isDelta = delta != null && typeof delta === 'object';
+  if (isDelta) {
+    if (!Array.isArray(delta.order) || delta.order.length === 0 || !Array.isArray(delta.chapters)) {
+      return res.status(400).json({ error: 'delta.order[] and delta.chapters[] are required' });
+    }
+  } else if (!Array.isArray(chapters) || chapters.length === 0) {
     return res.status(400).json({ error: 'chapters[] is required' });
   }
 
@@ -6942,7 +7253,7 @@ app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
     await client.query('BEGIN');
 
     const storyRes = await client.query(
-      'SELECT story_title_id, title, creator_id, genre, tags, creative_space_id FROM story_title WHERE story_title_id = $1 FOR UPDATE',
+      'SELECT story_title_id, title, creator_id, genre, tags, creative_space_id, updated_at FROM story_title WHERE story_title_id = $1 FOR UPDATE',
       [storyTitleId],
     );
     if (storyRes.rows.length === 0) {
@@ -6953,6 +7264,27 @@ app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
     const storyRow = storyRes.rows[0];
     const creatorId = storyRow.creator_id;
 
+    const existingChaptersRes = await client.query(
+      'SELECT chapter_id, chapter_index, chapter_title, paragraphs FROM stories WHERE story_title_id = $1 ORDER BY episode_number NULLS FIRST, part_number NULLS FIRST, chapter_index ASC, created_at ASC',
+      [storyTitleId],
+    );
+    const existingChapters = existingChaptersRes.rows;
+
+    // Precondition for delta syncs: the story must be exactly as the client
+    // left it. Checked before anything is written.
+    if (isDelta) {
+      const currentUpdatedAt = storyRow.updated_at ? new Date(storyRow.updated_at).getTime() : null;
+      const baseUpdatedAt = delta.baseUpdatedAt ? new Date(delta.baseUpdatedAt).getTime() : NaN;
+      if (currentUpdatedAt !== baseUpdatedAt || Number(delta.baseChapterCount) !== existingChapters.length) {
+        await client.query('ROLLBACK');
+        return res.status(409).json({
+          error: 'Story changed since the last desktop sync',
+          code: 'precondition_failed',
+          updatedAt: storyRow.updated_at,
+        });
+      }
+    }
+
     // Optional Space-aware association: if the desktop client provided a
     // candidate creative Space for this story, adopt it on first sync. If the
     // story is already linked to a different Space, log but keep the existing
@@ -7056,16 +7388,34 @@ app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
     }
 
     // 4) Sync chapters + paragraphs by position
-    const existingChaptersRes = await client.query(
-      'SELECT chapter_id, chapter_index, chapter_title, paragraphs FROM stories WHERE story_title_id = $1 ORDER BY episode_number NULLS FIRST, part_number NULLS FIRST, chapter_index ASC, created_at ASC',
-      [storyTitleId],
-    );
-    const existingChapters = existingChaptersRes.rows;
-
-    const incoming = chapters.map((c) => ({
+    const normalizeChapter = (c) => ({
       chapterTitle: typeof c?.chapterTitle === 'string' && c.chapterTitle.trim() ? c.chapterTitle.trim() : 'Chapter',
       paragraphs: Array.isArray(c?.paragraphs) ? c.paragraphs : [],
-    }));
+    });
+
+    let incoming;
+    if (isDelta) {
+      // Rebuild the full chapter list from kept positions and sent content.
+      const sent = new Map();
+      for (const c of delta.chapters) {
+        if (Number.isInteger(c?.index)) sent.set(c.index, normalizeChapter(c));
+      }
+      incoming = [];
+      for (let i = 0; i < delta.order.length; i++) {
+        const from = delta.order[i];
+        if (Number.isInteger(from) && from >= 0 && from < existingChapters.length) {
+          const ex = existingChapters[from];
+          incoming.push({ chapterTitle: ex.chapter_title, paragraphs: ex.paragraphs ?? [] });
+        } else if (sent.has(i)) {
+          incoming.push(sent.get(i));
+        } else {
+          await client.query('ROLLBACK');
+          return res.status(400).json({ error: `delta is missing content for chapter ${i}` });
+        }
+      }
+    } else {
+      incoming = chapters.map(normalizeChapter);
+    }
 
     const minLen = Math.min(existingChapters.length, incoming.length);
 
@@ -7175,19 +7525,26 @@ app.post('/story-titles/:storyTitleId/sync-desktop', async (req, res) => {
     }
 
     // Bump story_title.updated_at for desktop sync.
+    let updatedAt = null;
     try {
-      await client.query('UPDATE story_title SET updated_at = now() WHERE story_title_id = $1', [storyTitleId]);
+      const tsRes = await client.query(
+        'UPDATE story_title SET updated_at = now() WHERE story_title_id = $1 RETURNING updated_at',
+        [storyTitleId],
+      );
+      updatedAt = tsRes.rows[0]?.updated_at ?? null;
     } catch (errTs) {
       console.error('[POST /story-titles/:storyTitleId/sync-desktop] failed to bump story_title.updated_at:', errTs);
     }
 
     await client.query('COMMIT');
+    updateHub.publish('story', storyTitleId, updatedAt);
 
     return res.json({
       ok: true,
       storyTitleId,
       syncedChapters: incoming.length,
       deletedChapters: Math.max(0, existingChapters.length - incoming.length),
+      updatedAt,
     });
   } catch (err) {
     await client.query('ROLLBACK');
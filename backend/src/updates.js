@@ -0,0 +1,205 @@
+// Server-Sent Events channel for "story/screenplay changed" notifications.
+//
+// Clients subscribe with
+//   GET /updates/stream?stories=<id>,<id>&screenplays=<id>&userId=<id>
+// and receive `update` events `{ kind, id, updatedAt }` whenever the
+// story_title / screenplay_title row's updated_at moves. Endpoints that know
+// they changed something call `publish()` for an immediate event; any other
+// writer (web editor, other endpoints) is picked up by one batched
+// updated_at query per interval for all subscribed ids together.
+//
+// Clients that cannot hold a stream open poll instead, many items per call:
+//   POST /updates/changes  { userId, stories: { <id>: <updatedAt|null> }, screenplays: {...} }
+// answers `{ changes: [{ kind, id, updatedAt }] }` with only the items whose
+// current updated_at differs from the one the client sent.
+//
+// Both only ever cover items `userId` may read, with the rule of
+// GET /story-titles/:id: public items for everyone; otherwise the creator,
+// users in story_access / screenplay_access, and for unlisted stories the
+// holders of a `view` access rule. Other ids are silently dropped.
+
+const WATCH_INTERVAL_MS = Number(process.env.UPDATES_WATCH_INTERVAL_MS) || 2000;
+const HEARTBEAT_MS = 15000;
+const MAX_IDS_PER_KIND = 200;
+
+const parseIds = (raw) =>
+  String(raw || '')
+    .split(',')
+    .map((s) => s.trim())
+    .filter((s) => /^[0-9a-fA-F-]{8,64}$/.test(s))
+    .slice(0, MAX_IDS_PER_KIND);
+
+const toIso = (value) => {
+  if (!value) return null;
+  const date = value instanceof Date ? value : new Date(value);
+  return Number.isNaN(date.getTime()) ? String(value) : date.toISOString();
+};
+
+const parseUserId = (raw) => {
+  const value = typeof raw === 'string' ? raw.trim() : '';
+  return /^[0-9a-fA-F-]{8,64}$/.test(value) ? value : null;
+};
+
+const REVISION_QUERIES = {
+  story: 'SELECT story_title_id AS id, updated_at FROM story_title WHERE story_title_id = ANY($1::uuid[])',
+  screenplay: 'SELECT screenplay_id AS id, updated_at FROM screenplay_title WHERE screenplay_id = ANY($1::uuid[])',
+};
+
+// Same rows, restricted to what user $2 (NULL: anonymous) may read.
+const VISIBLE_REVISION_QUERIES = {
+  story: `SELECT st.story_title_id AS id, st.updated_at
+    FROM story_title st
+    WHERE st.story_title_id = ANY($1::uuid[])
+      AND (COALESCE(st.visibility, 'public') = 'public'
+        OR ($2::uuid IS NOT NULL AND (
+          st.creator_id = $2::uuid
+          OR EXISTS (SELECT 1 FROM story_access a WHERE a.story_title_id = st.story_title_id AND a.user_id = $2::uuid)
+          OR (st.visibility = 'unlisted' AND EXISTS (
+            SELECT 1 FROM story_access_rules r
+            WHERE r.story_title_id = st.story_title_id AND r.rule_type = 'view'
+              AND (r.grantee_user_id = $2::uuid
+                OR r.grantee_group_id IN (SELECT group_id FROM user_group_members WHERE user_id = $2::uuid))))
+        )))`,
+  screenplay: `SELECT sp.screenplay_id AS id, sp.updated_at
+    FROM screenplay_title sp
+    WHERE sp.screenplay_id = ANY($1::uuid[])
+      AND (COALESCE(sp.visibility, 'public') = 'public'
+        OR ($2::uuid IS NOT NULL AND (
+          sp.creator_id = $2::uuid
+          OR EXISTS (SELECT 1 FROM screenplay_access a WHERE a.screenplay_id = sp.screenplay_id AND a.user_id = $2::uuid)
+        )))`,
+};
+
+export function createUpdateHub(pool) {
+  // kind -> id -> Set(subscriber)
+  const subscriptions = { story: new Map(), screenplay: new Map() };
+  // kind -> id -> last seen updated_at (ISO)
+  const lastSeen = { story: new Map(), screenplay: new Map() };
+  let timer = null;
+  let watching = false;
+
+  const send = (sub, event) => {
+    sub.res.write(`event: update\ndata: ${JSON.stringify(event)}\n\n`);
+  };
+
+  const publish = (kind, id, updatedAt) => {
+    const iso = toIso(updatedAt);
+    const subs = subscriptions[kind]?.get(String(id));
+    if (!subs || !iso) return;
+    if (lastSeen[kind].get(String(id)) === iso) return;
+    lastSeen[kind].set(String(id), iso);
+    for (const sub of subs) send(sub, { kind, id: String(id), updatedAt: iso });
+  };
+
+  const watch = async () => {
+    if (watching) return;
+    watching = true;
+    try {
+      for (const [kind, sql] of Object.entries(REVISION_QUERIES)) {
+        const ids = [...subscriptions[kind].keys()];
+        if (ids.length === 0) continue;
+        const { rows } = await pool.query(sql, [ids]);
+        for (const row of rows) publish(kind, row.id, row.updated_at);
+      }
+    } catch (err) {
+      console.error('[updates] watch query failed:', err);
+    } finally {
+      watching = false;
+    }
+  };
+
+  const hasSubscribers = () => subscriptions.story.size > 0 || subscriptions.screenplay.size > 0;
+
+  const handleStream = async (req, res) => {
+    const wanted = { story: parseIds(req.query.stories), screenplay: parseIds(req.query.screenplays) };
+    const userId = parseUserId(req.query.userId);
+
+    // Current revisions of the items this user may read. They decide what
+    // the stream follows and are sent first, so a client that reconnects
+    // after a gap learns about changes it missed.
+    const snapshot = [];
+    try {
+      for (const [kind, sql] of Object.entries(VISIBLE_REVISION_QUERIES)) {
+        if (!wanted[kind].length) continue;
+        const { rows } = await pool.query(sql, [wanted[kind], userId]);
+        for (const row of rows) snapshot.push({ kind, id: String(row.id), updatedAt: toIso(row.updated_at) });
+      }
+    } catch (err) {
+      console.error('[GET /updates/stream] initial snapshot failed:', err);
+      return res.status(500).json({ error: 'Failed to open update stream' });
+    }
+    if (req.socket?.destroyed) return; // gone while we were querying
+    for (const kind of Object.keys(wanted)) {
+      wanted[kind] = snapshot.filter((event) => event.kind === kind).map((event) => event.id);
+    }
+
+    res.writeHead(200, {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache',
+      Connection: 'keep-alive',
+      'X-Accel-Buffering': 'no',
+    });
+    res.write('retry: 5000\n\n');
+
+    const sub = { res };
+    for (const kind of Object.keys(wanted)) {
+      for (const id of wanted[kind]) {
+        if (!subscriptions[kind].has(id)) subscriptions[kind].set(id, new Set());
+        subscriptions[kind].get(id).add(sub);
+      }
+    }
+    if (!timer && hasSubscribers()) timer = setInterval(watch, WATCH_INTERVAL_MS);
+
+    for (const event of snapshot) {
+      if (!lastSeen[event.kind].has(event.id)) lastSeen[event.kind].set(event.id, event.updatedAt);
+      send(sub, event);
+    }
+
+    const heartbeat = setInterval(() => res.write(': ping\n\n'), HEARTBEAT_MS);
+
+    req.on('close', () => {
+      clearInterval(heartbeat);
+      for (const kind of Object.keys(wanted)) {
+        for (const id of wanted[kind]) {
+          const subs = subscriptions[kind].get(id);
+          if (!subs) continue;
+          subs.delete(sub);
+          if (subs.size === 0) {
+            subscriptions[kind].delete(id);
+            lastSeen[kind].delete(id);
+          }
+        }
+      }
+      if (!hasSubscribers() && timer) {
+        clearInterval(timer);
+        timer = null;
+      }
+    });
+  };
+
+  const handleChanges = async (req, res) => {
+    const body = req.body || {};
+    const since = { story: body.stories, screenplay: body.screenplays };
+    const userId = parseUserId(body.userId);
+    try {
+      const changes = [];
+      for (const [kind, sql] of Object.entries(VISIBLE_REVISION_QUERIES)) {
+        const known = since[kind] && typeof since[kind] === 'object' ? since[kind] : {};
+        const ids = parseIds(Object.keys(known).join(','));
+        if (!ids.length) continue;
+        const { rows } = await pool.query(sql, [ids, userId]);
+        for (const row of rows) {
+          const id = String(row.id);
+          const updatedAt = toIso(row.updated_at);
+          if (updatedAt && known[id] !== updatedAt) changes.push({ kind, id, updatedAt });
+        }
+      }
+      res.json({ changes });
+    } catch (err) {
+      console.error('[POST /updates/changes] failed:', err);
+      res.status(500).json({ error: 'Failed to check for changes' });
+    }
+  };
+
+  return { handleStream, handleChanges, publish };
+}